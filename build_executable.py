@@ -12,6 +12,9 @@ import sys
 from importlib import import_module
 from pathlib import Path
 
+from command_builder.components.ui_loader import compile_all
+from command_builder.services.help_renderer import prerender_help
+
 
 def get_version() -> str:
     """Return CommandBuilder package version."""
@@ -86,11 +89,11 @@ def collect_data_files(base_dir):
                 dest_dir = rel_path.parent
                 data_files.append((str(rel_path), str(dest_dir)))
 
-    # Add help documentation Markdown files
+    # Add help documentation Markdown files and their prerendered HTML
     help_docs_dir = base_dir / "docs" / "help"
     if help_docs_dir.exists():
-        for md_file in help_docs_dir.glob("*.md"):
-            rel_path = md_file.relative_to(base_dir)
+        for help_file in [*help_docs_dir.glob("*.md"), *help_docs_dir.glob("*.html")]:
+            rel_path = help_file.relative_to(base_dir)
             dest_dir = rel_path.parent
             data_files.append((str(rel_path), str(dest_dir)))
 
@@ -220,6 +223,21 @@ def build_executable(dev_mode=False):
     if not install_pyinstaller_if_needed():
         return False
 
+    # Compile .ui files so that components skip runtime XML parsing
+    print("Compiling UI files...")
+    try:
+        compiled_ui_modules = compile_all(base_dir / "command_builder" / "components")
+    except Exception as e:
+        print(f"Warning: UI files not compiled, runtime loading will be used: {e}")
+        compiled_ui_modules = []
+
+    # Prerender the help pages so that the help window skips Markdown conversion
+    print("Prerendering help pages...")
+    try:
+        prerender_help(base_dir / "docs" / "help")
+    except Exception as e:
+        print(f"Warning: help pages not prerendered, converted at runtime: {e}")
+
     # Collect data files
     print("Collecting data files...")
     data_files = collect_data_files(base_dir)
@@ -245,6 +263,11 @@ def build_executable(dev_mode=False):
         ]
     )
 
+    # Compiled UI modules are imported dynamically by ui_loader
+    for module_path in compiled_ui_modules:
+        module = ".".join(module_path.relative_to(base_dir).with_suffix("").parts)
+        command.append(f"--hidden-import={module}")
+
     # Windowed mode (no console) unless in dev mode
     if not dev_mode:
         command.append("--windowed")
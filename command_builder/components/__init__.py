@@ -6,9 +6,11 @@ Chaque composant est organisé dans son propre sous-package avec ses fichiers .u
 from .argument_component import ArgumentComponent
 from .command_component import CommandComponent
 from .command_form import CommandForm
+from .command_palette import CommandPalette
 from .console_output import ConsoleOutput
 from .help_button import HelpButton
 from .help_window import HelpWindow
+from .log_viewer import LogViewer
 from .main_window import MainWindow
 from .task_component import TaskComponent
 from .task_list import TaskList
@@ -23,4 +25,6 @@ __all__ = [
     "CommandComponent",
     "HelpButton",
     "HelpWindow",
+    "LogViewer",
+    "CommandPalette",
 ]
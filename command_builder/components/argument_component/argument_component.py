@@ -5,8 +5,7 @@ Module contenant la classe ArgumentComponent qui représente un composant d'argu
 from pathlib import Path
 from typing import List, Optional
 
-from PySide6.QtCore import Signal
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QFileDialog,
@@ -17,7 +16,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.components.ui_loader import load_ui
 from command_builder.models.arguments import Argument
+from command_builder.services.path_validator import (
+    PATH_ARGUMENT_TYPES,
+    get_path_validator,
+)
 
 
 def normalize_path_for_display(path: str) -> str:
@@ -36,6 +41,163 @@ def normalize_path_for_display(path: str) -> str:
     return path.replace("/", "\\")
 
 
+def argument_value(argument: Argument, text: str, checked: bool) -> str:
+    """
+    Calcule la valeur d'un argument à partir de l'état de sa saisie.
+
+    Args:
+        argument: L'argument
+        text: Le texte saisi
+        checked: L'état de la case à cocher (flags et options avec valeur)
+
+    Returns:
+        La valeur (vide si l'argument n'a pas de valeur)
+    """
+    arg_type = argument.type or "string"
+
+    if arg_type == "flag":
+        # Pour les flags, retourner la valeur définie ou "1" par défaut si coché
+        if checked:
+            return argument.value if argument.value else "1"
+        return ""
+    elif arg_type == "valued_option":
+        # Pour les options avec valeur, retourner le préfixe + valeur si la checkbox est cochée
+        if checked:
+            user_value = text.strip()
+            if user_value:
+                # Si un préfixe est défini dans argument.value, l'ajouter avant la valeur
+                prefix = argument.value if argument.value else ""
+                if prefix:
+                    return f"{prefix} {user_value}"
+                return user_value
+        return ""
+    else:
+        # Pour les types classiques, retourner le texte du champ
+        return text
+
+
+def argument_value_tokens(argument: Argument, text: str, checked: bool) -> List[str]:
+    """
+    Calcule la valeur d'un argument sous forme de jetons de ligne de commande.
+
+    Une valeur saisie (chemin, texte) reste un jeton unique même si elle
+    contient des espaces. Le texte défini dans le YAML pour les flags et
+    préfixes d'options est découpé sur les espaces.
+
+    Args:
+        argument: L'argument
+        text: Le texte saisi
+        checked: L'état de la case à cocher (flags et options avec valeur)
+
+    Returns:
+        La liste des jetons (vide si l'argument n'a pas de valeur)
+    """
+    arg_type = argument.type or "string"
+
+    if arg_type == "flag":
+        value = argument_value(argument, text, checked)
+        return value.split() if value else []
+    elif arg_type == "valued_option":
+        if checked:
+            user_value = text.strip()
+            if user_value:
+                prefix = argument.value if argument.value else ""
+                return prefix.split() + [user_value]
+        return []
+    else:
+        return [text] if text else []
+
+
+class ArgumentState:
+    """
+    État d'un argument sans widget de saisie.
+
+    Utilisé pour les commandes repliées d'un formulaire paresseux : offre les
+    mêmes méthodes de lecture et d'écriture que ArgumentComponent, et sert à
+    initialiser le composant lorsque la commande est dépliée.
+    """
+
+    def __init__(
+        self,
+        argument: Argument,
+        text: str = "",
+        checked: bool = False,
+        has_default: bool = False,
+    ):
+        """
+        Initialise l'état.
+
+        Args:
+            argument: L'argument
+            text: Le texte saisi
+            checked: L'état de la case à cocher
+            has_default: Indique si la valeur est une valeur par défaut
+        """
+        self.argument = argument
+        self.text = text
+        self.checked = checked
+        self._has_default_value = has_default
+
+    @classmethod
+    def from_argument(cls, argument: Argument) -> "ArgumentState":
+        """
+        Crée l'état initial d'un argument (valeur par défaut du YAML).
+
+        Args:
+            argument: L'argument
+
+        Returns:
+            L'état tel que ArgumentComponent l'afficherait à sa création
+        """
+        arg_type = argument.type or "string"
+        if arg_type == "flag":
+            return cls(argument, checked=bool(argument.default))
+        if argument.default:
+            return cls(
+                argument,
+                text=normalize_path_for_display(argument.default),
+                checked=arg_type == "valued_option",
+                has_default=True,
+            )
+        return cls(argument)
+
+    def get_argument(self) -> Argument:
+        """Retourne l'objet Argument associé à cet état."""
+        return self.argument
+
+    def get_value(self) -> str:
+        """Retourne la valeur actuelle de l'argument."""
+        return argument_value(self.argument, self.text, self.checked)
+
+    def get_value_tokens(self) -> List[str]:
+        """Retourne la valeur de l'argument sous forme de jetons."""
+        return argument_value_tokens(self.argument, self.text, self.checked)
+
+    def set_value(self, value: str, is_default: bool = False):
+        """
+        Définit la valeur de l'argument (comme ArgumentComponent.set_value).
+
+        Args:
+            value: La valeur à définir
+            is_default: Indique si la valeur est une valeur par défaut
+        """
+        arg_type = self.argument.type or "string"
+
+        if arg_type == "flag":
+            self.checked = value in ["1", "true", "True"]
+        elif arg_type == "valued_option":
+            self.text = value
+            self.checked = bool(value)
+            self._has_default_value = is_default
+        else:
+            self.text = normalize_path_for_display(value)
+            self._has_default_value = is_default
+
+    def has_default_value(self) -> bool:
+        """Indique si l'argument a une valeur par défaut."""
+        return self._has_default_value
+
+
 class ArgumentComponent(QWidget):
     """
     Composant représentant un argument individuel.
@@ -44,6 +206,8 @@ class ArgumentComponent(QWidget):
 
     # Signal émis lorsque la valeur de l'argument change
     value_changed = Signal(str, str)  # (code, value)
+    # Signal émis lorsque le résultat de la validation en direct change
+    validation_changed = Signal(str, object)  # (code, message ou None)
 
     def __init__(
         self,
@@ -63,6 +227,7 @@ class ArgumentComponent(QWidget):
         self.argument = argument
         self.affected_commands = affected_commands or []
         self._has_default_value = False
+        self._validation_error: Optional[str] = None
         self._load_ui()
         self._load_stylesheet()
         self._setup_ui()
@@ -72,8 +237,8 @@ class ArgumentComponent(QWidget):
         current_dir = Path(__file__).parent
         ui_file = current_dir / "argument_component.ui"
 
-        loader = QUiLoader()
-        ui = loader.load(str(ui_file), self)
+        # Module précompilé s'il est à jour, sinon lecture du .ui
+        ui = load_ui(ui_file, self, __package__)
 
         # Configurer le layout pour inclure l'UI chargée
         layout = QHBoxLayout(self)
@@ -88,13 +253,8 @@ class ArgumentComponent(QWidget):
         self.commands_label = ui.findChild(QLabel, "commandsLabel")
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "argument_component.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _setup_ui(self):
         """Configure l'interface utilisateur avec les données de l'argument."""
@@ -129,6 +289,9 @@ class ArgumentComponent(QWidget):
             )
             self.checkbox.stateChanged.connect(self._on_checkbox_changed)
             self.line_edit.textChanged.connect(self._on_value_changed)
+            # La valeur par défaut n'a pas déclenché textChanged
+            if self._has_default_value:
+                self._validate_path(self.line_edit.text())
         else:
             # Type string/file : champ texte classique, pas de checkbox
             self.checkbox.setVisible(False)
@@ -141,6 +304,9 @@ class ArgumentComponent(QWidget):
                 )
                 self._has_default_value = True
             self.line_edit.textChanged.connect(self._on_value_changed)
+            # La valeur par défaut n'a pas déclenché textChanged
+            if self._has_default_value:
+                self._validate_path(self.line_edit.text())
             # Afficher le bouton parcourir pour les fichiers/dossiers
             if arg_type in ["file", "directory"]:
                 self.browse_button.setVisible(True)
@@ -159,8 +325,36 @@ class ArgumentComponent(QWidget):
 
     def _on_value_changed(self, text: str):
         """Gère le changement de valeur dans le champ de saisie."""
+        self._validate_path(text)
         self.value_changed.emit(self.argument.code, text)
 
+    def _validate_path(self, text: str):
+        """Demande la validation en direct d'un argument de type chemin."""
+        if self.argument.type in PATH_ARGUMENT_TYPES:
+            # Existence et droits vérifiés hors du thread de l'interface
+            get_path_validator().validate(self, self.argument, text)
+
+    def set_validation_error(self, message: Optional[str]):
+        """
+        Reçoit le résultat de la validation en direct du champ.
+
+        Args:
+            message: Le message d'erreur (None = valeur valide)
+        """
+        if message == self._validation_error:
+            return
+        self._validation_error = message
+        self.validation_changed.emit(self.argument.code, message)
+
+    def validation_error(self) -> Optional[str]:
+        """
+        Retourne le résultat de la dernière validation en direct.
+
+        Returns:
+            Le message d'erreur, ou None si la valeur est valide
+        """
+        return self._validation_error
+
     def _on_checkbox_changed(self, state: int):
         """Gère le changement d'état de la checkbox."""
         arg_type = self.argument.type or "string"
@@ -206,27 +400,58 @@ class ArgumentComponent(QWidget):
         Returns:
             La valeur saisie
         """
+        return argument_value(self.argument, *self._input_state())
+
+    def get_value_tokens(self) -> List[str]:
+        """
+        Retourne la valeur de l'argument sous forme de jetons de ligne de commande.
+
+        Une valeur saisie (chemin, texte) reste un jeton unique même si elle
+        contient des espaces. Le texte défini dans le YAML pour les flags et
+        préfixes d'options est découpé sur les espaces.
+
+        Returns:
+            La liste des jetons (vide si l'argument n'a pas de valeur)
+        """
+        return argument_value_tokens(self.argument, *self._input_state())
+
+    def _input_state(self):
+        """Retourne le texte saisi et l'état de la case à cocher."""
         arg_type = self.argument.type or "string"
+        text = ""
+        if arg_type != "flag" and self.line_edit:
+            text = self.line_edit.text()
+        checked = arg_type in ("flag", "valued_option") and bool(
+            self.checkbox and self.checkbox.isChecked()
+        )
+        return text, checked
+
+    def get_state(self) -> ArgumentState:
+        """
+        Retourne l'état de la saisie (pour recréer le composant plus tard).
 
-        if arg_type == "flag":
-            # Pour les flags, retourner la valeur définie ou "1" par défaut si coché
-            if self.checkbox and self.checkbox.isChecked():
-                return self.argument.value if self.argument.value else "1"
-            return ""
-        elif arg_type == "valued_option":
-            # Pour les options avec valeur, retourner le préfixe + valeur si la checkbox est cochée
-            if self.checkbox and self.checkbox.isChecked() and self.line_edit:
-                user_value = self.line_edit.text().strip()
-                if user_value:
-                    # Si un préfixe est défini dans argument.value, l'ajouter avant la valeur
-                    prefix = self.argument.value if self.argument.value else ""
-                    if prefix:
-                        return f"{prefix} {user_value}"
-                    return user_value
-            return ""
-        else:
-            # Pour les types classiques, retourner le texte du champ
-            return self.line_edit.text() if self.line_edit else ""
+        Returns:
+            L'état de l'argument
+        """
+        text, checked = self._input_state()
+        return ArgumentState(self.argument, text, checked, self._has_default_value)
+
+    def set_state(self, state: ArgumentState):
+        """
+        Restaure l'état de la saisie, sans émettre value_changed.
+
+        Args:
+            state: L'état à restaurer
+        """
+        self.blockSignals(True)
+        try:
+            if self.line_edit:
+                self.line_edit.setText(state.text)
+            if self.checkbox:
+                self.checkbox.setChecked(state.checked)
+        finally:
+            self.blockSignals(False)
+        self._has_default_value = state.has_default_value()
 
     def set_value(self, value: str, is_default: bool = False):
         """
@@ -274,6 +499,14 @@ class ArgumentComponent(QWidget):
         if self.browse_button:
             self.browse_button.setVisible(enabled)
 
+    def focus_input(self):
+        """Donne le focus au champ de saisie (case à cocher pour un flag)."""
+        if (self.argument.type or "string") == "flag":
+            self.checkbox.setFocus(Qt.FocusReason.OtherFocusReason)
+        else:
+            self.line_edit.setFocus(Qt.FocusReason.OtherFocusReason)
+            self.line_edit.selectAll()
+
     def has_default_value(self) -> bool:
         """
         Indique si l'argument a une valeur par défaut.
@@ -3,9 +3,9 @@ Module contenant la classe CommandComponent qui représente un composant de comm
 """
 
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QDialog,
     QFormLayout,
@@ -16,7 +16,114 @@ from PySide6.QtWidgets import (
 )
 
 from command_builder.components.argument_component import ArgumentComponent
+from command_builder.components.argument_component.argument_component import (
+    ArgumentState,
+)
+from command_builder.components.stylesheet import (
+    apply_application_stylesheet,
+    set_default_value_style,
+    set_validation_style,
+)
+from command_builder.components.ui_loader import load_ui
 from command_builder.models.command import Command
+from command_builder.services.command_template import (
+    compile_template,
+    render_argv,
+    render_command_line,
+)
+
+
+def build_command_text(command: Command, argument_components: Dict[str, dict]) -> str:
+    """
+    Construit la commande complète avec les valeurs des arguments.
+
+    Les valeurs sont protégées par des guillemets selon la plateforme : le
+    texte affiché est aussi celui exécuté par le shell.
+
+    Args:
+        command: La commande
+        argument_components: {code: {"component": ..., "label": ...}}, où
+                             chaque composant fournit get_value() et
+                             get_value_tokens() (ArgumentComponent ou
+                             ArgumentState)
+
+    Returns:
+        La commande complète sous forme de chaîne
+    """
+    template = command.command
+    values = {}
+    for argument in command.arguments or []:
+        arg_data = argument_components.get(argument.code)
+        value = arg_data["component"].get_value() if arg_data else ""
+        arg_type = argument.type or "string"
+        if value:
+            # Flags et options : texte du YAML découpé en jetons
+            if arg_type in ["flag", "valued_option"]:
+                values[argument.code] = arg_data["component"].get_value_tokens()
+            else:
+                values[argument.code] = [value]
+        elif arg_type in ["flag", "valued_option"] or argument.required == 0:
+            # Flags, options et arguments optionnels vides sont retirés
+            values[argument.code] = []
+        else:
+            # Pour les arguments obligatoires vides, afficher un placeholder stylisé
+            template = template.replace(f"{{{argument.code}}}", f"{{{argument.name}}}")
+
+    return render_command_line(template, values)
+
+
+def collect_io_paths(
+    command: Command, argument_components: Dict[str, dict]
+) -> Dict[str, List[str]]:
+    """
+    Retourne les chemins d'entrée et de sortie déclarés par les arguments
+    (propriété role), pour l'exécution incrémentale.
+
+    Args:
+        command: La commande
+        argument_components: {code: {"component": ..., "label": ...}}
+
+    Returns:
+        Dictionnaire {"inputs": [chemins], "outputs": [chemins]}
+        (les arguments vides sont ignorés)
+    """
+    paths = {"inputs": [], "outputs": []}
+    for argument in command.arguments or []:
+        if argument.role is None or argument.code not in argument_components:
+            continue
+        value = argument_components[argument.code]["component"].get_value()
+        if value:
+            paths[f"{argument.role}s"].append(value)
+    return paths
+
+
+def build_command_argv(
+    command: Command, argument_components: Dict[str, dict]
+) -> Optional[List[str]]:
+    """
+    Construit la liste d'arguments pour une exécution directe, sans shell.
+
+    Args:
+        command: La commande
+        argument_components: {code: {"component": ..., "label": ...}}, où
+                             chaque composant fournit get_value_tokens()
+
+    Returns:
+        La liste d'arguments (exécutable en premier), ou None si la
+        commande doit être exécutée via le shell
+    """
+    compiled = compile_template(command.command, command.shell)
+    if compiled.requires_shell:
+        return None
+
+    values = {}
+    for argument in command.arguments or []:
+        arg_data = argument_components.get(argument.code)
+        values[argument.code] = (
+            arg_data["component"].get_value_tokens() if arg_data else []
+        )
+
+    return render_argv(compiled, values)
 
 
 class CommandComponent(QWidget):
@@ -50,8 +157,8 @@ class CommandComponent(QWidget):
         current_dir = Path(__file__).parent
         ui_file = current_dir / "command_component.ui"
 
-        loader = QUiLoader()
-        ui = loader.load(str(ui_file), self)
+        # Module précompilé s'il est à jour, sinon lecture du .ui
+        ui = load_ui(ui_file, self, __package__)
 
         # Configurer le layout pour inclure l'UI chargée
         layout = QVBoxLayout(self)
@@ -72,13 +179,8 @@ class CommandComponent(QWidget):
             self.label_command_cli.mousePressEvent = self._on_command_clicked
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "command_component.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _setup_ui(self):
         """Configure l'interface utilisateur avec les données de la commande."""
@@ -148,6 +250,9 @@ class CommandComponent(QWidget):
         arg_component.value_changed.connect(
             lambda code, value: self._on_argument_changed(code, value, label)
         )
+        arg_component.validation_changed.connect(
+            lambda code, message: set_validation_style(label, message)
+        )
 
         # Stocker la référence avec le label
         self.argument_components[argument.code] = {
@@ -216,6 +321,68 @@ class CommandComponent(QWidget):
             else:
                 self._remove_default_style(arg_data["label"])
 
+    def set_argument_values(self, values: Dict[str, str], is_default: bool = False):
+        """
+        Définit la valeur de plusieurs arguments en une seule mise à jour.
+
+        Les signaux des arguments sont bloqués pendant la mise à jour :
+        l'affichage de la commande n'est recalculé, et arguments_changed
+        émis, qu'une seule fois.
+
+        Args:
+            values: Dictionnaire {code: valeur}
+            is_default: Indique si les valeurs sont des valeurs par défaut
+        """
+        updated = False
+        for code, value in values.items():
+            arg_data = self.argument_components.get(code)
+            if arg_data is None:
+                continue
+            component = arg_data["component"]
+            component.blockSignals(True)
+            try:
+                component.set_value(value, is_default)
+            finally:
+                component.blockSignals(False)
+            set_default_value_style(arg_data["label"], is_default and bool(value))
+            updated = True
+
+        if updated:
+            self._update_command_display()
+            self.arguments_changed.emit(self.get_argument_values())
+
+    def get_argument_states(self) -> Dict[str, ArgumentState]:
+        """
+        Retourne l'état de saisie de chaque argument.
+
+        Returns:
+            Dictionnaire {code: ArgumentState}
+        """
+        return {
+            code: arg_data["component"].get_state()
+            for code, arg_data in self.argument_components.items()
+        }
+
+    def set_argument_states(self, states: Dict[str, ArgumentState]):
+        """
+        Restaure l'état de saisie des arguments sans émettre de signal.
+
+        L'affichage de la commande n'est mis à jour qu'une fois, après la
+        restauration de tous les arguments.
+
+        Args:
+            states: Dictionnaire {code: ArgumentState}
+        """
+        for code, state in states.items():
+            arg_data = self.argument_components.get(code)
+            if arg_data is None:
+                continue
+            arg_data["component"].set_state(state)
+            set_default_value_style(
+                arg_data["label"], state.has_default_value() and bool(state.get_value())
+            )
+        self._update_command_display()
+
     def get_command(self) -> Command:
         """
         Retourne l'objet Command associé à ce composant.
@@ -266,49 +433,28 @@ class CommandComponent(QWidget):
         Returns:
             La commande complète sous forme de chaîne
         """
-        import re
-
-        # Commencer avec la commande de base
-        full_command = self.command.command
-
-        # Remplacer chaque placeholder par sa valeur
-        if self.command.arguments:
-            for argument in self.command.arguments:
-                # Récupérer la valeur actuelle de l'argument
-                value = ""
-                if argument.code in self.argument_components:
-                    value = self.argument_components[argument.code][
-                        "component"
-                    ].get_value()
-
-                # Créer le placeholder
-                placeholder = f"{{{argument.code}}}"
-
-                # Remplacer le placeholder par la valeur ou un texte indicatif
-                if value:
-                    full_command = full_command.replace(placeholder, value)
-                else:
-                    # Pour les options (flag ou valued_option), supprimer complètement le placeholder
-                    # Pour les autres types, vérifier si l'argument est optionnel
-                    arg_type = argument.type or "string"
-                    if arg_type in ["flag", "valued_option"]:
-                        # Pour flag et valued_option, supprimer seulement le placeholder
-                        # (pour valued_option, le préfixe est déjà inclus dans la valeur retournée par get_value())
-                        full_command = full_command.replace(placeholder, "")
-                    elif argument.required == 0:
-                        # Pour les arguments optionnels (required=0) vides, supprimer le placeholder
-                        full_command = full_command.replace(placeholder, "")
-                    else:
-                        # Pour les arguments obligatoires vides, afficher un placeholder stylisé
-                        display_placeholder = argument.name
-                        full_command = full_command.replace(
-                            placeholder, f"{{{display_placeholder}}}"
-                        )
-
-        # Nettoyer les espaces multiples consécutifs
-        full_command = re.sub(r"\s+", " ", full_command).strip()
-
-        return full_command
+        return build_command_text(self.command, self.argument_components)
+
+    def get_io_paths(self) -> Dict[str, List[str]]:
+        """
+        Retourne les chemins d'entrée et de sortie déclarés par les arguments
+        (propriété role), pour l'exécution incrémentale.
+
+        Returns:
+            Dictionnaire {"inputs": [chemins], "outputs": [chemins]}
+            (les arguments vides sont ignorés)
+        """
+        return collect_io_paths(self.command, self.argument_components)
+
+    def build_argv(self) -> Optional[List[str]]:
+        """
+        Construit la liste d'arguments pour une exécution directe, sans shell.
+
+        Returns:
+            La liste d'arguments (exécutable en premier), ou None si la
+            commande doit être exécutée via le shell
+        """
+        return build_command_argv(self.command, self.argument_components)
 
     def _apply_default_style(self, label: QLabel):
         """
@@ -317,9 +463,7 @@ class CommandComponent(QWidget):
         Args:
             label: Le label à styliser
         """
-        label.setProperty("hasDefault", True)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        set_default_value_style(label, True)
 
     def _remove_default_style(self, label: QLabel):
         """
@@ -328,9 +472,7 @@ class CommandComponent(QWidget):
         Args:
             label: Le label à déstyliser
         """
-        label.setProperty("hasDefault", False)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        set_default_value_style(label, False)
 
     def _on_command_clicked(self, event):
         """
@@ -3,23 +3,37 @@ Module contenant la classe CommandForm qui représente le formulaire de commande
 """
 
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterable, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
     QLabel,
     QMessageBox,
-    QScrollArea,
     QSizePolicy,
+    QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
 
 from command_builder.components.argument_component import ArgumentComponent
 from command_builder.components.command_component import CommandComponent
+from command_builder.components.command_form.command_section import CommandSection
+from command_builder.components.command_form.task_page import (
+    DEFAULT_LAZY_COMMAND_THRESHOLD,
+    DEFAULT_MAX_CACHED_PAGES,
+    DEFAULT_MAX_CACHED_WIDGETS,
+    DEFAULT_MAX_REALIZED_SECTIONS,
+    TaskPage,
+    TaskPageCache,
+)
+from command_builder.components.stylesheet import (
+    apply_application_stylesheet,
+    set_default_value_style,
+    set_validation_style,
+)
 from command_builder.models.arguments import Argument
 from command_builder.models.command import Command
 from command_builder.models.task import Task
@@ -27,6 +41,10 @@ from command_builder.services.command_builder_service import CommandBuilderServi
 from command_builder.services.command_validator import CommandValidator
 from command_builder.services.form_state_manager import FormStateManager
 
+# Délai entre la dernière frappe dans un argument partagé et sa propagation
+# aux commandes (ms)
+SHARED_ARGUMENT_DEBOUNCE_MS = 150
+
 
 class CommandForm(QWidget):
     """
@@ -34,6 +52,20 @@ class CommandForm(QWidget):
     Ce composant permet de configurer les paramètres d'une commande.
 
     Cette classe est découplée de CommandComponent grâce à l'injection de dépendances.
+
+    Chaque tâche est affichée dans sa propre page (TaskPage) d'une pile de
+    pages. Les pages des tâches récemment affichées restent en cache (LRU) :
+    revenir à l'une d'elles la réaffiche telle quelle, avec les valeurs saisies,
+    sans reconstruire ses widgets. Une page retirée du cache confie ses valeurs
+    au FormStateManager, qui les restaure si la tâche est rouverte.
+
+    Au-delà de lazy_command_threshold commandes, chaque commande est d'abord
+    une section repliée (CommandSection : case à cocher, nom et aperçu) dont
+    les arguments ne sont créés que lorsqu'elle est dépliée ou visible.
+
+    Les modifications des arguments partagés sont regroupées (anti-rebond) puis
+    propagées aux seuls arguments de commande qu'elles alimentent, grâce à un
+    index construit avec la page : une mise à jour par commande concernée.
     """
 
     # Signal émis lorsque le formulaire est complété
@@ -49,6 +81,10 @@ class CommandForm(QWidget):
         command_widget_factory: Optional[
             Callable[[Command, QWidget, bool], QWidget]
         ] = None,
+        max_cached_pages: int = DEFAULT_MAX_CACHED_PAGES,
+        max_cached_widgets: int = DEFAULT_MAX_CACHED_WIDGETS,
+        lazy_command_threshold: int = DEFAULT_LAZY_COMMAND_THRESHOLD,
+        max_realized_commands: int = DEFAULT_MAX_REALIZED_SECTIONS,
     ):
         """
         Initialise le composant CommandForm.
@@ -58,6 +94,12 @@ class CommandForm(QWidget):
             command_widget_factory: Fonction pour créer un widget de commande.
                                    Signature: (command: Command, parent: QWidget, simple_mode: bool) -> QWidget
                                    Si None, utilise CommandComponent par défaut.
+            max_cached_pages: Nombre maximal de pages de tâches gardées en cache
+            max_cached_widgets: Nombre maximal de widgets de saisie gardés en
+                                cache (toutes pages confondues)
+            lazy_command_threshold: Nombre de commandes au-delà duquel une
+                                    tâche est affichée en sections repliées
+            max_realized_commands: Nombre maximal de sections dépliées par page
         """
         super().__init__(parent)
         self.current_command = None
@@ -67,7 +109,17 @@ class CommandForm(QWidget):
         self.command_checkboxes = []  # Liste des checkboxes pour activer/désactiver les commandes
         self.task_argument_components = []  # Liste des ArgumentComponent pour les arguments de tâche
         self.shared_argument_values = {}  # Valeurs des arguments partagés
+        self.shared_argument_widgets = {}  # {code: arg_data} des arguments partagés
+        self.shared_argument_targets = {}  # {code: [(widget, code argument)]}
+        self._pending_shared_codes = set()  # Arguments partagés à propager
+        self._shared_argument_timer = QTimer(self)
+        self._shared_argument_timer.setSingleShot(True)
+        self._shared_argument_timer.setInterval(SHARED_ARGUMENT_DEBOUNCE_MS)
+        self._shared_argument_timer.timeout.connect(self._flush_shared_arguments)
         self._state_manager = FormStateManager()  # Gestionnaire d'état du formulaire
+        self._page_cache = TaskPageCache(max_cached_pages, max_cached_widgets)
+        self._lazy_command_threshold = lazy_command_threshold
+        self._max_realized_commands = max_realized_commands
         self._command_widget_factory = (
             command_widget_factory or self._default_command_widget_factory
         )
@@ -94,30 +146,21 @@ class CommandForm(QWidget):
         layout.addWidget(ui)
         self.setLayout(layout)
 
-        # Créer un scroll area pour le formulaire
-        self.scroll_area = QScrollArea(ui)
-        self.scroll_area.setMinimumHeight(0)
-        self.scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setObjectName("scrollArea")
-
-        # Créer un conteneur pour le formulaire
-        self.form_container = QWidget()
-        self.form_container.setObjectName("formContainer")
-
-        # Créer un layout vertical pour les CommandComponent
-        self.commands_layout = QVBoxLayout(self.form_container)
-        self.commands_layout.setContentsMargins(10, 10, 10, 10)
-        self.commands_layout.setSpacing(10)
-        self.commands_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        # Ajouter le conteneur au scroll area
-        self.scroll_area.setWidget(self.form_container)
-
-        # Ajouter le scroll area au layout principal
+        # Pile des pages : la page d'accueil (aussi utilisée par set_commands)
+        # puis une page par tâche en cache
+        self.page_stack = QStackedWidget(ui)
+        self.page_stack.setMinimumHeight(0)
+        self.page_stack.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self._default_page = TaskPage(parent=self.page_stack)
+        self.page_stack.addWidget(self._default_page)
+        self.scroll_area = self._default_page
+        self.form_container = self._default_page.form_container
+        self._show_page(self._default_page)
+
+        # Ajouter la pile au layout principal
         main_layout = ui.layout()
         if main_layout:
-            main_layout.addWidget(self.scroll_area)
+            main_layout.addWidget(self.page_stack)
 
         # Afficher le message d'accueil initial
         self._show_welcome_message()
@@ -156,41 +199,67 @@ class CommandForm(QWidget):
         self.commands_layout.addStretch()
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "command_form.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                stylesheet = f.read()
-                self.setStyleSheet(stylesheet)
-                # Stocker le stylesheet pour l'appliquer aux dialogs
-                self._stylesheet = stylesheet
-        else:
-            self._stylesheet = ""
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
-    def _save_current_values(self):
+    def _show_page(self, page: TaskPage, visible: bool = True):
         """
-        Sauvegarde les valeurs actuelles dans le cache avant de changer de tâche.
-        Délègue au FormStateManager.
+        Affiche une page et en fait la page courante du formulaire.
+
+        Args:
+            page: La page à afficher
+            visible: False pour en faire la page courante sans l'afficher
+                     encore (page en construction : ajouter des widgets à une
+                     page visible recalcule sa mise en page à chaque ajout)
+        """
+        if visible:
+            self.page_stack.setCurrentWidget(page)
+        self.current_task = page.task
+        self.current_commands = page.task.commands if page.task else []
+        self.commands_layout = page.commands_layout
+        self.command_components = page.command_components
+        self.command_checkboxes = page.command_checkboxes
+        self.task_argument_components = page.task_argument_components
+        self.shared_argument_values = page.shared_argument_values
+        self.shared_argument_widgets = page.shared_argument_widgets
+        self.shared_argument_targets = page.shared_argument_targets
+
+    def _evict_pages(self, pages):
+        """
+        Détruit des pages retirées du cache, après avoir sauvegardé leurs valeurs
+        dans le FormStateManager.
+
+        Args:
+            pages: Les pages retirées
+        """
+        for page in pages:
+            self._state_manager.save_state(
+                task_name=page.task.name,
+                task_argument_components=page.task_argument_components,
+                command_components=page.command_components,
+                command_checkboxes=page.command_checkboxes,
+            )
+            self.page_stack.removeWidget(page)
+            page.release()
+
+    def set_page_cache_limits(self, max_pages: int, max_widgets: int):
         """
-        if not self.current_task:
-            return
+        Change la taille du cache des pages de tâches.
 
-        self._state_manager.save_state(
-            task_name=self.current_task.name,
-            task_argument_components=self.task_argument_components,
-            command_components=self.command_components,
-            command_checkboxes=self.command_checkboxes,
-        )
+        Args:
+            max_pages: Nombre maximal de pages gardées en cache
+            max_widgets: Nombre maximal de widgets de saisie gardés en cache
+        """
+        self._evict_pages(self._page_cache.set_limits(max_pages, max_widgets))
 
     def _restore_cached_values(self):
         """
-        Restaure les valeurs depuis le cache après avoir chargé une tâche.
-        Délègue au FormStateManager.
+        Restaure les valeurs depuis le cache après avoir construit la page d'une
+        tâche retirée du cache. Délègue au FormStateManager.
         """
         if not self.current_task:
             return
+        has_cached_state = self._state_manager.has_cached_state(self.current_task.name)
 
         # Restaurer les valeurs via le gestionnaire d'état
         restored_shared_values = self._state_manager.restore_state(
@@ -200,6 +269,12 @@ class CommandForm(QWidget):
             command_checkboxes=self.command_checkboxes,
         )
 
+        # Aperçu des sections repliées, dont les valeurs ont été restaurées
+        if has_cached_state:
+            for command_widget in self.command_components:
+                if hasattr(command_widget, "refresh_preview"):
+                    command_widget.refresh_preview()
+
         # Mettre à jour shared_argument_values avec les valeurs restaurées
         self.shared_argument_values.update(restored_shared_values)
 
@@ -212,23 +287,35 @@ class CommandForm(QWidget):
         """
         Configure le formulaire pour afficher une tâche complète avec ses arguments partagés.
 
+        La page de la tâche est reprise du cache si elle y est encore (avec les
+        valeurs en cours de saisie), sinon elle est construite.
+
         Args:
             task: La tâche à afficher
         """
-        # Sauvegarder les valeurs de la tâche actuelle avant de changer
-        self._save_current_values()
-
-        self.current_task = task
-        self.current_commands = task.commands
+        self._flush_shared_arguments()
         self.current_command = None
-        self.shared_argument_values = {}
-
-        # Effacer le formulaire actuel
-        self._clear_form()
+        page = self._page_cache.get(task.name)
+        if page is not None and page.task is not task:
+            # Tâche rechargée depuis le YAML : reconstruire sa page
+            self._evict_pages([self._page_cache.pop(task.name)])
+            page = None
+        if page is not None:
+            self._show_page(page)
+            self.task_loaded.emit()
+            return
 
         if not task.commands or len(task.commands) == 0:
+            self._show_page(self._default_page)
+            self._clear_form()
+            self.current_task = task
+            self.current_commands = task.commands
             return
 
+        page = TaskPage(task, self.page_stack, self._max_realized_commands)
+        self.page_stack.addWidget(page)
+        self._show_page(page, visible=False)
+
         # Initialiser les valeurs partagées avec les valeurs par défaut des arguments de tâche
         if task.arguments:
             for task_arg in task.arguments:
@@ -249,7 +336,19 @@ class CommandForm(QWidget):
             self._add_shared_arguments_section(task.arguments)
 
         # Afficher les commandes
+        lazy = len(task.commands) > self._lazy_command_threshold
         for i, command in enumerate(task.commands, 1):
+            if lazy:
+                # Section repliée : arguments créés à l'affichage
+                section = CommandSection(
+                    command, i, self._command_widget_factory, page.form_container
+                )
+                self.command_checkboxes.append(section.checkbox)
+                self.command_components.append(section)
+                page.add_section(section)
+                self.commands_layout.addWidget(section)
+                continue
+
             # Créer un layout vertical pour chaque commande (titre + contenu)
             command_container_layout = QVBoxLayout()
             command_container_layout.setSpacing(5)
@@ -264,15 +363,13 @@ class CommandForm(QWidget):
             checkbox.setToolTip(
                 "Décochez pour ignorer cette commande lors de l'exécution"
             )
-            checkbox.setStyleSheet("QCheckBox { font-size: 12px; }")
+            checkbox.setObjectName("commandCheckBox")
             self.command_checkboxes.append(checkbox)
             title_layout.addWidget(checkbox)
 
             # Créer un label pour le numéro et le nom
             title_label = QLabel(f"{i}. {command.name}")
-            title_label.setStyleSheet(
-                "font-size: 12px; color: #ffffff ; font-weight: bold;"
-            )
+            title_label.setObjectName("commandTitle")
             title_layout.addWidget(title_label)
             title_layout.addStretch()
 
@@ -290,13 +387,58 @@ class CommandForm(QWidget):
 
         # Ajouter un spacer à la fin
         self.commands_layout.addStretch()
+        self._index_shared_arguments(task)
 
-        # Restaurer les valeurs depuis le cache si disponibles
+        # Restaurer les valeurs si la page avait été retirée du cache
         self._restore_cached_values()
+        self._evict_pages(self._page_cache.add(page))
+        self.page_stack.setCurrentWidget(page)
 
         # Émettre le signal pour activer le bouton Exécuter
         self.task_loaded.emit()
 
+    def focus_argument(
+        self, command_index: Optional[int] = None, argument_code: Optional[str] = None
+    ) -> bool:
+        """
+        Fait défiler la tâche affichée jusqu'à une commande ou un argument et
+        lui donne le focus. Une section repliée est dépliée.
+
+        Args:
+            command_index: L'index de la commande (None = argument partagé)
+            argument_code: Le code de l'argument (None = la commande elle-même)
+
+        Returns:
+            True si l'élément a été trouvé dans le formulaire
+        """
+        if command_index is None:
+            arg_data = self.shared_argument_widgets.get(argument_code)
+            if arg_data is None:
+                return False
+            target = focus = arg_data["component"]
+        elif 0 <= command_index < len(self.command_components):
+            command_widget = self.command_components[command_index]
+            if isinstance(command_widget, CommandSection):
+                command_widget.collapsed_by_user = False
+                command_widget.expand()
+            target = focus = command_widget
+            if command_index < len(self.command_checkboxes):
+                focus = self.command_checkboxes[command_index]
+            arg_data = command_widget.argument_components.get(argument_code)
+            if arg_data is not None and isinstance(arg_data["component"], QWidget):
+                target = focus = arg_data["component"]
+        else:
+            return False
+
+        page = self.page_stack.currentWidget()
+        if isinstance(page, TaskPage):
+            page.ensure_visible(target)
+        if hasattr(focus, "focus_input"):
+            focus.focus_input()
+        else:
+            focus.setFocus(Qt.FocusReason.OtherFocusReason)
+        return True
+
     def set_commands(self, commands, task_name=None):
         """
         Configure le formulaire pour afficher plusieurs commandes avec CommandComponent.
@@ -306,6 +448,8 @@ class CommandForm(QWidget):
             commands: Liste des commandes à afficher
             task_name: Le nom de la tâche (optionnel)
         """
+        self._flush_shared_arguments()
+        self._show_page(self._default_page)
         self.current_commands = commands
         self.current_command = None
         self.current_task = None
@@ -334,9 +478,7 @@ class CommandForm(QWidget):
 
             # Créer un label pour le numéro et le nom
             title_label = QLabel(f"{i}. {command.name}")
-            title_label.setStyleSheet(
-                "font-size: 12px; color: #a0a0a0; font-weight: bold;"
-            )
+            title_label.setObjectName("commandListTitle")
             title_layout.addWidget(title_label)
             title_layout.addStretch()
 
@@ -417,7 +559,6 @@ class CommandForm(QWidget):
         )
         arg_label.setMinimumWidth(200)
         arg_label.setMaximumWidth(200)
-        arg_label.setStyleSheet("font-weight: normal;")
 
         # Créer le composant
         arg_component = ArgumentComponent(
@@ -431,15 +572,18 @@ class CommandForm(QWidget):
             )
 
         arg_component.value_changed.connect(make_handler(arg_label))
+        arg_component.validation_changed.connect(
+            lambda code, message: set_validation_style(arg_label, message)
+        )
 
         # Appliquer le style initial si valeur par défaut
         if arg_component.has_default_value():
             self._apply_default_style(arg_label)
 
         # Stocker la référence
-        self.task_argument_components.append(
-            {"component": arg_component, "label": arg_label}
-        )
+        arg_data = {"component": arg_component, "label": arg_label}
+        self.task_argument_components.append(arg_data)
+        self.shared_argument_widgets[task_arg.code] = arg_data
 
         # Ajouter au layout
         arg_layout.addWidget(arg_label)
@@ -456,28 +600,55 @@ class CommandForm(QWidget):
         """
         Gère le changement de valeur d'un argument partagé.
 
+        La valeur est enregistrée tout de suite ; sa propagation aux commandes
+        attend SHARED_ARGUMENT_DEBOUNCE_MS ms sans nouvelle frappe.
+
         Args:
             code: Code de l'argument
             value: Nouvelle valeur
             label: Le label associé à l'argument
         """
         # Mettre à jour le style du label selon si la valeur est vide ou non
-        for arg_data in self.task_argument_components:
-            if arg_data["component"].get_argument().code == code:
-                if arg_data["component"].has_default_value() and value:
-                    self._apply_default_style(label)
-                else:
-                    self._remove_default_style(label)
-                break
-
-        # Stocker la valeur
+        arg_data = self.shared_argument_widgets.get(code)
+        if arg_data is not None:
+            if arg_data["component"].has_default_value() and value:
+                self._apply_default_style(label)
+            else:
+                self._remove_default_style(label)
+
+        # Stocker la valeur et planifier sa propagation
         self.shared_argument_values[code] = value
+        self._pending_shared_codes.add(code)
+        self._shared_argument_timer.start()
 
-        # Propager la valeur aux commandes concernées
-        if self.current_task:
-            self.current_task.apply_shared_arguments(self.shared_argument_values)
-            # Rafraîchir l'affichage des commandes
-            self._refresh_command_displays()
+    def _flush_shared_arguments(self):
+        """Propage sans attendre les arguments partagés modifiés depuis la dernière propagation."""
+        self._shared_argument_timer.stop()
+        codes, self._pending_shared_codes = self._pending_shared_codes, set()
+        if codes and self.current_task:
+            self.current_task.apply_shared_arguments(self.shared_argument_values, codes)
+            self._refresh_command_displays(codes)
+
+    def _index_shared_arguments(self, task: Task):
+        """
+        Indexe, pour chaque argument partagé, les arguments de commande qu'il alimente.
+
+        Args:
+            task: La tâche affichée
+        """
+        widgets_by_name = {}
+        for command_widget in self.command_components:
+            command = getattr(command_widget, "command", None)
+            if command is not None:
+                widgets_by_name.setdefault(command.name, command_widget)
+
+        self.shared_argument_targets.clear()
+        for task_arg in task.arguments or []:
+            self.shared_argument_targets[task_arg.code] = [
+                (widgets_by_name[target.command], target.argument)
+                for target in task_arg.values
+                if target.command in widgets_by_name
+            ]
 
     def _clear_form(self):
         """
@@ -506,40 +677,41 @@ class CommandForm(QWidget):
         self.command_checkboxes.clear()
         self.task_argument_components.clear()
 
-    def _refresh_command_displays(self):
+    def _refresh_command_displays(self, codes: Optional[Iterable[str]] = None):
         """
         Rafraîchit l'affichage des commandes après modification des arguments partagés.
         Met à jour en temps réel les valeurs dans les ArgumentComponent des commandes.
+
+        Les valeurs sont regroupées par commande : chaque commande concernée
+        reçoit une seule mise à jour (signaux bloqués, un seul rendu).
+
+        Args:
+            codes: Codes des arguments partagés à propager (None = tous)
         """
         if not self.current_task:
             return
+        if codes is None:
+            codes = list(self.shared_argument_values)
 
-        # Pour chaque argument partagé modifié
-        for task_arg_code, shared_value in self.shared_argument_values.items():
-            # Trouver l'argument de tâche correspondant (méthode héritée de WithArguments)
-            task_arg = self.current_task.get_argument_by_code(task_arg_code)
-            if not task_arg:
+        updates: Dict[int, tuple] = {}
+        for code in codes:
+            if code not in self.shared_argument_values:
                 continue
-
-            # Pour chaque cible (commande + argument)
-            for target in task_arg.values:
-                # Trouver le CommandComponent correspondant
-                for command_widget in self.command_components:
-                    if (
-                        hasattr(command_widget, "command")
-                        and command_widget.command.name == target.command
-                    ):
-                        # Trouver l'ArgumentComponent correspondant dans ce CommandComponent
-                        if hasattr(command_widget, "argument_components"):
-                            arg_data = command_widget.argument_components.get(
-                                target.argument
-                            )
-                            if arg_data and hasattr(arg_data["component"], "set_value"):
-                                # Mettre à jour la valeur en temps réel avec le flag is_default
-                                arg_data["component"].set_value(
-                                    shared_value, is_default=True
-                                )
-                        break
+            shared_value = self.shared_argument_values[code]
+            for command_widget, argument_code in self.shared_argument_targets.get(
+                code, ()
+            ):
+                _, values = updates.setdefault(id(command_widget), (command_widget, {}))
+                values[argument_code] = shared_value
+
+        for command_widget, values in updates.values():
+            if hasattr(command_widget, "set_argument_values"):
+                command_widget.set_argument_values(values, is_default=True)
+            elif hasattr(command_widget, "argument_components"):
+                for argument_code, shared_value in values.items():
+                    arg_data = command_widget.argument_components.get(argument_code)
+                    if arg_data and hasattr(arg_data["component"], "set_value"):
+                        arg_data["component"].set_value(shared_value, is_default=True)
 
     def _clear_layout(self, layout):
         """
@@ -563,6 +735,7 @@ class CommandForm(QWidget):
         Returns:
             Un dictionnaire contenant les valeurs de tous les arguments
         """
+        self._flush_shared_arguments()
         values = {}
 
         # Parcourir tous les widgets de commande
@@ -581,6 +754,7 @@ class CommandForm(QWidget):
         
         Délègue la validation à CommandValidator et la construction à CommandBuilderService.
         """
+        self._flush_shared_arguments()
         if not self.command_components:
             return
 
@@ -599,6 +773,7 @@ class CommandForm(QWidget):
         commands_list = CommandBuilderService.build_commands_list(
             self.command_components,
             self.command_checkboxes,
+            session=bool(self.current_task and self.current_task.session),
         )
 
         # Vérifier qu'au moins une commande est cochée
@@ -622,7 +797,6 @@ class CommandForm(QWidget):
         msg_box.setWindowTitle("Arguments manquants")
         msg_box.setText("Veuillez remplir tous les champs obligatoires :")
         msg_box.setInformativeText(error_text)
-        msg_box.setStyleSheet(self._stylesheet)
         msg_box.exec()
 
     def _show_no_command_selected_error(self):
@@ -633,7 +807,6 @@ class CommandForm(QWidget):
         msg_box.setIcon(QMessageBox.Warning)
         msg_box.setWindowTitle("Aucune commande sélectionnée")
         msg_box.setText("Veuillez cocher au moins une commande à exécuter.")
-        msg_box.setStyleSheet(self._stylesheet)
         msg_box.exec()
 
     def _apply_default_style(self, label: QLabel):
@@ -643,9 +816,7 @@ class CommandForm(QWidget):
         Args:
             label: Le label à styliser
         """
-        label.setProperty("hasDefault", True)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        set_default_value_style(label, True)
 
     def _remove_default_style(self, label: QLabel):
         """
@@ -654,6 +825,4 @@ class CommandForm(QWidget):
         Args:
             label: Le label à déstyliser
         """
-        label.setProperty("hasDefault", False)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        set_default_value_style(label, False)
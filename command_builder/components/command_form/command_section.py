@@ -0,0 +1,278 @@
+"""
+Module contenant la classe CommandSection, commande repliable d'un formulaire
+paresseux.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QCheckBox, QLabel, QVBoxLayout, QWidget
+
+from command_builder.components.argument_component.argument_component import (
+    ArgumentState,
+)
+from command_builder.components.command_component.command_component import (
+    build_command_argv,
+    build_command_text,
+    collect_io_paths,
+)
+from command_builder.models.command import Command
+
+# Symboles de la ligne de dépliage (replié, déplié)
+COLLAPSED_ARROW = "▸"
+EXPANDED_ARROW = "▾"
+
+# Texte de la ligne de dépliage d'une section dépliée
+EXPANDED_TEXT = f"{EXPANDED_ARROW} Masquer les arguments"
+
+
+class CommandSection(QWidget):
+    """
+    Commande d'une grosse tâche, affichée repliée tant qu'elle n'est pas utile.
+
+    Repliée, la section ne contient qu'une case à cocher portant le nom de la
+    commande et l'aperçu de la commande (cliquable pour la déplier) ; elle
+    garde les valeurs de ses arguments dans des ArgumentState. Le widget de
+    commande (et ses ArgumentComponent) n'est créé que lorsqu'elle est
+    dépliée, et détruit de nouveau lorsqu'elle est repliée, ses valeurs étant
+    reprises dans les ArgumentState.
+
+    La section offre les mêmes méthodes que CommandComponent pour la
+    validation, la construction des commandes et la sauvegarde de l'état du
+    formulaire, qu'elle soit dépliée ou non.
+    """
+
+    # Signal émis lorsque les arguments changent (section dépliée)
+    arguments_changed = Signal(dict)  # {code: value}
+    # Signal émis lorsque la section est dépliée (True) ou repliée (False)
+    expanded_changed = Signal(bool)
+
+    def __init__(
+        self,
+        command: Command,
+        index: int,
+        widget_factory: Callable[[Command, QWidget, bool], QWidget],
+        parent=None,
+    ):
+        """
+        Crée la section repliée d'une commande.
+
+        Args:
+            command: La commande
+            index: Le numéro de la commande dans la tâche (à partir de 1)
+            widget_factory: Fonction créant le widget de commande.
+                            Signature: (command, parent, simple_mode) -> QWidget
+            parent: Le widget parent
+        """
+        super().__init__(parent)
+        self.command = command
+        self.body: Optional[QWidget] = None
+        self.collapsed_by_user = False
+        self._widget_factory = widget_factory
+        self._states: Dict[str, dict] = {
+            argument.code: {
+                "component": ArgumentState.from_argument(argument),
+                "label": None,
+            }
+            for argument in command.arguments or []
+        }
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(5)
+
+        # Un minimum de widgets par section : la case à cocher porte le nom de
+        # la commande, l'aperçu sert aussi à déplier et replier la section
+        self.checkbox = QCheckBox(f"{index}. {command.name}", self)
+        self.checkbox.setChecked(True)  # Cochée par défaut
+        self.checkbox.setToolTip(
+            "Décochez pour ignorer cette commande lors de l'exécution"
+        )
+        self.checkbox.setObjectName("commandCheckBox")
+        self._layout.addWidget(self.checkbox)
+
+        self.preview_label = QLabel(self)
+        self.preview_label.setObjectName("commandPreview")
+        self.preview_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.preview_label.setToolTip("Cliquer pour afficher ou masquer les arguments")
+        self.preview_label.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.preview_label.mousePressEvent = self._on_preview_clicked
+        self._layout.addWidget(self.preview_label)
+        self.refresh_preview()
+
+    @property
+    def is_expanded(self) -> bool:
+        """Indique si le widget de commande est créé."""
+        return self.body is not None
+
+    @property
+    def argument_components(self) -> Dict[str, dict]:
+        """
+        Arguments de la commande : ceux du widget de commande si la section
+        est dépliée, les ArgumentState sinon.
+
+        Returns:
+            Dictionnaire {code: {"component": ..., "label": ...}}
+        """
+        if self.body is not None:
+            return self.body.argument_components
+        return self._states
+
+    @property
+    def widget_count(self) -> int:
+        """Nombre de widgets de saisie créés (aucun si la section est repliée)."""
+        if self.body is None:
+            return 0
+        return len(self.body.argument_components)
+
+    def expand(self):
+        """Crée le widget de commande et y restaure les valeurs des arguments."""
+        if self.body is not None:
+            return
+        self.body = self._widget_factory(self.command, self, simple_mode=True)
+        if hasattr(self.body, "set_argument_states"):
+            self.body.set_argument_states(
+                {code: data["component"] for code, data in self._states.items()}
+            )
+        if hasattr(self.body, "arguments_changed"):
+            self.body.arguments_changed.connect(self.arguments_changed)
+        self._layout.addWidget(self.body)
+        self.body.show()  # Sans attendre le prochain tour de boucle
+        self.preview_label.setText(EXPANDED_TEXT)
+        self.expanded_changed.emit(True)
+
+    def collapse(self):
+        """Reprend les valeurs des arguments puis détruit le widget de commande."""
+        if self.body is None:
+            return
+        body, self.body = self.body, None
+        if hasattr(body, "get_argument_states"):
+            for code, state in body.get_argument_states().items():
+                if code in self._states:
+                    self._states[code]["component"] = state
+        if hasattr(body, "remove_all_arguments"):
+            body.remove_all_arguments()
+        self._layout.removeWidget(body)
+        body.hide()
+        body.deleteLater()
+        self.refresh_preview()
+        self.updateGeometry()
+        self.expanded_changed.emit(False)
+
+    def toggle(self):
+        """Déplie ou replie la section à la demande de l'utilisateur."""
+        if self.body is None:
+            self.collapsed_by_user = False
+            self.expand()
+        else:
+            self.collapsed_by_user = True
+            self.collapse()
+
+    def _on_preview_clicked(self, event):
+        """Déplie ou replie la section quand on clique sur son aperçu."""
+        self.toggle()
+
+    def refresh_preview(self):
+        """Met à jour l'aperçu de la commande (section repliée)."""
+        if self.body is None:
+            self.preview_label.setText(
+                f"{COLLAPSED_ARROW} {build_command_text(self.command, self._states)}"
+            )
+
+    def get_command(self) -> Command:
+        """
+        Retourne l'objet Command associé à cette section.
+
+        Returns:
+            L'objet Command
+        """
+        return self.command
+
+    def get_argument_values(self) -> dict:
+        """
+        Retourne les valeurs de tous les arguments.
+
+        Returns:
+            Dictionnaire {code: value}
+        """
+        return {
+            code: arg_data["component"].get_value()
+            for code, arg_data in self.argument_components.items()
+        }
+
+    def set_argument_value(self, code: str, value: str, is_default: bool = False):
+        """
+        Définit la valeur d'un argument spécifique.
+
+        Args:
+            code: Le code de l'argument
+            value: La valeur à définir
+            is_default: Indique si la valeur est une valeur par défaut
+        """
+        if self.body is not None:
+            self.body.set_argument_value(code, value, is_default)
+        elif code in self._states:
+            self._states[code]["component"].set_value(value, is_default)
+            self.refresh_preview()
+
+    def set_argument_values(self, values: Dict[str, str], is_default: bool = False):
+        """
+        Définit la valeur de plusieurs arguments en une seule mise à jour.
+
+        Args:
+            values: Dictionnaire {code: valeur}
+            is_default: Indique si les valeurs sont des valeurs par défaut
+        """
+        if self.body is not None:
+            self.body.set_argument_values(values, is_default)
+            return
+        for code, value in values.items():
+            if code in self._states:
+                self._states[code]["component"].set_value(value, is_default)
+        self.refresh_preview()
+
+    def clear_arguments(self):
+        """Efface toutes les valeurs des arguments."""
+        if self.body is not None:
+            self.body.clear_arguments()
+            return
+        for arg_data in self._states.values():
+            arg_data["component"].set_value("")
+        self.refresh_preview()
+
+    def remove_all_arguments(self):
+        """Détruit le widget de commande et oublie les valeurs des arguments."""
+        if self.body is not None:
+            if hasattr(self.body, "remove_all_arguments"):
+                self.body.remove_all_arguments()
+            self._layout.removeWidget(self.body)
+            self.body.deleteLater()
+            self.body = None
+        self._states.clear()
+
+    def _build_full_command(self) -> str:
+        """
+        Construit la commande complète avec les valeurs des arguments.
+
+        Returns:
+            La commande complète sous forme de chaîne
+        """
+        return build_command_text(self.command, self.argument_components)
+
+    def get_io_paths(self) -> Dict[str, List[str]]:
+        """
+        Retourne les chemins d'entrée et de sortie déclarés par les arguments.
+
+        Returns:
+            Dictionnaire {"inputs": [chemins], "outputs": [chemins]}
+        """
+        return collect_io_paths(self.command, self.argument_components)
+
+    def build_argv(self) -> Optional[List[str]]:
+        """
+        Construit la liste d'arguments pour une exécution directe, sans shell.
+
+        Returns:
+            La liste d'arguments, ou None si la commande passe par le shell
+        """
+        return build_command_argv(self.command, self.argument_components)
@@ -0,0 +1,323 @@
+"""
+Module contenant les pages du formulaire (une par tâche) et leur cache.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QEvent, Qt, QTimer
+from PySide6.QtWidgets import (
+    QApplication,
+    QScrollArea,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
+
+from command_builder.components.command_form.command_section import CommandSection
+from command_builder.models.task import Task
+
+# Nombre maximal de pages gardées en cache
+DEFAULT_MAX_CACHED_PAGES = 8
+
+# Nombre maximal de widgets de saisie (commandes et arguments) gardés en cache,
+# toutes pages confondues : les grosses tâches occupent davantage de mémoire
+DEFAULT_MAX_CACHED_WIDGETS = 1500
+
+# Au-delà de ce nombre de commandes, la tâche est affichée en sections
+# repliées dont les arguments ne sont créés qu'à l'affichage
+DEFAULT_LAZY_COMMAND_THRESHOLD = 50
+
+# Nombre maximal de sections dépliées (widgets créés) par page
+DEFAULT_MAX_REALIZED_SECTIONS = 30
+
+
+class TaskPage(QScrollArea):
+    """
+    Page défilante du formulaire contenant les widgets d'une tâche.
+
+    La page garde ses composants et leur état (valeurs saisies, cases cochées,
+    position de défilement) tant qu'elle est en cache.
+
+    Les commandes d'une grosse tâche y sont des CommandSection repliées : à
+    chaque défilement ou redimensionnement, la page déplie les sections
+    visibles et replie les moins récemment dépliées hors de la vue au-delà
+    de max_realized_sections.
+    """
+
+    def __init__(
+        self,
+        task: Optional[Task] = None,
+        parent=None,
+        max_realized_sections: int = DEFAULT_MAX_REALIZED_SECTIONS,
+    ):
+        """
+        Crée une page vide.
+
+        Args:
+            task: La tâche affichée (None pour la page d'accueil)
+            parent: Le widget parent
+            max_realized_sections: Nombre maximal de sections dépliées
+        """
+        super().__init__(parent)
+        self.task = task
+        self.command_components = []
+        self.command_checkboxes = []
+        self.task_argument_components = []
+        self.shared_argument_values = {}
+        # Index des arguments partagés : {code: arg_data} et
+        # {code: [(widget de commande, code de l'argument ciblé)]}
+        self.shared_argument_widgets = {}
+        self.shared_argument_targets = {}
+        self.lazy_sections: List[CommandSection] = []
+        self.max_realized_sections = max(max_realized_sections, 1)
+        self._realized: Dict[int, CommandSection] = OrderedDict()
+
+        # Dépliage groupé après les défilements et redimensionnements
+        self._realize_timer = QTimer(self)
+        self._realize_timer.setSingleShot(True)
+        self._realize_timer.setInterval(0)
+        self._realize_timer.timeout.connect(self.realize_visible_sections)
+
+        self.setMinimumHeight(0)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.setWidgetResizable(True)
+        self.setObjectName("scrollArea")
+
+        self.form_container = QWidget()
+        self.form_container.setObjectName("formContainer")
+        self.commands_layout = QVBoxLayout(self.form_container)
+        self.commands_layout.setContentsMargins(10, 10, 10, 10)
+        self.commands_layout.setSpacing(10)
+        self.commands_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.setWidget(self.form_container)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_realization)
+
+    @property
+    def widget_count(self) -> int:
+        """Nombre de widgets de saisie de la page (coût mémoire approximatif)."""
+        count = len(self.command_components) + len(self.task_argument_components)
+        for command_widget in self.command_components:
+            if hasattr(command_widget, "widget_count"):
+                count += command_widget.widget_count
+            else:
+                count += len(getattr(command_widget, "argument_components", ()))
+        return count
+
+    def add_section(self, section: CommandSection):
+        """
+        Enregistre une section repliée de la page.
+
+        Args:
+            section: La section (déjà ajoutée au layout)
+        """
+        self.lazy_sections.append(section)
+        section.expanded_changed.connect(
+            lambda expanded: self._on_section_expanded(section, expanded)
+        )
+
+    def schedule_realization(self):
+        """Demande le dépliage des sections visibles au prochain tour de boucle."""
+        if self.lazy_sections:
+            self._realize_timer.start()
+
+    def realize_visible_sections(self):
+        """
+        Déplie les sections visibles et replie les plus anciennes hors de la vue.
+
+        Les sections repliées par l'utilisateur le restent. La mise en page est
+        appliquée après chaque section dépliée, qui décale les suivantes : seules
+        les sections réellement visibles sont dépliées.
+        """
+        if not self.isVisible():
+            return  # Géométrie des sections pas encore calculée
+        self._apply_pending_layout()
+        top = self.verticalScrollBar().value()
+        bottom = top + self.viewport().height()
+        visible = set()
+        for section in self.lazy_sections:
+            y = section.y()
+            if y > bottom:
+                break
+            if y + section.height() < top:
+                continue
+            visible.add(id(section))
+            if not section.is_expanded and not section.collapsed_by_user:
+                section.expand()
+                self._apply_pending_layout()
+
+        # Libérer les sections les moins récemment dépliées hors de la vue
+        for key in list(self._realized):
+            if len(self._realized) <= self.max_realized_sections:
+                break
+            if key in visible:
+                continue
+            section = self._realized[key]
+            height = section.height()
+            section.collapse()
+            if section.y() + height < top:
+                # Section au-dessus de la vue : garder le contenu visible en place
+                lost = height - section.sizeHint().height()
+                self.verticalScrollBar().setValue(top - lost)
+                top -= lost
+
+    def ensure_visible(self, widget: QWidget):
+        """
+        Fait défiler la page jusqu'à un widget.
+
+        Args:
+            widget: Le widget (descendant de la page)
+        """
+        self._apply_pending_layout()
+        self.ensureWidgetVisible(widget)
+
+    @staticmethod
+    def _apply_pending_layout():
+        """Applique les mises en page en attente (géométrie des sections à jour)."""
+        # Deux passes : celle des sections puis celle du conteneur, que la page
+        # redimensionne à la nouvelle hauteur de son contenu
+        for _ in range(2):
+            QApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest)
+
+    def _on_section_expanded(self, section: CommandSection, expanded: bool):
+        """Tient à jour l'ordre de dépliage des sections (LRU)."""
+        self._realized.pop(id(section), None)
+        if expanded:
+            self._realized[id(section)] = section
+
+    def showEvent(self, event):
+        """Déplie les sections visibles à l'affichage de la page."""
+        super().showEvent(event)
+        self.schedule_realization()
+
+    def resizeEvent(self, event):
+        """Déplie les sections devenues visibles après un redimensionnement."""
+        super().resizeEvent(event)
+        self.schedule_realization()
+
+    def release(self):
+        """Détruit les composants de la page."""
+        self._realize_timer.stop()
+        self.lazy_sections.clear()
+        self._realized.clear()
+        for command_widget in self.command_components:
+            if hasattr(command_widget, "remove_all_arguments"):
+                command_widget.remove_all_arguments()
+        self.command_components.clear()
+        self.command_checkboxes.clear()
+        self.task_argument_components.clear()
+        self.shared_argument_widgets.clear()
+        self.shared_argument_targets.clear()
+        self.deleteLater()
+
+
+class TaskPageCache:
+    """
+    Cache LRU des pages du formulaire, indexé par nom de tâche.
+
+    Les pages les moins récemment affichées sont retirées au-delà de
+    max_pages pages ou de max_widgets widgets de saisie ; la page la plus
+    récente n'est jamais retirée.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_CACHED_PAGES,
+        max_widgets: int = DEFAULT_MAX_CACHED_WIDGETS,
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            max_pages: Nombre maximal de pages gardées
+            max_widgets: Nombre maximal de widgets de saisie gardés
+        """
+        self.max_pages = max(max_pages, 1)
+        self.max_widgets = max_widgets
+        self._pages: Dict[str, TaskPage] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Nombre de pages en cache."""
+        return len(self._pages)
+
+    def __contains__(self, task_name: str) -> bool:
+        """Indique si une page est en cache pour cette tâche."""
+        return task_name in self._pages
+
+    @property
+    def pages(self) -> List[TaskPage]:
+        """Pages en cache, de la moins à la plus récemment affichée."""
+        return list(self._pages.values())
+
+    @property
+    def widget_count(self) -> int:
+        """Nombre total de widgets de saisie en cache."""
+        return sum(page.widget_count for page in self._pages.values())
+
+    def get(self, task_name: str) -> Optional[TaskPage]:
+        """
+        Retourne la page d'une tâche et la marque comme la plus récente.
+
+        Args:
+            task_name: Le nom de la tâche
+
+        Returns:
+            La page, ou None si elle n'est pas en cache
+        """
+        page = self._pages.get(task_name)
+        if page is not None:
+            self._pages.move_to_end(task_name)
+        return page
+
+    def add(self, page: TaskPage) -> List[TaskPage]:
+        """
+        Ajoute une page (la plus récente) et retire celles qui dépassent les limites.
+
+        Args:
+            page: La page construite
+
+        Returns:
+            Les pages retirées du cache
+        """
+        self._pages[page.task.name] = page
+        self._pages.move_to_end(page.task.name)
+        return self._evict()
+
+    def pop(self, task_name: str) -> Optional[TaskPage]:
+        """
+        Retire la page d'une tâche.
+
+        Args:
+            task_name: Le nom de la tâche
+
+        Returns:
+            La page retirée, ou None
+        """
+        return self._pages.pop(task_name, None)
+
+    def set_limits(self, max_pages: int, max_widgets: int) -> List[TaskPage]:
+        """
+        Change les limites du cache.
+
+        Args:
+            max_pages: Nombre maximal de pages gardées
+            max_widgets: Nombre maximal de widgets de saisie gardés
+
+        Returns:
+            Les pages retirées du cache
+        """
+        self.max_pages = max(max_pages, 1)
+        self.max_widgets = max_widgets
+        return self._evict()
+
+    def _evict(self) -> List[TaskPage]:
+        """Retire les pages les plus anciennes au-delà des limites."""
+        evicted = []
+        widgets = self.widget_count
+        while len(self._pages) > 1 and (
+            len(self._pages) > self.max_pages or widgets > self.max_widgets
+        ):
+            _, page = self._pages.popitem(last=False)
+            widgets -= page.widget_count
+            evicted.append(page)
+        return evicted
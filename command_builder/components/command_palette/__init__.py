@@ -0,0 +1,5 @@
+"""Palette d'ouverture rapide des tâches (Ctrl+P)."""
+
+from .command_palette import CommandPalette
+
+__all__ = ["CommandPalette"]
@@ -0,0 +1,179 @@
+"""
+Module contenant la classe CommandPalette, palette d'ouverture rapide (Ctrl+P).
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6 import QtUiTools
+from PySide6.QtCore import QEvent, QObject, Qt, Signal
+from PySide6.QtWidgets import (
+    QApplication,
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+)
+
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.services.task_search_index import (
+    KIND_ARGUMENT,
+    KIND_COMMAND,
+    KIND_SHARED_ARGUMENT,
+    KIND_TASK,
+    SearchResult,
+    TaskSearchIndex,
+)
+
+# Libellé affiché devant chaque type de résultat
+KIND_LABELS = {
+    KIND_TASK: "Tâche",
+    KIND_COMMAND: "Commande",
+    KIND_SHARED_ARGUMENT: "Argument partagé",
+    KIND_ARGUMENT: "Argument",
+}
+
+# Touches transmises du champ de recherche à la liste des résultats
+_NAVIGATION_KEYS = (
+    Qt.Key.Key_Up,
+    Qt.Key.Key_Down,
+    Qt.Key.Key_PageUp,
+    Qt.Key.Key_PageDown,
+)
+
+
+class CommandPalette(QDialog):
+    """
+    Palette de recherche des tâches, commandes et arguments du catalogue.
+
+    La recherche est faite à chaque frappe dans un TaskSearchIndex construit
+    au chargement du catalogue : la palette ne parcourt jamais les tâches.
+    Haut/Bas parcourent les résultats sans quitter le champ de recherche,
+    Entrée ouvre le résultat sélectionné et Échap ferme la palette.
+    """
+
+    # Signal émis lorsqu'un résultat est choisi
+    result_chosen = Signal(object)  # SearchResult
+
+    def __init__(self, index: Optional[TaskSearchIndex] = None, parent=None):
+        """
+        Initialise la palette.
+
+        Args:
+            index: L'index de recherche du catalogue
+            parent: Widget parent
+        """
+        super().__init__(parent)
+        self.index = index if index is not None else TaskSearchIndex()
+        self._results: List[SearchResult] = []
+        self._load_ui()
+        self._load_stylesheet()
+
+        self.line_edit.textChanged.connect(self._on_text_changed)
+        self.line_edit.returnPressed.connect(self._choose_current)
+        self.line_edit.installEventFilter(self)
+        self.result_list.itemActivated.connect(self._choose_current)
+        self.result_list.itemClicked.connect(self._choose_current)
+
+    def _load_ui(self):
+        """Charge l'interface depuis le fichier .ui."""
+        ui_file = Path(__file__).parent / "command_palette.ui"
+        loader = QtUiTools.QUiLoader()
+        ui = loader.load(str(ui_file))
+
+        self.resize(ui.size())
+        self.setWindowTitle(ui.windowTitle())
+        self.setLayout(ui.layout())
+
+        self.line_edit = self.findChild(QLineEdit, "paletteLineEdit")
+        self.result_list = self.findChild(QListWidget, "paletteResultList")
+        self.status_label = self.findChild(QLabel, "paletteStatusLabel")
+
+    def _load_stylesheet(self):
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
+
+    def set_index(self, index: TaskSearchIndex):
+        """
+        Remplace l'index de recherche (catalogue rechargé).
+
+        Args:
+            index: Le nouvel index
+        """
+        self.index = index
+        self.search(self.line_edit.text())
+
+    def popup(self):
+        """Affiche la palette, champ de recherche vidé et prêt à la saisie."""
+        self.line_edit.clear()
+        self.search("")
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.line_edit.setFocus(Qt.FocusReason.PopupFocusReason)
+
+    def search(self, text: str):
+        """
+        Affiche les résultats d'une recherche.
+
+        Args:
+            text: Le texte recherché
+        """
+        self._results = self.index.search(text)
+        self.result_list.clear()
+        for result in self._results:
+            item = QListWidgetItem(
+                f"{result.title}\n{KIND_LABELS[result.kind]} · {result.detail}"
+            )
+            item.setToolTip(result.detail)
+            self.result_list.addItem(item)
+        if self._results:
+            self.result_list.setCurrentRow(0)
+
+        if not text.strip():
+            self.status_label.setText(f"{len(self.index)} éléments indexés")
+        elif self._results:
+            self.status_label.setText(f"{len(self._results)} résultat(s)")
+        else:
+            self.status_label.setText("Aucun résultat")
+
+    @property
+    def results(self) -> List[SearchResult]:
+        """Résultats affichés, les plus pertinents en premier."""
+        return self._results
+
+    def current_result(self) -> Optional[SearchResult]:
+        """
+        Retourne le résultat sélectionné.
+
+        Returns:
+            Le résultat, ou None si la liste est vide
+        """
+        row = self.result_list.currentRow()
+        if 0 <= row < len(self._results):
+            return self._results[row]
+        return None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Parcourt les résultats avec les flèches sans quitter le champ de recherche."""
+        if (
+            watched is self.line_edit
+            and event.type() == QEvent.Type.KeyPress
+            and event.key() in _NAVIGATION_KEYS
+        ):
+            QApplication.sendEvent(self.result_list, event)
+            return True
+        return super().eventFilter(watched, event)
+
+    def _on_text_changed(self, text: str):
+        """Met à jour les résultats à chaque frappe."""
+        self.search(text)
+
+    def _choose_current(self, *_args):
+        """Ferme la palette et signale le résultat sélectionné."""
+        result = self.current_result()
+        if result is None:
+            return
+        self.accept()
+        self.result_chosen.emit(result)
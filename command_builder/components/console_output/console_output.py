@@ -2,23 +2,79 @@
 Module contenant la classe ConsoleOutput qui représente la sortie console.
 """
 
+import csv
 import datetime
-import os
-import subprocess
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
     QFileDialog,
     QLabel,
+    QLineEdit,
     QPlainTextEdit,
+    QProgressBar,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
-from command_builder.services.command_executor import CommandExecutorService
+from command_builder.components.console_output.console_view import (
+    DEFAULT_SCROLLBACK_LINES,
+    ConsoleView,
+)
+from command_builder.components.console_output.search_controller import (
+    ConsoleSearchController,
+)
+from command_builder.components.log_viewer import LogViewer
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.models.run_record import (
+    ResourceUsage,
+    RunRecord,
+    format_run_summary,
+)
+from command_builder.services.ansi_parser import DEFAULT_STYLE, AnsiParser
+from command_builder.services.build_state import BuildStateJob, get_build_state_store
+from command_builder.services.command_executor import (
+    CANCEL_STATE_KILLED,
+    CommandExecutorService,
+)
+from command_builder.services.console_buffer import ConsoleBuffer
+from command_builder.services.console_export import (
+    FORMAT_GZIP,
+    FORMAT_HTML,
+    FORMAT_JSONL,
+    FORMAT_TEXT,
+    ConsoleBufferSource,
+    ConsoleExportJob,
+    RunLogSource,
+    format_for_path,
+)
+from command_builder.services.console_search import ConsoleSearchIndex
+from command_builder.services.process_registry import get_process_registry
+from command_builder.services.run_checkpoint import (
+    RunCheckpoint,
+    get_run_checkpoint_store,
+)
+from command_builder.services.run_log import create_run_log, get_run_log_dir
+from command_builder.services.shell_session import ShellSession
+
+# Intervalle d'affichage des sorties des commandes (~30 images/s)
+RENDER_INTERVAL_MS = 33
+
+# Filtres de la boîte d'export et extension associée (CSV : ressources)
+EXPORT_FILTERS = {
+    "Fichiers texte (*.txt)": FORMAT_TEXT,
+    "JSON Lines (*.jsonl)": FORMAT_JSONL,
+    "Page HTML (*.html)": FORMAT_HTML,
+    "Journal compressé (*.log.gz)": FORMAT_GZIP,
+    "Ressources par commande (*.csv)": None,
+}
 
 
 class ConsoleOutput(QWidget):
@@ -34,12 +90,15 @@ class ConsoleOutput(QWidget):
     # Signal émis quand le bouton Exécuter est cliqué
     execute_requested = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, scrollback_lines: int = DEFAULT_SCROLLBACK_LINES):
         """
         Initialise le composant ConsoleOutput.
 
         Args:
             parent: Le widget parent (par défaut: None)
+            scrollback_lines: Nombre maximal de lignes gardées dans la zone de
+                              texte (les plus anciennes sont rechargées depuis
+                              le disque en remontant)
         """
         super().__init__(parent)
         self.executor_service = CommandExecutorService()
@@ -50,9 +109,42 @@ class ConsoleOutput(QWidget):
         self._elapsed_timer = None  # Timer pour le chronomètre visuel
         self._hourglass_frames = ["⏳", "⌛"]  # Animation du sablier
         self._hourglass_index = 0
+        self._shell_session = None  # Session shell unique (mode session)
+        self.run_records = []  # RunRecord des commandes de la dernière séquence
+        self._command_usage = None  # Ressources de la commande en cours
+        self._force_execution = False  # Réexécuter les commandes à jour
+        self._build_state_job = None  # Vérification d'état en cours
+        self._build_state_record = None  # Commande réussie à mémoriser
+        self._checkpoint = None  # Point de reprise de la séquence en cours
+        self._run_log = None  # Journal compressé de la dernière séquence
+        self._run_log_is_console = False  # La console contient tout le journal
+        self._pending_output = []  # Sorties en attente du prochain affichage
+        self.ansi_parser = AnsiParser()  # Codes couleur des sorties
+        self._export_job = None  # Export de la console en cours
+        self._log_viewers = []  # Journaux archivés ouverts
         self._load_ui()
+        self.console_view = ConsoleView(
+            self.text_edit_console, ConsoleBuffer(), scrollback_lines
+        )
+        self.search_index = ConsoleSearchIndex()
+        self.search_controller = ConsoleSearchController(
+            self.console_view,
+            self.search_index,
+            self.line_edit_search,
+            self.checkbox_regex,
+            self.combo_search_tag,
+            self.button_search_previous,
+            self.button_search_next,
+            self.label_search_count,
+            self,
+        )
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_INTERVAL_MS)
+        self._render_timer.timeout.connect(self.flush_output)
         self._load_stylesheet()
         self._connect_signals()
+        self._update_resume_button()
 
     def _load_ui(self):
         """Charge le fichier UI du composant."""
@@ -72,28 +164,46 @@ class ConsoleOutput(QWidget):
         self.text_edit_console = ui.findChild(QPlainTextEdit, "textEditConsole")
         self.button_execute = ui.findChild(QPushButton, "buttonExecute")
         self.button_stop = ui.findChild(QPushButton, "buttonStop")
+        self.button_resume = ui.findChild(QPushButton, "buttonResume")
         self.button_effacer = ui.findChild(QPushButton, "buttonEffacer")
+        self.button_journaux = ui.findChild(QPushButton, "buttonJournaux")
         self.button_exporter = ui.findChild(QPushButton, "buttonExporter")
         self.label_timer = ui.findChild(QLabel, "labelTimer")
+        self.checkbox_force = ui.findChild(QCheckBox, "checkBoxForce")
+        self.line_edit_search = ui.findChild(QLineEdit, "lineEditSearch")
+        self.checkbox_regex = ui.findChild(QCheckBox, "checkBoxRegex")
+        self.combo_search_tag = ui.findChild(QComboBox, "comboSearchTag")
+        self.button_search_previous = ui.findChild(QPushButton, "buttonSearchPrevious")
+        self.button_search_next = ui.findChild(QPushButton, "buttonSearchNext")
+        self.label_search_count = ui.findChild(QLabel, "labelSearchCount")
+        self.progress_bar_export = ui.findChild(QProgressBar, "progressBarExport")
+        self.progress_bar_export.hide()
 
         # Effacer le texte de simulation
         self.text_edit_console.clear()
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "console_output.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _connect_signals(self):
         """Connecte les signaux aux slots."""
         self.button_execute.clicked.connect(self._on_execute_clicked)
         self.button_stop.clicked.connect(self._on_stop_clicked)
+        self.button_resume.clicked.connect(lambda: self.resume_last_run())
         self.button_effacer.clicked.connect(self.clear)
         self.button_exporter.clicked.connect(self.export_console)
+        self.button_journaux.clicked.connect(lambda: self.open_log_viewer())
+
+        # Ctrl+F : aller à la barre de recherche
+        search_shortcut = QShortcut(QKeySequence.Find, self)
+        search_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        search_shortcut.activated.connect(self._focus_search)
+
+    def _focus_search(self):
+        """Place le curseur dans la barre de recherche."""
+        self.line_edit_search.setFocus()
+        self.line_edit_search.selectAll()
 
     def _on_execute_clicked(self):
         """Gère le clic sur le bouton Exécuter."""
@@ -124,10 +234,71 @@ class ConsoleOutput(QWidget):
         Args:
             text: Le texte à ajouter
         """
-        self.text_edit_console.appendPlainText(text)
-        self.text_edit_console.verticalScrollBar().setValue(
-            self.text_edit_console.verticalScrollBar().maximum()
-        )
+        # Afficher d'abord les sorties en attente pour conserver l'ordre
+        self.flush_output()
+        lines = text.split("\n")
+        self.console_view.append_lines(lines)
+        self.search_index.add_lines(lines)
+        self.console_view.scroll_to_end()
+        self.search_controller.on_lines_added()
+        self._write_run_log(text)
+
+    def queue_output(self, text):
+        """
+        Ajoute une sortie de commande à la console au prochain affichage.
+
+        Les sorties reçues entre deux affichages (RENDER_INTERVAL_MS) sont
+        insérées en un seul bloc, au lieu d'une mise en page par ligne.
+
+        Args:
+            text: Le texte à ajouter
+        """
+        self._pending_output.append(text)
+        # Le minuteur est déjà lancé si des sorties étaient en attente
+        if len(self._pending_output) == 1 and not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def flush_output(self):
+        """
+        Affiche immédiatement les sorties en attente.
+
+        Les codes couleur ANSI du lot sont interprétés en une seule passe ;
+        seul le texte est stocké, journalisé et indexé pour la recherche.
+        """
+        if not self._pending_output:
+            return
+        text = "\n".join(self._pending_output)
+        self._pending_output = []
+
+        runs = self.ansi_parser.feed(text)
+        text = "".join(map(itemgetter(0), runs))
+        if set(map(itemgetter(1), runs)) <= {DEFAULT_STYLE}:
+            runs = None  # Texte sans couleur : insertion directe
+        lines = text.split("\n")
+
+        self.console_view.append_lines(lines, runs)
+        self.search_index.add_lines(lines, output=True)
+        self._write_run_log(text, output=True)
+        self.console_view.scroll_to_end()
+        self.search_controller.on_lines_added()
+
+    def _write_run_log(self, text: str, output: bool = False):
+        """
+        Ajoute du texte au journal de la séquence en cours.
+
+        Du texte ajouté une fois le journal fermé n'y figure pas : la
+        console ne correspond alors plus au journal.
+
+        Args:
+            text: Le texte ajouté à la console
+            output: True si le texte provient de la sortie d'une commande
+        """
+        if self._run_log is None:
+            return
+        if self._run_log.closed:
+            self._run_log_is_console = False
+        else:
+            self._run_log.write_line(text, output=output)
 
     def append_command(self, command):
         """
@@ -158,112 +329,213 @@ class ConsoleOutput(QWidget):
 
     def clear(self):
         """Efface le contenu de la console."""
-        self.text_edit_console.clear()
+        self._pending_output = []
+        self.ansi_parser.reset()
+        self.console_view.clear()
+        self.search_index.clear()
+        self.search_controller.reset()
+        # La console ne contient plus tout le journal de la séquence
+        self._run_log_is_console = False
+        if self._run_log is not None and self._run_log.closed:
+            self._run_log = None
 
     def export_console(self):
-        """Exporte le contenu de la console dans un fichier texte."""
+        """
+        Exporte le contenu de la console (texte, JSON Lines, HTML ou journal
+        compressé) en arrière-plan, ou les ressources consommées par la
+        dernière séquence au format CSV. Pendant un export, le bouton
+        Exporter permet de l'annuler.
+        """
+        if self._export_job is not None:
+            self._export_job.cancel()
+            return
+
         # Générer un nom de fichier par défaut avec la date et l'heure
         default_filename = (
             f"console_output_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         )
 
         # Ouvrir une boîte de dialogue pour choisir où enregistrer le fichier
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Exporter la console", default_filename, "Fichiers texte (*.txt)"
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            "Exporter la console",
+            default_filename,
+            ";;".join(EXPORT_FILTERS),
         )
 
-        if file_path:
+        if not file_path:
+            return
+        self.flush_output()
+        if selected_filter.endswith("(*.csv)") or file_path.endswith(".csv"):
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(self.text_edit_console.toPlainText())
-                self.append_text(f"[INFO] Console exportée vers {file_path}")
+                self.export_run_records(file_path)
+                self.append_text(f"[INFO] Ressources exportées vers {file_path}")
             except Exception as e:
                 self.append_error(f"Erreur lors de l'exportation: {str(e)}")
+            return
 
-    def _cleanup_orphan_processes(self, commands_list):
+        # Le format suit l'extension du fichier, complétée d'après le filtre
+        extension = EXPORT_FILTERS.get(selected_filter)
+        if extension == FORMAT_GZIP and not file_path.endswith(".gz"):
+            file_path += ".gz"
+        elif extension and not Path(file_path).suffix:
+            file_path += "." + extension
+        self.start_export(file_path, format_for_path(file_path))
+
+    def start_export(self, file_path: str, export_format: str):
         """
-        Tue les processus orphelins liés aux exécutables des commandes.
+        Lance l'export de la console dans un thread du pool.
 
-        Exclut les exécutables critiques (python, cmd, powershell) pour éviter
-        de tuer l'application elle-même ou des shells système.
+        Args:
+            file_path: Le chemin du fichier exporté
+            export_format: Le format (FORMAT_*)
         """
-        # Exécutables à ne JAMAIS tuer (risque de casser l'app ou le système)
-        EXCLUSIONS = {
-            "python.exe",
-            "pythonw.exe",
-            "cmd.exe",
-            "powershell.exe",
-            "pwsh.exe",
-        }
+        if self._run_log is not None and self._run_log_is_console:
+            # La console contient exactement la séquence : lecture du journal
+            # sur disque, sans relire le document
+            self._run_log.flush()
+            source = RunLogSource(self._run_log.log_path)
+        else:
+            source = ConsoleBufferSource(self.console_view.buffer, self.search_index)
+
+        job = ConsoleExportJob(source, file_path, export_format)
+        job.progress.connect(self._on_export_progress)
+        job.finished.connect(self._on_export_finished)
+        job.failed.connect(self._on_export_failed)
+        self._export_job = job
+        self.progress_bar_export.setRange(0, max(source.line_count, 1))
+        self.progress_bar_export.setValue(0)
+        self.progress_bar_export.show()
+        self.button_exporter.setText("Annuler l'export")
+        job.start()
+
+    def _on_export_progress(self, written: int, total: int):
+        """Met à jour la barre de progression de l'export."""
+        self.progress_bar_export.setValue(written)
+
+    def _on_export_finished(self, file_path: str, completed: bool):
+        """Signale la fin (ou l'annulation) de l'export."""
+        self._end_export()
+        if completed:
+            self.append_text(f"[INFO] Console exportée vers {file_path}")
+        else:
+            self.append_text("[INFO] Exportation annulée")
 
-        executables = set()
-        for cmd_info in commands_list:
-            command = cmd_info.get("command", "")
-            parts = command.strip().split()
+    def _on_export_failed(self, message: str):
+        """Signale l'échec de l'export."""
+        self._end_export()
+        self.append_error(f"Erreur lors de l'exportation: {message}")
 
-            if not parts:
-                continue
+    def _end_export(self):
+        """Remet le bouton Exporter dans son état normal."""
+        self._export_job = None
+        self.progress_bar_export.hide()
+        self.button_exporter.setText("Exporter")
 
-            exe_name = parts[0]
-            # Nettoyer le nom (enlever le chemin si présent)
-            exe_name = exe_name.split("\\")[-1].split("/")[-1]
+    def open_log_viewer(self, file_path: Optional[str] = None):
+        """
+        Ouvre un journal d'exécution archivé dans une fenêtre de consultation.
 
-            # Ajouter .exe seulement si pas d'extension ET pas un script Python
-            if (
-                not exe_name.lower().endswith(".exe")
-                and "python" not in exe_name.lower()
-            ):
-                exe_name += ".exe"
+        Args:
+            file_path: Le chemin du journal (None = choisir dans une boîte de
+                       dialogue ouverte sur le dossier des journaux)
 
-            # Exclure les exécutables critiques
-            if exe_name.lower() not in EXCLUSIONS:
-                executables.add(exe_name)
+        Returns:
+            La fenêtre ouverte, ou None
+        """
+        if file_path is None:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self,
+                "Ouvrir un journal",
+                str(get_run_log_dir()),
+                "Journaux (*.log.gz *.log *.txt);;Tous les fichiers (*)",
+            )
+            if not file_path:
+                return None
+        try:
+            viewer = LogViewer(file_path, self)
+        except OSError as e:
+            self.append_error(f"Impossible d'ouvrir le journal: {str(e)}")
+            return None
+        # Garder les fenêtres ouvertes (et leur indexation) jusqu'à leur fermeture
+        self._log_viewers = [
+            v for v in self._log_viewers if v.isVisible() or v.is_indexing()
+        ]
+        self._log_viewers.append(viewer)
+        viewer.show()
+        return viewer
+
+    def export_run_records(self, file_path: str):
+        """
+        Exporte les ressources consommées par chaque commande de la dernière
+        séquence au format CSV.
 
-        killed_any = False
+        Args:
+            file_path: Le chemin du fichier CSV
+        """
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RunRecord.CSV_COLUMNS)
+            writer.writeheader()
+            for record in self.run_records:
+                writer.writerow(record.to_row())
 
-        for exe in executables:
-            try:
-                # CREATE_NO_WINDOW empêche l'apparition d'une console flash
-                creationflags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-                result = subprocess.run(
-                    ["taskkill", "/F", "/IM", exe],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    creationflags=creationflags,
-                )
-                if result.returncode == 0:
-                    self.append_text(f"[CLEANUP] Processus {exe} arrêté")
-                    killed_any = True
-            except Exception:
-                pass  # Ignorer les erreurs (processus non trouvé, etc.)
+    def _cleanup_orphan_processes(self):
+        """
+        Arrête les arbres de processus lancés par l'application qui n'ont plus
+        d'exécuteur actif.
+
+        Seuls les processus enregistrés dans le registre des processus sont
+        visés : les autres instances des mêmes exécutables ne sont pas touchées,
+        et une commande annulée encore dans son délai de grâce n'est pas tuée.
+        """
+        killed = get_process_registry().cleanup_orphans()
+        for pid in killed:
+            self.append_text(f"[CLEANUP] Arbre de processus {pid} arrêté")
 
-        if killed_any:
+        if killed:
             self.append_text("")
 
-    def execute_commands(self, commands_list):
+    def execute_commands(self, commands_list, start_index: int = 0):
         """
         Exécute toutes les commandes de la liste séquentiellement.
 
         Args:
             commands_list: Liste de dictionnaires avec 'name' et 'command'
+            start_index: Index de la première commande à exécuter (reprise
+                         du point de reprise en cours)
         """
         if not commands_list:
             return
 
+        # Journal de la séquence sur disque
+        self._open_run_log()
+
         # Nettoyer les processus orphelins avant de commencer
-        self._cleanup_orphan_processes(commands_list)
+        self._cleanup_orphan_processes()
 
         # Réinitialiser le flag d'arrêt
         self.executor_service.reset_stop_flag()
 
         # Initialiser la file d'attente
         self.commands_queue = commands_list
-        self.current_command_index = 0
+        self.current_command_index = start_index
+        self.run_records = []
+        self._build_state_job = None
+        self._build_state_record = None
+        self._start_checkpoint(commands_list, start_index)
+        self._force_execution = bool(
+            self.checkbox_force and self.checkbox_force.isChecked()
+        )
+
+        # Mode session : un seul shell pour toute la séquence
+        self._close_shell_session()
+        if any(cmd_info.get("session") for cmd_info in commands_list):
+            self._shell_session = ShellSession()
 
         # Gérer les états des boutons
         self.button_execute.setEnabled(False)  # Désactiver Exécuter
         self.button_stop.setEnabled(True)  # Activer Stop
+        self.button_resume.setEnabled(False)
 
         # Démarrer le chronomètre visuel
         self._start_elapsed_timer()
@@ -274,14 +546,151 @@ class ConsoleOutput(QWidget):
         self.append_text("=" * 80)
         self.append_text(f"EXÉCUTION DES COMMANDES - Début: {start_time}")
         self.append_text("=" * 80)
-        self.append_text(f"Nombre de commandes: {len(commands_list)}\n")
+        self.append_text(f"Nombre de commandes: {len(commands_list)}")
+        if start_index > 0:
+            self.append_text(
+                f"Reprise à l'étape {start_index + 1}/{len(commands_list)} "
+                f"(séquence du {self._checkpoint.started_at})"
+            )
+        if self._shell_session is not None:
+            self.append_text("Mode session: un seul shell pour toute la séquence")
+        if self._force_execution:
+            self.append_text("Mode forcé: les commandes à jour sont réexécutées")
+        self.append_text("")
 
         # Exécuter la première commande
         self._execute_next_command()
 
+    def resume_last_run(self, validate_inputs: bool = True) -> bool:
+        """
+        Reprend la dernière séquence à la première étape en échec ou non
+        exécutée, avec les mêmes commandes rendues.
+
+        Args:
+            validate_inputs: Si True, vérifie d'abord que les entrées déclarées
+                             des étapes restantes existent toujours
+
+        Returns:
+            True si la reprise a démarré
+        """
+        if self.is_executing():
+            return False
+        checkpoint = get_run_checkpoint_store().load()
+        start_index = checkpoint.resume_index() if checkpoint else None
+        if start_index is None:
+            self.append_text("[REPRISE] Aucune séquence à reprendre")
+            return False
+
+        if validate_inputs:
+            missing = [
+                path
+                for cmd_info in checkpoint.commands[start_index:]
+                for path in cmd_info.get("inputs", [])
+                if not Path(path).exists()
+            ]
+            if missing:
+                for path in missing:
+                    self.append_error(f"[REPRISE] Entrée introuvable: {path}")
+                return False
+
+        self._checkpoint = checkpoint
+        self.execute_commands(checkpoint.commands, start_index=start_index)
+        return True
+
+    def _start_checkpoint(self, commands_list, start_index: int):
+        """
+        Initialise le point de reprise de la séquence qui démarre.
+
+        Args:
+            commands_list: Les commandes de la séquence
+            start_index: Index de la première commande exécutée
+        """
+        if (
+            start_index == 0
+            or self._checkpoint is None
+            or self._checkpoint.commands is not commands_list
+        ):
+            self._checkpoint = RunCheckpoint(
+                commands=list(commands_list),
+                started_at=datetime.datetime.now().isoformat(timespec="seconds"),
+            )
+        for index in range(start_index, len(self._checkpoint.results)):
+            self._checkpoint.results[index] = None
+        get_run_checkpoint_store().save(self._checkpoint)
+
+    def _checkpoint_step(self, return_code: int):
+        """
+        Enregistre le code de retour de la commande en cours dans le point
+        de reprise.
+
+        Args:
+            return_code: Le code de retour
+        """
+        if self._checkpoint is None:
+            return
+        self._checkpoint.record_step(self.current_command_index, return_code)
+        get_run_checkpoint_store().save(self._checkpoint)
+
+    def _update_resume_button(self):
+        """Active le bouton Reprendre s'il reste des étapes à reprendre."""
+        checkpoint = get_run_checkpoint_store().load()
+        self.button_resume.setEnabled(
+            not self.is_executing()
+            and checkpoint is not None
+            and checkpoint.resume_index() is not None
+        )
+
     def _execute_next_command(self):
         """
         Exécute la prochaine commande dans la file d'attente.
+
+        L'état mémorisé (commande réussie à enregistrer, sorties à jour de la
+        prochaine commande) est traité par un BuildStateJob ; l'exécution
+        reprend dans _on_build_state_checked.
+        """
+        record = self._build_state_record
+        self._build_state_record = None
+        check = None
+        if (
+            not self.executor_service.is_stop_requested()
+            and self.current_command_index < len(self.commands_queue)
+        ):
+            cmd_info = self.commands_queue[self.current_command_index]
+            if not self._force_execution and cmd_info.get("outputs"):
+                check = (
+                    cmd_info["command"],
+                    cmd_info.get("inputs", []),
+                    cmd_info["outputs"],
+                )
+        if record is None and check is None:
+            self._run_current_command()
+            return
+
+        job = BuildStateJob(get_build_state_store(), record, check)
+        job.finished.connect(self._on_build_state_checked)
+        self._build_state_job = job
+        job.start()
+
+    def _on_build_state_checked(self, job: BuildStateJob, up_to_date: bool):
+        """
+        Poursuit la séquence une fois l'état de la commande en cours connu.
+
+        Args:
+            job: Le job terminé
+            up_to_date: True si les sorties de la commande sont à jour
+        """
+        if job is not self._build_state_job:
+            return
+        self._build_state_job = None
+        if up_to_date and not self.executor_service.is_stop_requested():
+            self._skip_current_command()
+            self._execute_next_command()
+        else:
+            self._run_current_command()
+
+    def _run_current_command(self):
+        """
+        Lance la commande en cours de la file d'attente.
         """
         # Vérifier si un arrêt a été demandé
         if self.executor_service.is_stop_requested():
@@ -296,35 +705,175 @@ class ConsoleOutput(QWidget):
         # Récupérer la commande courante
         cmd_info = self.commands_queue[self.current_command_index]
         command = cmd_info["command"]
-        name = cmd_info["name"]
 
         # Afficher l'en-tête de la commande avec timestamp
-        start_time = datetime.datetime.now().strftime("%H:%M:%S")
-
-        self.append_text("-" * 80)
-        self.append_text(
-            f"[{self.current_command_index + 1}/{len(self.commands_queue)}] {name}"
-        )
-        self.append_text(f"Heure de début: {start_time}")
-        self.append_command(command)
+        self._append_command_header(cmd_info)
         self.append_text("\nSortie:")
 
         # Stocker le timestamp de début
         self.command_start_time = datetime.datetime.now()
+        self._command_usage = None
 
         # Exécuter la commande
         self.executor_service.execute_command(
             command,
             on_output=self._on_command_output,
-            on_error=lambda line: self.append_error(line),
+            on_error=self._on_command_error,
             on_finished=lambda code: self._on_single_command_finished(code),
+            session=self._shell_session,
+            argv=cmd_info.get("argv"),
+            grace_period=cmd_info.get("grace_period"),
+            on_cancelled=self._on_command_cancelled,
+            on_resources=self._on_command_resources,
+        )
+
+    def _append_command_header(self, cmd_info: dict):
+        """
+        Affiche l'en-tête de la commande en cours.
+
+        Args:
+            cmd_info: Le dictionnaire de la commande
+        """
+        # Terminer d'abord l'affichage et le journal de la commande précédente
+        self.flush_output()
+        if self._run_log is not None:
+            self._run_log.begin_command(cmd_info["name"])
+        # Les couleurs laissées par la commande précédente ne débordent pas
+        self.ansi_parser.reset()
+        start_time = datetime.datetime.now().strftime("%H:%M:%S")
+
+        self.append_text("-" * 80)
+        self.append_text(
+            f"[{self.current_command_index + 1}/{len(self.commands_queue)}] "
+            f"{cmd_info['name']}"
         )
+        self.append_text(f"Heure de début: {start_time}")
+        self.append_command(cmd_info["command"])
+
+    def _skip_current_command(self):
+        """Marque la commande en cours comme ignorée et passe à la suivante."""
+        cmd_info = self.commands_queue[self.current_command_index]
+        self._append_command_header(cmd_info)
+        self.append_text("[SKIP] Sorties à jour, commande ignorée")
+        self.append_text("")
+        self.run_records.append(
+            RunRecord(
+                name=cmd_info.get("name", ""),
+                command=cmd_info.get("command", ""),
+                return_code=0,
+                duration=0.0,
+                skipped=True,
+            )
+        )
+        self._checkpoint_step(0)
+        self.current_command_index += 1
+
+    def _record_build_state(self):
+        """
+        Prépare la mémorisation de l'état de la commande en cours, qui vient
+        de réussir (faite avec la vérification de la commande suivante).
+        """
+        if self.current_command_index >= len(self.commands_queue):
+            return
+        cmd_info = self.commands_queue[self.current_command_index]
+        if cmd_info.get("outputs"):
+            self._build_state_record = (
+                cmd_info["command"],
+                cmd_info.get("inputs", []),
+                cmd_info["outputs"],
+            )
+
+    def _open_run_log(self):
+        """Crée le journal compressé de la séquence qui démarre."""
+        self._close_run_log()
+        # Le journal ne reflète la console que si elle était vide
+        self.flush_output()
+        self._run_log_is_console = len(self.console_view.buffer) == 0
+        try:
+            self._run_log = create_run_log()
+        except OSError as e:
+            self._run_log = None
+            self.append_error(f"Journal d'exécution indisponible: {e}")
+
+    def _close_run_log(self):
+        """Termine le journal de la séquence (conservé pour l'export)."""
+        if self._run_log is not None:
+            self._run_log.close()
+
+    def _close_shell_session(self):
+        """Ferme la session shell de la séquence, s'il y en a une."""
+        if self._shell_session is not None:
+            self._shell_session.close()
+            self._shell_session = None
+
+    def _on_command_cancelled(self, state: str):
+        """
+        Affiche comment la commande annulée s'est terminée.
+
+        Args:
+            state: CANCEL_STATE_TERMINATED ou CANCEL_STATE_KILLED
+        """
+        if state == CANCEL_STATE_KILLED:
+            self.append_text("[STOP] Délai de grâce expiré : processus tué")
+        else:
+            self.append_text("[STOP] Processus arrêté")
+
+    def _on_command_resources(self, usage: ResourceUsage):
+        """
+        Mémorise les ressources consommées par la commande en cours.
+
+        Args:
+            usage: Les ressources mesurées
+        """
+        self._command_usage = usage
+
+    def _record_command_run(self, return_code: int, duration: float):
+        """
+        Enregistre le résultat de la commande en cours pour le résumé et l'export.
+
+        Args:
+            return_code: Le code de retour
+            duration: La durée d'exécution en secondes
+        """
+        if self.current_command_index >= len(self.commands_queue):
+            return
+        cmd_info = self.commands_queue[self.current_command_index]
+        self.run_records.append(
+            RunRecord(
+                name=cmd_info.get("name", ""),
+                command=cmd_info.get("command", ""),
+                return_code=return_code,
+                duration=duration,
+                usage=self._command_usage,
+            )
+        )
+
+    def _append_run_summary(self):
+        """Affiche le résumé des ressources consommées par la séquence."""
+        if not any(record.usage for record in self.run_records):
+            return
+        self.append_text("Résumé des ressources:")
+        for line in format_run_summary(self.run_records):
+            self.append_text(f"  {line}")
 
     def _on_command_output(self, line: str):
         """
         Gère la réception d'une ligne de sortie.
         """
-        self.append_text(line)
+        self.queue_output(line)
+
+    def _on_command_error(self, text: str):
+        """
+        Gère la réception des erreurs d'une commande.
+
+        La sortie d'erreur arrive en un seul bloc : chaque ligne reçoit le
+        préfixe [ERR], et donc l'étiquette des erreurs.
+
+        Args:
+            text: Le texte reçu (une ou plusieurs lignes)
+        """
+        lines = text.replace("\r\n", "\n").split("\n")
+        self.queue_output("\n".join(f"[ERR] {line}" for line in lines))
 
     def _start_elapsed_timer(self):
         """Démarre le chronomètre visuel."""
@@ -388,12 +937,22 @@ class ConsoleOutput(QWidget):
         self.append_text("")
         self.append_text(f"Heure de fin: {end_time_str}")
         self.append_text(f"Durée: {duration:.2f}s")
+        if self._command_usage is not None:
+            self.append_text(f"Ressources: {self._command_usage}")
+        self._record_command_run(return_code, duration)
+        self._checkpoint_step(return_code)
+        if self._run_log is not None:
+            self._run_log.flush()
 
         if return_code == 0:
             self.append_text("✓ Succès")
+            self._record_build_state()
             # Passer à la commande suivante
             self.current_command_index += 1
             self._execute_next_command()
+        elif self.executor_service.is_stop_requested():
+            # Commande interrompue par le bouton Stop
+            self._on_execution_stopped_by_user()
         else:
             self.append_error(f"✗ Erreur (code {return_code})")
             # Arrêter l'exécution en cas d'erreur
@@ -405,6 +964,7 @@ class ConsoleOutput(QWidget):
         """
         # Arrêter le chronomètre visuel
         self._stop_elapsed_timer()
+        self._close_shell_session()
 
         end_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -414,11 +974,14 @@ class ConsoleOutput(QWidget):
         self.append_text(
             f"Commandes non exécutées: {len(self.commands_queue) - self.current_command_index - 1}"
         )
+        self._append_run_summary()
         self.append_text("=" * 80 + "\n")
+        self._close_run_log()
 
         # Réactiver le bouton Exécuter et désactiver Stop
         self.button_execute.setEnabled(True)
         self.button_stop.setEnabled(False)
+        self._update_resume_button()
 
         # Émettre le signal
         self.all_commands_finished.emit()
@@ -429,16 +992,23 @@ class ConsoleOutput(QWidget):
         """
         # Arrêter le chronomètre visuel
         self._stop_elapsed_timer()
+        self._close_shell_session()
 
         end_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         self.append_text("=" * 80)
         self.append_text(f"TOUTES LES COMMANDES TERMINÉES - Fin: {end_time}")
+        skipped = sum(1 for record in self.run_records if record.skipped)
+        if skipped:
+            self.append_text(f"Commandes ignorées (à jour): {skipped}")
+        self._append_run_summary()
         self.append_text("=" * 80 + "\n")
+        self._close_run_log()
 
         # Réactiver le bouton Exécuter et désactiver Stop
         self.button_execute.setEnabled(True)
         self.button_stop.setEnabled(False)
+        self._update_resume_button()
 
         # Émettre le signal
         self.all_commands_finished.emit()
@@ -449,6 +1019,7 @@ class ConsoleOutput(QWidget):
         """
         # Arrêter le chronomètre visuel
         self._stop_elapsed_timer()
+        self._close_shell_session()
 
         end_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -458,11 +1029,14 @@ class ConsoleOutput(QWidget):
         self.append_text(
             f"Commandes non exécutées: {len(self.commands_queue) - self.current_command_index}"
         )
+        self._append_run_summary()
         self.append_text("=" * 80 + "\n")
+        self._close_run_log()
 
         # Réactiver le bouton Exécuter et désactiver Stop
         self.button_execute.setEnabled(True)
         self.button_stop.setEnabled(False)
+        self._update_resume_button()
 
         # Émettre le signal
         self.all_commands_finished.emit()
@@ -0,0 +1,490 @@
+"""
+Module contenant la classe ConsoleView qui affiche une fenêtre de lignes
+de la console.
+"""
+
+import bisect
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor, QTextLayout
+from PySide6.QtWidgets import QPlainTextEdit
+
+from command_builder.services.ansi_parser import (
+    DEFAULT_BACKGROUND,
+    DEFAULT_FOREGROUND,
+    DEFAULT_STYLE,
+    AnsiRun,
+    AnsiStyle,
+)
+from command_builder.services.console_buffer import ConsoleBuffer
+
+# Nombre maximal de lignes dans le document affiché
+DEFAULT_SCROLLBACK_LINES = 10000
+
+# Nombre de lignes chargées à la fois en remontant ou en redescendant
+PAGE_LINES = 1000
+
+
+def style_format(style: AnsiStyle) -> QTextCharFormat:
+    """
+    Convertit un style ANSI en format de caractères Qt.
+
+    Args:
+        style: Le style
+
+    Returns:
+        Le format correspondant
+    """
+    char_format = QTextCharFormat()
+    foreground, background = style.foreground, style.background
+    if style.inverse:
+        foreground, background = (
+            background or DEFAULT_BACKGROUND,
+            foreground or DEFAULT_FOREGROUND,
+        )
+    if foreground:
+        char_format.setForeground(QColor(foreground))
+    if background:
+        char_format.setBackground(QColor(background))
+    if style.bold:
+        char_format.setFontWeight(QFont.Weight.Bold)
+    if style.italic:
+        char_format.setFontItalic(True)
+    if style.underline:
+        char_format.setFontUnderline(True)
+    if style.strike:
+        char_format.setFontStrikeOut(True)
+    return char_format
+
+
+class StyledLines:
+    """
+    Segments stylés d'un ajout de lignes colorées.
+
+    Les lignes sont insérées comme du texte brut ; les styles d'une ligne ne
+    sont appliqués (QTextLayout.setFormats) que lorsqu'elle devient visible.
+    """
+
+    def __init__(self, first_line: int, lines: List[str], runs: List[AnsiRun]):
+        """
+        Initialise les segments.
+
+        Args:
+            first_line: Numéro dans le stockage de la première ligne
+            lines: Les lignes (sans codes ANSI)
+            runs: Les segments stylés des lignes jointes par des retours à la
+                  ligne
+        """
+        self.first_line = first_line
+        self.runs = runs
+        # Longueurs cumulées des lignes et des segments du texte joint
+        self.line_ends = list(accumulate(map(len, lines), initial=0))
+        self.run_ends = list(accumulate(map(len, map(itemgetter(0), runs))))
+        self.applied = bytearray(len(lines))  # Styles déjà appliqués
+
+    @property
+    def end_line(self) -> int:
+        """Numéro dans le stockage de la ligne qui suit les segments."""
+        return self.first_line + len(self.applied)
+
+    def line_runs(self, line: int) -> List[tuple]:
+        """
+        Retourne les segments stylés d'une ligne.
+
+        Args:
+            line: Numéro de la ligne dans le stockage
+
+        Returns:
+            Liste de (début dans la ligne, longueur, style), styles par défaut
+            exclus
+        """
+        index = line - self.first_line
+        # Chaque ligne précédente est suivie d'un retour à la ligne
+        start = self.line_ends[index] + index
+        end = self.line_ends[index + 1] + index
+        result = []
+        position = bisect.bisect_right(self.run_ends, start)
+        run_start = self.run_ends[position - 1] if position else 0
+        while position < len(self.runs) and run_start < end:
+            run_end = self.run_ends[position]
+            style = self.runs[position][1]
+            if style != DEFAULT_STYLE:
+                first, last = max(run_start, start), min(run_end, end)
+                if first < last:
+                    result.append((first - start, last - first, style))
+            run_start = run_end
+            position += 1
+        return result
+
+
+class ConsoleView:
+    """
+    Affichage virtualisé des lignes de la console.
+
+    Le QPlainTextEdit ne contient qu'une fenêtre d'au plus scrollback_lines
+    lignes du ConsoleBuffer. Quand l'utilisateur atteint le haut de la fenêtre,
+    les lignes précédentes sont rechargées depuis le stockage (et celles du bas
+    retirées) ; en redescendant, la fenêtre avance jusqu'à rejoindre les
+    dernières lignes. Tant que la fenêtre ne montre pas la fin, les nouvelles
+    lignes sont seulement stockées.
+
+    L'affichage ne suit la fin que si l'utilisateur est en bas : s'il remonte
+    pour lire, la vue reste en place jusqu'à ce qu'il redescende.
+
+    Les lignes colorées (codes ANSI) sont insérées comme du texte brut, en un
+    seul appel par ajout ; leurs styles sont appliqués ligne par ligne quand
+    elles deviennent visibles, si bien que le coût des couleurs ne dépend pas
+    du débit de la sortie. Le stockage ne garde que le texte : les lignes
+    rechargées depuis le disque après avoir quitté la fenêtre s'affichent
+    sans couleurs.
+    """
+
+    def __init__(
+        self,
+        text_edit: QPlainTextEdit,
+        buffer: ConsoleBuffer,
+        scrollback_lines: int = DEFAULT_SCROLLBACK_LINES,
+    ):
+        """
+        Initialise l'affichage.
+
+        Args:
+            text_edit: La zone de texte de la console
+            buffer: Le stockage des lignes
+            scrollback_lines: Nombre maximal de lignes gardées dans la zone de texte
+        """
+        self.text_edit = text_edit
+        self.buffer = buffer
+        self.scrollback_lines = max(scrollback_lines, 2 * PAGE_LINES)
+        self.window_start = 0  # Numéro dans le stockage de la première ligne affichée
+        self.window_count = 0  # Nombre de lignes affichées
+        self.follow_output = True  # Défiler automatiquement vers la fin
+        self._paging = False
+        self._plain_format = QTextCharFormat()
+        self._formats: Dict[AnsiStyle, QTextCharFormat] = {}
+        # Segments stylés des lignes de la fenêtre, par première ligne
+        self._styled: List[StyledLines] = []
+        self._styled_starts: List[int] = []
+        # La console est en lecture seule : inutile de garder l'historique
+        self.text_edit.document().setUndoRedoEnabled(False)
+        self.text_edit.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        # Styles appliqués après la mise à jour en cours (les numéros de ligne
+        # ne sont fiables qu'une fois l'ajout ou le défilement terminé)
+        self._style_timer = QTimer(text_edit)
+        self._style_timer.setSingleShot(True)
+        self._style_timer.setInterval(0)
+        self._style_timer.timeout.connect(self.apply_visible_styles)
+        self.text_edit.updateRequest.connect(self._on_update_request)
+
+    @property
+    def window_end(self) -> int:
+        """Numéro dans le stockage de la ligne qui suit la fenêtre."""
+        return self.window_start + self.window_count
+
+    def is_live(self) -> bool:
+        """
+        Indique si la fenêtre affiche les dernières lignes.
+
+        Returns:
+            True si les nouvelles lignes sont ajoutées à la zone de texte
+        """
+        return self.window_end >= len(self.buffer)
+
+    def set_scrollback_limit(self, lines: int):
+        """
+        Change le nombre maximal de lignes gardées dans la zone de texte.
+
+        Args:
+            lines: Le nouveau nombre maximal de lignes
+        """
+        self.scrollback_lines = max(lines, 2 * PAGE_LINES)
+        self._trim_top()
+
+    def append_lines(self, lines: List[str], runs: Optional[List[AnsiRun]] = None):
+        """
+        Ajoute des lignes au stockage et, si la fenêtre suit la fin, à l'affichage.
+
+        Args:
+            lines: Les lignes à ajouter (sans codes ANSI)
+            runs: Les segments stylés des lignes jointes par des retours à la
+                  ligne (None = lignes sans style)
+        """
+        if not lines:
+            return
+        live = self.is_live()
+        first_line = len(self.buffer)
+        self.buffer.append_lines(lines)
+        if not live:
+            return
+        self._paging = True
+        try:
+            scroll_bar = self.text_edit.verticalScrollBar()
+            value = scroll_bar.value()
+            at_bottom = value >= scroll_bar.maximum()
+            if runs:
+                self._styled.append(StyledLines(first_line, lines, runs))
+                self._styled_starts.append(first_line)
+            self._append_plain("\n".join(lines))
+            self.window_count += len(lines)
+            removed = self._trim_top()
+            if not self.follow_output and removed:
+                # Garder à l'écran les lignes que l'utilisateur est en train de lire
+                scroll_bar.setValue(max(0, value - removed))
+            elif at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
+        finally:
+            self._paging = False
+
+    def scroll_to_end(self):
+        """Affiche la fin de la console si l'affichage suit la sortie."""
+        if not self.follow_output:
+            return
+        self._paging = True
+        try:
+            scroll_bar = self.text_edit.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+        finally:
+            self._paging = False
+
+    def show_line(self, line: int):
+        """
+        Affiche et sélectionne une ligne du stockage, en rechargeant la fenêtre
+        autour d'elle si nécessaire. L'affichage cesse de suivre la fin.
+
+        Args:
+            line: Le numéro de la ligne dans le stockage
+        """
+        if not 0 <= line < len(self.buffer):
+            return
+        self._paging = True
+        try:
+            if not self.window_start <= line < self.window_end:
+                start = max(
+                    0,
+                    min(
+                        line - self.scrollback_lines // 2,
+                        len(self.buffer) - self.scrollback_lines,
+                    ),
+                )
+                lines = self.buffer.get_lines(start, self.scrollback_lines)
+                self.text_edit.setPlainText("\n".join(lines))
+                self.window_start = start
+                self.window_count = len(lines)
+                self._drop_styles_outside_window()
+                self._reload_styles(self.window_start, self.window_end)
+
+            document = self.text_edit.document()
+            cursor = QTextCursor(document.findBlockByNumber(line - self.window_start))
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+            self.text_edit.setTextCursor(cursor)
+            self.text_edit.centerCursor()
+            self.follow_output = False
+        finally:
+            self._paging = False
+
+    def refresh(self):
+        """
+        Complète une fenêtre incomplète avec les lignes arrivées dans le
+        stockage sans passer par append_lines (journal en cours d'indexation).
+        """
+        missing = min(
+            self.scrollback_lines - self.window_count,
+            len(self.buffer) - self.window_end,
+        )
+        if missing <= 0:
+            return
+        lines = self.buffer.get_lines(self.window_end, missing)
+        self._paging = True
+        try:
+            self._append_plain("\n".join(lines))
+            self.window_count += len(lines)
+        finally:
+            self._paging = False
+
+    def clear(self):
+        """Efface le stockage et l'affichage."""
+        self.buffer.clear()
+        self.text_edit.clear()
+        self.window_start = 0
+        self.window_count = 0
+        self.follow_output = True
+        self._styled = []
+        self._styled_starts = []
+
+    def apply_visible_styles(self):
+        """
+        Applique les styles des lignes visibles qui ne les ont pas encore.
+
+        Appelée à chaque mise à jour de l'affichage : seules les lignes
+        visibles coûtent des appels Qt, quel que soit le volume de la sortie.
+        """
+        if not self._styled:
+            return
+        first = self.text_edit.firstVisibleBlock().blockNumber()
+        line_height = max(1, self.text_edit.fontMetrics().lineSpacing())
+        visible = self.text_edit.viewport().height() // line_height + 1
+        start = self.window_start + max(first, 0)
+        end = min(start + visible, self.window_end)
+        document = self.text_edit.document()
+        for line in range(start, end):
+            index = bisect.bisect_right(self._styled_starts, line) - 1
+            if index < 0:
+                continue
+            styled = self._styled[index]
+            if line >= styled.end_line or styled.applied[line - styled.first_line]:
+                continue
+            styled.applied[line - styled.first_line] = 1
+            ranges = []
+            for position, length, style in styled.line_runs(line):
+                format_range = QTextLayout.FormatRange()
+                format_range.start = position
+                format_range.length = length
+                format_range.format = self._style_format(style)
+                ranges.append(format_range)
+            if ranges:
+                block = document.findBlockByNumber(line - self.window_start)
+                block.layout().setFormats(ranges)
+
+    def _on_update_request(self, _rect, _dy: int):
+        """Programme l'application des styles des lignes qui apparaissent."""
+        if self._styled and not self._style_timer.isActive():
+            self._style_timer.start()
+
+    def _style_format(self, style: AnsiStyle) -> QTextCharFormat:
+        """Format Qt d'un style (mis en cache)."""
+        char_format = self._formats.get(style)
+        if char_format is None:
+            char_format = self._formats[style] = style_format(style)
+        return char_format
+
+    def _drop_styles_outside_window(self):
+        """Oublie les segments stylés des lignes sorties de la fenêtre."""
+        first = 0
+        while (
+            first < len(self._styled)
+            and self._styled[first].end_line <= self.window_start
+        ):
+            first += 1
+        last = bisect.bisect_left(self._styled_starts, self.window_end)
+        del self._styled[last:]
+        del self._styled_starts[last:]
+        del self._styled[:first]
+        del self._styled_starts[:first]
+
+    def _reload_styles(self, start: int, end: int):
+        """
+        Marque à appliquer de nouveau les styles de lignes rechargées.
+
+        Args:
+            start: Numéro de la première ligne rechargée
+            end: Numéro de la ligne qui suit les lignes rechargées
+        """
+        index = max(bisect.bisect_right(self._styled_starts, start) - 1, 0)
+        for styled in self._styled[index:]:
+            if styled.first_line >= end:
+                break
+            first = max(start, styled.first_line) - styled.first_line
+            last = min(end, styled.end_line) - styled.first_line
+            if first < last:
+                styled.applied[first:last] = bytes(last - first)
+
+    def _on_scrolled(self, value: int):
+        """
+        Charge les lignes voisines quand un bord de la fenêtre est atteint, et
+        suit la fin seulement si l'utilisateur est revenu tout en bas.
+        """
+        if self._paging:
+            return
+        scroll_bar = self.text_edit.verticalScrollBar()
+        if value <= scroll_bar.minimum() and self.window_start > 0:
+            self._page_up()
+        elif value >= scroll_bar.maximum() and not self.is_live():
+            self._page_down()
+        self.follow_output = (
+            self.is_live() and scroll_bar.value() >= scroll_bar.maximum()
+        )
+
+    def _page_up(self):
+        """Charge les lignes précédant la fenêtre."""
+        start = max(0, self.window_start - PAGE_LINES)
+        lines = self.buffer.get_lines(start, self.window_start - start)
+        if not lines:
+            return
+        self._paging = True
+        try:
+            cursor = QTextCursor(self.text_edit.document())
+            cursor.movePosition(QTextCursor.Start)
+            cursor.insertText("\n".join(lines) + "\n", self._plain_format)
+            self.window_start = start
+            self.window_count += len(lines)
+            self._trim_bottom()
+            self._reload_styles(start, start + len(lines))
+            # Garder à l'écran la ligne qui était en haut
+            self.text_edit.verticalScrollBar().setValue(len(lines))
+        finally:
+            self._paging = False
+
+    def _page_down(self):
+        """Charge les lignes suivant la fenêtre."""
+        lines = self.buffer.get_lines(self.window_end, PAGE_LINES)
+        if not lines:
+            return
+        self._paging = True
+        try:
+            scroll_bar = self.text_edit.verticalScrollBar()
+            value = scroll_bar.value()
+            self._append_plain("\n".join(lines))
+            self.window_count += len(lines)
+            self._reload_styles(self.window_end - len(lines), self.window_end)
+            removed = self._trim_top()
+            scroll_bar.setValue(value - removed)
+        finally:
+            self._paging = False
+
+    def _append_plain(self, text: str):
+        """Ajoute du texte sans style à la fin de la zone de texte."""
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        # Format explicite : ne pas hériter de la couleur du texte précédent
+        if self.window_count:
+            text = "\n" + text
+        cursor.insertText(text, self._plain_format)
+
+    def _trim_top(self) -> int:
+        """
+        Retire les lignes du haut qui dépassent la limite.
+
+        Returns:
+            Le nombre de lignes retirées
+        """
+        excess = self.window_count - self.scrollback_lines
+        if excess <= 0:
+            return 0
+        # Sélection par position : NextBlock avance bloc par bloc (coûteux)
+        document = self.text_edit.document()
+        cursor = QTextCursor(document)
+        cursor.setPosition(
+            document.findBlockByNumber(excess).position(), QTextCursor.KeepAnchor
+        )
+        cursor.removeSelectedText()
+        self.window_start += excess
+        self.window_count -= excess
+        self._drop_styles_outside_window()
+        return excess
+
+    def _trim_bottom(self):
+        """Retire les lignes du bas qui dépassent la limite."""
+        excess = self.window_count - self.scrollback_lines
+        if excess <= 0:
+            return
+        document = self.text_edit.document()
+        last_kept = document.findBlockByNumber(self.window_count - excess - 1)
+        cursor = QTextCursor(document)
+        cursor.setPosition(last_kept.position() + last_kept.length() - 1)
+        cursor.setPosition(document.characterCount() - 1, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        self.window_count -= excess
+        self._drop_styles_outside_window()
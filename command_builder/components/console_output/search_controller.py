@@ -0,0 +1,244 @@
+"""
+Module contenant la classe ConsoleSearchController qui gère la barre de
+recherche de la console.
+"""
+
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+)
+
+from command_builder.components.console_output.console_view import ConsoleView
+from command_builder.services.console_search import (
+    TAG_CMD,
+    TAG_ERR,
+    TAG_OUT,
+    ConsoleSearchIndex,
+    ConsoleSearchJob,
+    SearchQuery,
+)
+
+# Délai entre la dernière frappe et le lancement de la recherche (ms)
+SEARCH_DEBOUNCE_MS = 200
+
+# Étiquette filtrée pour chaque entrée de comboSearchTag
+TAG_FILTERS = [None, TAG_OUT, TAG_ERR, TAG_CMD]
+
+
+class ConsoleSearchController(QObject):
+    """
+    Recherche dans la console : lance les recherches en arrière-plan, les
+    complète au fil des nouvelles lignes et gère la navigation entre résultats.
+    """
+
+    def __init__(
+        self,
+        view: ConsoleView,
+        index: ConsoleSearchIndex,
+        line_edit: QLineEdit,
+        checkbox_regex: QCheckBox,
+        combo_tag: QComboBox,
+        button_previous: QPushButton,
+        button_next: QPushButton,
+        label_count: QLabel,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Initialise la recherche.
+
+        Args:
+            view: L'affichage de la console
+            index: L'index des étiquettes des lignes
+            line_edit: Le champ de recherche
+            checkbox_regex: La case « expression régulière »
+            combo_tag: Le filtre par étiquette
+            button_previous: Le bouton « résultat précédent »
+            button_next: Le bouton « résultat suivant »
+            label_count: Le libellé du nombre de résultats
+            parent: Le QObject parent
+        """
+        super().__init__(parent)
+        self.view = view
+        self.index = index
+        self.line_edit = line_edit
+        self.checkbox_regex = checkbox_regex
+        self.combo_tag = combo_tag
+        self.label_count = label_count
+
+        self.query: Optional[SearchQuery] = None
+        self.matches: List[int] = []  # Lignes trouvées, dans l'ordre
+        self.current = -1  # Index du résultat sélectionné
+        self.error: Optional[str] = None
+        self._generation = 0
+        self._searched_upto = 0  # Ligne suivant la dernière examinée
+        self._running = False
+        self._pending_lines = False  # Lignes ajoutées pendant une recherche
+        self._jobs = set()  # Recherches en cours (gardées jusqu'à leur fin)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._on_query_changed)
+
+        line_edit.textChanged.connect(lambda _text: self._debounce_timer.start())
+        line_edit.returnPressed.connect(self._on_return_pressed)
+        checkbox_regex.toggled.connect(lambda _checked: self._on_query_changed())
+        combo_tag.currentIndexChanged.connect(lambda _index: self._on_query_changed())
+        button_previous.clicked.connect(self.previous)
+        button_next.clicked.connect(self.next)
+
+    def is_running(self) -> bool:
+        """
+        Indique si une recherche est en cours.
+
+        Returns:
+            True si des résultats sont en attente
+        """
+        return self._running
+
+    def search(self, query: Optional[SearchQuery]):
+        """
+        Lance une nouvelle recherche (remplace la précédente).
+
+        Args:
+            query: La recherche (None ou texte vide = aucune recherche)
+        """
+        self._generation += 1
+        for job in self._jobs:
+            job.cancel()
+        self.query = query if query and query.text else None
+        self.matches = []
+        self.current = -1
+        self.error = None
+        self._searched_upto = 0
+        self._running = False
+        self._pending_lines = False
+        if self.query is not None:
+            self._start_job()
+        self._update_label()
+
+    def on_lines_added(self):
+        """Complète la recherche en cours avec les lignes ajoutées."""
+        if self.query is None or self.error:
+            return
+        if self._running:
+            self._pending_lines = True
+        else:
+            self._start_job()
+
+    def reset(self):
+        """Relance la recherche en cours après l'effacement de la console."""
+        self.search(self.query)
+
+    def next(self):
+        """Sélectionne le résultat suivant."""
+        self._select(self.current + 1)
+
+    def previous(self):
+        """Sélectionne le résultat précédent."""
+        self._select(self.current - 1 if self.current >= 0 else -1)
+
+    def _select(self, position: int):
+        """Affiche le résultat à la position donnée (en boucle)."""
+        if not self.matches:
+            return
+        self.current = position % len(self.matches)
+        self.view.show_line(self.matches[self.current])
+        self._update_label()
+
+    def _on_query_changed(self):
+        """Lance la recherche correspondant aux champs de la barre."""
+        self._debounce_timer.stop()
+        self.search(
+            SearchQuery(
+                text=self.line_edit.text(),
+                regex=self.checkbox_regex.isChecked(),
+                tag=TAG_FILTERS[max(0, self.combo_tag.currentIndex())],
+            )
+        )
+
+    def _on_return_pressed(self):
+        """Entrée : résultat suivant, Maj+Entrée : résultat précédent."""
+        if self._debounce_timer.isActive():
+            self._on_query_changed()
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier:
+            self.previous()
+        else:
+            self.next()
+
+    def _start_job(self):
+        """Cherche dans les lignes pas encore examinées."""
+        end = min(len(self.view.buffer), len(self.index))
+        if end <= self._searched_upto:
+            return
+        job = ConsoleSearchJob(
+            self.view.buffer,
+            self.index,
+            self.query,
+            self._generation,
+            self._searched_upto,
+            end,
+        )
+        job.finished.connect(
+            lambda generation, matches, upto: self._on_job_finished(
+                job, generation, matches, upto
+            )
+        )
+        job.failed.connect(
+            lambda generation, message: self._on_job_failed(job, generation, message)
+        )
+        self._jobs.add(job)
+        self._running = True
+        self._pending_lines = False
+        job.start()
+
+    def _on_job_finished(self, job, generation: int, matches: List[int], upto: int):
+        """Ajoute les résultats d'une recherche terminée."""
+        self._jobs.discard(job)
+        if generation != self._generation:
+            return
+        self._running = False
+        first_results = not self.matches and matches
+        self.matches.extend(matches)
+        self._searched_upto = upto
+        self._update_label()
+        if first_results:
+            self._select(0)
+        if self._pending_lines:
+            self._start_job()
+
+    def _on_job_failed(self, job, generation: int, message: str):
+        """Signale une expression régulière invalide."""
+        self._jobs.discard(job)
+        if generation != self._generation:
+            return
+        self._running = False
+        self.error = message
+        self._update_label()
+
+    def _update_label(self):
+        """Met à jour le nombre de résultats et l'état du champ de recherche."""
+        invalid = self.error is not None
+        if self.line_edit.property("invalid") != invalid:
+            self.line_edit.setProperty("invalid", invalid)
+            self.line_edit.style().unpolish(self.line_edit)
+            self.line_edit.style().polish(self.line_edit)
+
+        if self.query is None:
+            text = ""
+        elif invalid:
+            text = "Expression invalide"
+        elif not self.matches:
+            text = "Recherche..." if self._running else "Aucun résultat"
+        elif self.current >= 0:
+            text = f"{self.current + 1}/{len(self.matches)}"
+        else:
+            text = f"{len(self.matches)} résultats"
+        self.label_count.setText(text)
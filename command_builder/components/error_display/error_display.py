@@ -1,12 +1,23 @@
 """Composant pour afficher les erreurs YAML."""
 
 from pathlib import Path
+from typing import List, Optional
 
+from PySide6.QtCore import QModelIndex
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QLabel, QScrollArea, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QAbstractItemView, QLabel, QTreeView, QVBoxLayout, QWidget
 
+from command_builder.components.error_display.error_item_delegate import (
+    ErrorItemDelegate,
+)
+from command_builder.components.error_display.error_list_model import ErrorListModel
+from command_builder.components.stylesheet import apply_application_stylesheet
 from command_builder.models.yaml_error import YamlError
 
+# Jusqu'à ce nombre d'erreurs, tous les groupes sont dépliés à l'ouverture ;
+# au-delà, seuls les fichiers le sont (types d'erreur et nombres visibles)
+AUTO_EXPAND_MAX_ERRORS = 20
+
 
 class ErrorDisplay(QWidget):
     """Widget pour afficher une erreur YAML de manière lisible."""
@@ -43,14 +54,18 @@ class ErrorDisplay(QWidget):
         self.setLayout(ui.layout())
 
     def _load_stylesheet(self):
-        """Charge le fichier QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "error_display.qss"
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
-        if qss_file.exists():
-            with open(qss_file, "r", encoding="utf-8") as f:
-                stylesheet = f.read()
-                self.setStyleSheet(stylesheet)
+    def set_error(self, error: YamlError):
+        """
+        Affiche une autre erreur.
+
+        Args:
+            error: L'erreur YAML à afficher
+        """
+        self.error = error
+        self._populate_data()
 
     def _populate_data(self):
         """Remplit les labels avec les données de l'erreur."""
@@ -75,7 +90,16 @@ class ErrorDisplay(QWidget):
 
 
 class ErrorsPanel(QWidget):
-    """Panel pour afficher plusieurs erreurs YAML."""
+    """
+    Panel pour afficher plusieurs erreurs YAML.
+
+    Les erreurs sont présentées dans un arbre (ErrorListModel) groupé par
+    fichier puis par type d'erreur, avec le nombre d'erreurs de chaque
+    groupe ; un ErrorItemDelegate dessine chaque erreur sur deux lignes.
+    Le détail complet (message, suggestion) de l'erreur sélectionnée est
+    affiché sous l'arbre par un unique ErrorDisplay : le coût d'ouverture
+    ne dépend plus du nombre d'erreurs.
+    """
 
     def __init__(self, errors: list, parent=None):
         """
@@ -87,6 +111,7 @@ class ErrorsPanel(QWidget):
         """
         super().__init__(parent)
         self.errors = errors
+        self.model = ErrorListModel(errors, self)
         self._setup_ui()
         self._load_stylesheet()
 
@@ -96,39 +121,97 @@ class ErrorsPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Titre du panel
-        title_label = QLabel(f"⚠️ {len(self.errors)} erreur(s) détectée(s)")
-        title_label.setObjectName("titleLabel")
-        layout.addWidget(title_label)
+        # Titre du panel et nombre d'erreurs par type
+        file_count = self.model.rowCount()
+        self.title_label = QLabel(
+            f"⚠️ {len(self.errors)} erreur(s) détectée(s) dans {file_count} fichier(s)"
+        )
+        self.title_label.setObjectName("titleLabel")
+        layout.addWidget(self.title_label)
+
+        self.summary_label = QLabel(
+            " · ".join(
+                f"{error_type} : {count}"
+                for error_type, count in self.model.counts_by_type().items()
+            )
+        )
+        self.summary_label.setObjectName("summaryLabel")
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        # Arbre des erreurs (seules les lignes visibles sont dessinées)
+        self.tree_view = QTreeView()
+        self.tree_view.setObjectName("errorTree")
+        self.tree_view.setHeaderHidden(True)
+        self.tree_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tree_view.setModel(self.model)
+        self.delegate = ErrorItemDelegate(self.tree_view)
+        self.tree_view.setItemDelegate(self.delegate)
+        self.tree_view.selectionModel().currentChanged.connect(self._on_current_changed)
+        self._expand_groups()
+        layout.addWidget(self.tree_view, 1)
+
+        # Détail de l'erreur sélectionnée (affiché à la demande)
+        self.detail_display = ErrorDisplay(
+            self.errors[0] if self.errors else YamlError("", "", "")
+        )
+        self.detail_display.setVisible(False)
+        layout.addWidget(self.detail_display)
 
-        # Scroll area pour les erreurs
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setObjectName("scrollArea")
+        self.setLayout(layout)
 
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout()
-        scroll_layout.setSpacing(8)
-        scroll_layout.setContentsMargins(8, 8, 8, 8)
+    def _expand_groups(self):
+        """Déplie les fichiers, et les types d'erreur s'il y a peu d'erreurs."""
+        expand_types = len(self.errors) <= AUTO_EXPAND_MAX_ERRORS
+        for row in range(self.model.rowCount()):
+            file_index = self.model.index(row, 0)
+            self.tree_view.expand(file_index)
+            if expand_types:
+                for type_row in range(self.model.rowCount(file_index)):
+                    self.tree_view.expand(self.model.index(type_row, 0, file_index))
 
-        # Ajouter chaque erreur
-        for error in self.errors:
-            error_display = ErrorDisplay(error)
-            scroll_layout.addWidget(error_display)
+    def _load_stylesheet(self):
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
-        scroll_layout.addStretch()
-        scroll_content.setLayout(scroll_layout)
-        scroll.setWidget(scroll_content)
+    def selected_error(self) -> Optional[YamlError]:
+        """
+        Retourne l'erreur sélectionnée.
 
-        layout.addWidget(scroll)
-        self.setLayout(layout)
+        Returns:
+            L'erreur, ou None si aucune erreur n'est sélectionnée
+        """
+        return self.model.error_at(self.tree_view.currentIndex())
 
-    def _load_stylesheet(self):
-        """Charge le fichier QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "error_display.qss"
+    def select_error(self, error: YamlError):
+        """
+        Sélectionne une erreur et affiche son détail.
 
-        if qss_file.exists():
-            with open(qss_file, "r", encoding="utf-8") as f:
-                stylesheet = f.read()
-                self.setStyleSheet(stylesheet)
+        Args:
+            error: L'erreur (de la liste du panel)
+        """
+        for index in self._error_indexes():
+            if self.model.error_at(index) is error:
+                self.tree_view.scrollTo(index)
+                self.tree_view.setCurrentIndex(index)
+                return
+
+    def _error_indexes(self) -> List[QModelIndex]:
+        """Retourne les index de toutes les lignes d'erreur."""
+        indexes = []
+        for row in range(self.model.rowCount()):
+            file_index = self.model.index(row, 0)
+            for type_row in range(self.model.rowCount(file_index)):
+                type_index = self.model.index(type_row, 0, file_index)
+                indexes.extend(
+                    self.model.index(error_row, 0, type_index)
+                    for error_row in range(self.model.rowCount(type_index))
+                )
+        return indexes
+
+    def _on_current_changed(self, current: QModelIndex, _previous: QModelIndex):
+        """Affiche le détail de l'erreur sélectionnée (rien pour un groupe)."""
+        error = self.model.error_at(current)
+        if error is not None:
+            self.detail_display.set_error(error)
+        self.detail_display.setVisible(error is not None)
@@ -0,0 +1,88 @@
+"""
+Module contenant le délégué qui dessine les erreurs du panneau d'erreurs.
+"""
+
+from PySide6.QtCore import QModelIndex, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from command_builder.components.error_display.error_list_model import (
+    ERROR_ROLE,
+    error_title,
+)
+
+# Couleurs reprises de error_display.qss (titre et message d'une erreur)
+ERROR_TITLE_COLOR = "#d32f2f"
+ERROR_MESSAGE_COLOR = "#333333"
+ERROR_SELECTED_COLOR = "#fff3e0"
+
+# Marges intérieures d'une ligne d'erreur (px)
+ERROR_ITEM_PADDING = 4
+
+
+class ErrorItemDelegate(QStyledItemDelegate):
+    """
+    Dessine chaque erreur sur deux lignes : type et numéro de ligne en
+    rouge, puis le message (tronqué). Les lignes de groupe gardent le rendu
+    standard ; le détail complet de l'erreur sélectionnée est affiché sous
+    la liste par ErrorsPanel.
+    """
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Hauteur de deux lignes de texte pour une erreur."""
+        if index.data(ERROR_ROLE) is None:
+            return super().sizeHint(option, index)
+        height = QFontMetrics(option.font).height() * 2 + ERROR_ITEM_PADDING * 2
+        return QSize(option.rect.width(), height)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ):
+        """
+        Dessine une ligne de la liste.
+
+        Args:
+            painter: Le QPainter de la vue
+            option: L'état et la géométrie de la ligne
+            index: L'index de la ligne
+        """
+        error = index.data(ERROR_ROLE)
+        if error is None:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, QColor(ERROR_SELECTED_COLOR))
+
+        padding = ERROR_ITEM_PADDING
+        rect = option.rect.adjusted(padding, padding, -padding, -padding)
+        metrics = QFontMetrics(option.font)
+        line_height = metrics.height()
+        title_rect = rect.adjusted(0, 0, 0, -line_height)
+        message_rect = rect.adjusted(0, line_height, 0, 0)
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(ERROR_TITLE_COLOR))
+        painter.drawText(
+            title_rect,
+            align,
+            QFontMetrics(font).elidedText(
+                error_title(error), Qt.TextElideMode.ElideRight, title_rect.width()
+            ),
+        )
+
+        painter.setFont(option.font)
+        painter.setPen(QColor(ERROR_MESSAGE_COLOR))
+        message = " ".join(error.error_message.split())  # Sur une seule ligne
+        painter.drawText(
+            message_rect,
+            align,
+            metrics.elidedText(
+                message, Qt.TextElideMode.ElideRight, message_rect.width()
+            ),
+        )
+        painter.restore()
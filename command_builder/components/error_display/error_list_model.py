@@ -0,0 +1,138 @@
+"""
+Module contenant le modèle des erreurs YAML, groupées par fichier et par type.
+"""
+
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
+
+from command_builder.models.yaml_error import YamlError
+
+# Rôle portant la YamlError d'une ligne d'erreur (None pour les groupes)
+ERROR_ROLE = Qt.ItemDataRole.UserRole + 1
+# Rôle portant le nombre d'erreurs d'un groupe
+COUNT_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+def group_errors(errors: List[YamlError]) -> Dict[str, Dict[str, List[YamlError]]]:
+    """
+    Regroupe des erreurs par fichier puis par type d'erreur.
+
+    Args:
+        errors: Les erreurs, dans l'ordre de détection
+
+    Returns:
+        {fichier: {type: [erreurs]}}, dans l'ordre de première apparition
+    """
+    groups: Dict[str, Dict[str, List[YamlError]]] = {}
+    for error in errors:
+        groups.setdefault(error.file_name, {}).setdefault(error.error_type, []).append(
+            error
+        )
+    return groups
+
+
+def error_title(error: YamlError) -> str:
+    """
+    Retourne le titre d'une erreur (type et ligne).
+
+    Args:
+        error: L'erreur
+
+    Returns:
+        Le titre affiché
+    """
+    if error.line_number:
+        return f"{error.error_type} (ligne {error.line_number})"
+    return error.error_type
+
+
+class ErrorListModel(QStandardItemModel):
+    """
+    Arbre des erreurs YAML : fichiers, types d'erreur puis erreurs.
+
+    Chaque groupe affiche son nombre d'erreurs. Les données sont tenues par
+    des QStandardItem (aucune méthode redéfinie en Python) : la vue ne
+    dessine que les lignes visibles, quel que soit le nombre d'erreurs.
+    """
+
+    def __init__(self, errors: Optional[List[YamlError]] = None, parent=None):
+        """
+        Initialise le modèle.
+
+        Args:
+            errors: Les erreurs à afficher
+            parent: Le QObject parent
+        """
+        super().__init__(parent)
+        self.errors: List[YamlError] = []
+        self.set_errors(errors or [])
+
+    def set_errors(self, errors: List[YamlError]):
+        """
+        Remplace les erreurs du modèle.
+
+        Args:
+            errors: Les erreurs, dans l'ordre de détection
+        """
+        self.errors = list(errors)
+        self.clear()
+        bold = QFont()
+        bold.setBold(True)
+        root = self.invisibleRootItem()
+        for file_name, by_type in group_errors(self.errors).items():
+            count = sum(len(type_errors) for type_errors in by_type.values())
+            file_item = self._group_item(f"📄 {file_name}", count, bold)
+            for error_type, type_errors in by_type.items():
+                type_item = self._group_item(f"❌ {error_type}", len(type_errors))
+                type_item.appendRows([self._error_item(e) for e in type_errors])
+                file_item.appendRow(type_item)
+            root.appendRow(file_item)
+
+    @staticmethod
+    def _group_item(
+        label: str, count: int, font: Optional[QFont] = None
+    ) -> QStandardItem:
+        """Crée la ligne d'un groupe, avec son nombre d'erreurs."""
+        item = QStandardItem(f"{label}  ({count})")
+        item.setEditable(False)
+        item.setData(count, COUNT_ROLE)
+        if font is not None:
+            item.setFont(font)
+        return item
+
+    @staticmethod
+    def _error_item(error: YamlError) -> QStandardItem:
+        """Crée la ligne d'une erreur (message complet dans la bulle d'aide)."""
+        item = QStandardItem(error.error_message)
+        item.setEditable(False)
+        item.setData(error, ERROR_ROLE)
+        item.setToolTip(str(error))
+        return item
+
+    def error_at(self, index: QModelIndex) -> Optional[YamlError]:
+        """
+        Retourne l'erreur d'une ligne.
+
+        Args:
+            index: L'index de la ligne
+
+        Returns:
+            L'erreur, ou None pour une ligne de groupe
+        """
+        if not index.isValid():
+            return None
+        return index.data(ERROR_ROLE)
+
+    def counts_by_type(self) -> Dict[str, int]:
+        """
+        Compte les erreurs par type, tous fichiers confondus.
+
+        Returns:
+            {type: nombre}, les types les plus fréquents en premier
+        """
+        counts: Dict[str, int] = {}
+        for error in self.errors:
+            counts[error.error_type] = counts.get(error.error_type, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
@@ -6,6 +6,8 @@ from PySide6 import QtUiTools
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QPushButton
 
+from command_builder.components.stylesheet import apply_application_stylesheet
+
 
 class HelpButton(QPushButton):
     """Bouton pour ouvrir la fenêtre d'aide YAML."""
@@ -36,11 +38,8 @@ class HelpButton(QPushButton):
         self.setMinimumSize(widget.minimumSize())
 
     def _load_stylesheet(self):
-        """Charge la feuille de style depuis le fichier .qss."""
-        qss_file = Path(__file__).parent / "help_button.qss"
-        if qss_file.exists():
-            with open(qss_file, "r", encoding="utf-8") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _connect_signals(self):
         """Connecte les signaux internes."""
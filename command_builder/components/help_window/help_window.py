@@ -1,15 +1,18 @@
 """Fenêtre d'aide avec documentation complète YAML.
 
-La documentation est écrite en Markdown et convertie en HTML pour l'affichage.
+La documentation est écrite en Markdown et convertie en HTML pour l'affichage
+(HTML prérendu au build ou mis en cache, voir services/help_renderer.py).
 """
 
 import sys
 from pathlib import Path
 
-import markdown
 from PySide6 import QtUiTools
 from PySide6.QtWidgets import QDialog
 
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.services.help_renderer import load_help_html
+
 
 def get_help_docs_dir() -> Path:
     """Retourne le chemin vers le dossier docs/help.
@@ -134,15 +137,13 @@ class HelpWindow(QDialog):
     """Fenêtre d'aide affichant la documentation YAML complète.
 
     La documentation est écrite en Markdown pour faciliter la maintenance
-    et convertie en HTML pour l'affichage dans QTextBrowser.
+    et convertie en HTML pour l'affichage dans QTextBrowser. Chaque onglet
+    n'est rempli qu'à sa première apparition.
     """
 
     # Chemin vers les fichiers Markdown de documentation
     HELP_DOCS_DIR = get_help_docs_dir()
 
-    # Instance du convertisseur Markdown
-    _md_converter = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
-
     def __init__(self, parent=None):
         """Initialise la fenêtre d'aide.
 
@@ -150,6 +151,7 @@ class HelpWindow(QDialog):
             parent: Widget parent
         """
         super().__init__(parent)
+        self._populated = set()  # Onglets déjà remplis (index)
         self._load_ui()
         self._load_stylesheet()
         self._connect_signals()
@@ -181,24 +183,45 @@ class HelpWindow(QDialog):
         self.close_button = self.findChild(QPushButton, "closeButton")
 
     def _load_stylesheet(self):
-        """Charge la feuille de style depuis le fichier .qss."""
-        qss_file = Path(__file__).parent / "help_window.qss"
-        if qss_file.exists():
-            with open(qss_file, "r", encoding="utf-8") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _connect_signals(self):
         """Connecte les signaux des widgets."""
         if self.close_button:
             self.close_button.clicked.connect(self.accept)
+        if self.tab_widget:
+            self.tab_widget.currentChanged.connect(self._populate_tab)
+
+    def _tab_populators(self):
+        """Retourne, pour chaque onglet, son QTextBrowser et sa méthode de remplissage."""
+        return [
+            (self.intro_text, self._populate_intro),
+            (self.structure_text, self._populate_structure),
+            (self.arguments_text, self._populate_arguments),
+            (self.shared_text, self._populate_shared),
+            (self.examples_text, self._populate_examples),
+        ]
 
     def _populate_content(self):
-        """Remplit le contenu de chaque onglet."""
-        self._populate_intro()
-        self._populate_structure()
-        self._populate_arguments()
-        self._populate_shared()
-        self._populate_examples()
+        """Remplit l'onglet affiché ; les autres le sont à leur première apparition."""
+        if self.tab_widget:
+            self._populate_tab(self.tab_widget.currentIndex())
+
+    def _populate_tab(self, index: int):
+        """Remplit un onglet s'il ne l'a pas encore été.
+
+        Args:
+            index: L'index de l'onglet
+        """
+        if index in self._populated or index < 0:
+            return
+        tab = self.tab_widget.widget(index)
+        for text_browser, populate in self._tab_populators():
+            if text_browser is not None and tab.isAncestorOf(text_browser):
+                self._populated.add(index)
+                populate()
+                return
 
     def _load_markdown_file(self, filename: str) -> str:
         """Charge un fichier Markdown et le convertit en HTML.
@@ -211,14 +234,8 @@ class HelpWindow(QDialog):
         """
         md_path = self.HELP_DOCS_DIR / filename
         if md_path.exists():
-            with open(md_path, "r", encoding="utf-8") as f:
-                md_content = f.read()
-
-            # Reset le convertisseur pour éviter les problèmes de cache
-            self._md_converter.reset()
-
-            # Convertir le Markdown en HTML
-            html_body = self._md_converter.convert(md_content)
+            # HTML prérendu ou en cache, converti seulement si le fichier a changé
+            html_body = load_help_html(md_path)
 
             # Retourner le HTML complet avec le CSS
             return f"{MARKDOWN_CSS}<body>{html_body}</body>"
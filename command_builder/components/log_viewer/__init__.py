@@ -0,0 +1,5 @@
+"""Visionneuse des journaux d'exécution archivés."""
+
+from .log_viewer import LogViewer
+
+__all__ = ["LogViewer"]
@@ -0,0 +1,141 @@
+"""
+Module contenant la classe LogViewer qui affiche un journal d'exécution archivé.
+"""
+
+from pathlib import Path
+
+from PySide6 import QtUiTools
+from PySide6.QtWidgets import QComboBox, QDialog, QLabel, QPlainTextEdit, QPushButton
+
+from command_builder.components.console_output.console_view import ConsoleView
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.services.log_file import LogIndexJob, open_log_file
+
+
+class LogViewer(QDialog):
+    """
+    Fenêtre de consultation d'un journal archivé (texte ou .log.gz).
+
+    Le journal est projeté en mémoire et affiché par la même vue virtualisée
+    que la console : la fenêtre s'ouvre immédiatement, quelle que soit la
+    taille du fichier, et seules les lignes affichées sont lues. Un journal
+    texte est indexé en arrière-plan ; ses lignes et ses commandes
+    apparaissent au fur et à mesure.
+    """
+
+    def __init__(self, file_path: str, parent=None):
+        """
+        Ouvre un journal.
+
+        Args:
+            file_path: Le chemin du journal
+            parent: Widget parent
+
+        Raises:
+            OSError: Si le journal ne peut pas être ouvert
+        """
+        super().__init__(parent)
+        self.file_path = Path(file_path)
+        self.log_file = open_log_file(self.file_path)
+        self._load_ui()
+        self._load_stylesheet()
+        self.label_file.setText(self.file_path.name)
+        self.setWindowTitle(f"{self.file_path.name} - CommandBuilder")
+
+        self.view = ConsoleView(self.text_log, self.log_file)
+        self.view.follow_output = False
+        self._command_count = 0
+        self._index_job = None
+        self.close_button.clicked.connect(self.accept)
+        self.combo_commands.activated.connect(self._on_command_selected)
+
+        if self.log_file.complete:
+            self._on_index_progress()
+        else:
+            self._index_job = LogIndexJob(self.log_file)
+            self._index_job.progress.connect(self._on_index_progress)
+            self._index_job.finished.connect(self._on_index_finished)
+            self._update_status()
+            self._index_job.start()
+
+    def _load_ui(self):
+        """Charge l'interface depuis le fichier .ui."""
+        ui_file = Path(__file__).parent / "log_viewer.ui"
+        loader = QtUiTools.QUiLoader()
+        ui = loader.load(str(ui_file))
+
+        self.resize(ui.size())
+        self.setLayout(ui.layout())
+
+        self.label_file = self.findChild(QLabel, "labelFile")
+        self.label_status = self.findChild(QLabel, "labelStatus")
+        self.combo_commands = self.findChild(QComboBox, "comboCommands")
+        self.text_log = self.findChild(QPlainTextEdit, "textLog")
+        self.close_button = self.findChild(QPushButton, "closeButton")
+
+    def _load_stylesheet(self):
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
+
+    def show_command(self, index: int):
+        """
+        Affiche le début d'une commande du journal.
+
+        Args:
+            index: L'index de la commande
+        """
+        if 0 <= index < self._command_count:
+            self.view.show_line(self.log_file.commands[index].first_line)
+
+    def is_indexing(self) -> bool:
+        """
+        Indique si l'indexation du journal est en cours.
+
+        Returns:
+            True tant que le thread d'indexation n'est pas terminé
+        """
+        return self._index_job is not None
+
+    def _on_command_selected(self, index: int):
+        """Affiche la commande choisie dans la liste."""
+        self.show_command(index)
+
+    def _on_index_progress(self):
+        """Affiche les lignes et les commandes indexées depuis le dernier appel."""
+        if self.log_file is None:
+            return
+        commands = self.log_file.commands[self._command_count :]
+        if commands:
+            first = self._command_count + 1
+            self.combo_commands.addItems(
+                [f"{i}. {command.name}" for i, command in enumerate(commands, first)]
+            )
+            self._command_count += len(commands)
+        self.combo_commands.setEnabled(self._command_count > 0)
+        self.view.refresh()
+        self._update_status()
+
+    def _on_index_finished(self):
+        """Termine l'affichage du journal indexé."""
+        self._index_job = None
+        self._on_index_progress()
+
+    def _update_status(self):
+        """Affiche le nombre de lignes et l'avancement de l'indexation."""
+        lines = len(self.log_file)
+        if self.log_file.complete:
+            self.label_status.setText(
+                f"{lines} lignes, {self._command_count} commandes"
+            )
+        else:
+            percent = self.log_file.indexed_bytes * 100 // max(self.log_file.size, 1)
+            self.label_status.setText(f"Indexation... {percent} % ({lines} lignes)")
+
+    def done(self, result: int):
+        """Ferme le journal avec la fenêtre (l'indexation en cours est arrêtée)."""
+        if self._index_job is not None:
+            self._index_job.cancel()
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+        super().done(result)
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List
 
 from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QDialog,
@@ -19,12 +20,22 @@ from PySide6.QtWidgets import (
 )
 
 from command_builder.components.command_form import CommandForm
+from command_builder.components.command_palette import CommandPalette
 from command_builder.components.console_output import ConsoleOutput
 from command_builder.components.error_display.error_display import ErrorsPanel
 from command_builder.components.help_button import HelpButton
 from command_builder.components.help_window import HelpWindow
+from command_builder.components.stylesheet import apply_application_stylesheet
 from command_builder.components.task_list import TaskList
 from command_builder.models.yaml_error import YamlError
+from command_builder.services.task_search_index import (
+    KIND_TASK,
+    SearchResult,
+    TaskSearchIndex,
+)
+
+# Raccourci d'ouverture de la palette de recherche
+COMMAND_PALETTE_SHORTCUT = "Ctrl+P"
 
 
 class MainWindow(QMainWindow):
@@ -173,6 +184,10 @@ class MainWindow(QMainWindow):
             layout.setSpacing(0)
             layout.addWidget(self.console_output)
 
+        # Palette de recherche (Ctrl+P), sur l'index construit par set_tasks
+        self.search_index = TaskSearchIndex()
+        self.command_palette = CommandPalette(self.search_index, self)
+
         # Définir les tailles initiales des panneaux
         self._restore_splitter_sizes()
 
@@ -201,13 +216,8 @@ class MainWindow(QMainWindow):
             self.right_splitter.setSizes([form_height, console_height])
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "main_window.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _connect_signals(self):
         """Connecte les signaux aux slots."""
@@ -219,6 +229,11 @@ class MainWindow(QMainWindow):
             # Connecter le signal de sélection de commande à l'affichage du formulaire
             self.task_list.command_selected.connect(self._on_command_selected)
 
+        # Ouvrir la palette de recherche depuis n'importe quel widget de la fenêtre
+        self.palette_shortcut = QShortcut(QKeySequence(COMMAND_PALETTE_SHORTCUT), self)
+        self.palette_shortcut.activated.connect(self.command_palette.popup)
+        self.command_palette.result_chosen.connect(self._on_palette_result_chosen)
+
         if self.command_form and self.console_output:
             # Connecter le formulaire via un intercepteur pour vérifier les exécutions en cours
             self.command_form.commands_to_execute.connect(self._on_commands_to_execute)
@@ -275,15 +290,26 @@ class MainWindow(QMainWindow):
 
     def _on_command_selected(self, _unused, task_name):
         """Gère la sélection d'une tâche dans la liste."""
-        if task := next((t for t in self.task_list.tasks if t.name == task_name), None):
+        if task := self.task_list.get_task(task_name):
             if task.commands and self.command_form:
                 # Utiliser set_task pour supporter les arguments partagés
                 self.command_form.set_task(task)
 
+    def _on_palette_result_chosen(self, result: SearchResult):
+        """Ouvre la tâche choisie dans la palette et y sélectionne l'élément trouvé."""
+        task = self.task_list.get_task(result.task_name)
+        if task is None:
+            return
+        self.task_list.select_task(task)
+        if result.kind != KIND_TASK and self.command_form:
+            self.command_form.focus_argument(result.command_index, result.argument_code)
+
     def set_tasks(self, tasks):
-        """Définit les tâches à afficher dans l'interface."""
+        """Définit les tâches à afficher dans l'interface et indexe leur recherche."""
         if self.task_list:
             self.task_list.set_tasks(tasks)
+        self.search_index.rebuild(tasks or [])
+        self.command_palette.set_index(self.search_index)
 
     def show_yaml_errors(self, errors: List[YamlError]):
         """
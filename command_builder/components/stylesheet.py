@@ -0,0 +1,201 @@
+"""
+Feuille de style unique de l'application.
+
+Les fichiers .qss des composants sont lus une seule fois et fusionnés en une
+feuille appliquée à la QApplication, au lieu d'être relus et appliqués par
+setStyleSheet à chaque instance (ce qui obligeait Qt à recalculer le style de
+chaque widget). Chaque règle est limitée au composant auquel appartient le
+fichier par un sélecteur de classe : « QLabel » dans argument_component.qss
+devient « ArgumentComponent QLabel », et s'applique donc, comme avant, au
+composant et à ses descendants uniquement.
+"""
+
+import html
+import re
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6 import QtWidgets
+from PySide6.QtGui import Qt
+from PySide6.QtWidgets import QApplication, QLabel
+
+# Dossier des composants (les chemins des fichiers .qss y sont relatifs)
+COMPONENTS_DIR = Path(__file__).parent
+
+# Règles globales, non limitées à un composant (bulles d'aide, etc.)
+APPLICATION_STYLESHEET = "application.qss"
+
+# Feuilles des composants dans l'ordre de la fusion : à spécificité égale la
+# dernière règle l'emporte, les conteneurs précèdent donc leur contenu.
+# (classe du composant, classe Qt dont il hérite, fichier .qss)
+COMPONENT_STYLESHEETS = [
+    ("MainWindow", "QMainWindow", "main_window/main_window.qss"),
+    ("TaskList", "QWidget", "task_list/task_list.qss"),
+    ("TaskComponent", "QWidget", "task_component/task_component.qss"),
+    ("CommandForm", "QWidget", "command_form/command_form.qss"),
+    ("CommandComponent", "QWidget", "command_component/command_component.qss"),
+    ("ArgumentComponent", "QWidget", "argument_component/argument_component.qss"),
+    ("ConsoleOutput", "QWidget", "console_output/console_output.qss"),
+    ("HelpButton", "QPushButton", "help_button/help_button.qss"),
+    ("HelpWindow", "QDialog", "help_window/help_window.qss"),
+    ("LogViewer", "QDialog", "log_viewer/log_viewer.qss"),
+    ("CommandPalette", "QDialog", "command_palette/command_palette.qss"),
+    ("ErrorsPanel", "QWidget", "error_display/error_display.qss"),
+]
+
+# Mise en forme des labels d'arguments ayant leur valeur par défaut
+DEFAULT_VALUE_STYLE = "color: rgb(76, 175, 80); font-weight: bold;"
+
+# Symbole précédant le label d'un argument dont la valeur est invalide
+VALIDATION_ERROR_MARK = "⚠"
+VALIDATION_ERROR_STYLE = "color: #e74c3c; font-weight: bold;"
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_LEADING_TYPE = re.compile(r"[A-Za-z_]\w*")
+
+# Feuille fusionnée (construite au premier appel)
+_stylesheet: Optional[str] = None
+
+
+def _is_qt_class(name: str, base_class: str) -> bool:
+    """Indique si base_class hérite de la classe Qt name."""
+    qt_class = getattr(QtWidgets, name, None)
+    return isinstance(qt_class, type) and issubclass(
+        getattr(QtWidgets, base_class), qt_class
+    )
+
+
+def scope_stylesheet(stylesheet: str, component: str, base_class: str) -> str:
+    """
+    Limite les règles d'une feuille de style à un composant.
+
+    Chaque sélecteur est préfixé par la classe du composant (descendants) ;
+    un sélecteur qui peut désigner le composant lui-même (« QDialog »,
+    « #CommandForm ») est aussi repris avec la classe du composant à la place
+    de son type. Les sélecteurs commençant déjà par une classe de composant
+    sont gardés tels quels.
+
+    Args:
+        stylesheet: Le contenu du fichier .qss
+        component: Le nom de la classe du composant
+        base_class: Le nom de la classe Qt dont hérite le composant
+
+    Returns:
+        La feuille de style limitée au composant
+    """
+    rules = []
+    for match in _RULE.finditer(_COMMENT.sub("", stylesheet)):
+        selectors = []
+        for selector in match.group(1).split(","):
+            selector = selector.strip()
+            leading = _LEADING_TYPE.match(selector)
+            leading_type = leading.group(0) if leading else None
+            if leading_type and not hasattr(QtWidgets, leading_type):
+                selectors.append(selector)  # Déjà limité à un composant
+                continue
+            selectors.append(f"{component} {selector}")
+            if leading_type is None or _is_qt_class(leading_type, base_class):
+                rest = selector[len(leading_type or "") :].lstrip("*")
+                selectors.append(component + rest)
+        rules.append(f"{', '.join(selectors)} {{{match.group(2)}}}")
+    return "\n".join(rules)
+
+
+def application_stylesheet() -> str:
+    """
+    Retourne la feuille de style de l'application.
+
+    Les fichiers .qss ne sont lus et fusionnés qu'au premier appel.
+
+    Returns:
+        Les règles globales suivies des règles de chaque composant
+    """
+    global _stylesheet
+    if _stylesheet is None:
+        parts: List[str] = []
+        global_file = COMPONENTS_DIR / APPLICATION_STYLESHEET
+        if global_file.exists():
+            parts.append(global_file.read_text(encoding="utf-8"))
+        for component, base_class, qss_path in COMPONENT_STYLESHEETS:
+            qss_file = COMPONENTS_DIR / qss_path
+            if qss_file.exists():
+                parts.append(
+                    scope_stylesheet(
+                        qss_file.read_text(encoding="utf-8"), component, base_class
+                    )
+                )
+        _stylesheet = "\n".join(parts)
+    return _stylesheet
+
+
+def apply_application_stylesheet(app: Optional[QApplication] = None):
+    """
+    Applique la feuille de style à l'application si ce n'est pas déjà fait.
+
+    Args:
+        app: L'application (None = l'instance courante)
+    """
+    app = app or QApplication.instance()
+    if app is None:
+        return
+    stylesheet = application_stylesheet()
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+
+
+def set_default_value_style(label: QLabel, has_default: bool):
+    """
+    Met en évidence (ou non) le label d'un argument ayant sa valeur par défaut.
+
+    La mise en forme passe par le texte (HTML) du label : contrairement à une
+    propriété lue par la feuille de style, elle ne demande pas de recalculer
+    le style du widget (unpolish/polish). Rien n'est fait si l'état ne change
+    pas, ce qui est le cas de la plupart des frappes au clavier.
+
+    Args:
+        label: Le label de l'argument
+        has_default: True pour mettre le label en évidence
+    """
+    if bool(label.property("hasDefault")) == has_default:
+        return
+    label.setProperty("hasDefault", has_default)
+    _render_argument_label(label, has_default, label.property("validationError"))
+
+
+def set_validation_style(label: QLabel, message: Optional[str]):
+    """
+    Signale (ou non) sur le label d'un argument que sa valeur est invalide.
+
+    Le label est précédé d'un symbole d'avertissement et le message est
+    affiché dans sa bulle d'aide. Rien n'est fait si le message ne change pas.
+
+    Args:
+        label: Le label de l'argument
+        message: Le message d'erreur (None = valeur valide)
+    """
+    if (label.property("validationError") or None) == message:
+        return
+    label.setProperty("validationError", message or "")
+    label.setToolTip(message or "")
+    _render_argument_label(label, bool(label.property("hasDefault")), message)
+
+
+def _render_argument_label(label: QLabel, has_default: bool, error: Optional[str]):
+    """Recompose le texte d'un label d'argument d'après son état."""
+    text = label.property("baseText")
+    if text is None:
+        text = label.text()
+        label.setProperty("baseText", text)
+    has_error = isinstance(error, str) and bool(error)
+    if not has_default and not has_error:
+        label.setText(text)
+        return
+    if label.textFormat() != Qt.TextFormat.RichText and not Qt.mightBeRichText(text):
+        text = html.escape(text)
+    if has_default:
+        text = f'<span style="{DEFAULT_VALUE_STYLE}">{text}</span>'
+    if has_error:
+        mark = f'<span style="{VALIDATION_ERROR_STYLE}">{VALIDATION_ERROR_MARK}</span>'
+        text = f"{mark} {text}"
+    label.setText(text)
@@ -5,9 +5,7 @@ Module contenant la classe TaskComponent qui représente un composant de tâche
 from pathlib import Path
 
 from PySide6.QtCore import QEvent, QPoint, Qt, Signal
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
-    QApplication,
     QHBoxLayout,
     QPushButton,
     QToolTip,
@@ -15,9 +13,51 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.components.ui_loader import load_ui
 from command_builder.models.task import Task
 
 
+def build_task_tooltip(task: Task) -> str:
+    """
+    Construit un tooltip HTML formaté avec la description de la tâche et des commandes.
+
+    Args:
+        task: La tâche
+
+    Returns:
+        Le texte HTML du tooltip
+    """
+    # Commencer avec la description de la tâche
+    # Style tooltip via inline CSS to ensure theme consistency
+    tooltip_parts = [
+        "<div style='background-color: #333; color: #dcdcdc; padding: 5px; border-radius: 5px;'>",
+        f"<p style='margin: 0 0 10px 0; font-weight: bold; font-size: 13px;'>{task.name}</p>",
+        f"<p style='margin: 0 0 10px 0; color: #cccccc;'>{task.description}</p>",
+    ]
+
+    # Ajouter les commandes
+    if task.commands:
+        tooltip_parts.append(
+            "<p style='margin: 10px 0 5px 0; font-weight: bold;'>Commandes :</p>"
+        )
+        tooltip_parts.append("<ul style='margin: 0; padding-left: 20px;'>")
+
+        for cmd in task.commands:
+            tooltip_parts.append(
+                f"<li style='margin: 3px 0;'>"
+                f"<span style='font-weight: bold;'>{cmd.name}</span> : "
+                f"<span style='color: #aaaaaa;'>{cmd.description}</span>"
+                f"</li>"
+            )
+
+        tooltip_parts.append("</ul>")
+
+    tooltip_parts.append("</div>")
+
+    return "".join(tooltip_parts)
+
+
 class TaskComponent(QWidget):
     """
     Composant représentant une tâche individuelle.
@@ -49,8 +89,8 @@ class TaskComponent(QWidget):
         current_dir = Path(__file__).parent
         ui_file = current_dir / "task_component.ui"
 
-        loader = QUiLoader()
-        ui = loader.load(str(ui_file), self)
+        # Module précompilé s'il est à jour, sinon lecture du .ui
+        ui = load_ui(ui_file, self, __package__)
 
         # Configurer le layout pour inclure l'UI chargée
         layout = QVBoxLayout(self)
@@ -63,13 +103,8 @@ class TaskComponent(QWidget):
         self.info_button = ui.findChild(QPushButton, "infoButton")
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "task_component.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
 
     def _setup_ui(self):
         """Configure l'interface utilisateur avec les données de la tâche."""
@@ -87,12 +122,6 @@ class TaskComponent(QWidget):
 
         if self.info_button:
             self.info_button.setCursor(Qt.PointingHandCursor)
-            # Appliquer un style global personnalisé pour les tooltips
-            app = QApplication.instance()
-            if app is not None:
-                app.setStyleSheet(
-                    "QToolTip { background-color: #2e2e2e; color: #ffffff; border: 1px solid #7aa2f7; padding: 5px; border-radius: 5px; }"
-                )
             # Créer un tooltip riche avec la description de la tâche et des commandes
             tooltip = self._build_tooltip()
             self.info_button.setToolTip(tooltip)
@@ -133,34 +162,7 @@ class TaskComponent(QWidget):
         Returns:
             Le texte HTML du tooltip
         """
-        # Commencer avec la description de la tâche
-        # Style tooltip via inline CSS to ensure theme consistency
-        tooltip_parts = [
-            "<div style='background-color: #333; color: #dcdcdc; padding: 5px; border-radius: 5px;'>",
-            f"<p style='margin: 0 0 10px 0; font-weight: bold; font-size: 13px;'>{self.task.name}</p>",
-            f"<p style='margin: 0 0 10px 0; color: #cccccc;'>{self.task.description}</p>",
-        ]
-
-        # Ajouter les commandes
-        if self.task.commands:
-            tooltip_parts.append(
-                "<p style='margin: 10px 0 5px 0; font-weight: bold;'>Commandes :</p>"
-            )
-            tooltip_parts.append("<ul style='margin: 0; padding-left: 20px;'>")
-
-            for cmd in self.task.commands:
-                tooltip_parts.append(
-                    f"<li style='margin: 3px 0;'>"
-                    f"<span style='font-weight: bold;'>{cmd.name}</span> : "
-                    f"<span style='color: #aaaaaa;'>{cmd.description}</span>"
-                    f"</li>"
-                )
-
-            tooltip_parts.append("</ul>")
-
-        tooltip_parts.append("</div>")
-
-        return "".join(tooltip_parts)
+        return build_task_tooltip(self.task)
 
     def _on_clicked(self):
         """Gère le clic sur le bouton de tâche."""
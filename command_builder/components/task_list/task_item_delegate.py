@@ -0,0 +1,117 @@
+"""
+Module contenant le délégué qui dessine les tâches de la liste.
+"""
+
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QEvent, QModelIndex, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QHelpEvent, QPainter, QPalette
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QToolTip,
+)
+
+from command_builder.components.task_component.task_component import (
+    build_task_tooltip,
+)
+from command_builder.models.task import Task
+
+# Hauteur d'une tâche dans la liste (px)
+TASK_ITEM_HEIGHT = 40
+
+# Icône d'information dessinée à droite de chaque tâche
+TASK_INFO_MARK = "ℹ"
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """
+    Dessine chaque tâche comme l'ancien bouton de TaskComponent : fond
+    arrondi, nom en gras et icône d'information à droite (la description
+    s'affiche dans la bulle d'aide de la ligne).
+
+    Le fond et le nom sont dessinés par le style de la vue, qui applique la
+    feuille task_list.qss (règles « ::item » et police de la vue) ; la couleur de l'icône est celle de
+    info_color (propriété infoColor de TaskList, définie dans la même
+    feuille), ou à défaut celle des liens de la palette.
+    """
+
+    def __init__(
+        self, task_for_index: Callable[[QModelIndex], Optional[Task]], parent=None
+    ):
+        """
+        Initialise le délégué.
+
+        Args:
+            task_for_index: Fonction retournant la tâche d'un index de la vue
+            parent: Le QObject parent
+        """
+        super().__init__(parent)
+        self._task_for_index = task_for_index
+        self._tooltips: Dict[int, str] = {}  # Construites au premier survol
+        self.info_color = QColor()  # Invalide : couleur des liens
+
+    def helpEvent(
+        self,
+        event: QHelpEvent,
+        view: QAbstractItemView,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> bool:
+        """Affiche la description de la tâche et de ses commandes au survol."""
+        if event.type() != QEvent.Type.ToolTip:
+            return super().helpEvent(event, view, option, index)
+        task = self._task_for_index(index)
+        if task is None:
+            QToolTip.hideText()
+            return False
+        tooltip = self._tooltips.get(id(task))
+        if tooltip is None:
+            tooltip = self._tooltips[id(task)] = build_task_tooltip(task)
+        QToolTip.showText(event.globalPos(), tooltip, view)
+        return True
+
+    def clear_tooltips(self):
+        """Oublie les bulles d'aide construites (tâches rechargées)."""
+        self._tooltips = {}
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Hauteur fixe : la vue peut utiliser des lignes de taille uniforme."""
+        return QSize(option.rect.width(), TASK_ITEM_HEIGHT)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ):
+        """
+        Dessine une tâche.
+
+        Args:
+            painter: Le QPainter de la vue
+            option: L'état et la géométrie de la ligne
+            index: L'index de la tâche
+        """
+        item_option = QStyleOptionViewItem(option)
+        self.initStyleOption(item_option, index)
+        widget = item_option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, item_option, painter, widget
+        )
+
+        painter.save()
+        font = QFont(option.font)
+        font.setBold(False)
+        painter.setFont(font)
+        color = self.info_color
+        if not color.isValid():
+            color = option.palette.color(QPalette.ColorRole.Link)
+        painter.setPen(color)
+        painter.drawText(
+            option.rect.adjusted(0, 0, -12, 0),
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight,
+            TASK_INFO_MARK,
+        )
+        painter.restore()
@@ -3,13 +3,16 @@ Module contenant la classe TaskList qui affiche les tâches disponibles.
 """
 
 from pathlib import Path
-from typing import Callable, Optional
+from typing import List, Optional
 
-from PySide6.QtCore import Signal
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QVBoxLayout, QWidget
+from PySide6.QtCore import Property, QModelIndex, QSortFilterProxyModel, Qt, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QLineEdit, QListView, QVBoxLayout, QWidget
 
-from command_builder.components.task_component import TaskComponent
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.components.task_list.task_item_delegate import TaskItemDelegate
+from command_builder.components.task_list.task_list_model import TaskListModel
+from command_builder.components.ui_loader import load_ui
 from command_builder.models.task import Task
 
 
@@ -18,7 +21,10 @@ class TaskList(QWidget):
     Classe représentant le composant de liste des tâches.
     Ce composant affiche la liste des tâches disponibles et permet de les sélectionner.
 
-    Cette classe est découplée de TaskComponent grâce à l'injection de dépendances.
+    Les tâches sont tenues par un TaskListModel (trié, indexé par nom) et
+    dessinées par un TaskItemDelegate : aucun widget n'est créé par tâche.
+    Le champ de filtre restreint la liste au fil de la frappe, via un
+    QSortFilterProxyModel.
     """
 
     # Signal émis lorsqu'une tâche est sélectionnée
@@ -26,40 +32,30 @@ class TaskList(QWidget):
     # Signal émis lorsqu'une commande est sélectionnée
     command_selected = Signal(str, str)  # (task_name, command_name)
 
-    def __init__(
-        self,
-        parent=None,
-        task_widget_factory: Optional[Callable[[Task, QWidget], QWidget]] = None,
-    ):
+    def __init__(self, parent=None):
         """
         Initialise le composant TaskList.
 
         Args:
             parent: Le widget parent (par défaut: None)
-            task_widget_factory: Fonction pour créer un widget de tâche.
-                                Signature: (task: Task, parent: QWidget) -> QWidget
-                                Si None, utilise TaskComponent par défaut.
         """
         super().__init__(parent)
-        self.tasks = []
         self.selected_task = None
-        self._task_widget_factory = (
-            task_widget_factory or self._default_task_widget_factory
-        )
+        self.model = TaskListModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self._load_ui()
         self._load_stylesheet()
-
-    def _default_task_widget_factory(self, task: Task, parent: QWidget) -> QWidget:
-        """Factory par défaut pour créer un TaskComponent."""
-        return TaskComponent(task, parent)
+        self._setup_ui()
 
     def _load_ui(self):
         """Charge le fichier UI du composant."""
         current_dir = Path(__file__).parent
         ui_file = current_dir / "task_list.ui"
 
-        loader = QUiLoader()
-        ui = loader.load(str(ui_file), self)
+        # Module précompilé s'il est à jour, sinon lecture du .ui
+        ui = load_ui(ui_file, self, __package__)
 
         # Configurer le layout pour inclure l'UI chargée
         layout = QVBoxLayout(self)
@@ -68,17 +64,42 @@ class TaskList(QWidget):
         self.setLayout(layout)
 
         # Stocker les références aux widgets importants
-        self.task_items_container = ui.findChild(QWidget, "taskItemsContainer")
-        self.task_items_layout = ui.findChild(QVBoxLayout, "taskItemsLayout")
+        self.filter_line_edit = ui.findChild(QLineEdit, "taskFilterLineEdit")
+        self.list_view = ui.findChild(QListView, "taskListView")
 
     def _load_stylesheet(self):
-        """Charge la feuille de style QSS."""
-        current_dir = Path(__file__).parent
-        qss_file = current_dir / "task_list.qss"
-
-        if qss_file.exists():
-            with open(qss_file, "r") as f:
-                self.setStyleSheet(f.read())
+        """Applique la feuille de style de l'application (chargée une seule fois)."""
+        apply_application_stylesheet()
+
+    def _setup_ui(self):
+        """Relie la vue au modèle filtré et au délégué."""
+        self.list_view.setModel(self.proxy_model)
+        self.delegate = TaskItemDelegate(self._task_for_index, self.list_view)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setMouseTracking(True)  # Survol des lignes
+        self.list_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.list_view.clicked.connect(self._on_index_activated)
+        self.list_view.activated.connect(self._on_index_activated)
+
+        self.filter_line_edit.textChanged.connect(self.set_filter_text)
+        self.filter_line_edit.returnPressed.connect(self._on_filter_return_pressed)
+
+    def _get_info_color(self) -> QColor:
+        """Retourne la couleur de l'icône d'information des tâches."""
+        return self.delegate.info_color
+
+    def _set_info_color(self, color: QColor):
+        """Définit la couleur de l'icône d'information (feuille de style)."""
+        self.delegate.info_color = QColor(color)
+        self.list_view.viewport().update()
+
+    # Couleur de l'icône ℹ, définie par qproperty-infoColor dans task_list.qss
+    infoColor = Property(QColor, _get_info_color, _set_info_color)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """Tâches affichées (avant filtrage), triées par nom."""
+        return self.model.tasks
 
     def set_tasks(self, tasks):
         """
@@ -87,42 +108,74 @@ class TaskList(QWidget):
         Args:
             tasks: Liste des objets Task à afficher
         """
-        self.tasks = tasks
-        self._update_task_list()
-
-    def _update_task_list(self):
-        """Met à jour l'affichage de la liste des tâches."""
-        # Effacer le contenu actuel (sauf le spacer à la fin)
-        while self.task_items_layout.count() > 1:
-            item = self.task_items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Trier les tâches par nom
-        sorted_tasks = sorted(self.tasks, key=lambda t: t.name)
-
-        # Ajouter chaque tâche triée
-        for task in sorted_tasks:
-            self._add_task_widget(task)
-
-    def _add_task_widget(self, task):
-        """Ajoute un widget pour une tâche."""
-        # Utiliser la factory pour créer le widget
-        task_widget = self._task_widget_factory(task, self)
-
-        # Connecter le signal si le widget a un signal task_clicked
-        if hasattr(task_widget, "task_clicked"):
-            task_widget.task_clicked.connect(
-                lambda t: self.command_selected.emit("", t.name)
-            )
-
-        # Ajouter le composant au layout
-        self.task_items_layout.insertWidget(
-            self.task_items_layout.count() - 1, task_widget
-        )
+        self.delegate.clear_tooltips()
+        self.model.set_tasks(list(tasks or []))
+
+    def get_task(self, name: str) -> Optional[Task]:
+        """
+        Retourne une tâche d'après son nom.
+
+        Args:
+            name: Le nom de la tâche
+
+        Returns:
+            La tâche, ou None si elle n'est pas dans la liste
+        """
+        return self.model.task_by_name(name)
+
+    def set_filter_text(self, text: str):
+        """
+        Ne garde dans la liste que les tâches dont le nom contient un texte.
+
+        Args:
+            text: Le texte recherché (sans tenir compte de la casse)
+        """
+        if self.filter_line_edit.text() != text:
+            self.filter_line_edit.setText(text)  # Rappelle cette méthode
+            return
+        self.proxy_model.setFilterFixedString(text)
+
+    def visible_tasks(self) -> List[Task]:
+        """
+        Retourne les tâches affichées après filtrage.
+
+        Returns:
+            Les tâches, dans l'ordre de la liste
+        """
+        return [
+            self._task_for_index(self.proxy_model.index(row, 0))
+            for row in range(self.proxy_model.rowCount())
+        ]
+
+    def select_task(self, task: Task):
+        """
+        Sélectionne une tâche et signale sa sélection.
+
+        Args:
+            task: La tâche
+        """
+        self.selected_task = task
+        self.task_selected.emit(task)
+        self.command_selected.emit("", task.name)
+
+    def _task_for_index(self, index: QModelIndex) -> Optional[Task]:
+        """Retourne la tâche d'un index de la vue (modèle filtré)."""
+        return self.model.task_at(self.proxy_model.mapToSource(index).row())
+
+    def _on_index_activated(self, index: QModelIndex):
+        """Sélectionne la tâche cliquée (ou validée au clavier)."""
+        task = self._task_for_index(index)
+        if task is not None:
+            self.select_task(task)
+
+    def _on_filter_return_pressed(self):
+        """Ouvre la première tâche affichée quand on valide le filtre."""
+        if self.proxy_model.rowCount() > 0:
+            index = self.proxy_model.index(0, 0)
+            self.list_view.setCurrentIndex(index)
+            self._on_index_activated(index)
 
     def clear(self):
         """Efface toutes les tâches de la liste."""
-        self.tasks = []
         self.selected_task = None
-        self._update_task_list()
+        self.set_tasks([])
@@ -0,0 +1,78 @@
+"""
+Module contenant le modèle de la liste des tâches.
+"""
+
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QStringListModel
+
+from command_builder.models.task import Task
+
+
+class TaskListModel(QStringListModel):
+    """
+    Modèle des tâches affichées par TaskList, triées par nom.
+
+    Les tâches sont triées une seule fois par set_tasks et indexées par nom ;
+    aucun widget n'est créé par tâche, la vue ne dessine que les lignes
+    visibles. Les noms sont tenus par QStringListModel : data() n'est pas
+    redéfinie en Python, ce qui permet au proxy de filtrer des milliers de
+    lignes sans repasser par l'interpréteur pour chacune. La ligne i du
+    modèle correspond à tasks[i].
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialise un modèle vide.
+
+        Args:
+            parent: Le QObject parent
+        """
+        super().__init__(parent)
+        self._tasks: List[Task] = []
+        self._tasks_by_name: Dict[str, Task] = {}
+
+    @property
+    def tasks(self) -> List[Task]:
+        """Tâches du modèle, triées par nom."""
+        return self._tasks
+
+    def set_tasks(self, tasks: List[Task]):
+        """
+        Remplace les tâches du modèle.
+
+        Args:
+            tasks: Les tâches (dans n'importe quel ordre)
+        """
+        self._tasks = sorted(tasks, key=lambda t: t.name)
+        self._tasks_by_name = {}
+        for task in tasks:
+            # À nom égal, la première tâche chargée l'emporte
+            self._tasks_by_name.setdefault(task.name, task)
+        self.setStringList([task.name for task in self._tasks])
+
+    def task_at(self, row: int) -> Optional[Task]:
+        """
+        Retourne la tâche d'une ligne du modèle.
+
+        Args:
+            row: Le numéro de la ligne
+
+        Returns:
+            La tâche, ou None si la ligne n'existe pas
+        """
+        if 0 <= row < len(self._tasks):
+            return self._tasks[row]
+        return None
+
+    def task_by_name(self, name: str) -> Optional[Task]:
+        """
+        Retourne la tâche portant un nom.
+
+        Args:
+            name: Le nom de la tâche
+
+        Returns:
+            La tâche, ou None si aucune tâche ne porte ce nom
+        """
+        return self._tasks_by_name.get(name)
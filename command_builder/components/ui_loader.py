@@ -0,0 +1,153 @@
+"""
+Chargement des fichiers .ui, précompilés quand c'est possible.
+
+Les fichiers .ui peuvent être compilés à l'avance (pyside6-uic) en modules
+Python « <nom>_ui.py » placés à côté d'eux, au moment de l'installation ou du
+build (script compile_ui.py à la racine du projet). Chaque module
+compilé garde l'empreinte du .ui dont il est issu ; load_ui l'utilise si elle
+correspond au fichier actuel et revient au chargement par QUiLoader sinon
+(module absent ou .ui modifié depuis la compilation). Le module et la
+vérification de l'empreinte sont mis en cache : construire des centaines de
+composants identiques ne relit pas le XML à chaque fois.
+"""
+
+import hashlib
+import importlib
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PySide6 import QtWidgets
+from PySide6.QtUiTools import QUiLoader
+
+# Suffixe des modules générés à partir des fichiers .ui
+COMPILED_SUFFIX = "_ui"
+
+# Classe de la racine d'un fichier .ui (<widget class="QWidget" name="...">)
+_ROOT_WIDGET = re.compile(rb'<widget\s+class="(\w+)"')
+
+# Classe de configuration (ou None si indisponible) par fichier .ui
+_setup_classes: Dict[Path, Optional[Tuple[type, str]]] = {}
+
+
+def ui_source_hash(ui_file: Path) -> str:
+    """
+    Calcule l'empreinte d'un fichier .ui.
+
+    Args:
+        ui_file: Le chemin du fichier .ui
+
+    Returns:
+        L'empreinte SHA-256 (hexadécimale) du contenu du fichier
+    """
+    return hashlib.sha256(Path(ui_file).read_bytes()).hexdigest()
+
+
+def compiled_path_for(ui_file: Path) -> Path:
+    """
+    Retourne le chemin du module compilé d'un fichier .ui.
+
+    Args:
+        ui_file: Le chemin du fichier .ui
+
+    Returns:
+        Le chemin du module Python généré
+    """
+    ui_file = Path(ui_file)
+    return ui_file.with_name(ui_file.stem + COMPILED_SUFFIX + ".py")
+
+
+def compile_ui(ui_file: Path) -> Path:
+    """
+    Compile un fichier .ui en module Python avec pyside6-uic.
+
+    Args:
+        ui_file: Le chemin du fichier .ui
+
+    Returns:
+        Le chemin du module généré
+
+    Raises:
+        FileNotFoundError: Si pyside6-uic est introuvable
+        subprocess.CalledProcessError: Si la compilation échoue
+    """
+    uic = shutil.which("pyside6-uic")
+    if uic is None:
+        raise FileNotFoundError("pyside6-uic introuvable (installer PySide6)")
+    ui_file = Path(ui_file)
+    result = subprocess.run(
+        [uic, str(ui_file)], capture_output=True, text=True, check=True
+    )
+    root = _ROOT_WIDGET.search(ui_file.read_bytes())
+    base_class = root.group(1).decode() if root else "QWidget"
+    target = compiled_path_for(ui_file)
+    target.write_text(
+        result.stdout
+        + "\n\n# Fichier source et classe de sa racine (vérifiés par load_ui)\n"
+        + f'UI_SOURCE_SHA256 = "{ui_source_hash(ui_file)}"\n'
+        + f'UI_BASE_CLASS = "{base_class}"\n',
+        encoding="utf-8",
+    )
+    return target
+
+
+def compile_all(root: Path) -> List[Path]:
+    """
+    Compile tous les fichiers .ui d'une arborescence.
+
+    Args:
+        root: Le dossier à parcourir
+
+    Returns:
+        Les chemins des modules générés
+    """
+    return [compile_ui(ui_file) for ui_file in sorted(Path(root).rglob("*.ui"))]
+
+
+def _find_setup_class(ui_file: Path, package: str) -> Optional[Tuple[type, str]]:
+    """Importe le module compilé s'il est à jour et retourne sa classe Ui_."""
+    module_name = f"{package}.{ui_file.stem}{COMPILED_SUFFIX}"
+    try:
+        module = importlib.import_module(module_name)
+        if module.UI_SOURCE_SHA256 != ui_source_hash(ui_file):
+            return None  # .ui modifié depuis la compilation
+        setup_class = next(
+            value
+            for name, value in vars(module).items()
+            if name.startswith("Ui_") and isinstance(value, type)
+        )
+        return setup_class, module.UI_BASE_CLASS
+    except (ImportError, AttributeError, OSError, StopIteration):
+        return None
+
+
+def load_ui(
+    ui_file: Path,
+    parent: Optional[QtWidgets.QWidget] = None,
+    package: Optional[str] = None,
+) -> QtWidgets.QWidget:
+    """
+    Crée le widget décrit par un fichier .ui.
+
+    Args:
+        ui_file: Le chemin du fichier .ui
+        parent: Le widget parent
+        package: Le paquet contenant le module compilé (None = chargement
+                 par QUiLoader)
+
+    Returns:
+        Le widget racine, dont les enfants se retrouvent par findChild
+    """
+    ui_file = Path(ui_file)
+    if package is not None:
+        if ui_file not in _setup_classes:
+            _setup_classes[ui_file] = _find_setup_class(ui_file, package)
+        setup = _setup_classes[ui_file]
+        if setup is not None:
+            setup_class, base_class = setup
+            widget = getattr(QtWidgets, base_class)(parent)
+            setup_class().setupUi(widget)
+            return widget
+    return QUiLoader().load(str(ui_file), parent)
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -20,6 +20,8 @@ class Argument(BaseModel):
         None  # Valeur à insérer pour les options booléennes (ex: "--debug")
     )
     validation: Optional[dict[str, Any]] = None
+    # Rôle d'un chemin (file/directory) pour l'exécution incrémentale
+    role: Optional[Literal["input", "output"]] = None
 
 
 class ArgumentValue(BaseModel):
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -19,3 +19,7 @@ class Command(BaseModel, WithArguments):
     description: str
     command: str
     arguments: List[Argument]
+    # Exécution via le shell : True/False pour forcer, None = détection automatique
+    shell: Optional[bool] = None
+    # Délai (s) laissé à la commande pour s'arrêter avant d'être tuée (Stop)
+    cancel_grace_period: Optional[float] = None
@@ -0,0 +1,139 @@
+"""Modèles pour les mesures d'exécution des commandes."""
+
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """
+    Formate une taille en octets de manière lisible.
+
+    Args:
+        size: La taille en octets (None si inconnue)
+
+    Returns:
+        La taille formatée (ex: "12.3 Mo"), ou "n/d" si inconnue
+    """
+    if size is None:
+        return "n/d"
+    if size < 1024:
+        return f"{size} o"
+    value = size / 1024
+    for unit in ("Ko", "Mo"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} Go"
+
+
+@dataclass
+class ResourceUsage:
+    """Ressources consommées par une commande (processus et descendants attendus).
+
+    Attributes:
+        user_cpu: Temps CPU utilisateur en secondes
+        system_cpu: Temps CPU système en secondes
+        peak_rss: Mémoire résidente maximale en octets (None si inconnue)
+        read_bytes: Octets lus (None si inconnu)
+        write_bytes: Octets écrits (None si inconnu)
+    """
+
+    user_cpu: float
+    system_cpu: float
+    peak_rss: Optional[int] = None
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+
+    def __str__(self) -> str:
+        """Retourne une représentation lisible des ressources."""
+        return (
+            f"CPU {self.user_cpu:.2f}s util. / {self.system_cpu:.2f}s sys. | "
+            f"Mémoire max {format_bytes(self.peak_rss)} | "
+            f"E/S {format_bytes(self.read_bytes)} lus / "
+            f"{format_bytes(self.write_bytes)} écrits"
+        )
+
+
+@dataclass
+class RunRecord:
+    """Résultat de l'exécution d'une commande d'une séquence.
+
+    Attributes:
+        name: Nom de la commande
+        command: Ligne de commande exécutée
+        return_code: Code de retour
+        duration: Durée d'exécution en secondes
+        usage: Ressources consommées (None si non mesurées, ex: mode session)
+        skipped: True si la commande a été ignorée car à jour
+    """
+
+    name: str
+    command: str
+    return_code: int
+    duration: float
+    usage: Optional[ResourceUsage] = None
+    skipped: bool = False
+
+    # Colonnes de l'export CSV
+    CSV_COLUMNS = [
+        "name",
+        "command",
+        "return_code",
+        "duration",
+        *(field.name for field in fields(ResourceUsage)),
+        "skipped",
+    ]
+
+    def to_row(self) -> Dict[str, object]:
+        """
+        Retourne l'enregistrement à plat pour l'export.
+
+        Returns:
+            Dictionnaire {colonne: valeur} (valeurs vides si non mesurées)
+        """
+        row = {
+            "name": self.name,
+            "command": self.command,
+            "return_code": self.return_code,
+            "duration": round(self.duration, 3),
+        }
+        usage = asdict(self.usage) if self.usage else {}
+        for field in fields(ResourceUsage):
+            value = usage.get(field.name)
+            row[field.name] = "" if value is None else value
+        row["skipped"] = int(self.skipped)
+        return row
+
+    def __str__(self) -> str:
+        """Retourne une ligne de résumé lisible."""
+        if self.skipped:
+            return f"{self.name} — ignorée (à jour)"
+        result = f"{self.name} — {self.duration:.2f}s (code {self.return_code})"
+        if self.usage:
+            result += f" | {self.usage}"
+        return result
+
+
+def format_run_summary(records: List[RunRecord]) -> List[str]:
+    """
+    Construit le résumé des ressources d'une séquence, une ligne par commande.
+
+    La commande la plus coûteuse en temps CPU est signalée.
+
+    Args:
+        records: Les enregistrements de la séquence
+
+    Returns:
+        Les lignes du résumé
+    """
+    measured = [record for record in records if record.usage]
+    heaviest = max(
+        measured,
+        key=lambda record: record.usage.user_cpu + record.usage.system_cpu,
+        default=None,
+    )
+    lines = []
+    for index, record in enumerate(records, start=1):
+        marker = " ◀ plus coûteuse (CPU)" if record is heaviest else ""
+        lines.append(f"[{index}] {record}{marker}")
+    return lines
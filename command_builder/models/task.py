@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from pydantic import BaseModel
 
@@ -12,20 +12,34 @@ class Task(BaseModel, WithArguments):
     description: str
     arguments: Optional[List[TaskArgument]] = []  # Arguments partagés
     commands: List[Command]
+    session: Optional[bool] = False  # Exécuter la séquence dans un shell unique
 
-    def apply_shared_arguments(self, shared_values: Dict[str, str]) -> None:
+    def apply_shared_arguments(
+        self, shared_values: Dict[str, str], codes: Optional[Iterable[str]] = None
+    ) -> None:
         """
         Applique les valeurs des arguments partagés aux commandes concernées.
         Priorité : valeur de tâche > valeur par défaut de commande.
 
         Args:
             shared_values: Dictionnaire {code_argument_tache: valeur}
+            codes: Codes des arguments de tâche à appliquer (None = tous)
         """
         if not self.arguments:
             return
 
+        selected = set(codes) if codes is not None else None
+
+        # Commandes par nom (plusieurs commandes peuvent porter le même nom)
+        commands_by_name: Dict[str, List[Command]] = {}
+        for command in self.commands:
+            commands_by_name.setdefault(command.name, []).append(command)
+
         # Pour chaque argument de tâche
         for task_arg in self.arguments:
+            if selected is not None and task_arg.code not in selected:
+                continue
+
             # Récupère la valeur saisie ou la valeur par défaut de la tâche
             value = shared_values.get(task_arg.code, task_arg.default or "")
             if not value:
@@ -33,11 +47,10 @@ class Task(BaseModel, WithArguments):
 
             # Propage la valeur vers les commandes/arguments cibles
             for target in task_arg.values:
-                # Trouve la commande concernée
-                for command in self.commands:
-                    if command.name == target.command:
-                        # Utilise la méthode héritée de WithArguments
-                        arg = command.get_argument_by_code(target.argument)
-                        if arg:
-                            # Applique la valeur par défaut (priorité tâche > commande)
-                            arg.default = value
+                # Trouve les commandes concernées
+                for command in commands_by_name.get(target.command, []):
+                    # Utilise la méthode héritée de WithArguments
+                    arg = command.get_argument_by_code(target.argument)
+                    if arg:
+                        # Applique la valeur par défaut (priorité tâche > commande)
+                        arg.default = value
@@ -0,0 +1,289 @@
+"""
+Interprétation incrémentale des codes couleur ANSI (SGR).
+
+Les sorties des commandes arrivent par morceaux : l'AnsiParser découpe chaque
+morceau en segments de texte associés à un style (couleurs, gras...), en
+conservant d'un morceau à l'autre le style courant et une éventuelle séquence
+d'échappement coupée en deux. Seul le nouveau morceau est analysé, jamais le
+texte déjà reçu. Les autres séquences de contrôle (curseur, effacement,
+titre de fenêtre) sont retirées du texte.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Couleurs de base (30-37 / 40-47) et vives (90-97 / 100-107), lisibles sur
+# le fond sombre de la console
+ANSI_COLORS = (
+    "#000000",
+    "#cd3131",
+    "#0dbc79",
+    "#e5e510",
+    "#2472c8",
+    "#bc3fbc",
+    "#11a8cd",
+    "#e5e5e5",
+)
+ANSI_BRIGHT_COLORS = (
+    "#666666",
+    "#f14c4c",
+    "#23d18b",
+    "#f5f543",
+    "#3b8eea",
+    "#d670d6",
+    "#29b8db",
+    "#ffffff",
+)
+
+# Couleurs par défaut de la console (utilisées pour l'inversion vidéo)
+DEFAULT_FOREGROUND = "#a0e0a0"
+DEFAULT_BACKGROUND = "#1e2130"
+
+# Longueur maximale d'une séquence incomplète gardée pour le morceau suivant
+MAX_PENDING_SEQUENCE = 256
+
+# Nombre maximal de transitions de style mémorisées
+MAX_CACHED_TRANSITIONS = 4096
+
+# Séquences reconnues : OSC (ESC ] ... BEL/ST), CSI (ESC [ ... final),
+# désignation de jeu de caractères (ESC ( B...) ou séquence de deux caractères.
+# Le groupe englobant fait alterner texte et séquences dans re.split.
+_SEQUENCE = re.compile(
+    r"(\x1b(?:\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    r"|\[[0-?]*[ -/]*[@-~]"
+    r"|[ -/]+[0-~]"
+    r"|[@-Z\\\]^_]))"
+)
+# Aucune transition connue depuis un style
+_NO_TRANSITIONS: Dict[str, "AnsiStyle"] = {}
+# Séquence SGR (couleurs et attributs) et ses paramètres
+_SGR_SEQUENCE = re.compile(r"\x1b\[([0-?]*)[ -/]*m\Z")
+# Séquence incomplète en fin de morceau (commence au dernier ESC)
+_PARTIAL_SEQUENCE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*|[ -/]*)\Z")
+
+
+class AnsiStyle(NamedTuple):
+    """
+    Style du texte défini par les codes SGR.
+
+    Attributes:
+        foreground: Couleur du texte (#rrggbb, None = couleur par défaut)
+        background: Couleur du fond (#rrggbb, None = fond par défaut)
+        bold: Texte en gras
+        italic: Texte en italique
+        underline: Texte souligné
+        inverse: Couleurs du texte et du fond inversées
+        strike: Texte barré
+    """
+
+    foreground: Optional[str] = None
+    background: Optional[str] = None
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    inverse: bool = False
+    strike: bool = False
+
+
+DEFAULT_STYLE = AnsiStyle()
+
+# Segment de texte et son style
+AnsiRun = Tuple[str, AnsiStyle]
+
+
+def color_256(index: int) -> str:
+    """
+    Retourne la couleur d'un index de la palette 256 couleurs.
+
+    Args:
+        index: L'index (0-255)
+
+    Returns:
+        La couleur au format #rrggbb
+    """
+    if index < 8:
+        return ANSI_COLORS[index]
+    if index < 16:
+        return ANSI_BRIGHT_COLORS[index - 8]
+    if index < 232:
+        index -= 16
+        steps = (index // 36, index // 6 % 6, index % 6)
+        levels = [0 if step == 0 else 55 + 40 * step for step in steps]
+        return "#{:02x}{:02x}{:02x}".format(*levels)
+    gray = 8 + 10 * (index - 232)
+    return f"#{gray:02x}{gray:02x}{gray:02x}"
+
+
+def _extended_color(codes: List[int], position: int) -> Tuple[Optional[str], int]:
+    """
+    Lit une couleur étendue (38/48 ; 5 ; n ou 38/48 ; 2 ; r ; g ; b).
+
+    Returns:
+        (couleur ou None si invalide, position du code suivant)
+    """
+    mode = codes[position + 1] if position + 1 < len(codes) else None
+    if mode == 5 and position + 2 < len(codes):
+        return color_256(min(codes[position + 2], 255)), position + 3
+    if mode == 2 and position + 4 < len(codes):
+        red, green, blue = (min(c, 255) for c in codes[position + 2 : position + 5])
+        return f"#{red:02x}{green:02x}{blue:02x}", position + 5
+    return None, len(codes)
+
+
+def apply_sgr(style: AnsiStyle, parameters: str) -> AnsiStyle:
+    """
+    Applique les paramètres d'une séquence SGR (ESC [ ... m) à un style.
+
+    Args:
+        style: Le style courant
+        parameters: Les paramètres de la séquence (ex: "1;31")
+
+    Returns:
+        Le nouveau style
+    """
+    codes = [
+        int(code) if code.isdigit() else 0 for code in re.split("[;:]", parameters)
+    ]
+    values = style._asdict()
+    position = 0
+    while position < len(codes):
+        code = codes[position]
+        position += 1
+        if code == 0:
+            values = DEFAULT_STYLE._asdict()
+        elif code == 1:
+            values["bold"] = True
+        elif code == 3:
+            values["italic"] = True
+        elif code == 4:
+            values["underline"] = True
+        elif code == 7:
+            values["inverse"] = True
+        elif code == 9:
+            values["strike"] = True
+        elif code == 22:
+            values["bold"] = False
+        elif code == 23:
+            values["italic"] = False
+        elif code == 24:
+            values["underline"] = False
+        elif code == 27:
+            values["inverse"] = False
+        elif code == 29:
+            values["strike"] = False
+        elif 30 <= code <= 37:
+            values["foreground"] = ANSI_COLORS[code - 30]
+        elif 90 <= code <= 97:
+            values["foreground"] = ANSI_BRIGHT_COLORS[code - 90]
+        elif code == 39:
+            values["foreground"] = None
+        elif 40 <= code <= 47:
+            values["background"] = ANSI_COLORS[code - 40]
+        elif 100 <= code <= 107:
+            values["background"] = ANSI_BRIGHT_COLORS[code - 100]
+        elif code == 49:
+            values["background"] = None
+        elif code in (38, 48):
+            color, position = _extended_color(codes, position - 1)
+            if color is not None:
+                values["foreground" if code == 38 else "background"] = color
+    return AnsiStyle(**values)
+
+
+class AnsiParser:
+    """
+    Découpe au fil de l'eau un texte contenant des codes ANSI en segments stylés.
+    """
+
+    def __init__(self):
+        """Initialise l'analyse avec le style par défaut."""
+        self.style = DEFAULT_STYLE
+        self._pending = ""  # Séquence coupée à la fin du morceau précédent
+        # {style: {séquence: style suivant}}
+        self._transitions: Dict[AnsiStyle, Dict[str, AnsiStyle]] = {}
+        self._styles = {DEFAULT_STYLE: DEFAULT_STYLE}  # Styles déjà rencontrés
+        self._transition_count = 0
+
+    def reset(self):
+        """Revient au style par défaut (par exemple au début d'une commande)."""
+        self.style = DEFAULT_STYLE
+        self._pending = ""
+
+    def feed(self, text: str) -> List[AnsiRun]:
+        """
+        Analyse un nouveau morceau de texte.
+
+        Le morceau est découpé en un seul appel (re.split) ; chaque séquence
+        est ensuite résolue par le cache des transitions de style.
+
+        Args:
+            text: Le morceau reçu
+
+        Returns:
+            Les segments (texte sans codes ANSI, style), dans l'ordre
+        """
+        if self._pending:
+            text, self._pending = self._pending + text, ""
+        if "\x1b" not in text:
+            return [(text, self.style)] if text else []
+
+        last_escape = text.rfind("\x1b")
+        if _PARTIAL_SEQUENCE.match(text, last_escape) is not None:
+            if len(text) - last_escape <= MAX_PENDING_SEQUENCE:
+                self._pending = text[last_escape:]
+            text = text[:last_escape]
+
+        # Textes et séquences alternent : texts[i] suit sequences[i - 1]
+        pieces = _SEQUENCE.split(text)
+        texts = pieces[0::2]
+        runs: List[AnsiRun] = []
+        style = self.style
+        transitions = self._transitions.get(style, _NO_TRANSITIONS)
+        run_start = 0  # Premier texte du segment en cours
+        for index, sequence in enumerate(pieces[1::2], 1):
+            new_style = transitions.get(sequence)
+            if new_style is None:
+                new_style = self._transition(style, sequence)
+            if new_style is not style:
+                if index - run_start == 1:
+                    run_text = texts[run_start]
+                else:
+                    run_text = "".join(texts[run_start:index])
+                if run_text:
+                    if runs and runs[-1][1] is style:
+                        runs[-1] = (runs[-1][0] + run_text, style)
+                    else:
+                        runs.append((run_text, style))
+                run_start = index
+                style = new_style
+                transitions = self._transitions.get(style, _NO_TRANSITIONS)
+        run_text = "".join(texts[run_start:])
+        if run_text:
+            if runs and runs[-1][1] is style:
+                runs[-1] = (runs[-1][0] + run_text, style)
+            else:
+                runs.append((run_text, style))
+        self.style = style
+        return runs
+
+    def _transition(self, style: AnsiStyle, sequence: str) -> AnsiStyle:
+        """
+        Calcule et mémorise le style qui suit une séquence.
+
+        Les styles mémorisés sont réutilisés tels quels, ce qui permet de
+        comparer les styles par identité dans feed.
+        """
+        if self._transition_count >= MAX_CACHED_TRANSITIONS:
+            self._transitions.clear()
+            self._styles = {DEFAULT_STYLE: DEFAULT_STYLE}
+            self._transition_count = 0
+        sgr = _SGR_SEQUENCE.match(sequence)
+        if sgr is not None:
+            # Un style égal à un style déjà connu est remplacé par celui-ci
+            new_style = apply_sgr(style, sgr.group(1))
+            new_style = self._styles.setdefault(new_style, new_style)
+        else:
+            new_style = style
+        self._transitions.setdefault(style, {})[sequence] = new_style
+        self._transition_count += 1
+        return new_style
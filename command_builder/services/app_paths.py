@@ -0,0 +1,34 @@
+"""
+Emplacements des fichiers de données de l'application.
+"""
+
+import os
+from pathlib import Path
+
+# Variable d'environnement permettant de remplacer le répertoire de données
+DATA_DIR_ENV_VAR = "COMMANDBUILDER_DATA_DIR"
+
+
+def get_app_data_dir() -> Path:
+    """
+    Retourne le répertoire de données de l'application (créé si nécessaire).
+
+    Ordre de résolution : variable COMMANDBUILDER_DATA_DIR, puis
+    %LOCALAPPDATA%\\CommandBuilder sous Windows, ou
+    $XDG_DATA_HOME/commandbuilder (~/.local/share/commandbuilder) ailleurs.
+
+    Returns:
+        Le chemin du répertoire de données
+    """
+    override = os.environ.get(DATA_DIR_ENV_VAR)
+    if override:
+        data_dir = Path(override)
+    elif os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        data_dir = Path(base) / "CommandBuilder"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+        data_dir = Path(base) / "commandbuilder"
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
@@ -0,0 +1,249 @@
+"""
+Exécution incrémentale : mémorisation de l'état des commandes réussies.
+
+Une commande qui déclare des sorties (arguments de rôle "output") est
+considérée à jour, comme avec make, si elle a déjà réussi avec exactement la
+même ligne de commande, que ses entrées n'ont pas changé depuis, et que ses
+sorties existent toujours sans avoir été modifiées. L'empreinte d'un fichier
+est sa taille et sa date de modification (pas de lecture du contenu) ;
+celle d'un dossier combine les empreintes de tous les fichiers qu'il contient.
+
+Parcourir un dossier de sortie peut être long : la console fait ces
+vérifications dans un BuildStateJob, hors du thread de l'interface.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from command_builder.services.app_paths import get_app_data_dir
+
+# Nom du fichier de sauvegarde de l'état
+BUILD_STATE_FILE_NAME = "build_state.json"
+
+
+def path_fingerprint(path: str) -> Optional[str]:
+    """
+    Calcule l'empreinte d'un fichier ou d'un dossier.
+
+    Args:
+        path: Le chemin du fichier ou du dossier
+
+    Returns:
+        L'empreinte, ou None si le chemin n'existe pas
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isdir(path):
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            relative = os.path.relpath(file_path, path)
+            digest.update(
+                f"{relative}\0{file_stat.st_size}\0{file_stat.st_mtime_ns}\n".encode()
+            )
+    return f"dir:{digest.hexdigest()}"
+
+
+def command_key(command: str) -> str:
+    """
+    Retourne la clé d'état d'une ligne de commande.
+
+    Args:
+        command: La ligne de commande rendue (valeurs des arguments incluses)
+
+    Returns:
+        La clé (empreinte SHA-256 de la commande)
+    """
+    return hashlib.sha256(command.encode("utf-8")).hexdigest()
+
+
+class BuildStateStore:
+    """
+    Stockage local de l'état des commandes réussies.
+    """
+
+    def __init__(self, state_file: Optional[Path] = None):
+        """
+        Initialise le stockage.
+
+        Args:
+            state_file: Fichier de sauvegarde (None = en mémoire seulement)
+        """
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+
+    def is_up_to_date(
+        self, command: str, inputs: List[str], outputs: List[str]
+    ) -> bool:
+        """
+        Indique si une commande peut être ignorée car ses sorties sont à jour.
+
+        Args:
+            command: La ligne de commande rendue
+            inputs: Les chemins d'entrée déclarés
+            outputs: Les chemins de sortie déclarés
+
+        Returns:
+            True si la commande a déjà réussi avec les mêmes entrées et que ses
+            sorties sont intactes
+        """
+        if not outputs:
+            return False
+        with self._lock:
+            entry = self._entries.get(command_key(command))
+        if entry is None:
+            return False
+        current = self._fingerprints(inputs, outputs)
+        if any(value is None for value in current["outputs"].values()):
+            return False
+        return current == {"inputs": entry["inputs"], "outputs": entry["outputs"]}
+
+    def record_success(self, command: str, inputs: List[str], outputs: List[str]):
+        """
+        Mémorise l'état d'une commande qui vient de réussir.
+
+        Rien n'est mémorisé si une sortie déclarée n'a pas été produite.
+
+        Args:
+            command: La ligne de commande rendue
+            inputs: Les chemins d'entrée déclarés
+            outputs: Les chemins de sortie déclarés
+        """
+        if not outputs:
+            return
+        fingerprints = self._fingerprints(inputs, outputs)
+        key = command_key(command)
+        with self._lock:
+            if any(value is None for value in fingerprints["outputs"].values()):
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = fingerprints
+            self._save()
+
+    def invalidate(self, command: str):
+        """
+        Oublie l'état d'une commande (elle sera réexécutée).
+
+        Args:
+            command: La ligne de commande rendue
+        """
+        with self._lock:
+            if self._entries.pop(command_key(command), None) is not None:
+                self._save()
+
+    @staticmethod
+    def _fingerprints(inputs: List[str], outputs: List[str]) -> dict:
+        """Calcule les empreintes des entrées et des sorties."""
+        return {
+            "inputs": {path: path_fingerprint(path) for path in inputs},
+            "outputs": {path: path_fingerprint(path) for path in outputs},
+        }
+
+    def _load(self) -> Dict[str, dict]:
+        """Charge l'état sauvegardé."""
+        if self.state_file is None:
+            return {}
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Sauvegarde l'état (écriture atomique)."""
+        if self.state_file is None:
+            return
+        try:
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(temp_file, self.state_file)
+        except OSError:
+            pass
+
+
+class BuildStateJob(QObject, QRunnable):
+    """
+    Mémorisation et vérification d'état exécutées dans un thread du pool
+    global.
+
+    La commande qui vient de réussir est mémorisée avant que la suivante ne
+    soit vérifiée, ce qui garde l'ordre de la séquence.
+    """
+
+    # Fin : (le job lui-même, True si la commande vérifiée est à jour)
+    finished = Signal(object, bool)
+
+    def __init__(
+        self,
+        store: BuildStateStore,
+        record: Optional[Tuple[str, List[str], List[str]]] = None,
+        check: Optional[Tuple[str, List[str], List[str]]] = None,
+    ):
+        """
+        Initialise le job.
+
+        Args:
+            store: Le stockage d'état
+            record: (commande, entrées, sorties) de la commande qui vient de
+                    réussir, ou None
+            check: (commande, entrées, sorties) de la commande à vérifier,
+                   ou None
+        """
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.store = store
+        self.record = record
+        self.check = check
+
+    def start(self):
+        """Soumet le job au pool de threads global."""
+        QThreadPool.globalInstance().start(self)
+
+    def run(self):
+        """Mémorise, vérifie puis émet le résultat."""
+        up_to_date = False
+        try:
+            if self.record is not None:
+                self.store.record_success(*self.record)
+            if self.check is not None:
+                up_to_date = self.store.is_up_to_date(*self.check)
+        except Exception:  # Ne jamais perdre le signal finished
+            up_to_date = False
+        finally:
+            self.finished.emit(self, up_to_date)
+
+
+_build_state_store: Optional[BuildStateStore] = None
+
+
+def get_build_state_store() -> BuildStateStore:
+    """
+    Retourne le stockage d'état de l'application.
+
+    Returns:
+        Le BuildStateStore partagé, sauvegardé dans le répertoire de données
+    """
+    global _build_state_store
+    if _build_state_store is None:
+        _build_state_store = BuildStateStore(get_app_data_dir() / BUILD_STATE_FILE_NAME)
+    return _build_state_store
@@ -22,6 +22,7 @@ class CommandBuilderService:
     def build_commands_list(
         command_components: List,
         command_checkboxes: List[QCheckBox],
+        session: bool = False,
     ) -> List[Dict[str, str]]:
         """
         Construit la liste des commandes cochées avec leurs noms.
@@ -29,9 +30,16 @@ class CommandBuilderService:
         Args:
             command_components: Liste des widgets de commande
             command_checkboxes: Liste des checkboxes associées
+            session: Si True, marque les commandes pour une exécution
+                     dans une session shell unique
 
         Returns:
             Liste de dictionnaires {"name": str, "command": str}
+            (plus "argv": list pour une exécution directe sans shell,
+            ou "session": True en mode session, "grace_period": float
+            si la commande définit cancel_grace_period, et "inputs"/"outputs"
+            si elle déclare des sorties pour l'exécution incrémentale, et
+            "arguments": dict des valeurs saisies, pour le point de reprise)
         """
         commands_list = []
 
@@ -43,6 +51,10 @@ class CommandBuilderService:
 
             command_info = CommandBuilderService._build_single_command(command_widget)
             if command_info:
+                if session:
+                    # La session exécute la chaîne de commande dans son shell
+                    command_info.pop("argv", None)
+                    command_info["session"] = True
                 commands_list.append(command_info)
 
         return commands_list
@@ -56,7 +68,8 @@ class CommandBuilderService:
             command_widget: Le widget de commande
 
         Returns:
-            Dictionnaire {"name": str, "command": str} ou None si invalide
+            Dictionnaire {"name": str, "command": str[, "argv": list]}
+            ou None si invalide
         """
         if not hasattr(command_widget, "_build_full_command"):
             return None
@@ -68,4 +81,32 @@ class CommandBuilderService:
             else "Commande"
         )
 
-        return {"name": command_name, "command": full_command}
+        command_info = {"name": command_name, "command": full_command}
+
+        # Liste d'arguments pour une exécution directe (None = via le shell)
+        if hasattr(command_widget, "build_argv"):
+            argv = command_widget.build_argv()
+            if isinstance(argv, list) and argv:
+                command_info["argv"] = argv
+
+        # Délai de grâce à l'annulation défini dans le YAML
+        grace_period = getattr(
+            getattr(command_widget, "command", None), "cancel_grace_period", None
+        )
+        if isinstance(grace_period, (int, float)):
+            command_info["grace_period"] = float(grace_period)
+
+        # Chemins déclarés pour l'exécution incrémentale
+        if hasattr(command_widget, "get_io_paths"):
+            io_paths = command_widget.get_io_paths()
+            if isinstance(io_paths, dict) and io_paths.get("outputs"):
+                command_info["inputs"] = list(io_paths.get("inputs", []))
+                command_info["outputs"] = list(io_paths["outputs"])
+
+        # Valeurs des arguments, enregistrées avec le point de reprise
+        if hasattr(command_widget, "get_argument_values"):
+            values = command_widget.get_argument_values()
+            if isinstance(values, dict):
+                command_info["arguments"] = dict(values)
+
+        return command_info
@@ -1,113 +1,462 @@
 """
 Service d'exécution de commandes Windows.
+
+Les exécutions ne créent plus de thread dédié : chaque commande est un job
+(QRunnable) soumis à un pool de threads partagé, et la lecture des flux
+stdout/stderr est elle aussi confiée à ce pool. Les threads sont donc
+réutilisés d'une commande et d'une tâche à l'autre.
+
+Chaque lecteur de flux réserve son propre thread dans le pool et passe avant
+les jobs en attente : un job qui attend son processus ne peut pas bloquer la
+lecture des sorties, quel que soit le nombre de jobs en parallèle.
 """
 
 import os
+import shutil
+import signal
 import subprocess
 import threading
 import time
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from command_builder.services.command_template import format_command_line
+from command_builder.services.process_registry import get_process_registry
+from command_builder.services.resource_usage import ProcessWaiter
+
+if TYPE_CHECKING:
+    from command_builder.models.run_record import ResourceUsage
+    from command_builder.services.shell_session import ShellSession
+
+# Nombre de threads du pool pour les jobs (attente des processus). Chaque
+# lecteur de flux en cours y ajoute le sien (voir reserve_pool_threads).
+EXECUTOR_POOL_MAX_THREADS = 32
+
+# Priorité des lecteurs de flux : ils passent avant les jobs en attente
+PIPE_READER_PRIORITY = 1
+
+# Scripts Windows exécutés par cmd.exe (lancés via le shell)
+WINDOWS_SCRIPT_EXTENSIONS = (".bat", ".cmd")
+
+# Délai par défaut (s) entre la demande d'arrêt et l'arrêt forcé d'une commande
+DEFAULT_CANCEL_GRACE_PERIOD = 5.0
+
+# États finaux d'une commande annulée
+CANCEL_STATE_TERMINATED = "terminated"  # Arrêtée après la demande d'arrêt
+CANCEL_STATE_KILLED = "killed"  # Tuée à l'expiration du délai de grâce
+
+_executor_pool: Optional[QThreadPool] = None
+_reserved_threads = 0
+_reserved_lock = threading.Lock()
+
+
+def get_executor_pool() -> QThreadPool:
+    """
+    Retourne le pool de threads partagé par toutes les exécutions.
+
+    Les threads du pool n'expirent jamais : une fois créés, ils sont réutilisés
+    pour toutes les commandes suivantes.
+
+    Returns:
+        Le QThreadPool de l'application
+    """
+    global _executor_pool
+    if _executor_pool is None:
+        _executor_pool = QThreadPool()
+        _executor_pool.setMaxThreadCount(EXECUTOR_POOL_MAX_THREADS)
+        _executor_pool.setExpiryTimeout(-1)
+    return _executor_pool
+
+
+def reserve_pool_threads(count: int):
+    """
+    Réserve count threads du pool à des lecteurs de flux.
+
+    Le pool est agrandi si nécessaire, mais jamais réduit : ses threads
+    n'expirent pas, et le réduire arrêterait des threads qui seraient
+    recréés à la réservation suivante.
+
+    Args:
+        count: Nombre de threads à réserver
+    """
+    global _reserved_threads
+    with _reserved_lock:
+        _reserved_threads += count
+        pool = get_executor_pool()
+        needed = EXECUTOR_POOL_MAX_THREADS + _reserved_threads
+        if needed > pool.maxThreadCount():
+            pool.setMaxThreadCount(needed)
+
+
+def release_pool_threads(count: int):
+    """
+    Libère des threads réservés par reserve_pool_threads().
+
+    Args:
+        count: Nombre de threads à libérer
+    """
+    global _reserved_threads
+    with _reserved_lock:
+        _reserved_threads -= count
+
+
+def process_group_options() -> Tuple[str, dict]:
+    """
+    Retourne l'encodage et les options Popen propres à la plateforme.
+
+    Le processus est démarré dans son propre groupe de processus afin de
+    pouvoir tuer tout son arbre, sans fenêtre console sous Windows.
+
+    Returns:
+        Tuple (encodage des flux, options supplémentaires pour Popen)
+    """
+    if os.name == "nt":
+        # Utiliser CP850 pour la console Windows (OEM)
+        # CREATE_NO_WINDOW empêche l'apparition d'une console flash
+        return "cp850", {
+            "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP
+            | subprocess.CREATE_NO_WINDOW
+        }
+    # Nouvelle session = nouveau groupe de processus (killpg)
+    return "utf-8", {"start_new_session": True}
+
+
+def resolve_launch(argv: List[str]) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Prépare le lancement direct d'une liste d'arguments.
 
-from PySide6.QtCore import QObject, QThread, Signal
+    Sous Windows, CreateProcess ne consulte pas PATHEXT : l'exécutable est
+    résolu avec shutil.which, et les scripts .bat ou .cmd, que seul cmd.exe
+    sait exécuter, sont lancés via le shell avec une ligne de commande citée.
 
+    Args:
+        argv: La liste d'arguments (exécutable en premier)
 
-class CommandExecutor(QThread):
+    Returns:
+        Tuple (arguments pour Popen, True s'ils doivent passer par le shell)
     """
-    Thread pour exécuter une commande de manière asynchrone.
+    if os.name != "nt":
+        return argv, False
+    resolved = shutil.which(argv[0])
+    if resolved is None:
+        # Exécutable introuvable : l'erreur est signalée au lancement
+        return argv, False
+    if resolved.lower().endswith(WINDOWS_SCRIPT_EXTENSIONS):
+        return format_command_line([resolved] + argv[1:]), True
+    return [resolved] + argv[1:], False
+
+
+class PipeReader(QRunnable):
+    """
+    Lit un flux de sortie ligne par ligne dans un thread du pool.
+
+    start() réserve un thread du pool pour toute la durée de la lecture.
+    """
+
+    def __init__(
+        self,
+        stream,
+        on_line: Callable[[str], None],
+        thread_ids: set,
+        on_eof: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialise le lecteur.
+
+        Args:
+            stream: Le flux texte à lire (stdout ou stderr du processus)
+            on_line: Callback appelé pour chaque ligne lue
+            thread_ids: Ensemble où enregistrer l'identifiant du thread utilisé
+            on_eof: Callback optionnel appelé à la fermeture du flux
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self._stream = stream
+        self._on_line = on_line
+        self._on_eof = on_eof
+        self._thread_ids = thread_ids
+        self._done = threading.Event()
+
+    def start(self):
+        """Réserve un thread du pool et y démarre la lecture."""
+        reserve_pool_threads(1)
+        get_executor_pool().start(self, PIPE_READER_PRIORITY)
+
+    def run(self):
+        """Lit le flux jusqu'à sa fermeture."""
+        self._thread_ids.add(threading.get_native_id())
+        try:
+            for line in iter(self._stream.readline, ""):
+                if line:
+                    self._on_line(line)
+        except Exception:
+            pass
+        finally:
+            if self._on_eof is not None:
+                self._on_eof()
+            release_pool_threads(1)
+            self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend la fin de la lecture.
+
+        Args:
+            timeout: Délai maximal en secondes (None = infini)
+
+        Returns:
+            True si la lecture est terminée
+        """
+        return self._done.wait(timeout)
+
+
+class CommandExecutor(QObject, QRunnable):
+    """
+    Job d'exécution asynchrone d'une commande, exécuté dans le pool partagé.
+
+    Conserve l'interface de l'ancien QThread (start, wait, isRunning)
+    afin que les appelants n'aient pas à changer.
     """
 
     # Signaux pour communiquer avec l'interface
     output_received = Signal(str)  # Sortie standard
     error_received = Signal(str)  # Sortie d'erreur
     execution_finished = Signal(int)  # Code de retour
+    cancellation_finished = Signal(str)  # État final après annulation
+    resources_measured = Signal(object)  # ResourceUsage de la commande
 
-    def __init__(self, command: str, parent: Optional[QObject] = None):
+    def __init__(
+        self,
+        command: str,
+        parent: Optional[QObject] = None,
+        argv: Optional[List[str]] = None,
+        grace_period: float = DEFAULT_CANCEL_GRACE_PERIOD,
+    ):
         """
         Initialise l'exécuteur de commande.
 
         Args:
-            command: La commande à exécuter
+            command: La commande à exécuter (ligne de commande pour le shell)
             parent: Le QObject parent
+            argv: Liste d'arguments pour lancer l'exécutable directement,
+                  sans shell (None = exécuter command via le shell)
+            grace_period: Délai (s) laissé au processus pour s'arrêter après
+                          une annulation avant d'être tué (0 = tué immédiatement)
         """
-        super().__init__(parent)
+        QObject.__init__(self, parent)
+        QRunnable.__init__(self)
+        # Le job est conservé par le service : Qt ne doit pas le détruire
+        self.setAutoDelete(False)
         self.command = command
+        self.argv = argv
+        self.grace_period = grace_period
         self._is_cancelled = False
+        self._cancel_time: Optional[float] = None
+        self._terminate_sent = False
+        self._force_killed = False
         self._process = None  # Stocker le processus pour pouvoir le tuer de l'extérieur
+        self._started = threading.Event()
+        self._done = threading.Event()
+        self.thread_ids = set()  # Threads du pool utilisés par ce job
+
+    def start(self):
+        """Soumet le job au pool de threads partagé."""
+        self._started.set()
+        get_executor_pool().start(self)
+
+    def isRunning(self) -> bool:
+        """
+        Indique si le job a été démarré et n'est pas encore terminé.
+
+        Returns:
+            True si l'exécution est en cours
+        """
+        return self._started.is_set() and not self._done.is_set()
+
+    @property
+    def pid(self) -> Optional[int]:
+        """
+        PID du processus lancé (l'exécutable lui-même en exécution directe,
+        le shell sinon).
+
+        Returns:
+            Le PID, ou None si le processus n'est pas encore démarré
+        """
+        return self._process.pid if self._process is not None else None
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        """
+        Attend la fin de l'exécution, comme QThread.wait().
+
+        Les signaux émis par le job sont délivrés par la boucle d'événements
+        du thread propriétaire : ils ne sont pas traités pendant l'attente.
+
+        Args:
+            msecs: Délai maximal en millisecondes (None = infini)
+
+        Returns:
+            True si l'exécution est terminée (ou n'a jamais été démarrée)
+        """
+        if not self._started.is_set():
+            return True
+        return self._done.wait(None if msecs is None else msecs / 1000)
 
     def run(self):
-        """Exécute la commande dans un thread séparé."""
+        """Exécute la commande dans un thread du pool."""
+        self._started.set()
+        self.thread_ids.add(threading.get_native_id())
         process = None
         try:
-            # Utiliser CP850 pour la console Windows (OEM)
-            encoding = "cp850"
+            if self._is_cancelled:
+                self._emit_cancellation_state()
+                self.execution_finished.emit(-1)
+                return
 
-            # Créer le processus avec un nouveau groupe de processus pour pouvoir le tuer proprement
-            # CREATE_NO_WINDOW empêche l'apparition d'une console flash sur Windows
-            creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
-            if os.name == "nt":
-                creationflags |= subprocess.CREATE_NO_WINDOW
-
-            process = subprocess.Popen(
-                self.command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding=encoding,
-                errors="replace",
-                creationflags=creationflags,
-            )
+            process = self._spawn_process()
 
             # Stocker le processus pour pouvoir le tuer depuis cancel()
             self._process = process
+            # Enregistrer l'arbre de processus pour le nettoyage
+            get_process_registry().register(process.pid)
 
-            # Lire la sortie avec un thread séparé pour éviter le blocage
-            def read_output():
-                try:
-                    for line in iter(process.stdout.readline, ""):
-                        if self._is_cancelled:
-                            break
-                        if line:
-                            self.output_received.emit(line.rstrip())
-                except Exception:
-                    pass
-
-            # Démarrer le thread de lecture
-            reader_thread = threading.Thread(target=read_output, daemon=True)
-            reader_thread.start()
-
-            # Attendre la fin du processus ou l'annulation
-            while process.poll() is None:
-                if self._is_cancelled:
-                    self._kill_process(process)
-                    break
-                time.sleep(0.1)  # Vérifier toutes les 100ms
+            # Lire stdout et stderr dans des threads du pool (pas de thread dédié)
+            stderr_lines: List[str] = []
+            stdout_reader = PipeReader(
+                process.stdout, self._on_stdout_line, self.thread_ids
+            )
+            stderr_reader = PipeReader(
+                process.stderr, stderr_lines.append, self.thread_ids
+            )
+            stdout_reader.start()
+            stderr_reader.start()
 
-            # Attendre que le thread de lecture se termine
-            reader_thread.join(timeout=0.5)
+            # Attendre la fin du processus (arrêt progressif si annulé)
+            usage = self._wait_for_exit(process)
 
-            # Lire les erreurs restantes (seulement si pas annulé)
+            # Attendre que les lecteurs aient vidé les flux
+            stdout_reader.wait(timeout=0.5)
+            stderr_reader.wait(timeout=0.5)
+
+            # Émettre les erreurs (seulement si pas annulé)
             if not self._is_cancelled:
-                try:
-                    stderr = process.stderr.read()
-                    if stderr:
-                        self.error_received.emit(stderr.rstrip())
-                except Exception:
-                    pass
+                stderr = "".join(stderr_lines)
+                if stderr:
+                    self.error_received.emit(stderr.rstrip())
 
             # Émettre le code de retour
             return_code = process.poll()
             if return_code is None:
                 return_code = -1 if self._is_cancelled else 0
+            if self._is_cancelled:
+                self._emit_cancellation_state()
+            if usage is not None:
+                self.resources_measured.emit(usage)
             self.execution_finished.emit(return_code)
 
+        except FileNotFoundError as e:
+            # Exécution directe : l'exécutable n'existe pas
+            if self.argv:
+                self.error_received.emit(f"Exécutable introuvable: {self.argv[0]}")
+            else:
+                self.error_received.emit(f"Erreur lors de l'exécution: {str(e)}")
+            self.execution_finished.emit(-1)
         except Exception as e:
             self.error_received.emit(f"Erreur lors de l'exécution: {str(e)}")
             self.execution_finished.emit(-1)
         finally:
             # S'assurer que le processus est bien terminé
-            if process is not None and process.poll() is None:
-                self._kill_process(process)
+            if process is not None:
+                if process.poll() is None:
+                    self._kill_process(process)
+                get_process_registry().release(process.pid)
+            self._done.set()
+
+    def _spawn_process(self) -> subprocess.Popen:
+        """
+        Démarre le processus de la commande dans son propre groupe de processus.
+
+        Avec une liste d'arguments, l'exécutable est lancé directement : pas de
+        processus shell intermédiaire, et les valeurs ne sont pas réinterprétées.
+
+        Returns:
+            Le processus démarré
+        """
+        encoding, kwargs = process_group_options()
+        if self.argv:
+            args, shell = resolve_launch(self.argv)
+        else:
+            args, shell = self.command, True
+        return subprocess.Popen(
+            args,
+            shell=shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding=encoding,
+            errors="replace",
+            **kwargs,
+        )
+
+    def _wait_for_exit(self, process: subprocess.Popen) -> Optional["ResourceUsage"]:
+        """
+        Attend la fin du processus et mesure ses ressources.
+
+        Après une annulation, le processus reçoit d'abord une demande d'arrêt,
+        puis est tué s'il tourne encore à l'expiration du délai de grâce.
+
+        Args:
+            process: Le processus à attendre
+
+        Returns:
+            Les ressources consommées, ou None si elles n'ont pas été mesurées
+        """
+        waiter = ProcessWaiter(process)
+        while not waiter.wait(timeout=0.1):  # Vérifier toutes les 100ms
+            if self._is_cancelled:
+                self._escalate_cancellation(process)
+        return waiter.usage
+
+    def _escalate_cancellation(self, process: subprocess.Popen):
+        """Envoie la demande d'arrêt, puis tue le processus après le délai de grâce."""
+        if self._force_killed:
+            return
+        elapsed = time.monotonic() - (self._cancel_time or time.monotonic())
+        if elapsed >= self.grace_period:
+            self._force_killed = True
+            self._kill_process(process)
+        elif not self._terminate_sent:
+            self._terminate_sent = True
+            self._terminate_process(process)
+
+    def _emit_cancellation_state(self):
+        """Signale comment la commande annulée s'est terminée."""
+        self.cancellation_finished.emit(
+            CANCEL_STATE_KILLED if self._force_killed else CANCEL_STATE_TERMINATED
+        )
+
+    def _on_stdout_line(self, line: str):
+        """Relaie une ligne de sortie standard tant que le job n'est pas annulé."""
+        if not self._is_cancelled:
+            self.output_received.emit(line.rstrip())
+
+    def _terminate_process(self, process):
+        """
+        Demande l'arrêt du processus et de ses enfants, sans forcer ni attendre.
+
+        Sur Unix, envoie SIGTERM au groupe de processus. Sur Windows, envoie
+        CTRL_BREAK_EVENT au groupe créé par CREATE_NEW_PROCESS_GROUP (dont
+        l'identifiant est le PID du processus) : taskkill sans /F n'arrête pas
+        les programmes console. Ceux qui ignorent la demande sont tués à
+        l'expiration du délai de grâce.
+        """
+        try:
+            if os.name == "nt":
+                os.kill(process.pid, signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        except Exception:
+            pass
 
     def _kill_process(self, process):
         """Tue le processus et tous ses enfants de manière forcée.
@@ -130,8 +479,6 @@ class CommandExecutor(QThread):
                 )
             else:
                 # Sur Unix, utiliser kill avec le groupe de processus
-                import signal
-
                 os.killpg(os.getpgid(pid), signal.SIGKILL)
 
             # Attendre que le processus se termine
@@ -149,12 +496,18 @@ class CommandExecutor(QThread):
                 pass
 
     def cancel(self):
-        """Annule l'exécution de la commande."""
-        self._is_cancelled = True
+        """
+        Annule l'exécution de la commande sans bloquer.
 
-        # Tuer le processus immédiatement
-        if self._process is not None and self._process.poll() is None:
-            self._kill_process(self._process)
+        Ne fait que signaler l'annulation : c'est le job, dans son thread, qui
+        envoie la demande d'arrêt au processus (au plus 100 ms plus tard), puis
+        le tue s'il tourne encore à l'expiration du délai de grâce, et émet
+        enfin cancellation_finished et execution_finished.
+        """
+        if self._is_cancelled:
+            return
+        self._cancel_time = time.monotonic()
+        self._is_cancelled = True
 
 
 class CommandExecutorService:
@@ -165,6 +518,7 @@ class CommandExecutorService:
     def __init__(self):
         """Initialise le service d'exécution."""
         self.current_executor: Optional[CommandExecutor] = None
+        self._active_executors: List[CommandExecutor] = []
         self._stop_requested = False
 
     def execute_command(
@@ -173,46 +527,100 @@ class CommandExecutorService:
         on_output: Optional[Callable[[str], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
         on_finished: Optional[Callable[[int], None]] = None,
+        session: Optional["ShellSession"] = None,
+        argv: Optional[List[str]] = None,
+        grace_period: Optional[float] = None,
+        on_cancelled: Optional[Callable[[str], None]] = None,
+        exclusive: bool = True,
+        on_resources: Optional[Callable[["ResourceUsage"], None]] = None,
     ) -> CommandExecutor:
         """
-        Exécute une commande de manière asynchrone.
+        Exécute une commande de manière asynchrone dans le pool de threads.
 
         Args:
             command: La commande à exécuter
             on_output: Callback appelé pour chaque ligne de sortie
             on_error: Callback appelé pour chaque ligne d'erreur
             on_finished: Callback appelé à la fin de l'exécution avec le code de retour
+            session: Session shell persistante dans laquelle exécuter la commande
+                     (None = un nouveau processus pour la commande)
+            argv: Liste d'arguments pour lancer l'exécutable sans shell
+                  (ignorée en mode session)
+            grace_period: Délai (s) avant l'arrêt forcé après une annulation
+                          (None = DEFAULT_CANCEL_GRACE_PERIOD)
+            on_cancelled: Callback appelé avec l'état final après une annulation
+                          (CANCEL_STATE_TERMINATED ou CANCEL_STATE_KILLED)
+            exclusive: Si True, annule l'exécution courante avant de démarrer
+                       (False = exécuter en parallèle)
+            on_resources: Callback appelé avec les ressources consommées par la
+                          commande, avant on_finished (non appelé si non mesurées)
 
         Returns:
             L'instance de CommandExecutor créée
         """
-        # Annuler l'exécution précédente si elle existe
-        if self.current_executor and self.current_executor.isRunning():
+        # Annuler l'exécution précédente si elle existe (sans attendre) :
+        # ses callbacks ne concernent plus la commande courante
+        if exclusive and self.current_executor and self.current_executor.isRunning():
+            self.current_executor.blockSignals(True)
             self.current_executor.cancel()
-            self.current_executor.wait()
 
-        # Créer un nouveau thread d'exécution
-        self.current_executor = CommandExecutor(command)
+        if grace_period is None:
+            grace_period = DEFAULT_CANCEL_GRACE_PERIOD
+
+        # Créer un nouveau job d'exécution
+        if session is not None:
+            from command_builder.services.shell_session import SessionCommandExecutor
+
+            executor = SessionCommandExecutor(
+                command, session, grace_period=grace_period
+            )
+        else:
+            executor = CommandExecutor(command, argv=argv, grace_period=grace_period)
 
         # Connecter les callbacks si fournis
         if on_output:
-            self.current_executor.output_received.connect(on_output)
+            executor.output_received.connect(on_output)
         if on_error:
-            self.current_executor.error_received.connect(on_error)
+            executor.error_received.connect(on_error)
         if on_finished:
-            self.current_executor.execution_finished.connect(on_finished)
+            executor.execution_finished.connect(on_finished)
+        if on_cancelled:
+            executor.cancellation_finished.connect(on_cancelled)
+        if on_resources:
+            executor.resources_measured.connect(on_resources)
 
-        # Démarrer l'exécution
-        self.current_executor.start()
+        self.current_executor = executor
+        self._active_executors = self.active_executors() + [executor]
+
+        # Soumettre le job au pool
+        executor.start()
+
+        return executor
+
+    def active_executors(self) -> List[CommandExecutor]:
+        """
+        Retourne les exécutions en cours lancées par le service.
 
-        return self.current_executor
+        Returns:
+            La liste des exécuteurs actifs
+        """
+        return [executor for executor in self._active_executors if executor.isRunning()]
 
     def cancel_current_execution(self):
-        """Annule l'exécution en cours."""
+        """
+        Annule l'exécution en cours sans bloquer.
+
+        La fin de l'exécution est signalée par cancellation_finished puis
+        execution_finished.
+        """
         if self.current_executor and self.current_executor.isRunning():
             self.current_executor.cancel()
-            # Attendre avec timeout pour ne pas bloquer l'UI
-            self.current_executor.wait(1000)  # Max 1 seconde
+
+    def cancel_all(self):
+        """Annule toutes les exécutions en cours sans bloquer."""
+        self.cancel_current_execution()
+        for executor in self.active_executors():
+            executor.cancel()
 
     def request_stop(self):
         """
@@ -220,7 +628,7 @@ class CommandExecutorService:
         Cette méthode doit être appelée pour arrêter complètement l'exécution d'une séquence.
         """
         self._stop_requested = True
-        self.cancel_current_execution()
+        self.cancel_all()
 
     def is_stop_requested(self) -> bool:
         """
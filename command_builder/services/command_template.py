@@ -0,0 +1,346 @@
+"""
+Compilation des modèles de commande en liste d'arguments (argv).
+
+Un modèle comme "computeprofile {DB} --config {CONFIG} {DEBUG_FLAG}" est
+découpé une seule fois en jetons, puis chaque exécution remplace les
+placeholders par les valeurs saisies sans repasser par un shell : une valeur
+contenant des espaces ou des caractères spéciaux reste un argument unique.
+
+Les modèles qui utilisent des fonctionnalités du shell (redirections, pipes,
+variables, commandes internes) sont détectés et continuent d'être exécutés
+via le shell.
+"""
+
+import os
+import re
+import shlex
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+# Placeholder d'argument dans un modèle : {CODE}
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+# Caractères interprétés par le shell (hors placeholders)
+WINDOWS_SHELL_CHARACTERS = set("|&<>^%")
+POSIX_SHELL_CHARACTERS = set("|&;<>()$`*?[]~!#")
+
+# Caractères imposant des guillemets autour d'un argument pour cmd.exe
+WINDOWS_QUOTED_CHARACTERS = set(' \t"|&<>^()%')
+
+# Caractères que cmd.exe interprète même entre guillemets (fin de la citation,
+# expansion de variable) : l'argument est alors protégé par des ^
+WINDOWS_UNSAFE_IN_QUOTES = set('"%')
+WINDOWS_CARET_PATTERN = re.compile(r'(["%|&<>^()])')
+
+# Commandes internes du shell, sans exécutable correspondant
+WINDOWS_SHELL_BUILTINS = {
+    "assoc",
+    "call",
+    "cd",
+    "chdir",
+    "cls",
+    "copy",
+    "del",
+    "dir",
+    "echo",
+    "erase",
+    "exit",
+    "for",
+    "if",
+    "md",
+    "mkdir",
+    "mklink",
+    "move",
+    "path",
+    "popd",
+    "pushd",
+    "rd",
+    "ren",
+    "rename",
+    "rmdir",
+    "set",
+    "start",
+    "title",
+    "type",
+    "ver",
+    "vol",
+}
+POSIX_SHELL_BUILTINS = {
+    ".",
+    "alias",
+    "cd",
+    "eval",
+    "exec",
+    "exit",
+    "export",
+    "set",
+    "source",
+    "unset",
+}
+
+# Un segment de jeton est soit un texte littéral, soit un placeholder
+Segment = Union[str, "Placeholder"]
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """Référence à un argument dans un jeton de modèle."""
+
+    code: str
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    Modèle de commande découpé en jetons.
+
+    Attributes:
+        template: Le modèle d'origine
+        tokens: Jetons du modèle, chacun composé de segments
+        requires_shell: True si le modèle doit être exécuté par le shell
+    """
+
+    template: str
+    tokens: Tuple[Tuple[Segment, ...], ...]
+    requires_shell: bool
+
+
+def split_template(template: str) -> List[str]:
+    """
+    Découpe un modèle en jetons séparés par des espaces.
+
+    Les guillemets simples ou doubles regroupent un jeton et sont retirés.
+    Les antislashs sont conservés tels quels (chemins Windows).
+
+    Args:
+        template: Le modèle de commande
+
+    Returns:
+        La liste des jetons
+    """
+    tokens = []
+    current = []
+    in_token = False
+    quote = None
+
+    for char in template:
+        if quote:
+            if char == quote:
+                quote = None
+            else:
+                current.append(char)
+        elif char in "\"'":
+            quote = char
+            in_token = True
+        elif char.isspace():
+            if in_token:
+                tokens.append("".join(current))
+                current = []
+                in_token = False
+        else:
+            current.append(char)
+            in_token = True
+
+    if in_token:
+        tokens.append("".join(current))
+    return tokens
+
+
+def _parse_segments(token: str) -> Tuple[Segment, ...]:
+    """Découpe un jeton en segments littéraux et placeholders."""
+    segments = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(token):
+        if match.start() > position:
+            segments.append(token[position : match.start()])
+        segments.append(Placeholder(match.group(1)))
+        position = match.end()
+    if position < len(token):
+        segments.append(token[position:])
+    return tuple(segments)
+
+
+def template_requires_shell(template: str) -> bool:
+    """
+    Indique si un modèle utilise des fonctionnalités du shell.
+
+    Seul le texte du modèle est examiné : les valeurs saisies par
+    l'utilisateur ne peuvent pas faire basculer une commande vers le shell.
+
+    Args:
+        template: Le modèle de commande
+
+    Returns:
+        True si le modèle contient des caractères spéciaux du shell
+        ou commence par une commande interne du shell
+    """
+    if os.name == "nt":
+        shell_characters = WINDOWS_SHELL_CHARACTERS
+        builtins = WINDOWS_SHELL_BUILTINS
+    else:
+        shell_characters = POSIX_SHELL_CHARACTERS
+        builtins = POSIX_SHELL_BUILTINS
+
+    literal_text = PLACEHOLDER_PATTERN.sub(" ", template)
+    if any(char in shell_characters for char in literal_text):
+        return True
+
+    tokens = split_template(template)
+    return bool(tokens) and tokens[0].lower() in builtins
+
+
+@lru_cache(maxsize=512)
+def compile_template(template: str, shell: Optional[bool] = None) -> CompiledTemplate:
+    """
+    Compile un modèle de commande (résultat mis en cache).
+
+    Args:
+        template: Le modèle de commande
+        shell: True pour forcer l'exécution via le shell, False pour la
+               forcer en direct, None pour la détection automatique
+
+    Returns:
+        Le modèle compilé
+    """
+    requires_shell = template_requires_shell(template) if shell is None else shell
+    tokens = tuple(_parse_segments(token) for token in split_template(template))
+    return CompiledTemplate(
+        template=template, tokens=tokens, requires_shell=requires_shell
+    )
+
+
+def render_argv(compiled: CompiledTemplate, values: Dict[str, List[str]]) -> List[str]:
+    """
+    Produit la liste d'arguments d'un modèle compilé.
+
+    Un jeton composé uniquement d'un placeholder est remplacé par les jetons
+    de la valeur (aucun jeton si la valeur est vide). Dans un jeton mixte
+    (ex: "--out={OUT}"), la valeur est insérée dans le texte.
+
+    Args:
+        compiled: Le modèle compilé
+        values: Jetons de valeur par code d'argument
+
+    Returns:
+        La liste d'arguments (le premier élément est l'exécutable)
+    """
+    argv = []
+    for segments in compiled.tokens:
+        if len(segments) == 1 and isinstance(segments[0], Placeholder):
+            code = segments[0].code
+            if code in values:
+                argv.extend(values[code])
+            else:
+                argv.append(f"{{{code}}}")
+            continue
+
+        parts = []
+        for segment in segments:
+            if isinstance(segment, Placeholder):
+                if segment.code in values:
+                    parts.append(" ".join(values[segment.code]))
+                else:
+                    parts.append(f"{{{segment.code}}}")
+            else:
+                parts.append(segment)
+        token = "".join(parts)
+        if token:
+            argv.append(token)
+    return argv
+
+
+def quote_argument(argument: str) -> str:
+    """
+    Protège un argument pour la ligne de commande de la plateforme.
+
+    Sous Windows, l'argument est entouré de guillemets s'il contient des
+    espaces ou des caractères spéciaux de cmd.exe (règles du runtime C pour
+    les antislashs, guillemets internes doublés). Un guillemet ou un % reste
+    interprété par cmd.exe entre guillemets : chaque caractère spécial est
+    alors précédé de ^, y compris les guillemets, pour que cmd.exe n'exécute
+    rien de la valeur. Sous Unix, shlex.quote est utilisé.
+
+    Args:
+        argument: L'argument à protéger
+
+    Returns:
+        L'argument, entre guillemets si nécessaire
+    """
+    if os.name != "nt":
+        return shlex.quote(argument)
+    if argument and not WINDOWS_QUOTED_CHARACTERS.intersection(argument):
+        return argument
+    # Antislashs doublés devant un guillemet (doublé) et en fin d'argument
+    escaped = re.sub(r'(\\*)"', r'\1\1""', argument)
+    escaped = re.sub(r"(\\+)$", r"\1\1", escaped)
+    quoted = f'"{escaped}"'
+    if not WINDOWS_UNSAFE_IN_QUOTES.intersection(argument):
+        return quoted
+    return WINDOWS_CARET_PATTERN.sub(r"^\1", quoted)
+
+
+def format_command_line(argv: List[str]) -> str:
+    """
+    Formate une liste d'arguments en ligne de commande avec les guillemets
+    appropriés à la plateforme.
+
+    Args:
+        argv: La liste d'arguments
+
+    Returns:
+        La ligne de commande équivalente
+    """
+    return " ".join(quote_argument(argument) for argument in argv)
+
+
+def render_command_line(template: str, values: Dict[str, List[str]]) -> str:
+    """
+    Produit la ligne de commande d'un modèle, pour l'affichage et le shell.
+
+    Le texte du modèle (redirections, pipes...) est conservé tel quel et
+    chaque jeton de valeur est protégé par quote_argument(). Une valeur
+    placée entre guillemets dans le modèle est insérée sans autre protection.
+    Les espaces consécutifs du modèle sont réduits à un seul.
+
+    Args:
+        template: Le modèle de commande
+        values: Jetons de valeur par code d'argument (un placeholder absent
+                est laissé tel quel, une liste vide le retire)
+
+    Returns:
+        La ligne de commande
+    """
+    parts = []
+    rendered_values = []
+    quote = None
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        literal = template[position : match.start()]
+        parts.append(literal)
+        position = match.end()
+        for char in literal:
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+
+        code = match.group(1)
+        if code not in values:
+            parts.append(match.group(0))
+            continue
+        tokens = values[code]
+        if not tokens:
+            continue
+        if not quote:
+            tokens = [quote_argument(token) for token in tokens]
+        # Les valeurs sont réinsérées après la réduction des espaces
+        parts.append(f"\0{len(rendered_values)}\0")
+        rendered_values.append(" ".join(tokens))
+    parts.append(template[position:])
+
+    command_line = re.sub(r"\s+", " ", "".join(parts)).strip()
+    return re.sub(
+        r"\0(\d+)\0", lambda match: rendered_values[int(match.group(1))], command_line
+    )
@@ -0,0 +1,181 @@
+"""
+Stockage des lignes de la console.
+
+Toutes les lignes affichées sont ajoutées à un fichier temporaire (supprimé à
+la fermeture) ; seules les plus récentes sont gardées en mémoire. Un index
+clairsemé (une position pour SPARSE_INDEX_STEP lignes) permet de relire
+n'importe quelle plage de lignes anciennes sans garder leurs positions : la
+mémoire utilisée reste quasiment constante quel que soit le volume de sortie.
+"""
+
+import tempfile
+import threading
+from array import array
+from collections import deque
+from typing import Iterator, List
+
+# Nombre de lignes récentes gardées en mémoire
+DEFAULT_MEMORY_LINES = 5000
+
+# Une position de ligne est mémorisée toutes les SPARSE_INDEX_STEP lignes
+SPARSE_INDEX_STEP = 256
+
+
+class ConsoleBuffer:
+    """
+    Lignes de la console, stockées sur disque avec les plus récentes en mémoire.
+    """
+
+    def __init__(self, memory_lines: int = DEFAULT_MEMORY_LINES):
+        """
+        Initialise le stockage.
+
+        Args:
+            memory_lines: Nombre de lignes récentes gardées en mémoire
+        """
+        self.memory_lines = memory_lines
+        self._lock = threading.Lock()
+        self._spool = None
+        self._offsets = array("Q")
+        self._recent = deque(maxlen=memory_lines)
+        self._line_count = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Nombre total de lignes."""
+        return self._line_count
+
+    def append_lines(self, lines: List[str]):
+        """
+        Ajoute des lignes à la fin du stockage.
+
+        Args:
+            lines: Les lignes (sans retour à la ligne)
+        """
+        if not lines:
+            return
+        with self._lock:
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile(prefix="commandbuilder_console_")
+            self._spool.seek(0, 2)
+            # Encodage par groupes de lignes entre deux positions mémorisées
+            chunk = []
+            position = 0
+            while position < len(lines):
+                if self._line_count % SPARSE_INDEX_STEP == 0:
+                    self._offsets.append(self._size)
+                end = min(
+                    len(lines),
+                    position + SPARSE_INDEX_STEP - self._line_count % SPARSE_INDEX_STEP,
+                )
+                group = lines[position:end]
+                data = ("\n".join(group) + "\n").encode("utf-8")
+                if data.count(b"\n") != len(group):
+                    # Retour à la ligne dans une ligne : une ligne par ligne stockée
+                    data = (
+                        "\n".join(line.replace("\n", " ") for line in group) + "\n"
+                    ).encode("utf-8")
+                chunk.append(data)
+                self._size += len(data)
+                self._line_count += len(group)
+                position = end
+            self._recent.extend(lines)
+            self._spool.write(b"".join(chunk))
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        """
+        Retourne une plage de lignes.
+
+        Args:
+            start: Numéro (à partir de 0) de la première ligne
+            count: Nombre de lignes
+
+        Returns:
+            Les lignes (moins si la fin du stockage est atteinte)
+        """
+        with self._lock:
+            end = min(start + count, self._line_count)
+            start = max(start, 0)
+            if start >= end:
+                return []
+
+            # Lignes récentes : lues en mémoire
+            first_recent = self._line_count - len(self._recent)
+            if start >= first_recent:
+                return [self._recent[i - first_recent] for i in range(start, end)]
+
+            # Lignes anciennes : relues dans le fichier depuis l'index clairsemé
+            self._spool.flush()
+            self._spool.seek(self._offsets[start // SPARSE_INDEX_STEP])
+            for _ in range(start % SPARSE_INDEX_STEP):
+                self._spool.readline()
+            return [
+                self._spool.readline()[:-1].decode("utf-8", errors="replace")
+                for _ in range(end - start)
+            ]
+
+    def read_text(self, start: int, count: int) -> str:
+        """
+        Lit une plage de lignes d'un seul bloc, pour la recherche.
+
+        Args:
+            start: Numéro de la première ligne (multiple de SPARSE_INDEX_STEP)
+            count: Nombre de lignes
+
+        Returns:
+            Le texte des lignes, chacune terminée par un retour à la ligne
+        """
+        if start % SPARSE_INDEX_STEP:
+            raise ValueError("start doit être un multiple de SPARSE_INDEX_STEP")
+        with self._lock:
+            end = min(start + count, self._line_count)
+            if start >= end:
+                return ""
+            next_step = -(-end // SPARSE_INDEX_STEP)
+            stop = (
+                self._offsets[next_step]
+                if next_step < len(self._offsets)
+                else self._size
+            )
+            self._spool.flush()
+            self._spool.seek(self._offsets[start // SPARSE_INDEX_STEP])
+            data = self._spool.read(stop - self._offsets[start // SPARSE_INDEX_STEP])
+
+        # Ne garder que les lignes demandées (le bloc lu peut aller plus loin)
+        position = 0
+        for _ in range(end - start):
+            position = data.index(b"\n", position) + 1
+        return data[:position].decode("utf-8", errors="replace")
+
+    def iter_lines(self, page_size: int = 10000) -> Iterator[str]:
+        """
+        Parcourt toutes les lignes par pages.
+
+        Args:
+            page_size: Nombre de lignes lues à la fois
+
+        Yields:
+            Chaque ligne, de la plus ancienne à la plus récente
+        """
+        start = 0
+        while start < self._line_count:
+            page = self.get_lines(start, page_size)
+            if not page:
+                return
+            yield from page
+            start += len(page)
+
+    def clear(self):
+        """Supprime toutes les lignes."""
+        with self._lock:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+            self._offsets = array("Q")
+            self._recent.clear()
+            self._line_count = 0
+            self._size = 0
+
+    def close(self):
+        """Libère le fichier temporaire."""
+        self.clear()
@@ -0,0 +1,368 @@
+"""
+Export de la sortie de la console.
+
+La console s'exporte en texte brut, en JSON Lines (un objet par ligne avec
+l'horodatage, la commande, le flux et le texte, pour l'ingestion des journaux)
+ou en page HTML autonome. L'export lit les lignes bloc par bloc depuis le
+journal de la séquence quand la console contient exactement cette séquence
+(sinon depuis le stockage de la console) et les écrit au fil de l'eau dans un
+thread du pool : l'interface reste fluide quelle que soit la taille de la
+sortie, et l'export peut être annulé.
+"""
+
+import datetime
+import gzip
+import html
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from command_builder.services.console_buffer import ConsoleBuffer
+from command_builder.services.console_search import (
+    TAG_CMD,
+    TAG_ERR,
+    TAG_NONE,
+    TAG_OUT,
+    TAG_PREFIXES,
+    ConsoleSearchIndex,
+    classify_line,
+)
+from command_builder.services.run_log import RunLogReader, export_run_log
+
+# Formats d'export
+FORMAT_TEXT = "txt"
+FORMAT_JSONL = "jsonl"
+FORMAT_HTML = "html"
+FORMAT_GZIP = "log.gz"
+EXPORT_FORMATS = (FORMAT_TEXT, FORMAT_JSONL, FORMAT_HTML, FORMAT_GZIP)
+
+# Nom du flux de chaque étiquette dans l'export JSON Lines
+STREAM_NAMES = {
+    TAG_NONE: "console",
+    TAG_CMD: "command",
+    TAG_OUT: "stdout",
+    TAG_ERR: "stderr",
+}
+
+# Nombre de lignes lues à la fois depuis le stockage de la console
+EXPORT_PAGE_LINES = 4096
+
+# Ligne exportée : (horodatage Unix, index de la commande, étiquette, texte)
+ExportLine = Tuple[Optional[float], Optional[int], int, str]
+
+HTML_HEADER = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ background-color: #1e2130; margin: 0; padding: 10px; }}
+pre {{ color: #a0e0a0; font-family: "Consolas", monospace; font-size: 13px; }}
+.command {{ color: #64b5f6; }}
+.stderr {{ color: #ff6b6b; }}
+.console {{ color: #ffffff; }}
+</style>
+</head>
+<body>
+<pre>
+"""
+
+HTML_FOOTER = """</pre>
+</body>
+</html>
+"""
+
+
+def format_for_path(file_path: str) -> str:
+    """
+    Détermine le format d'export d'après l'extension du fichier.
+
+    Args:
+        file_path: Le chemin du fichier exporté
+
+    Returns:
+        Le format (FORMAT_*), texte brut par défaut
+    """
+    if file_path.endswith(".gz"):
+        return FORMAT_GZIP
+    suffix = Path(file_path).suffix.lstrip(".").lower()
+    return suffix if suffix in (FORMAT_JSONL, FORMAT_HTML) else FORMAT_TEXT
+
+
+def strip_tag(line: str) -> str:
+    """
+    Retire le préfixe d'étiquette ([CMD], [OUT], [ERR]) d'une ligne.
+
+    Args:
+        line: La ligne de la console
+
+    Returns:
+        Le texte de la ligne sans son préfixe
+    """
+    if line[:5] in TAG_PREFIXES:
+        return line[6:] if line[5:6] == " " else line[5:]
+    return line
+
+
+class RunLogSource:
+    """
+    Lignes à exporter lues depuis le journal compressé d'une séquence.
+    """
+
+    def __init__(self, log_path: Path):
+        """
+        Initialise la source (l'index est lu tel qu'il est à cet instant).
+
+        Args:
+            log_path: Le chemin du journal (.log.gz)
+        """
+        self.log_path = Path(log_path)
+        self.reader = RunLogReader(self.log_path)
+
+    @property
+    def line_count(self) -> int:
+        """Nombre de lignes à exporter."""
+        return self.reader.line_count
+
+    def iter_batches(self) -> Iterator[List[ExportLine]]:
+        """
+        Parcourt les lignes bloc par bloc.
+
+        Yields:
+            Les lignes d'un bloc du journal
+        """
+        reader = self.reader
+        for first_line, lines in reader.iter_blocks():
+            yield [
+                (
+                    reader.line_time(number),
+                    reader.command_index(number),
+                    classify_line(line, reader.is_output(number)),
+                    line,
+                )
+                for number, line in enumerate(lines, first_line)
+            ]
+
+
+class ConsoleBufferSource:
+    """
+    Lignes à exporter lues depuis le stockage de la console (sans horodatage
+    ni commande : utilisé quand la console ne correspond pas au journal d'une
+    séquence).
+    """
+
+    def __init__(self, buffer: ConsoleBuffer, index: ConsoleSearchIndex):
+        """
+        Initialise la source avec les lignes présentes à cet instant.
+
+        Args:
+            buffer: Le stockage des lignes
+            index: L'index des étiquettes
+        """
+        self.buffer = buffer
+        self.index = index
+        self._line_count = min(len(buffer), len(index))
+
+    @property
+    def line_count(self) -> int:
+        """Nombre de lignes à exporter."""
+        return self._line_count
+
+    def iter_batches(self) -> Iterator[List[ExportLine]]:
+        """
+        Parcourt les lignes par pages.
+
+        Yields:
+            Les lignes d'une page
+        """
+        for start in range(0, self._line_count, EXPORT_PAGE_LINES):
+            count = min(EXPORT_PAGE_LINES, self._line_count - start)
+            lines = self.buffer.get_lines(start, count)
+            tags = self.index.tags_range(start, count)
+            yield [(None, None, tag, line) for tag, line in zip(tags, lines)]
+
+
+def _write_text(f, batch: List[ExportLine]):
+    """Écrit des lignes telles qu'affichées dans la console."""
+    f.write("".join(line + "\n" for _, _, _, line in batch))
+
+
+def _jsonl_writer() -> Callable:
+    """Crée l'écriture JSON Lines (les horodatages ISO sont mis en cache)."""
+    cache = {}
+
+    def timestamp(value: Optional[float]) -> Optional[str]:
+        if value is None:
+            return None
+        if value not in cache:
+            cache.clear()
+            cache[value] = (
+                datetime.datetime.fromtimestamp(value)
+                .astimezone()
+                .isoformat(timespec="milliseconds")
+            )
+        return cache[value]
+
+    def write(f, batch: List[ExportLine]):
+        f.write(
+            "".join(
+                json.dumps(
+                    {
+                        "timestamp": timestamp(time_value),
+                        "command_index": command_index,
+                        "stream": STREAM_NAMES[tag],
+                        "line": strip_tag(line),
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for time_value, command_index, tag, line in batch
+            )
+        )
+
+    return write
+
+
+def _write_html(f, batch: List[ExportLine]):
+    """Écrit des lignes dans le corps de la page HTML."""
+    parts = []
+    for _, _, tag, line in batch:
+        text = html.escape(line, quote=False)
+        if tag == TAG_OUT:
+            parts.append(text + "\n")
+        else:
+            parts.append(f'<span class="{STREAM_NAMES[tag]}">{text}</span>\n')
+    f.write("".join(parts))
+
+
+def export_console(
+    source,
+    file_path: str,
+    export_format: str = FORMAT_TEXT,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """
+    Exporte les lignes d'une source vers un fichier, en flux.
+
+    Le fichier est écrit sous un nom temporaire puis renommé : un export
+    annulé ou en échec ne laisse pas de fichier partiel.
+
+    Args:
+        source: RunLogSource ou ConsoleBufferSource
+        file_path: Le chemin du fichier exporté
+        export_format: Le format (FORMAT_*)
+        on_progress: Appelée avec (lignes écrites, total) après chaque bloc
+        is_cancelled: Fonction indiquant si l'export a été annulé
+
+    Returns:
+        True si l'export est terminé, False s'il a été annulé
+
+    Raises:
+        ValueError: Si le format est inconnu
+        OSError: Si le fichier ne peut pas être écrit
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export inconnu: {export_format}")
+    total = source.line_count
+
+    if export_format == FORMAT_GZIP and isinstance(source, RunLogSource):
+        # Le journal est déjà au bon format : copie directe
+        export_run_log(source.log_path, file_path)
+        if on_progress is not None:
+            on_progress(total, total)
+        return True
+
+    if export_format == FORMAT_JSONL:
+        write_batch = _jsonl_writer()
+    elif export_format == FORMAT_HTML:
+        write_batch = _write_html
+    else:
+        write_batch = _write_text
+
+    part_path = file_path + ".part"
+    opener = gzip.open if export_format == FORMAT_GZIP else open
+    written = 0
+    try:
+        with opener(part_path, "wt", encoding="utf-8", newline="\n") as f:
+            if export_format == FORMAT_HTML:
+                title = f"Console CommandBuilder - {Path(file_path).stem}"
+                f.write(HTML_HEADER.format(title=html.escape(title)))
+            for batch in source.iter_batches():
+                if is_cancelled is not None and is_cancelled():
+                    break
+                write_batch(f, batch)
+                written += len(batch)
+                if on_progress is not None:
+                    on_progress(written, total)
+            else:
+                if export_format == FORMAT_HTML:
+                    f.write(HTML_FOOTER)
+        if is_cancelled is not None and is_cancelled():
+            os.remove(part_path)
+            return False
+        os.replace(part_path, file_path)
+        return True
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+class ConsoleExportJob(QObject, QRunnable):
+    """
+    Export exécuté dans un thread du pool global.
+    """
+
+    # Avancement : (lignes écrites, total)
+    progress = Signal(int, int)
+    # Fin : (chemin du fichier, True si terminé / False si annulé)
+    finished = Signal(str, bool)
+    # Erreur : message
+    failed = Signal(str)
+
+    def __init__(self, source, file_path: str, export_format: str = FORMAT_TEXT):
+        """
+        Initialise l'export.
+
+        Args:
+            source: RunLogSource ou ConsoleBufferSource
+            file_path: Le chemin du fichier exporté
+            export_format: Le format (FORMAT_*)
+        """
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.source = source
+        self.file_path = file_path
+        self.export_format = export_format
+        self._cancelled = threading.Event()
+
+    def start(self):
+        """Soumet l'export au pool de threads global."""
+        QThreadPool.globalInstance().start(self)
+
+    def cancel(self):
+        """Annule l'export (le fichier partiel est supprimé)."""
+        self._cancelled.set()
+
+    def run(self):
+        """Exécute l'export et émet son résultat."""
+        try:
+            completed = export_console(
+                self.source,
+                self.file_path,
+                self.export_format,
+                self.progress.emit,
+                self._cancelled.is_set,
+            )
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self.file_path, completed)
@@ -0,0 +1,306 @@
+"""
+Recherche dans la sortie de la console.
+
+L'index est mis à jour à chaque ajout de lignes : il garde l'étiquette de
+chaque ligne ([CMD], [OUT], [ERR]) sur un octet, et pour chaque bloc de
+CHUNK_LINES lignes l'ensemble des étiquettes présentes, ce qui permet
+d'écarter sans les lire les blocs qui ne peuvent pas correspondre au filtre.
+
+La recherche lit le texte bloc par bloc depuis le ConsoleBuffer et cherche
+dans chaque bloc d'un seul appel (str.find ou re.finditer), dans un thread du
+pool : l'interface reste fluide même sur des millions de lignes. Une recherche
+peut être limitée aux lignes ajoutées depuis la précédente.
+"""
+
+import bisect
+import re
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from command_builder.services.console_buffer import SPARSE_INDEX_STEP, ConsoleBuffer
+
+# Étiquettes des lignes de la console
+TAG_NONE = 0  # Messages de l'application (en-têtes, résumés...)
+TAG_CMD = 1
+TAG_OUT = 2
+TAG_ERR = 3
+
+# Préfixes des lignes étiquetées
+TAG_PREFIXES = {"[CMD]": TAG_CMD, "[OUT]": TAG_OUT, "[ERR]": TAG_ERR}
+
+# Nombre de lignes d'un bloc de recherche (multiple de SPARSE_INDEX_STEP)
+CHUNK_LINES = SPARSE_INDEX_STEP * 16
+
+
+def classify_line(line: str, output: bool = False) -> int:
+    """
+    Détermine l'étiquette d'une ligne de la console.
+
+    Args:
+        line: La ligne
+        output: True si la ligne provient de la sortie d'une commande
+
+    Returns:
+        L'étiquette (TAG_*)
+    """
+    tag = TAG_PREFIXES.get(line[:5])
+    if tag is not None:
+        return tag
+    return TAG_OUT if output else TAG_NONE
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """
+    Recherche dans la console.
+
+    Attributes:
+        text: Le texte ou l'expression régulière recherché
+        regex: True si text est une expression régulière
+        case_sensitive: True pour respecter la casse
+        tag: Étiquette des lignes à retenir (None = toutes)
+    """
+
+    text: str
+    regex: bool = False
+    case_sensitive: bool = False
+    tag: Optional[int] = None
+
+    def compile(self) -> re.Pattern:
+        """
+        Compile la recherche en expression régulière.
+
+        Returns:
+            L'expression compilée
+
+        Raises:
+            re.error: Si l'expression régulière est invalide
+        """
+        pattern = self.text if self.regex else re.escape(self.text)
+        flags = re.MULTILINE if self.case_sensitive else re.MULTILINE | re.IGNORECASE
+        return re.compile(pattern, flags)
+
+
+class ConsoleSearchIndex:
+    """
+    Index des étiquettes des lignes de la console, mis à jour au fil de l'eau.
+    """
+
+    def __init__(self):
+        """Initialise un index vide."""
+        self._lock = threading.Lock()
+        self.tags = array("B")
+        self.chunk_masks: List[int] = []
+
+    def __len__(self) -> int:
+        """Nombre de lignes indexées."""
+        return len(self.tags)
+
+    def add_lines(self, lines: List[str], output: bool = False):
+        """
+        Indexe des lignes ajoutées à la console.
+
+        Args:
+            lines: Les lignes
+            output: True si les lignes proviennent de la sortie d'une commande
+        """
+        # Même règle que classify_line, en une seule compréhension
+        default = TAG_OUT if output else TAG_NONE
+        prefix_tag = TAG_PREFIXES.get
+        tags = [prefix_tag(line[:5], default) for line in lines]
+        with self._lock:
+            position = 0
+            while position < len(tags):
+                chunk = len(self.tags) // CHUNK_LINES
+                if chunk == len(self.chunk_masks):
+                    self.chunk_masks.append(0)
+                end = position + CHUNK_LINES - len(self.tags) % CHUNK_LINES
+                chunk_tags = tags[position:end]
+                for tag in set(chunk_tags):
+                    self.chunk_masks[chunk] |= 1 << tag
+                self.tags.extend(chunk_tags)
+                position = end
+
+    def chunk_has_tag(self, chunk: int, tag: Optional[int]) -> bool:
+        """
+        Indique si un bloc contient des lignes d'une étiquette.
+
+        Args:
+            chunk: L'index du bloc
+            tag: L'étiquette (None = n'importe laquelle)
+
+        Returns:
+            True si le bloc peut contenir des résultats
+        """
+        if tag is None:
+            return True
+        with self._lock:
+            return bool(self.chunk_masks[chunk] & (1 << tag))
+
+    def tag_of(self, line: int) -> int:
+        """
+        Retourne l'étiquette d'une ligne.
+
+        Args:
+            line: Le numéro de la ligne
+
+        Returns:
+            L'étiquette (TAG_*)
+        """
+        with self._lock:
+            return self.tags[line]
+
+    def tags_range(self, start: int, count: int) -> array:
+        """
+        Retourne les étiquettes d'une plage de lignes.
+
+        Args:
+            start: Numéro de la première ligne
+            count: Nombre de lignes
+
+        Returns:
+            Une copie des étiquettes de la plage
+        """
+        with self._lock:
+            return self.tags[start : start + count]
+
+    def clear(self):
+        """Vide l'index."""
+        with self._lock:
+            self.tags = array("B")
+            self.chunk_masks = []
+
+
+def search_lines(
+    buffer: ConsoleBuffer,
+    index: ConsoleSearchIndex,
+    query: SearchQuery,
+    start: int = 0,
+    end: Optional[int] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> List[int]:
+    """
+    Cherche les lignes correspondant à une recherche.
+
+    Args:
+        buffer: Le stockage des lignes
+        index: L'index des étiquettes
+        query: La recherche
+        start: Première ligne examinée
+        end: Ligne qui suit la dernière examinée (None = jusqu'à la fin)
+        is_cancelled: Fonction indiquant si la recherche a été abandonnée
+
+    Returns:
+        Les numéros des lignes correspondantes, dans l'ordre
+
+    Raises:
+        re.error: Si l'expression régulière est invalide
+    """
+    if not query.text:
+        return []
+    pattern = query.compile()
+    end = min(len(buffer), len(index)) if end is None else end
+    matches = []
+
+    for chunk in range(start // CHUNK_LINES, -(-end // CHUNK_LINES)):
+        if is_cancelled is not None and is_cancelled():
+            break
+        if not index.chunk_has_tag(chunk, query.tag):
+            continue
+        chunk_start = chunk * CHUNK_LINES
+        text = buffer.read_text(chunk_start, min(CHUNK_LINES, end - chunk_start))
+        if pattern.search(text) is None:
+            continue
+
+        # Début de chaque ligne du bloc, pour retrouver le numéro des résultats
+        line_starts = [0]
+        position = text.find("\n")
+        while position != -1:
+            line_starts.append(position + 1)
+            position = text.find("\n", position + 1)
+
+        next_line_start = 0
+        for match in pattern.finditer(text):
+            if match.start() < next_line_start:
+                continue  # Un seul résultat par ligne
+            line_in_chunk = bisect.bisect_right(line_starts, match.start()) - 1
+            next_line_start = line_starts[line_in_chunk + 1]
+            line = chunk_start + line_in_chunk
+            if line < start or line >= end:
+                continue
+            if query.tag is not None and index.tag_of(line) != query.tag:
+                continue
+            matches.append(line)
+    return matches
+
+
+class ConsoleSearchJob(QObject, QRunnable):
+    """
+    Recherche exécutée dans un thread du pool global.
+    """
+
+    # Résultats : (génération, lignes trouvées, ligne qui suit la plage examinée)
+    finished = Signal(int, object, int)
+    # Erreur de recherche : (génération, message)
+    failed = Signal(int, str)
+
+    def __init__(
+        self,
+        buffer: ConsoleBuffer,
+        index: ConsoleSearchIndex,
+        query: SearchQuery,
+        generation: int,
+        start: int,
+        end: int,
+    ):
+        """
+        Initialise la recherche.
+
+        Args:
+            buffer: Le stockage des lignes
+            index: L'index des étiquettes
+            query: La recherche
+            generation: Numéro de la recherche (les résultats périmés sont ignorés)
+            start: Première ligne examinée
+            end: Ligne qui suit la dernière examinée
+        """
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.buffer = buffer
+        self.index = index
+        self.query = query
+        self.generation = generation
+        self.start_line = start
+        self.end_line = end
+        self._cancelled = threading.Event()
+
+    def start(self):
+        """Soumet la recherche au pool de threads global."""
+        QThreadPool.globalInstance().start(self)
+
+    def cancel(self):
+        """Abandonne la recherche."""
+        self._cancelled.set()
+
+    def run(self):
+        """Exécute la recherche et émet ses résultats."""
+        try:
+            matches = search_lines(
+                self.buffer,
+                self.index,
+                self.query,
+                self.start_line,
+                self.end_line,
+                self._cancelled.is_set,
+            )
+        except re.error as e:
+            self.failed.emit(self.generation, str(e))
+            return
+        # Émis même après abandon : le destinataire libère le job et ignore
+        # les résultats d'une génération périmée
+        self.finished.emit(self.generation, matches, self.end_line)
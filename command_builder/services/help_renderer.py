@@ -0,0 +1,181 @@
+"""
+Conversion de la documentation d'aide (Markdown) en HTML, avec cache.
+
+Le HTML de chaque fichier d'aide est cherché, dans l'ordre :
+- en mémoire (fichier déjà affiché depuis le lancement) ;
+- à côté du fichier Markdown (« intro.html », prérendu au build par
+  build_executable.py) ;
+- dans le dossier « help_cache » du répertoire de données de l'application.
+
+Chaque fichier HTML commence par l'empreinte du Markdown dont il est issu et
+n'est utilisé que si elle correspond au fichier actuel. Sinon, le Markdown
+est converti puis le résultat est enregistré dans le cache. Le paquet
+markdown n'est importé qu'à la première conversion : ni le démarrage de
+l'application ni l'ouverture de l'aide ne le chargent quand le HTML est à
+jour.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from command_builder.services.app_paths import get_app_data_dir
+
+# Nom du dossier de cache dans le répertoire de données
+HELP_CACHE_DIR_NAME = "help_cache"
+
+# Extensions Markdown utilisées pour l'aide
+MARKDOWN_EXTENSIONS = ["tables", "fenced_code", "nl2br"]
+
+# Version du rendu : à incrémenter si la conversion change (extensions...)
+HELP_RENDER_VERSION = 1
+
+# Première ligne d'un fichier HTML rendu, portant l'empreinte de sa source
+_HASH_HEADER = "<!-- help-source-sha256: {} -->\n"
+
+# HTML déjà chargé, par empreinte du Markdown
+_rendered: Dict[str, str] = {}
+
+# Convertisseur Markdown (créé à la première conversion)
+_converter = None
+
+
+def help_source_hash(content: bytes) -> str:
+    """
+    Calcule l'empreinte d'un fichier d'aide.
+
+    Args:
+        content: Le contenu du fichier Markdown
+
+    Returns:
+        L'empreinte SHA-256 (hexadécimale) du contenu et de la version du rendu
+    """
+    digest = hashlib.sha256(f"v{HELP_RENDER_VERSION}\n".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def render_markdown(text: str) -> str:
+    """
+    Convertit du Markdown en HTML (importe markdown au premier appel).
+
+    Args:
+        text: Le texte Markdown
+
+    Returns:
+        Le corps HTML
+    """
+    global _converter
+    if _converter is None:
+        import markdown
+
+        _converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    # Réinitialiser le convertisseur entre deux documents
+    _converter.reset()
+    return _converter.convert(text)
+
+
+def get_help_cache_dir() -> Path:
+    """
+    Retourne le dossier du cache de l'aide (créé si nécessaire).
+
+    Returns:
+        Le chemin du dossier
+    """
+    cache_dir = get_app_data_dir() / HELP_CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def prerendered_path_for(md_path: Path) -> Path:
+    """
+    Retourne le chemin du HTML prérendu d'un fichier d'aide.
+
+    Args:
+        md_path: Le chemin du fichier Markdown
+
+    Returns:
+        Le chemin du fichier HTML voisin
+    """
+    return Path(md_path).with_suffix(".html")
+
+
+def _read_rendered(html_path: Path, source_hash: str) -> Optional[str]:
+    """Lit un HTML rendu s'il est issu de la source d'empreinte donnée."""
+    try:
+        text = html_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    header = _HASH_HEADER.format(source_hash)
+    if not text.startswith(header):
+        return None  # Rendu d'une autre version du Markdown
+    return text[len(header) :]
+
+
+def _write_rendered(html_path: Path, source_hash: str, html: str):
+    """Enregistre un HTML rendu, précédé de l'empreinte de sa source."""
+    html_path.write_text(_HASH_HEADER.format(source_hash) + html, encoding="utf-8")
+
+
+def load_help_html(md_path: Path, cache_dir: Optional[Path] = None) -> str:
+    """
+    Retourne le HTML d'un fichier d'aide, converti seulement s'il a changé.
+
+    Args:
+        md_path: Le chemin du fichier Markdown
+        cache_dir: Le dossier du cache (défaut: celui de l'application)
+
+    Returns:
+        Le corps HTML, ou une chaîne vide si le fichier n'existe pas
+    """
+    md_path = Path(md_path)
+    try:
+        content = md_path.read_bytes()
+    except OSError:
+        return ""
+    source_hash = help_source_hash(content)
+    html = _rendered.get(source_hash)
+    if html is not None:
+        return html
+
+    html = _read_rendered(prerendered_path_for(md_path), source_hash)
+    if html is None:
+        try:
+            cache_path = (cache_dir or get_help_cache_dir()) / f"{md_path.stem}.html"
+        except OSError:
+            cache_path = None  # Répertoire de données inaccessible
+        if cache_path is not None:
+            html = _read_rendered(cache_path, source_hash)
+        if html is None:
+            html = render_markdown(content.decode("utf-8"))
+            if cache_path is not None:
+                try:
+                    _write_rendered(cache_path, source_hash, html)
+                except OSError:
+                    pass  # Le cache n'est qu'une optimisation
+
+    _rendered[source_hash] = html
+    return html
+
+
+def prerender_help(docs_dir: Path) -> List[Path]:
+    """
+    Prérend les fichiers d'aide d'un dossier (build de l'application).
+
+    Args:
+        docs_dir: Le dossier des fichiers Markdown
+
+    Returns:
+        Les chemins des fichiers HTML écrits
+    """
+    written = []
+    for md_path in sorted(Path(docs_dir).glob("*.md")):
+        content = md_path.read_bytes()
+        html_path = prerendered_path_for(md_path)
+        _write_rendered(
+            html_path,
+            help_source_hash(content),
+            render_markdown(content.decode("utf-8")),
+        )
+        written.append(html_path)
+    return written
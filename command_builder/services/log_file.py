@@ -0,0 +1,328 @@
+"""
+Lecture des journaux archivés, de toute taille.
+
+Les journaux sont projetés en mémoire (mmap) : seules les pages lues par
+l'affichage sont chargées par le système, quelle que soit la taille du
+fichier. Un journal texte est indexé en arrière-plan (une position toutes les
+SPARSE_INDEX_STEP lignes, et la première ligne de chaque commande) : il est
+consultable dès l'ouverture, au fur et à mesure de l'indexation. Un journal
+compressé (.log.gz) dispose déjà de son index (.idx) et s'ouvre directement.
+"""
+
+import contextlib
+import mmap
+import operator
+import os
+import re
+import threading
+from array import array
+from itertools import accumulate, repeat
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from command_builder.services.console_buffer import SPARSE_INDEX_STEP
+from command_builder.services.run_log import (
+    LOG_SUFFIX,
+    LogCommand,
+    RunLogReader,
+    index_path_for,
+)
+
+# Taille des morceaux lus à la fois pendant l'indexation
+INDEX_CHUNK_SIZE = 4 * 1024 * 1024
+
+# En-tête d'une commande dans la console : une ligne de tirets puis « [i/n] nom »
+COMMAND_SEPARATOR = b"-" * 80
+_COMMAND_HEADER = re.compile(rb"^\[\d+/\d+\] ([^\r\n]*)", re.MULTILINE)
+
+
+class TextLogFile:
+    """
+    Journal texte projeté en mémoire, indexé en arrière-plan.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Ouvre le journal (l'index est construit par build_index).
+
+        Args:
+            path: Le chemin du journal
+
+        Raises:
+            OSError: Si le fichier ne peut pas être ouvert
+        """
+        self.path = Path(path)
+        self.commands: List[LogCommand] = []
+        self._lock = threading.Lock()
+        self._file = open(self.path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.size
+            else None
+        )
+        self._offsets = array("Q")
+        self._line_count = 0
+        self._indexed_bytes = 0
+        self._indexing = False
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Nombre de lignes indexées."""
+        return self._line_count
+
+    @property
+    def complete(self) -> bool:
+        """True quand tout le fichier est indexé."""
+        return self._indexed_bytes >= self.size
+
+    @property
+    def indexed_bytes(self) -> int:
+        """Nombre d'octets déjà indexés."""
+        return self._indexed_bytes
+
+    def build_index(
+        self,
+        on_progress: Optional[Callable[[], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        chunk_size: int = INDEX_CHUNK_SIZE,
+    ):
+        """
+        Indexe les lignes et les commandes du journal, morceau par morceau.
+
+        Args:
+            on_progress: Appelée après chaque morceau indexé
+            is_cancelled: Fonction indiquant si l'indexation a été abandonnée
+            chunk_size: Taille approximative d'un morceau
+        """
+        with self._lock:
+            if self._closed or self._indexing or self.complete:
+                return
+            self._indexing = True
+        try:
+            position = self._indexed_bytes
+            while position < self.size:
+                if self._closed or (is_cancelled is not None and is_cancelled()):
+                    break
+                self._index_chunk(position, chunk_size)
+                position = self._indexed_bytes
+                if on_progress is not None:
+                    on_progress()
+        finally:
+            with self._lock:
+                self._indexing = False
+                if self._closed:
+                    self._release()
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        """
+        Retourne une plage de lignes indexées.
+
+        Args:
+            start: Numéro de la première ligne
+            count: Nombre de lignes
+
+        Returns:
+            Les lignes (moins si la fin de l'index est atteinte)
+        """
+        with self._lock:
+            end = min(start + count, self._line_count)
+            start = max(start, 0)
+            if start >= end or self._mmap is None:
+                return []
+            data = self._mmap
+            position = self._offsets[start // SPARSE_INDEX_STEP]
+        for _ in range(start % SPARSE_INDEX_STEP):
+            position = data.find(b"\n", position) + 1
+        stop = position
+        for _ in range(end - start):
+            newline = data.find(b"\n", stop)
+            stop = self.size if newline == -1 else newline + 1
+        text = data[position:stop].decode("utf-8", errors="replace")
+        return [line.rstrip("\r") for line in text.split("\n")[: end - start]]
+
+    def close(self):
+        """Ferme le journal (après la fin de l'indexation en cours)."""
+        with self._lock:
+            self._closed = True
+            if not self._indexing:
+                self._release()
+
+    def _index_chunk(self, position: int, chunk_size: int):
+        """Indexe les lignes d'un morceau qui se termine en fin de ligne."""
+        data = self._mmap
+        end = min(position + chunk_size, self.size)
+        if end < self.size:
+            newline = data.find(b"\n", end - 1)
+            end = self.size if newline == -1 else newline + 1
+        chunk = data[position:end]
+
+        parts = chunk.split(b"\n")
+        if chunk.endswith(b"\n"):
+            parts.pop()  # Pas de ligne après le dernier retour à la ligne
+        first_line = self._line_count
+        # Début de chaque ligne du morceau (calculé sans boucle Python)
+        starts = list(
+            accumulate(map(operator.add, map(len, parts), repeat(1)), initial=position)
+        )
+        first_indexed = -first_line % SPARSE_INDEX_STEP
+        offsets = starts[first_indexed : len(parts) : SPARSE_INDEX_STEP]
+
+        commands = []
+        for match in _COMMAND_HEADER.finditer(chunk):
+            line_start = position + match.start()
+            if self._follows_separator(line_start):
+                line = first_line + chunk.count(b"\n", 0, match.start())
+                name = match.group(1).decode("utf-8", errors="replace")
+                commands.append(LogCommand(name, line))
+
+        with self._lock:
+            self._offsets.extend(offsets)
+            self.commands.extend(commands)
+            self._line_count += len(parts)
+            self._indexed_bytes = end
+
+    def _follows_separator(self, line_start: int) -> bool:
+        """Indique si la ligne qui commence à line_start suit une ligne de tirets."""
+        for newline in (b"\n", b"\r\n"):
+            begin = line_start - len(COMMAND_SEPARATOR) - len(newline)
+            if begin < 0:
+                continue
+            if self._mmap[begin:line_start] == COMMAND_SEPARATOR + newline:
+                return True
+        return False
+
+    def _release(self):
+        """Libère la projection et le fichier."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CompressedLogFile(RunLogReader):
+    """
+    Journal d'exécution compressé (.log.gz) projeté en mémoire.
+    """
+
+    def __init__(self, log_path: Path):
+        """
+        Ouvre le journal et charge son index.
+
+        Args:
+            log_path: Le chemin du journal (.log.gz)
+
+        Raises:
+            OSError: Si le journal ou son index est introuvable
+        """
+        if not index_path_for(Path(log_path)).exists():
+            raise FileNotFoundError(
+                f"Index introuvable pour {Path(log_path).name} "
+                f"(fichier {index_path_for(Path(log_path)).name} attendu)"
+            )
+        super().__init__(log_path)
+        self._file = open(self.log_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+
+    def __len__(self) -> int:
+        """Nombre de lignes du journal."""
+        return self.line_count
+
+    @property
+    def complete(self) -> bool:
+        """Le journal compressé est indexé dès l'ouverture."""
+        return True
+
+    def build_index(self, on_progress=None, is_cancelled=None):
+        """Rien à indexer : l'index accompagne le journal."""
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        """
+        Retourne une plage de lignes.
+
+        Args:
+            start: Numéro de la première ligne
+            count: Nombre de lignes
+
+        Returns:
+            Les lignes (moins si la fin du journal est atteinte)
+        """
+        if self._mmap is None:
+            return []
+        return self.read_lines(max(start, 0), count)
+
+    def close(self):
+        """Libère la projection et le fichier."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _open(self):
+        """Lit les blocs dans la projection plutôt que dans le fichier."""
+        return contextlib.nullcontext(self._mmap)
+
+
+def open_log_file(path: Path):
+    """
+    Ouvre un journal archivé.
+
+    Args:
+        path: Le chemin du journal (.log.gz avec son index, ou texte)
+
+    Returns:
+        Un CompressedLogFile ou un TextLogFile
+
+    Raises:
+        OSError: Si le journal ne peut pas être ouvert
+    """
+    path = Path(path)
+    if path.name.endswith(LOG_SUFFIX):
+        return CompressedLogFile(path)
+    return TextLogFile(path)
+
+
+class LogIndexJob(QObject, QRunnable):
+    """
+    Indexation d'un journal dans un thread du pool global.
+    """
+
+    # Émis après chaque morceau indexé
+    progress = Signal()
+    # Émis à la fin (terminée ou abandonnée)
+    finished = Signal()
+
+    def __init__(self, log_file):
+        """
+        Initialise l'indexation.
+
+        Args:
+            log_file: Le journal à indexer (TextLogFile ou CompressedLogFile)
+        """
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.log_file = log_file
+        self._cancelled = threading.Event()
+
+    def start(self):
+        """Soumet l'indexation au pool de threads global."""
+        QThreadPool.globalInstance().start(self)
+
+    def cancel(self):
+        """Abandonne l'indexation."""
+        self._cancelled.set()
+
+    def run(self):
+        """Indexe le journal et signale l'avancement."""
+        try:
+            self.log_file.build_index(self.progress.emit, self._cancelled.is_set)
+        finally:
+            self.finished.emit()
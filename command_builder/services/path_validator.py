@@ -0,0 +1,378 @@
+"""
+Validation en direct des arguments de type fichier ou dossier.
+
+La validation faite au clic sur « Exécuter » ne vérifie que l'extension des
+fichiers : tester l'existence d'un chemin depuis l'interface la bloquerait
+sur un lecteur réseau lent. Ici, chaque champ modifié est vérifié (existence,
+droits de lecture, extension) après un court délai sans frappe, dans un
+thread d'un pool dédié, et le résultat est renvoyé au champ dès qu'il arrive.
+
+Les résultats des appels système sont gardés quelques secondes dans un
+StatCache : les frappes successives qui reviennent sur un même chemin (ou ses
+dossiers parents) n'interrogent pas de nouveau le partage réseau.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from command_builder.models.with_argument import WithArguments
+
+# Types d'arguments désignant un chemin
+PATH_ARGUMENT_TYPES = ("file", "directory")
+
+# Délai entre la dernière frappe et la vérification d'un champ (ms)
+PATH_VALIDATION_DEBOUNCE_MS = 300
+
+# Durée de validité d'un résultat d'appel système (s)
+STAT_CACHE_TTL_S = 5.0
+
+# Nombre maximal de chemins gardés dans le cache
+STAT_CACHE_MAX_ENTRIES = 1024
+
+# Threads du pool de vérification : un partage réseau qui ne répond pas ne
+# bloque que ces threads, pas le pool global (recherche, journaux...)
+PATH_VALIDATION_MAX_THREADS = 2
+
+
+@dataclass(frozen=True)
+class PathProbe:
+    """
+    Résultat de l'examen d'un chemin.
+
+    Attributes:
+        exists: True si le chemin existe
+        is_dir: True si le chemin est un dossier
+        readable: True si le chemin est lisible (dossier : parcourable)
+    """
+
+    exists: bool
+    is_dir: bool = False
+    readable: bool = False
+
+
+def probe_path(path: str) -> PathProbe:
+    """
+    Examine un chemin sur le disque (appels système bloquants).
+
+    Args:
+        path: Le chemin
+
+    Returns:
+        L'état du chemin
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return PathProbe(exists=False)
+    is_dir = stat.S_ISDIR(mode)
+    access = os.R_OK | os.X_OK if is_dir else os.R_OK
+    return PathProbe(exists=True, is_dir=is_dir, readable=os.access(path, access))
+
+
+class StatCache:
+    """
+    Cache à durée de vie limitée des examens de chemins.
+
+    Partagé entre les threads de vérification.
+    """
+
+    def __init__(
+        self,
+        ttl: float = STAT_CACHE_TTL_S,
+        max_entries: int = STAT_CACHE_MAX_ENTRIES,
+        probe: Callable[[str], PathProbe] = probe_path,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialise un cache vide.
+
+        Args:
+            ttl: Durée de validité d'un résultat (s)
+            max_entries: Nombre maximal de chemins gardés
+            probe: Fonction examinant un chemin
+            clock: Horloge (s)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, PathProbe]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Nombre de chemins en cache."""
+        with self._lock:
+            return len(self._entries)
+
+    def probe(self, path: str) -> PathProbe:
+        """
+        Retourne l'état d'un chemin, examiné au plus une fois par durée de
+        validité.
+
+        Args:
+            path: Le chemin
+
+        Returns:
+            L'état du chemin
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(path)
+                return entry[1]
+
+        # Examen hors du verrou : un chemin lent ne bloque pas les autres
+        result = self._probe(path)
+        with self._lock:
+            self._entries[path] = (self._clock(), result)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Oublie un chemin, ou tout le cache.
+
+        Args:
+            path: Le chemin (None = tous)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+def check_path_argument(argument, value: str, cache: StatCache) -> Optional[str]:
+    """
+    Vérifie la valeur d'un argument de type fichier ou dossier.
+
+    Un fichier ou dossier d'entrée doit exister et être lisible ; pour une
+    sortie (role: output), seul le dossier qui la contiendra doit exister.
+    Un champ vide n'est pas signalé (les arguments obligatoires sont vérifiés
+    à l'exécution).
+
+    Args:
+        argument: L'argument (Argument ou TaskArgument)
+        value: La valeur saisie
+        cache: Le cache des examens de chemins
+
+    Returns:
+        Le message d'erreur, ou None si la valeur est valide
+    """
+    path = value.strip()
+    if not path or argument.type not in PATH_ARGUMENT_TYPES:
+        return None
+
+    is_valid, error = WithArguments.validate_single_argument(argument, path)
+    if not is_valid:
+        return error
+
+    if getattr(argument, "role", None) == "output":
+        probe = cache.probe(path)
+        if probe.exists:
+            if probe.is_dir and argument.type == "file":
+                return f"'{argument.name}' désigne un dossier : {path}"
+            return None
+        parent = os.path.dirname(path.rstrip("\\/"))
+        if parent and not cache.probe(parent).is_dir:
+            return f"Le dossier de '{argument.name}' est introuvable : {parent}"
+        return None
+
+    probe = cache.probe(path)
+    if argument.type == "directory":
+        if not probe.exists:
+            return f"Le dossier '{argument.name}' est introuvable : {path}"
+        if not probe.is_dir:
+            return f"'{argument.name}' n'est pas un dossier : {path}"
+        if not probe.readable:
+            return f"Le dossier '{argument.name}' n'est pas accessible en lecture"
+        return None
+
+    if not probe.exists:
+        return f"Le fichier '{argument.name}' est introuvable : {path}"
+    if probe.is_dir:
+        return f"'{argument.name}' désigne un dossier : {path}"
+    if not probe.readable:
+        return f"Le fichier '{argument.name}' n'est pas accessible en lecture"
+    return None
+
+
+class PathValidationJob(QObject, QRunnable):
+    """
+    Vérification de chemins exécutée dans un thread du pool de vérification.
+    """
+
+    # Résultat d'un champ : (clé, génération, message d'erreur ou None)
+    validated = Signal(object, int, object)
+    # Émis lorsque tous les champs ont été vérifiés (le job lui-même)
+    finished = Signal(object)
+
+    def __init__(self, requests: List[tuple], cache: StatCache, pool: QThreadPool):
+        """
+        Initialise la vérification.
+
+        Args:
+            requests: Liste de (clé, génération, argument, valeur)
+            cache: Le cache des examens de chemins
+            pool: Le pool de threads
+        """
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.requests = requests
+        self.cache = cache
+        self.pool = pool
+
+    def start(self):
+        """Soumet la vérification au pool de threads."""
+        self.pool.start(self)
+
+    def run(self):
+        """Vérifie chaque champ et émet son résultat dès qu'il est connu."""
+        try:
+            for key, generation, argument, value in self.requests:
+                try:
+                    message = check_path_argument(argument, value, self.cache)
+                except Exception as e:  # Ne jamais perdre le signal finished
+                    message = str(e)
+                self.validated.emit(key, generation, message)
+        finally:
+            self.finished.emit(self)
+
+
+class PathValidator(QObject):
+    """
+    Valide en direct les champs de type fichier ou dossier.
+
+    Chaque champ (la « cible ») demande sa vérification à chaque
+    modification ; seule sa dernière valeur est vérifiée, après
+    PATH_VALIDATION_DEBOUNCE_MS sans nouvelle demande. Le résultat est remis
+    à la cible par sa méthode set_validation_error(message), dans le thread
+    de l'interface ; un résultat devenu périmé (nouvelle saisie, cible
+    détruite) est ignoré.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[StatCache] = None,
+        pool: Optional[QThreadPool] = None,
+        debounce_ms: int = PATH_VALIDATION_DEBOUNCE_MS,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Initialise le validateur.
+
+        Args:
+            cache: Le cache des examens de chemins (None = nouveau cache)
+            pool: Le pool de threads (None = pool dédié)
+            debounce_ms: Délai entre la dernière demande et la vérification (ms)
+            parent: Le QObject parent
+        """
+        super().__init__(parent)
+        self.cache = cache if cache is not None else StatCache()
+        if pool is None:
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(PATH_VALIDATION_MAX_THREADS)
+        self.pool = pool
+        self._targets: Dict[int, QObject] = {}  # Cibles vivantes par clé
+        self._generations: Dict[int, int] = {}
+        self._pending: Dict[int, tuple] = {}  # {clé: (argument, valeur)}
+        self._jobs = set()  # Vérifications en cours (gardées jusqu'à leur fin)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self.flush)
+
+    def validate(self, target: QObject, argument, value: str):
+        """
+        Demande la vérification d'un champ.
+
+        Args:
+            target: Le champ, qui reçoit le résultat par set_validation_error
+            argument: L'argument du champ
+            value: La valeur saisie
+        """
+        key = id(target)
+        if key not in self._targets:
+            self._targets[key] = target
+            target.destroyed.connect(lambda _obj=None, k=key: self._forget(k))
+        # Toute réponse en cours pour ce champ devient périmée
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+        if not value.strip() or argument.type not in PATH_ARGUMENT_TYPES:
+            # Rien à examiner sur le disque : réponse immédiate
+            self._pending.pop(key, None)
+            target.set_validation_error(None)
+            return
+        self._pending[key] = (argument, value)
+        self._debounce_timer.start()
+
+    def flush(self):
+        """Lance sans attendre la vérification des champs en attente."""
+        self._debounce_timer.stop()
+        pending, self._pending = self._pending, {}
+        requests = [
+            (key, self._generations[key], argument, value)
+            for key, (argument, value) in pending.items()
+            if key in self._targets
+        ]
+        if not requests:
+            return
+        job = PathValidationJob(requests, self.cache, self.pool)
+        job.validated.connect(self._on_validated)
+        job.finished.connect(self._on_job_finished)
+        self._jobs.add(job)
+        job.start()
+
+    def is_running(self) -> bool:
+        """
+        Indique si des vérifications sont en attente ou en cours.
+
+        Returns:
+            True si des résultats sont attendus
+        """
+        return bool(self._pending or self._jobs)
+
+    def _on_validated(self, key: int, generation: int, message: Optional[str]):
+        """Remet le résultat d'une vérification à son champ s'il est à jour."""
+        target = self._targets.get(key)
+        if target is None or self._generations.get(key) != generation:
+            return
+        target.set_validation_error(message)
+
+    def _on_job_finished(self, job: PathValidationJob):
+        """Libère une vérification terminée."""
+        self._jobs.discard(job)
+
+    def _forget(self, key: int):
+        """Oublie un champ détruit (ses résultats seront ignorés)."""
+        self._targets.pop(key, None)
+        self._generations.pop(key, None)
+        self._pending.pop(key, None)
+
+
+_path_validator: Optional[PathValidator] = None
+
+
+def get_path_validator() -> PathValidator:
+    """
+    Retourne le validateur partagé par tous les champs de l'application.
+
+    Returns:
+        Le PathValidator de l'application
+    """
+    global _path_validator
+    if _path_validator is None:
+        _path_validator = PathValidator()
+    return _path_validator
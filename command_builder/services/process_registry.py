@@ -0,0 +1,359 @@
+"""
+Registre des arbres de processus lancés par l'application.
+
+Chaque processus démarré par un exécuteur est enregistré avec son PID, son
+groupe de processus et son heure de démarrage. Le nettoyage (au début d'une
+exécution et à la fermeture de l'application) ne tue que ces arbres-là : les
+autres instances des mêmes outils ne sont jamais touchées, et un PID réutilisé
+par le système est reconnu grâce à l'heure de démarrage.
+
+Au début d'une exécution, seuls les arbres qui n'ont plus d'exécuteur actif
+sont arrêtés (processus laissés en arrière-plan, instance précédente) : une
+commande annulée qui dispose encore de son délai de grâce n'est pas tuée.
+
+Le registre est sauvegardé dans le répertoire de données de l'application pour
+que les processus laissés par une instance interrompue (plantage) soient
+nettoyés par l'instance suivante.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from command_builder.services.app_paths import get_app_data_dir
+
+# Nom du fichier de sauvegarde du registre
+REGISTRY_FILE_NAME = "process_registry.json"
+
+# Code de sortie Windows d'un processus encore actif
+_STILL_ACTIVE = 259
+
+
+@dataclass
+class ProcessRecord:
+    """
+    Arbre de processus lancé par l'application.
+
+    Attributes:
+        pid: PID du processus racine
+        pgid: Groupe de processus de l'arbre (POSIX, égal au PID sinon)
+        start_time: Heure de démarrage du processus racine (unités du système)
+        owner_pid: PID de l'instance de l'application qui l'a lancé
+        owner_start_time: Heure de démarrage de cette instance
+    """
+
+    pid: int
+    pgid: int
+    start_time: Optional[int]
+    owner_pid: int
+    owner_start_time: Optional[int]
+
+
+def read_process_start_time(pid: int) -> Optional[int]:
+    """
+    Lit l'heure de démarrage d'un processus.
+
+    Sous Linux, il s'agit du champ starttime de /proc/<pid>/stat (tops d'horloge
+    depuis le démarrage du système), sous Windows de l'heure de création
+    retournée par GetProcessTimes.
+
+    Args:
+        pid: Le PID du processus
+
+    Returns:
+        L'heure de démarrage, ou None si le processus n'existe pas
+        ou si elle n'est pas disponible sur la plateforme
+    """
+    if os.name == "nt":
+        return _read_windows_start_time(pid)
+
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # Le nom du processus (champ 2) peut contenir des espaces : découper après ")"
+    fields = stat[stat.rfind(b")") + 2 :].split()
+    try:
+        return int(fields[19])  # Champ 22 (starttime)
+    except (IndexError, ValueError):
+        return None
+
+
+def _read_windows_start_time(pid: int) -> Optional[int]:
+    """Lit l'heure de création d'un processus Windows actif (FILETIME)."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32
+        process_query_limited_information = 0x1000
+        handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+        if not handle:
+            return None
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return None
+            if exit_code.value != _STILL_ACTIVE:
+                return None
+            times = [wintypes.FILETIME() for _ in range(4)]
+            if not kernel32.GetProcessTimes(
+                handle, *(ctypes.byref(time) for time in times)
+            ):
+                return None
+            creation = times[0]
+            return (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+        finally:
+            kernel32.CloseHandle(handle)
+    except Exception:
+        return None
+
+
+class ProcessRegistry:
+    """
+    Registre thread-safe des arbres de processus lancés par l'application.
+    """
+
+    def __init__(self, state_file: Optional[Path] = None):
+        """
+        Initialise le registre.
+
+        Args:
+            state_file: Fichier de sauvegarde du registre (None = en mémoire seulement)
+        """
+        self.state_file = state_file
+        self._records: Dict[int, ProcessRecord] = {}
+        self._active: Set[int] = set()  # Arbres dont l'exécuteur tourne encore
+        self._lock = threading.Lock()
+        self._owner_pid = os.getpid()
+        self._owner_start_time = read_process_start_time(self._owner_pid)
+
+    def register(self, pid: int) -> ProcessRecord:
+        """
+        Enregistre un processus qui vient d'être démarré.
+
+        Le processus doit avoir été lancé dans son propre groupe de processus.
+
+        Args:
+            pid: Le PID du processus
+
+        Returns:
+            L'enregistrement créé
+        """
+        record = ProcessRecord(
+            pid=pid,
+            pgid=pid,
+            start_time=read_process_start_time(pid),
+            owner_pid=self._owner_pid,
+            owner_start_time=self._owner_start_time,
+        )
+        with self._lock:
+            self._records[pid] = record
+            self._active.add(pid)
+            self._save()
+        return record
+
+    def release(self, pid: int) -> bool:
+        """
+        Retire un processus terminé du registre.
+
+        Appelé quand l'exécuteur du processus a fini. L'enregistrement est
+        conservé tant qu'il reste des processus dans son arbre (ex: un
+        programme lancé en arrière-plan par la commande), afin qu'ils soient
+        arrêtés au prochain nettoyage.
+
+        Args:
+            pid: Le PID du processus
+
+        Returns:
+            True si l'enregistrement a été retiré
+        """
+        with self._lock:
+            self._active.discard(pid)
+            record = self._records.get(pid)
+            if record is None or self._tree_alive(record):
+                return False
+            del self._records[pid]
+            self._save()
+            return True
+
+    def records(self) -> List[ProcessRecord]:
+        """
+        Retourne les arbres de processus enregistrés par cette instance.
+
+        Returns:
+            La liste des enregistrements
+        """
+        with self._lock:
+            return list(self._records.values())
+
+    def cleanup(self) -> List[int]:
+        """
+        Arrête les arbres de processus enregistrés encore actifs.
+
+        Traite tous les processus de cette instance (à la fermeture de
+        l'application) et ceux laissés par des instances qui ne tournent plus.
+        Les processus des autres instances en cours d'exécution ne sont pas
+        touchés.
+
+        Returns:
+            Les PID racines des arbres arrêtés
+        """
+        return self._cleanup(include_active=True)
+
+    def cleanup_orphans(self) -> List[int]:
+        """
+        Arrête les arbres de processus qui n'ont plus d'exécuteur actif.
+
+        Appelé au début d'une exécution : les arbres dont l'exécuteur tourne
+        encore (ex: commande annulée dans son délai de grâce) sont conservés.
+
+        Returns:
+            Les PID racines des arbres arrêtés
+        """
+        return self._cleanup(include_active=False)
+
+    def _cleanup(self, include_active: bool) -> List[int]:
+        """
+        Arrête les arbres de cette instance et ceux des instances terminées.
+
+        Args:
+            include_active: True pour arrêter aussi les arbres dont
+                            l'exécuteur tourne encore
+
+        Returns:
+            Les PID racines des arbres arrêtés
+        """
+        with self._lock:
+            orphans = [
+                record
+                for record in self._load()
+                if not self._is_own(record) and not self._owner_alive(record)
+            ]
+            own = [
+                record
+                for record in self._records.values()
+                if include_active or record.pid not in self._active
+            ]
+            killed = []
+            for record in own + orphans:
+                if self._kill_tree(record):
+                    killed.append(record.pid)
+
+            for record in own:
+                del self._records[record.pid]
+                self._active.discard(record.pid)
+            self._save(dropped={(r.owner_pid, r.pid) for r in orphans})
+            return killed
+
+    def _is_own(self, record: ProcessRecord) -> bool:
+        """Indique si l'enregistrement appartient à cette instance."""
+        return (
+            record.owner_pid == self._owner_pid
+            and record.owner_start_time == self._owner_start_time
+        )
+
+    @staticmethod
+    def _owner_alive(record: ProcessRecord) -> bool:
+        """Indique si l'instance qui a lancé le processus tourne encore."""
+        start_time = read_process_start_time(record.owner_pid)
+        return start_time is not None and start_time == record.owner_start_time
+
+    @staticmethod
+    def _is_reused_pid(record: ProcessRecord) -> bool:
+        """Indique si le PID racine désigne désormais un autre processus."""
+        start_time = read_process_start_time(record.pid)
+        return start_time is not None and start_time != record.start_time
+
+    def _tree_alive(self, record: ProcessRecord) -> bool:
+        """Indique s'il reste des processus dans l'arbre enregistré."""
+        if self._is_reused_pid(record):
+            return False
+        if os.name == "nt":
+            return read_process_start_time(record.pid) is not None
+        # Un PGID n'est pas réattribué tant que le groupe contient un processus
+        try:
+            os.killpg(record.pgid, 0)
+            return True
+        except (ProcessLookupError, PermissionError):
+            return False
+
+    def _kill_tree(self, record: ProcessRecord) -> bool:
+        """
+        Tue l'arbre de processus s'il est encore actif.
+
+        Returns:
+            True si l'arbre a été arrêté
+        """
+        if not self._tree_alive(record):
+            return False
+        try:
+            if os.name == "nt":
+                result = subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(record.pid)],
+                    capture_output=True,
+                    timeout=5,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                )
+                return result.returncode == 0
+            os.killpg(record.pgid, signal.SIGKILL)
+            return True
+        except Exception:
+            return False
+
+    def _load(self) -> List[ProcessRecord]:
+        """Charge les enregistrements sauvegardés (toutes instances confondues)."""
+        if self.state_file is None:
+            return []
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return [ProcessRecord(**data) for data in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def _save(self, dropped: Set[Tuple[int, int]] = frozenset()):
+        """
+        Sauvegarde le registre en conservant les enregistrements des autres
+        instances.
+
+        Args:
+            dropped: Enregistrements d'autres instances à retirer (owner_pid, pid)
+        """
+        if self.state_file is None:
+            return
+        records = [
+            record
+            for record in self._load()
+            if not self._is_own(record)
+            and (record.owner_pid, record.pid) not in dropped
+        ]
+        records.extend(self._records.values())
+        try:
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump([asdict(record) for record in records], f)
+            os.replace(temp_file, self.state_file)
+        except OSError:
+            pass
+
+
+_process_registry: Optional[ProcessRegistry] = None
+
+
+def get_process_registry() -> ProcessRegistry:
+    """
+    Retourne le registre des processus de l'application.
+
+    Returns:
+        Le ProcessRegistry partagé, sauvegardé dans le répertoire de données
+    """
+    global _process_registry
+    if _process_registry is None:
+        _process_registry = ProcessRegistry(get_app_data_dir() / REGISTRY_FILE_NAME)
+    return _process_registry
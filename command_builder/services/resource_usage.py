@@ -0,0 +1,223 @@
+"""
+Mesure des ressources consommées par les processus lancés.
+
+Sous Unix, le processus terminé est détecté sans être récupéré
+(waitid + WNOWAIT) : ses compteurs d'E/S sont lus dans /proc/<pid>/io tant
+qu'il existe encore, puis os.wait4 le récupère en retournant son temps CPU et
+sa mémoire résidente maximale. Ces mesures incluent les descendants que le
+processus a lui-même attendus (ex: la commande lancée par le shell).
+
+Sous Windows, les compteurs sont lus sur le handle du processus terminé
+(GetProcessTimes, GetProcessMemoryInfo, GetProcessIoCounters) : ils ne
+concernent que le processus racine.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Optional, Tuple
+
+from command_builder.models.run_record import ResourceUsage
+
+# Délai maximal entre deux vérifications de la fin du processus (s)
+MAX_POLL_DELAY = 0.05
+
+
+def read_proc_io(pid: int) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Lit les octets lus et écrits par un processus dans /proc/<pid>/io.
+
+    Args:
+        pid: Le PID du processus
+
+    Returns:
+        Tuple (octets lus, octets écrits), (None, None) si indisponible
+    """
+    try:
+        with open(f"/proc/{pid}/io", "r") as f:
+            counters = dict(
+                line.split(": ", 1) for line in f.read().splitlines() if ": " in line
+            )
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def usage_from_rusage(rusage, read_bytes=None, write_bytes=None) -> ResourceUsage:
+    """
+    Convertit le résultat de os.wait4 en ResourceUsage.
+
+    Args:
+        rusage: La structure resource.struct_rusage
+        read_bytes: Octets lus (optionnel)
+        write_bytes: Octets écrits (optionnel)
+
+    Returns:
+        Les ressources consommées
+    """
+    # ru_maxrss est en Ko sous Linux, en octets sous macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return ResourceUsage(
+        user_cpu=rusage.ru_utime,
+        system_cpu=rusage.ru_stime,
+        peak_rss=rusage.ru_maxrss * scale,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+    )
+
+
+class ProcessWaiter:
+    """
+    Attend la fin d'un processus Popen et mesure ses ressources.
+
+    S'utilise à la place de Popen.wait() : après la fin du processus,
+    returncode est renseigné et usage contient les mesures (ou None si elles
+    n'ont pas pu être prises, ex: processus récupéré par un autre appel).
+    """
+
+    def __init__(self, process: subprocess.Popen):
+        """
+        Initialise l'attente.
+
+        Args:
+            process: Le processus à attendre
+        """
+        self.process = process
+        self.usage: Optional[ResourceUsage] = None
+        self._delay = 0.0005
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Attend la fin du processus.
+
+        Args:
+            timeout: Délai maximal en secondes
+
+        Returns:
+            True si le processus est terminé
+        """
+        if os.name == "nt" or not hasattr(os, "waitid"):
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return False
+            if os.name == "nt":
+                self.usage = _read_windows_usage(self.process)
+            return True
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._collect():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Délai croissant, comme Popen.wait()
+            self._delay = min(self._delay * 2, MAX_POLL_DELAY)
+            time.sleep(min(self._delay, remaining))
+
+    def _collect(self) -> bool:
+        """
+        Récupère le processus s'il est terminé, en mesurant ses ressources.
+
+        Returns:
+            True si le processus est terminé
+        """
+        process = self.process
+        if process.returncode is not None:
+            return True
+
+        # Verrou utilisé par Popen pour ne pas récupérer deux fois le processus
+        lock = getattr(process, "_waitpid_lock", None)
+        if lock is not None and not lock.acquire(False):
+            return False
+        try:
+            if process.returncode is not None:
+                return True
+            try:
+                exited = os.waitid(
+                    os.P_PID, process.pid, os.WEXITED | os.WNOWAIT | os.WNOHANG
+                )
+            except ChildProcessError:
+                # Récupéré hors de Popen : code inconnu, comme Popen.wait()
+                process.returncode = 0
+                return True
+            if exited is None:
+                return False
+
+            # Processus terminé mais pas encore récupéré : /proc est lisible
+            read_bytes, write_bytes = read_proc_io(process.pid)
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            self.usage = usage_from_rusage(rusage, read_bytes, write_bytes)
+            return True
+        finally:
+            if lock is not None:
+                lock.release()
+
+
+def _read_windows_usage(process: subprocess.Popen) -> Optional[ResourceUsage]:
+    """Lit les ressources d'un processus Windows terminé sur son handle."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        handle = int(process._handle)
+        kernel32 = ctypes.windll.kernel32
+
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not kernel32.GetProcessTimes(
+            handle, *(ctypes.byref(time_) for time_ in times)
+        ):
+            return None
+        kernel_time, user_time = times[2], times[3]
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        class IoCounters(ctypes.Structure):
+            _fields_ = [
+                ("ReadOperationCount", ctypes.c_ulonglong),
+                ("WriteOperationCount", ctypes.c_ulonglong),
+                ("OtherOperationCount", ctypes.c_ulonglong),
+                ("ReadTransferCount", ctypes.c_ulonglong),
+                ("WriteTransferCount", ctypes.c_ulonglong),
+                ("OtherTransferCount", ctypes.c_ulonglong),
+            ]
+
+        memory = ProcessMemoryCounters()
+        memory.cb = ctypes.sizeof(memory)
+        peak_rss = None
+        if kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(memory), memory.cb):
+            peak_rss = memory.PeakWorkingSetSize
+
+        io = IoCounters()
+        read_bytes = write_bytes = None
+        if kernel32.GetProcessIoCounters(handle, ctypes.byref(io)):
+            read_bytes, write_bytes = io.ReadTransferCount, io.WriteTransferCount
+
+        def seconds(filetime) -> float:
+            # Unités de 100 ns
+            return ((filetime.dwHighDateTime << 32) | filetime.dwLowDateTime) / 1e7
+
+        return ResourceUsage(
+            user_cpu=seconds(user_time),
+            system_cpu=seconds(kernel_time),
+            peak_rss=peak_rss,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+        )
+    except Exception:
+        return None
@@ -0,0 +1,162 @@
+"""
+Points de reprise des séquences de commandes.
+
+Chaque exécution enregistre les commandes rendues (avec les valeurs des
+arguments) et le code de retour de chaque étape terminée. Après un échec ou un
+arrêt, la séquence peut être reprise à la première étape en échec ou non
+exécutée, avec exactement les mêmes commandes, y compris après un redémarrage
+de l'application.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from command_builder.services.app_paths import get_app_data_dir
+
+# Nom du fichier de sauvegarde du dernier point de reprise
+CHECKPOINT_FILE_NAME = "last_run.json"
+
+
+@dataclass
+class RunCheckpoint:
+    """
+    Point de reprise d'une séquence de commandes.
+
+    Attributes:
+        commands: Les dictionnaires de commande de la séquence (commandes
+                  rendues, argv, valeurs des arguments...)
+        results: Code de retour de chaque étape (None si non exécutée)
+        started_at: Date de début de la séquence (ISO 8601)
+    """
+
+    commands: List[dict]
+    results: List[Optional[int]] = field(default_factory=list)
+    started_at: str = ""
+
+    def __post_init__(self):
+        """Aligne la liste des résultats sur celle des commandes."""
+        missing = len(self.commands) - len(self.results)
+        if missing > 0:
+            self.results.extend([None] * missing)
+
+    def record_step(self, index: int, return_code: int):
+        """
+        Enregistre le code de retour d'une étape.
+
+        Args:
+            index: L'index de l'étape
+            return_code: Le code de retour
+        """
+        if 0 <= index < len(self.results):
+            self.results[index] = return_code
+
+    def resume_index(self) -> Optional[int]:
+        """
+        Retourne l'étape à partir de laquelle reprendre la séquence.
+
+        Returns:
+            L'index de la première étape en échec ou non exécutée,
+            ou None si toutes les étapes ont réussi
+        """
+        for index, return_code in enumerate(self.results):
+            if return_code != 0:
+                return index
+        return None
+
+
+class RunCheckpointStore:
+    """
+    Stockage du point de reprise de la dernière séquence.
+    """
+
+    def __init__(self, state_file: Optional[Path] = None):
+        """
+        Initialise le stockage.
+
+        Args:
+            state_file: Fichier de sauvegarde (None = en mémoire seulement)
+        """
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._checkpoint: Optional[RunCheckpoint] = None
+        self._loaded = False
+
+    def load(self) -> Optional[RunCheckpoint]:
+        """
+        Retourne le dernier point de reprise.
+
+        Returns:
+            Le point de reprise, ou None s'il n'y en a pas
+        """
+        with self._lock:
+            if not self._loaded:
+                self._checkpoint = self._read()
+                self._loaded = True
+            return self._checkpoint
+
+    def save(self, checkpoint: RunCheckpoint):
+        """
+        Enregistre un point de reprise (remplace le précédent).
+
+        Args:
+            checkpoint: Le point de reprise
+        """
+        with self._lock:
+            self._checkpoint = checkpoint
+            self._loaded = True
+            self._write(checkpoint)
+
+    def clear(self):
+        """Supprime le point de reprise."""
+        with self._lock:
+            self._checkpoint = None
+            self._loaded = True
+            if self.state_file is not None:
+                try:
+                    os.remove(self.state_file)
+                except OSError:
+                    pass
+
+    def _read(self) -> Optional[RunCheckpoint]:
+        """Charge le point de reprise sauvegardé."""
+        if self.state_file is None:
+            return None
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return RunCheckpoint(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, checkpoint: RunCheckpoint):
+        """Sauvegarde le point de reprise (écriture atomique)."""
+        if self.state_file is None:
+            return
+        try:
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(asdict(checkpoint), f, ensure_ascii=False)
+            os.replace(temp_file, self.state_file)
+        except OSError:
+            pass
+
+
+_run_checkpoint_store: Optional[RunCheckpointStore] = None
+
+
+def get_run_checkpoint_store() -> RunCheckpointStore:
+    """
+    Retourne le stockage des points de reprise de l'application.
+
+    Returns:
+        Le RunCheckpointStore partagé, sauvegardé dans le répertoire de données
+    """
+    global _run_checkpoint_store
+    if _run_checkpoint_store is None:
+        _run_checkpoint_store = RunCheckpointStore(
+            get_app_data_dir() / CHECKPOINT_FILE_NAME
+        )
+    return _run_checkpoint_store
@@ -0,0 +1,432 @@
+"""
+Journaux d'exécution compressés sur disque.
+
+Chaque séquence écrit sa sortie dans un fichier .log.gz en ajout seul : les
+lignes sont regroupées en blocs compressés indépendamment (un membre gzip par
+bloc). Le fichier reste un .gz standard, lisible d'un seul tenant par
+gzip/zcat, tout en permettant de ne décompresser que les blocs utiles.
+
+Un index en ajout seul (.idx, une entrée JSON par ligne) accompagne le
+journal : position et taille de chaque bloc compressé avec sa première ligne,
+et première ligne de chaque commande. Il permet un accès direct à n'importe
+quelle plage de lignes ou à la sortie d'une commande donnée.
+
+L'index note aussi l'heure d'écriture (au plus une marque par
+TIME_MARK_INTERVAL secondes) et les plages de lignes provenant de la sortie
+des commandes, ce qui permet d'horodater et de classer chaque ligne sans
+alourdir le journal lui-même.
+"""
+
+import bisect
+import datetime
+import gzip
+import json
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from command_builder.services.app_paths import get_app_data_dir
+
+# Sous-dossier des journaux dans le répertoire de données
+RUN_LOG_DIR_NAME = "logs"
+
+# Taille (non compressée) à partir de laquelle un bloc est écrit
+BLOCK_SIZE = 64 * 1024
+
+# Intervalle minimal entre deux marques horaires de l'index (secondes)
+TIME_MARK_INTERVAL = 1.0
+
+# Durée de conservation des journaux (jours)
+RUN_LOG_RETENTION_DAYS = 14
+
+# Suffixes des fichiers
+LOG_SUFFIX = ".log.gz"
+INDEX_SUFFIX = ".idx"
+
+
+@dataclass(frozen=True)
+class LogBlock:
+    """
+    Bloc compressé d'un journal.
+
+    Attributes:
+        offset: Position du bloc dans le fichier compressé
+        length: Taille du bloc compressé
+        first_line: Numéro (à partir de 0) de la première ligne du bloc
+        line_count: Nombre de lignes du bloc
+    """
+
+    offset: int
+    length: int
+    first_line: int
+    line_count: int
+
+
+@dataclass(frozen=True)
+class LogCommand:
+    """
+    Commande d'un journal.
+
+    Attributes:
+        name: Nom de la commande
+        first_line: Numéro de la première ligne de la commande
+    """
+
+    name: str
+    first_line: int
+
+
+def index_path_for(log_path: Path) -> Path:
+    """
+    Retourne le chemin de l'index d'un journal.
+
+    Args:
+        log_path: Le chemin du journal (.log.gz)
+
+    Returns:
+        Le chemin de l'index (.idx)
+    """
+    return log_path.with_name(log_path.name[: -len(LOG_SUFFIX)] + INDEX_SUFFIX)
+
+
+class RunLogWriter:
+    """
+    Écriture en flux d'un journal d'exécution compressé par blocs.
+    """
+
+    def __init__(self, log_path: Path, block_size: int = BLOCK_SIZE):
+        """
+        Crée le journal et son index.
+
+        Args:
+            log_path: Le chemin du journal (.log.gz)
+            block_size: Taille non compressée d'un bloc
+        """
+        self.log_path = Path(log_path)
+        self.index_path = index_path_for(self.log_path)
+        self.block_size = block_size
+        self._log_file = open(self.log_path, "wb")
+        self._index_file = open(self.index_path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._first_buffered_line = 0
+        self._line_count = 0
+        self._offset = 0
+        self._last_time_mark = None
+        self._output = False  # Les lignes en cours proviennent d'une commande
+
+    @property
+    def line_count(self) -> int:
+        """Nombre de lignes écrites dans le journal."""
+        return self._line_count
+
+    @property
+    def closed(self) -> bool:
+        """True une fois le journal fermé (les lignes suivantes sont ignorées)."""
+        return self._log_file is None
+
+    def write_line(self, line: str, output: bool = False):
+        """
+        Ajoute une ligne au journal.
+
+        Args:
+            line: La ligne (sans retour à la ligne final)
+            output: True si la ligne provient de la sortie d'une commande
+        """
+        with self._lock:
+            if self._log_file is None:
+                return
+            now = time.time()
+            if (
+                self._last_time_mark is None
+                or now - self._last_time_mark >= TIME_MARK_INTERVAL
+            ):
+                self._last_time_mark = now
+                self._write_index_entry(
+                    {"time": round(now, 3), "line": self._line_count}
+                )
+            if output != self._output:
+                self._output = output
+                self._write_index_entry({"output": output, "line": self._line_count})
+            # Une entrée multiligne compte pour autant de lignes
+            parts = line.split("\n")
+            self._buffer.extend(parts)
+            self._buffer_size += len(line) + 1
+            self._line_count += len(parts)
+            if self._buffer_size >= self.block_size:
+                self._write_block()
+
+    def begin_command(self, name: str):
+        """
+        Marque le début d'une commande dans l'index.
+
+        Args:
+            name: Le nom de la commande
+        """
+        with self._lock:
+            if self._index_file is None:
+                return
+            self._write_index_entry({"command": name, "first_line": self._line_count})
+
+    def flush(self):
+        """Écrit le bloc en cours sur le disque."""
+        with self._lock:
+            if self._log_file is not None:
+                self._write_block()
+                self._log_file.flush()
+                self._index_file.flush()
+
+    def close(self):
+        """Écrit le dernier bloc et ferme le journal."""
+        with self._lock:
+            if self._log_file is None:
+                return
+            self._write_block()
+            self._log_file.close()
+            self._index_file.close()
+            self._log_file = None
+            self._index_file = None
+
+    def _write_block(self):
+        """Compresse et écrit les lignes en attente."""
+        if not self._buffer:
+            return
+        data = gzip.compress(("\n".join(self._buffer) + "\n").encode("utf-8"))
+        self._log_file.write(data)
+        self._write_index_entry(
+            {
+                "block": [
+                    self._offset,
+                    len(data),
+                    self._first_buffered_line,
+                    len(self._buffer),
+                ]
+            }
+        )
+        self._offset += len(data)
+        self._first_buffered_line = self._line_count
+        self._buffer = []
+        self._buffer_size = 0
+
+    def _write_index_entry(self, entry: dict):
+        """Ajoute une entrée à l'index."""
+        self._index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class RunLogReader:
+    """
+    Lecture à accès direct d'un journal d'exécution.
+    """
+
+    def __init__(self, log_path: Path):
+        """
+        Charge l'index du journal.
+
+        Args:
+            log_path: Le chemin du journal (.log.gz)
+        """
+        self.log_path = Path(log_path)
+        self.blocks: List[LogBlock] = []
+        self.commands: List[LogCommand] = []
+        self.time_marks: List[Tuple[int, float]] = []  # (ligne, heure)
+        self.output_spans: List[Tuple[int, bool]] = []  # (ligne, sortie ?)
+        self._load_index(index_path_for(self.log_path))
+        self._block_starts = [block.first_line for block in self.blocks]
+        self._command_starts = [command.first_line for command in self.commands]
+        self._time_lines = [line for line, _ in self.time_marks]
+        self._output_lines = [line for line, _ in self.output_spans]
+
+    @property
+    def line_count(self) -> int:
+        """Nombre de lignes indexées."""
+        if not self.blocks:
+            return 0
+        last = self.blocks[-1]
+        return last.first_line + last.line_count
+
+    def line_time(self, line: int) -> Optional[float]:
+        """
+        Retourne l'heure (à TIME_MARK_INTERVAL près) d'écriture d'une ligne.
+
+        Args:
+            line: Le numéro de la ligne
+
+        Returns:
+            L'horodatage Unix, ou None si le journal n'en contient pas
+        """
+        position = bisect.bisect_right(self._time_lines, line) - 1
+        return self.time_marks[position][1] if position >= 0 else None
+
+    def command_index(self, line: int) -> Optional[int]:
+        """
+        Retourne la commande à laquelle appartient une ligne.
+
+        Args:
+            line: Le numéro de la ligne
+
+        Returns:
+            L'index de la commande, ou None avant la première commande
+        """
+        position = bisect.bisect_right(self._command_starts, line) - 1
+        return position if position >= 0 else None
+
+    def is_output(self, line: int) -> bool:
+        """
+        Indique si une ligne provient de la sortie d'une commande.
+
+        Args:
+            line: Le numéro de la ligne
+
+        Returns:
+            True pour une sortie de commande, False pour un message de l'application
+        """
+        position = bisect.bisect_right(self._output_lines, line) - 1
+        return position >= 0 and self.output_spans[position][1]
+
+    def iter_blocks(self) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Parcourt le journal bloc par bloc, sans le charger entièrement.
+
+        Yields:
+            (numéro de la première ligne, lignes du bloc)
+        """
+        with self._open() as f:
+            for block in self.blocks:
+                f.seek(block.offset)
+                data = gzip.decompress(f.read(block.length)).decode("utf-8")
+                yield block.first_line, data.split("\n")[: block.line_count]
+
+    def read_lines(self, start: int, count: int) -> List[str]:
+        """
+        Lit une plage de lignes en ne décompressant que les blocs concernés.
+
+        Args:
+            start: Numéro de la première ligne
+            count: Nombre de lignes
+
+        Returns:
+            Les lignes lues (moins si la fin du journal est atteinte)
+        """
+        end = min(start + count, self.line_count)
+        if start < 0 or start >= end:
+            return []
+        lines = []
+        block_index = bisect.bisect_right(self._block_starts, start) - 1
+        with self._open() as f:
+            while block_index < len(self.blocks) and len(lines) < end - start:
+                block = self.blocks[block_index]
+                f.seek(block.offset)
+                block_lines = (
+                    gzip.decompress(f.read(block.length)).decode("utf-8").split("\n")
+                )
+                first = max(start, block.first_line) - block.first_line
+                last = min(end, block.first_line + block.line_count) - block.first_line
+                lines.extend(block_lines[first:last])
+                block_index += 1
+        return lines
+
+    def command_lines(self, index: int) -> List[str]:
+        """
+        Lit les lignes d'une commande du journal.
+
+        Args:
+            index: L'index de la commande dans le journal
+
+        Returns:
+            Les lignes de la commande
+        """
+        start = self.commands[index].first_line
+        if index + 1 < len(self.commands):
+            end = self.commands[index + 1].first_line
+        else:
+            end = self.line_count
+        return self.read_lines(start, end - start)
+
+    def _open(self):
+        """Ouvre le journal compressé en lecture (fichier binaire)."""
+        return open(self.log_path, "rb")
+
+    def _load_index(self, index_path: Path):
+        """Charge l'index (une entrée incomplète en fin de fichier est ignorée)."""
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if "block" in entry:
+                        self.blocks.append(LogBlock(*entry["block"]))
+                    elif "command" in entry:
+                        self.commands.append(
+                            LogCommand(entry["command"], entry["first_line"])
+                        )
+                    elif "time" in entry:
+                        self.time_marks.append((entry["line"], entry["time"]))
+                    elif "output" in entry:
+                        self.output_spans.append((entry["line"], entry["output"]))
+        except OSError:
+            pass
+
+
+def export_run_log(log_path: Path, file_path: str):
+    """
+    Exporte un journal vers un fichier.
+
+    Un fichier .gz est une copie directe du journal compressé ; sinon le
+    journal est décompressé en flux, sans le charger entièrement en mémoire.
+
+    Args:
+        log_path: Le chemin du journal (.log.gz)
+        file_path: Le chemin du fichier exporté
+    """
+    if file_path.endswith(".gz"):
+        shutil.copyfile(log_path, file_path)
+        return
+    with gzip.open(log_path, "rb") as source, open(file_path, "wb") as target:
+        shutil.copyfileobj(source, target)
+
+
+def get_run_log_dir() -> Path:
+    """
+    Retourne le dossier des journaux d'exécution (créé si nécessaire).
+
+    Returns:
+        Le chemin du dossier
+    """
+    log_dir = get_app_data_dir() / RUN_LOG_DIR_NAME
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def create_run_log(log_dir: Optional[Path] = None) -> RunLogWriter:
+    """
+    Crée le journal d'une nouvelle séquence et supprime ceux de plus de
+    RUN_LOG_RETENTION_DAYS jours.
+
+    Args:
+        log_dir: Le dossier des journaux (défaut: celui de l'application)
+
+    Returns:
+        Le RunLogWriter du nouveau journal
+    """
+    log_dir = log_dir or get_run_log_dir()
+    oldest = time.time() - RUN_LOG_RETENTION_DAYS * 24 * 3600
+    for old_log in log_dir.glob(f"*{LOG_SUFFIX}"):
+        try:
+            if old_log.stat().st_mtime >= oldest:
+                continue
+        except OSError:
+            continue
+        for path in (old_log, index_path_for(old_log)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return RunLogWriter(log_dir / f"run_{stamp}{LOG_SUFFIX}")
@@ -0,0 +1,359 @@
+"""
+Session shell persistante pour l'exécution séquentielle des commandes d'une tâche.
+
+En mode session, un seul processus shell exécute toute la séquence : le coût
+de démarrage du shell n'est payé qu'une fois, et les changements de répertoire
+ou de variables d'environnement faits par une étape restent visibles pour les
+suivantes. Après chaque commande, le shell écrit un marqueur (sentinelle) sur
+stdout avec le code de retour, puis sur stderr, pour délimiter les sorties.
+"""
+
+import os
+import queue
+import shlex
+import subprocess
+import tempfile
+import threading
+import uuid
+from typing import Callable, Optional, Tuple
+
+from PySide6.QtCore import QObject
+
+from command_builder.services.command_executor import (
+    DEFAULT_CANCEL_GRACE_PERIOD,
+    CommandExecutor,
+    PipeReader,
+    process_group_options,
+)
+from command_builder.services.process_registry import get_process_registry
+
+# Délai maximal d'attente du marqueur stderr après la fin d'une commande (s)
+STDERR_MARKER_TIMEOUT = 1.0
+
+# Fonction définie (sans être exécutée) pour vérifier la syntaxe d'une commande
+POSIX_CHECK_FUNCTION = "__cb_check"
+
+
+class ShellSession:
+    """
+    Processus shell unique réutilisé pour exécuter une séquence de commandes.
+
+    Une seule commande peut être exécutée à la fois. Le shell est démarré au
+    premier appel de run_command() et tourne dans son propre groupe de
+    processus : le tuer arrête aussi toutes les commandes lancées.
+    """
+
+    def __init__(self):
+        """Initialise la session (le shell n'est pas encore démarré)."""
+        self.process: Optional[subprocess.Popen] = None
+        self._marker = f"__CB_END_{uuid.uuid4().hex}__"
+        self._stdout_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._readers = []
+        self._ready = False
+        self._lock = threading.Lock()
+        self._step_path: Optional[str] = None  # Fichier .cmd des étapes (Windows)
+        self.thread_ids = set()  # Threads du pool utilisés par les lecteurs
+
+    def start(self):
+        """Démarre le shell s'il ne tourne pas déjà."""
+        if self.process is not None:
+            return
+
+        encoding, kwargs = process_group_options()
+        if os.name == "nt":
+            # /Q : pas d'écho des commandes, /D : pas d'AutoRun
+            shell_argv = ["cmd.exe", "/Q", "/D"]
+        else:
+            shell_argv = ["/bin/sh"]
+
+        self.process = subprocess.Popen(
+            shell_argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding=encoding,
+            errors="replace",
+            bufsize=1,
+            **kwargs,
+        )
+        # Le shell et les commandes qu'il lance forment un seul arbre
+        get_process_registry().register(self.process.pid)
+
+        # Les lecteurs vivent aussi longtemps que la session
+        for stream, target in (
+            (self.process.stdout, self._stdout_queue),
+            (self.process.stderr, self._stderr_queue),
+        ):
+            reader = PipeReader(
+                stream,
+                target.put,
+                self.thread_ids,
+                on_eof=lambda target=target: target.put(None),
+            )
+            self._readers.append(reader)
+            reader.start()
+
+    def is_alive(self) -> bool:
+        """
+        Indique si le shell de la session tourne encore.
+
+        Returns:
+            True si le shell est démarré et n'est pas terminé
+        """
+        return self.process is not None and self.process.poll() is None
+
+    def run_command(
+        self,
+        command: str,
+        on_output: Callable[[str], None],
+        is_cancelled: Callable[[], bool],
+    ) -> Tuple[int, str]:
+        """
+        Exécute une commande dans le shell et attend son marqueur de fin.
+
+        Bloquant : doit être appelé depuis un thread de travail.
+
+        Args:
+            command: La commande à exécuter
+            on_output: Callback appelé pour chaque ligne de sortie standard
+            is_cancelled: Fonction indiquant si l'exécution a été annulée
+
+        Returns:
+            Tuple (code de retour, sortie d'erreur de la commande)
+        """
+        with self._lock:
+            if self.process is not None and not self.is_alive():
+                raise RuntimeError("La session shell est terminée")
+            self.start()
+            if not self._ready:
+                # Ignorer ce que le shell affiche au démarrage (bannière)
+                self._write(self._marker_script())
+                self._ready = True
+                if self._read_stdout_until_marker(None, is_cancelled) is None:
+                    return -1, ""
+                self._read_stderr_until_marker()
+
+            self._write(self._command_script(command))
+            return_code = self._read_stdout_until_marker(on_output, is_cancelled)
+            if return_code is None:
+                if is_cancelled():
+                    return -1, ""
+                # La commande a terminé le shell (ex: "exit 3")
+                return self._shell_exit_code(), self._read_stderr_until_marker()
+            return return_code, self._read_stderr_until_marker()
+
+    def close(self):
+        """Demande au shell de se terminer (sans attendre)."""
+        if self.process is not None:
+            if self.is_alive():
+                try:
+                    self.process.stdin.write("exit\n")
+                    self.process.stdin.close()
+                except Exception:
+                    pass
+            # Plus aucune commande n'utilise le shell : son arbre peut être nettoyé
+            get_process_registry().release(self.process.pid)
+        if self._step_path is not None:
+            try:
+                os.remove(self._step_path)
+            except OSError:
+                pass
+            self._step_path = None
+
+    def _shell_exit_code(self) -> int:
+        """Retourne le code de sortie du shell terminé (-1 si inconnu)."""
+        try:
+            return self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            return -1
+
+    def _write(self, script: str):
+        """Envoie un script au shell."""
+        self.process.stdin.write(script)
+        self.process.stdin.flush()
+
+    def _marker_script(self) -> str:
+        """Retourne le script écrivant les marqueurs de fin sur stdout et stderr."""
+        if os.name == "nt":
+            return f"echo {self._marker} %ERRORLEVEL%\necho {self._marker} 1>&2\n"
+        return (
+            f"printf '%s %s\\n' '{self._marker}' \"$?\"\n"
+            f"printf '%s\\n' '{self._marker}' >&2\n"
+        )
+
+    def _command_script(self, command: str) -> str:
+        """
+        Retourne le script exécutant la commande suivie des marqueurs.
+
+        La commande est exécutée par le shell de la session lui-même, ce qui
+        conserve cd et les variables d'environnement, mais n'est jamais collée
+        telle quelle : une erreur d'analyse (guillemet ou bloc non fermé) le
+        laisserait en attente de la suite, ou le terminerait.
+
+        Sous Unix, la commande citée est d'abord analysée en définissant une
+        fonction qui la contient (sans l'exécuter), puis exécutée par eval.
+        « command eval » fait d'une erreur de syntaxe un simple code de retour
+        au lieu de terminer le shell. Sous Windows, la commande est écrite
+        dans un fichier .cmd exécuté par call dans le cmd de la session.
+
+        L'entrée standard de la commande est redirigée vers le périphérique nul
+        pour qu'elle ne consomme pas les lignes destinées au shell.
+        """
+        if os.name == "nt":
+            step_path = self._write_step_file(command)
+            return f'call "{step_path}" <NUL\n' + self._marker_script()
+        return (
+            f"__cb_command={shlex.quote(command)}\n"
+            f'command eval "{POSIX_CHECK_FUNCTION}() {{\n$__cb_command\n:\n}}"'
+            ' && command eval "$__cb_command" </dev/null\n' + self._marker_script()
+        )
+
+    def _write_step_file(self, command: str) -> str:
+        """
+        Écrit une commande dans le fichier .cmd des étapes de la session.
+
+        Dans un fichier de commandes, un % littéral s'écrit %% : les ^% des
+        valeurs protégées par quote_argument() sont convertis.
+
+        Args:
+            command: La commande à exécuter
+
+        Returns:
+            Le chemin du fichier
+        """
+        if self._step_path is None:
+            handle, self._step_path = tempfile.mkstemp(
+                prefix="command_builder_", suffix=".cmd"
+            )
+            os.close(handle)
+        encoding, _ = process_group_options()
+        with open(
+            self._step_path, "w", encoding=encoding, errors="replace", newline="\r\n"
+        ) as step_file:
+            step_file.write(f"@echo off\n{command.replace('^%', '%%')}\n")
+        return self._step_path
+
+    def _read_stdout_until_marker(
+        self,
+        on_output: Optional[Callable[[str], None]],
+        is_cancelled: Callable[[], bool],
+    ) -> Optional[int]:
+        """
+        Relaie la sortie standard jusqu'au marqueur de fin.
+
+        Returns:
+            Le code de retour lu dans le marqueur, ou None si le shell s'est
+            terminé ou si l'exécution a été annulée
+        """
+        while True:
+            if is_cancelled():
+                return None
+            try:
+                line = self._stdout_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if line is None:
+                return None
+
+            index = line.find(self._marker)
+            if index < 0:
+                if on_output is not None:
+                    on_output(line)
+                continue
+
+            # Sortie sans retour à la ligne final : le marqueur suit le texte
+            before = line[:index]
+            if before and on_output is not None:
+                on_output(before)
+            try:
+                return int(line[index + len(self._marker) :].strip())
+            except ValueError:
+                return -1
+
+    def _read_stderr_until_marker(self) -> str:
+        """
+        Collecte la sortie d'erreur jusqu'au marqueur de fin.
+
+        Returns:
+            La sortie d'erreur de la commande
+        """
+        lines = []
+        while True:
+            try:
+                line = self._stderr_queue.get(timeout=STDERR_MARKER_TIMEOUT)
+            except queue.Empty:
+                break
+            if line is None:
+                break
+            index = line.find(self._marker)
+            if index >= 0:
+                lines.append(line[:index])
+                break
+            lines.append(line)
+        return "".join(lines)
+
+
+class SessionCommandExecutor(CommandExecutor):
+    """
+    Job exécutant une commande dans une session shell persistante.
+
+    Expose les mêmes signaux que CommandExecutor. L'annulation arrête le shell
+    de la session et tout son arbre de processus.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        session: ShellSession,
+        parent: Optional[QObject] = None,
+        grace_period: float = DEFAULT_CANCEL_GRACE_PERIOD,
+    ):
+        """
+        Initialise le job.
+
+        Args:
+            command: La commande à exécuter
+            session: La session shell dans laquelle exécuter la commande
+            parent: Le QObject parent
+            grace_period: Délai (s) avant l'arrêt forcé après une annulation
+        """
+        super().__init__(command, parent, grace_period=grace_period)
+        self.session = session
+
+    def run(self):
+        """Exécute la commande dans la session, depuis un thread du pool."""
+        self._started.set()
+        self.thread_ids.add(threading.get_native_id())
+        try:
+            if self._is_cancelled:
+                self._emit_cancellation_state()
+                self.execution_finished.emit(-1)
+                return
+
+            self.session.start()
+            # cancel() arrête le shell de la session (et ses enfants)
+            self._process = self.session.process
+
+            return_code, stderr = self.session.run_command(
+                self.command,
+                self._on_stdout_line,
+                lambda: self._is_cancelled,
+            )
+
+            if self._is_cancelled:
+                # Attendre l'arrêt du shell (arrêt forcé après le délai de grâce)
+                self._wait_for_exit(self.session.process)
+                self._emit_cancellation_state()
+                return_code = -1
+            elif stderr:
+                self.error_received.emit(stderr.rstrip())
+            self.execution_finished.emit(return_code)
+
+        except Exception as e:
+            self.error_received.emit(f"Erreur lors de l'exécution: {str(e)}")
+            self.execution_finished.emit(-1)
+        finally:
+            self.thread_ids.update(self.session.thread_ids)
+            self._done.set()
@@ -0,0 +1,311 @@
+"""
+Index de recherche des tâches pour la palette d'ouverture rapide (Ctrl+P).
+
+L'index est construit une fois au chargement du catalogue (et reconstruit à
+chaque rechargement) : une entrée par tâche, argument partagé, commande et
+argument de commande. Chaque entrée est indexée par trigrammes (sous-chaînes
+de trois caractères) et par débuts de mots (un ou deux caractères) de son nom
+et de sa description, normalisés (casse et accents ignorés).
+
+Une recherche ne lit que les entrées contenant tous les trigrammes (ou
+débuts de mots) des mots saisis, puis les classe : nom identique, puis début
+du nom, début d'un mot, sous-chaîne, description. Si aucun mot ne
+correspond exactement, les entrées partageant la majorité des trigrammes
+d'un mot sont retenues, ce qui tolère les fautes de frappe.
+"""
+
+import heapq
+import math
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from command_builder.models.task import Task
+
+# Types d'entrées, par ordre de priorité
+KIND_TASK = "task"
+KIND_SHARED_ARGUMENT = "shared_argument"
+KIND_COMMAND = "command"
+KIND_ARGUMENT = "argument"
+
+# Bonus de classement selon le type d'entrée
+KIND_WEIGHTS = {
+    KIND_TASK: 30,
+    KIND_SHARED_ARGUMENT: 15,
+    KIND_COMMAND: 20,
+    KIND_ARGUMENT: 10,
+}
+
+# Nombre de résultats retournés par défaut
+DEFAULT_RESULT_LIMIT = 50
+
+# Part des trigrammes d'un mot qu'une entrée doit contenir (recherche approchée)
+FUZZY_MIN_OVERLAP = 0.6
+
+_EMPTY: Set[int] = frozenset()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalise un texte pour la recherche (minuscules, sans accents).
+
+    Args:
+        text: Le texte
+
+    Returns:
+        Le texte normalisé
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Retourne les trigrammes d'un texte normalisé.
+
+    Args:
+        text: Le texte
+
+    Returns:
+        L'ensemble des sous-chaînes de trois caractères
+    """
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Élément trouvé par la palette.
+
+    Attributes:
+        kind: Le type d'entrée (KIND_*)
+        task_name: Le nom de la tâche
+        title: Le nom affiché (tâche, commande ou argument)
+        detail: Le contexte affiché (description, tâche › commande...)
+        command_index: L'index de la commande dans la tâche (None = aucune)
+        argument_code: Le code de l'argument (None = aucun)
+    """
+
+    kind: str
+    task_name: str
+    title: str
+    detail: str = ""
+    command_index: Optional[int] = None
+    argument_code: Optional[str] = None
+
+
+class TaskSearchIndex:
+    """
+    Index des tâches, commandes et arguments d'un catalogue.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Construit l'index.
+
+        Args:
+            tasks: Les tâches du catalogue
+        """
+        self.entries: List[SearchResult] = []
+        self._titles: List[str] = []  # Noms normalisés, par entrée
+        self._words: List[str] = []  # " " + nom normalisé (débuts de mots)
+        self._details: List[str] = []  # Descriptions normalisées
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._prefixes: Dict[str, Set[int]] = {}
+        self.rebuild(tasks)
+
+    def __len__(self) -> int:
+        """Nombre d'entrées indexées."""
+        return len(self.entries)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        """
+        Reconstruit l'index à partir d'un catalogue (rechargement).
+
+        Args:
+            tasks: Les tâches du catalogue
+        """
+        self.entries = []
+        self._titles = []
+        self._words = []
+        self._details = []
+        self._trigrams = {}
+        self._prefixes = {}
+        for task in tasks:
+            self._add_task(task)
+
+    def _add_task(self, task: Task):
+        """Indexe une tâche, ses arguments partagés, commandes et arguments."""
+        self._add(
+            SearchResult(KIND_TASK, task.name, task.name, task.description or ""),
+            task.description or "",
+        )
+        for argument in task.arguments or []:
+            self._add(
+                SearchResult(
+                    KIND_SHARED_ARGUMENT,
+                    task.name,
+                    argument.name,
+                    f"{task.name} › argument partagé",
+                    argument_code=argument.code,
+                ),
+                f"{argument.code} {argument.description or ''}",
+            )
+
+        seen_arguments = set()
+        for index, command in enumerate(task.commands or []):
+            self._add(
+                SearchResult(
+                    KIND_COMMAND,
+                    task.name,
+                    command.name,
+                    f"{task.name} › {command.description or command.command}",
+                    command_index=index,
+                ),
+                command.description or "",
+            )
+            for argument in command.arguments or []:
+                # Un argument commun à plusieurs commandes mène à la première
+                if argument.name in seen_arguments:
+                    continue
+                seen_arguments.add(argument.name)
+                self._add(
+                    SearchResult(
+                        KIND_ARGUMENT,
+                        task.name,
+                        argument.name,
+                        f"{task.name} › {command.name}",
+                        command_index=index,
+                        argument_code=argument.code,
+                    ),
+                    f"{argument.code} {argument.description or ''}",
+                )
+
+    def _add(self, entry: SearchResult, detail: str):
+        """Ajoute une entrée et ses trigrammes et débuts de mots à l'index."""
+        entry_id = len(self.entries)
+        title = normalize_text(entry.title)
+        detail = normalize_text(detail)
+        self.entries.append(entry)
+        self._titles.append(title)
+        self._words.append(" " + title)
+        self._details.append(detail)
+
+        for gram in trigrams(title) | trigrams(detail):
+            self._trigrams.setdefault(gram, set()).add(entry_id)
+        for word in (title + " " + detail).split():
+            for length in (1, 2):
+                if len(word) >= length:
+                    self._prefixes.setdefault(word[:length], set()).add(entry_id)
+
+    def search(
+        self, query: str, limit: int = DEFAULT_RESULT_LIMIT
+    ) -> List[SearchResult]:
+        """
+        Cherche les entrées correspondant à une saisie.
+
+        Args:
+            query: Les mots saisis (casse et accents ignorés)
+            limit: Nombre maximal de résultats
+
+        Returns:
+            Les entrées trouvées, les plus pertinentes en premier
+        """
+        tokens = normalize_text(query).split()
+        if not tokens:
+            return []
+
+        candidates = self._exact_candidates(tokens)
+        fuzzy = not candidates
+        if fuzzy:
+            candidates = self._fuzzy_candidates(tokens)
+            if not candidates:
+                return []
+
+        query_text = " ".join(tokens)
+        token_grams = [(token, tuple(trigrams(token))) for token in tokens]
+
+        def score(entry_id: int) -> float:
+            return self._score(entry_id, query_text, token_grams, fuzzy)
+
+        best = heapq.nlargest(limit, candidates, key=score)
+        return [self.entries[entry_id] for entry_id in best]
+
+    def _exact_candidates(self, tokens: List[str]) -> Set[int]:
+        """Entrées contenant chaque mot (sous-chaîne, ou début de mot)."""
+        candidates: Optional[Set[int]] = None
+        for token in sorted(tokens, key=len, reverse=True):
+            if len(token) < 3:
+                matches = self._prefixes.get(token, _EMPTY)
+            else:
+                postings = sorted(
+                    (self._trigrams.get(gram, _EMPTY) for gram in trigrams(token)),
+                    key=len,
+                )
+                matches = set(postings[0]).intersection(*postings[1:])
+                if candidates is not None:
+                    matches &= candidates
+                # Les trigrammes peuvent être présents sans être contigus
+                matches = {
+                    entry_id
+                    for entry_id in matches
+                    if token in self._titles[entry_id]
+                    or token in self._details[entry_id]
+                }
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+        return candidates or set()
+
+    def _fuzzy_candidates(self, tokens: List[str]) -> Set[int]:
+        """Entrées partageant la majorité des trigrammes de chaque mot."""
+        candidates: Optional[Set[int]] = None
+        for token in tokens:
+            grams = trigrams(token)
+            if not grams:
+                continue  # Mot trop court pour une recherche approchée
+            needed = math.ceil(len(grams) * FUZZY_MIN_OVERLAP)
+            counts = Counter()
+            for gram in grams:
+                counts.update(self._trigrams.get(gram, _EMPTY))
+            matches = {
+                entry_id for entry_id, count in counts.items() if count >= needed
+            }
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+        return candidates or set()
+
+    def _score(
+        self,
+        entry_id: int,
+        query_text: str,
+        token_grams: List[Tuple[str, Tuple[str, ...]]],
+        fuzzy: bool,
+    ) -> float:
+        """Pertinence d'une entrée pour les mots saisis (et leurs trigrammes)."""
+        title = self._titles[entry_id]
+        if title == query_text:
+            score = 200.0  # Nom saisi en entier
+        else:
+            words = self._words[entry_id]
+            score = 0.0
+            for token, grams in token_grams:
+                if title == token:
+                    score += 100
+                elif title.startswith(token):
+                    score += 80
+                elif " " + token in words:
+                    score += 60
+                elif token in title:
+                    score += 40
+                elif fuzzy:
+                    if grams:
+                        found = sum(1 for gram in grams if gram in title)
+                        score += 30 * found / len(grams)
+                else:
+                    score += 10  # Trouvé dans la description
+        entry = self.entries[entry_id]
+        # À pertinence égale : tâches d'abord, puis noms courts
+        return score + KIND_WEIGHTS[entry.kind] - len(title) * 0.1
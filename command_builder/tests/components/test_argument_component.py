@@ -5,10 +5,15 @@ Tests unitaires pour le composant ArgumentComponent.
 from unittest.mock import Mock, patch
 
 import pytest
+from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QApplication, QLineEdit, QPushButton
 
 from command_builder.components.argument_component import ArgumentComponent
+from command_builder.components.command_component import CommandComponent
+from command_builder.components.stylesheet import VALIDATION_ERROR_MARK
 from command_builder.models.arguments import Argument
+from command_builder.models.command import Command
+from command_builder.services.path_validator import get_path_validator
 
 
 @pytest.fixture(scope="module")
@@ -324,3 +329,59 @@ class TestArgumentComponentAffectedCommands:
 
         assert component.affected_commands == []
         assert component.argument == sample_argument
+
+
+class TestArgumentComponentLiveValidation:
+    """Tests de la validation en direct des chemins."""
+
+    def test_missing_file_reported_to_label(self, qapp, tmp_path):
+        """Test qu'un fichier introuvable est signalé sur le label de l'argument."""
+        command = Command(
+            name="copy",
+            description="",
+            command="cp {SRC}",
+            arguments=[Argument(code="SRC", name="Source", type="file")],
+        )
+        component = CommandComponent(command)
+        arg_data = component.argument_components["SRC"]
+        changes = []
+        arg_data["component"].validation_changed.connect(
+            lambda code, message: changes.append((code, message))
+        )
+        validator = get_path_validator()
+
+        arg_data["component"].set_value(str(tmp_path / "absent.txt"))
+        validator.flush()
+        for _ in range(200):
+            if changes:
+                break
+            QTest.qWait(10)
+
+        assert changes and changes[0][0] == "SRC"
+        assert "introuvable" in arg_data["component"].validation_error()
+        assert VALIDATION_ERROR_MARK in arg_data["label"].text()
+        assert "introuvable" in arg_data["label"].toolTip()
+
+        arg_data["component"].set_value("")
+
+        assert arg_data["component"].validation_error() is None
+        assert VALIDATION_ERROR_MARK not in arg_data["label"].text()
+
+    def test_missing_default_reported(self, qapp, tmp_path):
+        """Test qu'une valeur par défaut introuvable est signalée dès la création."""
+        argument = Argument(
+            code="SRC",
+            name="Source",
+            type="file",
+            default=str(tmp_path / "absent.txt"),
+        )
+        component = ArgumentComponent(argument)
+        validator = get_path_validator()
+
+        validator.flush()
+        for _ in range(200):
+            if component.validation_error():
+                break
+            QTest.qWait(10)
+
+        assert "introuvable" in component.validation_error()
@@ -347,3 +347,70 @@ def test_build_command_optional_positional_argument_removed(qapp):
 
     # La commande finale doit être propre sans l'argument optionnel
     assert full_command == "campaignexport data.db txt_output img_output"
+
+
+def test_build_argv_keeps_values_as_single_arguments(qapp):
+    """Test que build_argv produit un argument par valeur saisie."""
+    command = Command(
+        name="test",
+        description="Test",
+        command="mycommand {INPUT} {DEBUG} {LEVEL}",
+        arguments=[
+            Argument(code="INPUT", name="Input", type="file", required=1),
+            Argument(
+                code="DEBUG", name="Debug", type="flag", required=0, value="--debug"
+            ),
+            Argument(
+                code="LEVEL",
+                name="Level",
+                type="valued_option",
+                required=0,
+                value="--level",
+            ),
+        ],
+    )
+
+    component = CommandComponent(command, simple_mode=False)
+    component.argument_components["INPUT"]["component"].set_value("my input.txt")
+    level = component.argument_components["LEVEL"]["component"]
+    level.checkbox.setChecked(True)
+    level.line_edit.setText("3")
+
+    # DEBUG non coché ne produit aucun argument
+    assert component.build_argv() == ["mycommand", "my input.txt", "--level", "3"]
+
+
+def test_build_argv_returns_none_for_shell_command(qapp):
+    """Test que build_argv retourne None si la commande nécessite le shell."""
+    command = Command(
+        name="test",
+        description="Test",
+        command="mycommand {INPUT}",
+        arguments=[Argument(code="INPUT", name="Input", type="file", required=1)],
+        shell=True,
+    )
+
+    component = CommandComponent(command, simple_mode=False)
+    assert component.build_argv() is None
+
+
+def test_get_io_paths_returns_declared_roles(qapp):
+    """Test que get_io_paths retourne les chemins d'entrée et de sortie."""
+    command = Command(
+        name="test",
+        description="Test",
+        command="convert {SOURCE} {RESULT} {LABEL}",
+        arguments=[
+            Argument(code="SOURCE", name="Source", type="file", role="input"),
+            Argument(code="RESULT", name="Result", type="file", role="output"),
+            Argument(code="LABEL", name="Label", type="string"),
+        ],
+    )
+
+    component = CommandComponent(command, simple_mode=False)
+    component.argument_components["SOURCE"]["component"].set_value("in.csv")
+    component.argument_components["RESULT"]["component"].set_value("")
+    component.argument_components["LABEL"]["component"].set_value("x")
+
+    # Les chemins vides sont ignorés
+    assert component.get_io_paths() == {"inputs": ["in.csv"], "outputs": []}
@@ -6,9 +6,13 @@ Améliore la couverture de command_form.py
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QApplication, QLabel, QMessageBox
 
 from command_builder.components.command_form import CommandForm
+from command_builder.components.command_form.command_form import (
+    SHARED_ARGUMENT_DEBOUNCE_MS,
+)
 from command_builder.models.arguments import Argument, TaskArgument, ArgumentValue
 from command_builder.models.command import Command
 from command_builder.models.task import Task
@@ -153,47 +157,29 @@ class TestCommandFormDefaultFactory:
 class TestCommandFormSetTask:
     """Tests pour la méthode set_task."""
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_set_task_updates_current_task(
-        self, mock_style, mock_ui, qapp, sample_task
-    ):
+    def test_set_task_updates_current_task(self, qapp, sample_task):
         """Teste que set_task met à jour la tâche courante."""
         form = CommandForm()
-        form.commands_layout = Mock()
-        form.commands_layout.count.return_value = 0
-        form._clear_form = Mock()
-        form._restore_cached_values = Mock()
-        form.task_loaded = Mock()
-        
+
         form.set_task(sample_task)
-        
+
         assert form.current_task is sample_task
         assert form.current_commands == sample_task.commands
-        form._clear_form.assert_called_once()
+        assert form.page_stack.currentWidget().task is sample_task
+        assert len(form.command_components) == 1
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_set_task_emits_task_loaded_signal(
-        self, mock_style, mock_ui, qapp, sample_task
-    ):
+    def test_set_task_emits_task_loaded_signal(self, qapp, sample_task):
         """Teste que set_task émet le signal task_loaded."""
         form = CommandForm()
-        form.commands_layout = Mock()
-        form.commands_layout.count.return_value = 0
-        form._clear_form = Mock()
-        form._restore_cached_values = Mock()
-        
+
         signal_spy = Mock()
         form.task_loaded.connect(signal_spy)
-        
+
         form.set_task(sample_task)
-        
+
         signal_spy.assert_called_once()
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_set_task_with_empty_commands(self, mock_style, mock_ui, qapp):
+    def test_set_task_with_empty_commands(self, qapp):
         """Teste set_task avec une tâche sans commandes."""
         empty_task = Task(
             name="EmptyTask",
@@ -201,48 +187,119 @@ class TestCommandFormSetTask:
             commands=[],
             arguments=[],
         )
-        
+
         form = CommandForm()
-        form.commands_layout = Mock()
-        form._clear_form = Mock()
-        form._save_current_values = Mock()
-        
+
         form.set_task(empty_task)
-        
+
         assert form.current_task is empty_task
         assert form.current_commands == []
+        assert form.command_components == []
+
+
+class TestCommandFormPageCache:
+    """Tests pour le cache des pages de tâches."""
+
+    @staticmethod
+    def make_task(name):
+        """Crée une tâche d'une commande avec un argument."""
+        return Task(
+            name=name,
+            description="",
+            commands=[
+                Command(
+                    name=f"{name}_cmd",
+                    description="",
+                    command="echo {MESSAGE}",
+                    arguments=[Argument(code="MESSAGE", name="Message")],
+                )
+            ],
+        )
+
+    @staticmethod
+    def message(form):
+        """Retourne le composant de l'argument MESSAGE de la tâche courante."""
+        return form.command_components[0].argument_components["MESSAGE"]["component"]
+
+    def test_switching_back_reuses_page(self, qapp):
+        """Revenir à une tâche réaffiche sa page sans la reconstruire."""
+        form = CommandForm()
+        first, second = self.make_task("A"), self.make_task("B")
+
+        form.set_task(first)
+        component = form.command_components[0]
+        self.message(form).set_value("bonjour")
+        form.command_checkboxes[0].setChecked(False)
+        form.set_task(second)
+        form.set_task(first)
+
+        assert form.command_components[0] is component
+        assert self.message(form).get_value() == "bonjour"
+        assert not form.command_checkboxes[0].isChecked()
+        assert form.page_stack.count() == 3  # Accueil + deux tâches
+
+    def test_evicted_page_values_restored(self, qapp):
+        """Une page retirée du cache retrouve ses valeurs à la reconstruction."""
+        form = CommandForm(max_cached_pages=1)
+        first, second = self.make_task("A"), self.make_task("B")
+
+        form.set_task(first)
+        component = form.command_components[0]
+        self.message(form).set_value("bonjour")
+        form.set_task(second)
+        assert form.page_stack.count() == 2  # Accueil + page courante
+
+        form.set_task(first)
+        assert form.command_components[0] is not component
+        assert self.message(form).get_value() == "bonjour"
+
+    def test_widget_budget_evicts_oldest_pages(self, qapp):
+        """Les pages les plus anciennes sont retirées au-delà du budget."""
+        form = CommandForm(max_cached_widgets=4)
+        for name in "ABC":
+            form.set_task(self.make_task(name))
+
+        # Deux widgets par page (commande + argument)
+        assert [page.task.name for page in form._page_cache.pages] == ["B", "C"]
+
+        form.set_page_cache_limits(max_pages=1, max_widgets=100)
+        assert [page.task.name for page in form._page_cache.pages] == ["C"]
+
+    def test_reloaded_task_rebuilds_page(self, qapp):
+        """Une tâche rechargée (même nom, nouvel objet) a une nouvelle page."""
+        form = CommandForm()
+        form.set_task(self.make_task("A"))
+        self.message(form).set_value("bonjour")
+        reloaded = self.make_task("A")
+
+        form.set_task(reloaded)
+
+        assert form.current_task is reloaded
+        assert form.command_components[0].command is reloaded.commands[0]
+        assert self.message(form).get_value() == "bonjour"
+        assert form.page_stack.count() == 2
 
 
 class TestCommandFormSetCommands:
     """Tests pour la méthode set_commands."""
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_set_commands_updates_list(
-        self, mock_style, mock_ui, qapp, sample_command
-    ):
+    def test_set_commands_updates_list(self, qapp, sample_command):
         """Teste que set_commands met à jour la liste des commandes."""
         form = CommandForm()
-        form.commands_layout = Mock()
-        form.commands_layout.count.return_value = 0
-        form._clear_form = Mock()
-        
+
         commands = [sample_command]
         form.set_commands(commands, "TestTask")
-        
+
         assert form.current_commands == commands
         assert form.current_task is None
+        assert form.page_stack.currentWidget() is form.scroll_area
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_set_commands_with_empty_list(self, mock_style, mock_ui, qapp):
+    def test_set_commands_with_empty_list(self, qapp):
         """Teste set_commands avec une liste vide."""
         form = CommandForm()
-        form.commands_layout = Mock()
-        form._clear_form = Mock()
-        
+
         form.set_commands([], "EmptyTask")
-        
+
         assert form.current_commands == []
 
 
@@ -478,49 +535,35 @@ class TestCommandFormDefaultStyles:
     @patch.object(CommandForm, "_load_ui")
     @patch.object(CommandForm, "_load_stylesheet")
     def test_apply_default_style(self, mock_style, mock_ui, qapp):
-        """Teste _apply_default_style."""
+        """Teste _apply_default_style (sans recalcul du style du label)."""
         form = CommandForm()
-        
-        mock_label = Mock(spec=QLabel)
-        mock_style_obj = Mock()
-        mock_label.style.return_value = mock_style_obj
-        
-        form._apply_default_style(mock_label)
-        
-        mock_label.setProperty.assert_called_once_with("hasDefault", True)
-        mock_style_obj.unpolish.assert_called_once_with(mock_label)
-        mock_style_obj.polish.assert_called_once_with(mock_label)
+        label = QLabel("Argument :")
+        label.style = Mock()
+
+        form._apply_default_style(label)
+
+        assert label.property("hasDefault") is True
+        assert "font-weight: bold" in label.text()
+        assert "Argument :" in label.text()
+        label.style.assert_not_called()
 
     @patch.object(CommandForm, "_load_ui")
     @patch.object(CommandForm, "_load_stylesheet")
     def test_remove_default_style(self, mock_style, mock_ui, qapp):
         """Teste _remove_default_style."""
         form = CommandForm()
-        
-        mock_label = Mock(spec=QLabel)
-        mock_style_obj = Mock()
-        mock_label.style.return_value = mock_style_obj
-        
-        form._remove_default_style(mock_label)
-        
-        mock_label.setProperty.assert_called_once_with("hasDefault", False)
-        mock_style_obj.unpolish.assert_called_once_with(mock_label)
-        mock_style_obj.polish.assert_called_once_with(mock_label)
+        label = QLabel("Argument :")
+        form._apply_default_style(label)
+
+        form._remove_default_style(label)
+
+        assert label.property("hasDefault") is False
+        assert label.text() == "Argument :"
 
 
 class TestCommandFormValueCache:
     """Tests pour le cache des valeurs."""
 
-    @patch.object(CommandForm, "_load_ui")
-    @patch.object(CommandForm, "_load_stylesheet")
-    def test_save_current_values_no_task(self, mock_style, mock_ui, qapp):
-        """Teste _save_current_values sans tâche courante."""
-        form = CommandForm()
-        form.current_task = None
-        
-        # Ne doit pas lever d'exception
-        form._save_current_values()
-
     @patch.object(CommandForm, "_load_ui")
     @patch.object(CommandForm, "_load_stylesheet")
     def test_restore_cached_values_no_task(self, mock_style, mock_ui, qapp):
@@ -591,4 +634,111 @@ class TestCommandFormOnSharedArgumentChanged:
         form._on_shared_argument_changed("SHARED_INPUT", "test_value", mock_label)
         
         assert form.shared_argument_values["SHARED_INPUT"] == "test_value"
-        form._refresh_command_displays.assert_called_once()
+        form._refresh_command_displays.assert_not_called()  # Propagation différée
+
+        form._flush_shared_arguments()
+        form._refresh_command_displays.assert_called_once_with({"SHARED_INPUT"})
+
+
+class TestCommandFormSharedArgumentPropagation:
+    """Tests de la propagation groupée et indexée des arguments partagés."""
+
+    @staticmethod
+    def make_task():
+        """Tâche de trois commandes dont deux alimentées par l'argument partagé."""
+        commands = [
+            Command(
+                name=f"Command{i}",
+                description="",
+                command=f"cmd{i} {{INPUT}} {{OTHER}}",
+                arguments=[
+                    Argument(code="INPUT", name="Input"),
+                    Argument(code="OTHER", name="Other"),
+                ],
+            )
+            for i in range(3)
+        ]
+        return Task(
+            name="Shared",
+            description="",
+            commands=commands,
+            arguments=[
+                TaskArgument(
+                    code="SHARED_INPUT",
+                    name="Shared Input",
+                    values=[
+                        ArgumentValue(command="Command0", argument="INPUT"),
+                        ArgumentValue(command="Command2", argument="INPUT"),
+                    ],
+                ),
+                TaskArgument(
+                    code="SHARED_OTHER",
+                    name="Shared Other",
+                    values=[ArgumentValue(command="Command2", argument="OTHER")],
+                ),
+            ],
+        )
+
+    @staticmethod
+    def type_shared(form, code, value):
+        """Simule la saisie d'un argument partagé."""
+        arg_data = form.shared_argument_widgets[code]
+        arg_data["component"].set_value(value)
+
+    def test_index_lists_targeted_widgets(self, qapp):
+        form = CommandForm()
+        form.set_task(self.make_task())
+
+        targets = form.shared_argument_targets["SHARED_INPUT"]
+        assert [(widget.command.name, code) for widget, code in targets] == [
+            ("Command0", "INPUT"),
+            ("Command2", "INPUT"),
+        ]
+
+    def test_keystrokes_debounced(self, qapp):
+        form = CommandForm()
+        form.set_task(self.make_task())
+        first = form.command_components[0]
+
+        for text in ("d", "da", "data"):
+            self.type_shared(form, "SHARED_INPUT", text)
+
+        assert first.get_argument_values()["INPUT"] == ""
+        assert form._shared_argument_timer.isActive()
+
+        QTest.qWait(SHARED_ARGUMENT_DEBOUNCE_MS + 100)
+        assert first.get_argument_values()["INPUT"] == "data"
+        assert form.current_task.commands[0].arguments[0].default == "data"
+
+    def test_one_update_per_affected_command(self, qapp):
+        form = CommandForm()
+        form.set_task(self.make_task())
+        emitted = {}
+        for widget in form.command_components:
+            widget.arguments_changed.connect(
+                lambda values, name=widget.command.name: emitted.setdefault(
+                    name, []
+                ).append(values)
+            )
+
+        self.type_shared(form, "SHARED_INPUT", "in.txt")
+        self.type_shared(form, "SHARED_OTHER", "other.txt")
+        form._flush_shared_arguments()
+
+        assert sorted(emitted) == ["Command0", "Command2"]
+        assert emitted["Command2"] == [{"INPUT": "in.txt", "OTHER": "other.txt"}]
+        assert "cmd2 in.txt other.txt" in (
+            form.command_components[2].label_command_cli.text()
+        )
+
+    def test_pending_values_flushed_before_execution(self, qapp):
+        form = CommandForm()
+        form.set_task(self.make_task())
+        emitted = []
+        form.commands_to_execute.connect(emitted.append)
+        form.command_components[1].set_argument_value("INPUT", "x")
+
+        self.type_shared(form, "SHARED_INPUT", "in.txt")
+        form._on_execute_clicked()
+
+        assert [cmd["command"] for cmd in emitted[0]][0] == "cmd0 in.txt"
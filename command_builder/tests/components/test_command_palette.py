@@ -0,0 +1,149 @@
+"""
+Tests pour la palette d'ouverture rapide (Ctrl+P).
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from command_builder.components.command_palette import CommandPalette
+from command_builder.components.main_window import MainWindow
+from command_builder.models.arguments import Argument, TaskArgument
+from command_builder.models.command import Command
+from command_builder.models.task import Task
+from command_builder.services.task_search_index import TaskSearchIndex
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def make_tasks():
+    """Crée deux tâches dont l'une a un argument partagé."""
+    return [
+        Task(
+            name="Archivage",
+            description="Archive les journaux",
+            arguments=[TaskArgument(code="ROOT", name="Racine des journaux")],
+            commands=[
+                Command(
+                    name="Compression",
+                    description="",
+                    command="gzip {LEVEL}",
+                    arguments=[Argument(code="LEVEL", name="Niveau de compression")],
+                ),
+                Command(
+                    name="Transfert",
+                    description="",
+                    command="scp {DEST}",
+                    arguments=[Argument(code="DEST", name="Destination distante")],
+                ),
+            ],
+        ),
+        Task(
+            name="Nettoyage",
+            description="Supprime les fichiers temporaires",
+            commands=[
+                Command(name="Purge", description="", command="rm", arguments=[])
+            ],
+        ),
+    ]
+
+
+class TestCommandPalette:
+    """Tests du dialogue CommandPalette."""
+
+    def test_results_follow_typing(self, qapp):
+        palette = CommandPalette(TaskSearchIndex(make_tasks()))
+        palette.popup()
+
+        QTest.keyClicks(palette.line_edit, "transf")
+
+        assert [r.title for r in palette.results] == ["Transfert"]
+        assert palette.result_list.count() == 1
+        assert palette.result_list.currentRow() == 0
+        palette.close()
+
+    def test_arrow_keys_move_selection(self, qapp):
+        palette = CommandPalette(TaskSearchIndex(make_tasks()))
+        palette.search("compression")
+        assert len(palette.results) > 1
+
+        QTest.keyClick(palette.line_edit, Qt.Key.Key_Down)
+
+        assert palette.current_result() is palette.results[1]
+
+    def test_enter_emits_chosen_result(self, qapp):
+        palette = CommandPalette(TaskSearchIndex(make_tasks()))
+        chosen = []
+        palette.result_chosen.connect(chosen.append)
+        palette.popup()
+        palette.line_edit.setText("nettoyage")
+
+        QTest.keyClick(palette.line_edit, Qt.Key.Key_Return)
+
+        assert [r.title for r in chosen] == ["Nettoyage"]
+        assert not palette.isVisible()
+
+    def test_no_result(self, qapp):
+        palette = CommandPalette(TaskSearchIndex(make_tasks()))
+        palette.line_edit.setText("zzzz")
+
+        assert palette.current_result() is None
+        assert palette.status_label.text() == "Aucun résultat"
+
+
+class TestMainWindowPalette:
+    """Tests de la palette dans la fenêtre principale."""
+
+    def test_set_tasks_rebuilds_index(self, qapp):
+        window = MainWindow()
+        window.set_tasks(make_tasks())
+        assert window.search_index.search("archivage")
+
+        window.set_tasks(make_tasks()[1:])
+        assert not window.search_index.search("archivage")
+        window.close()
+
+    def test_shortcut_opens_palette(self, qapp):
+        window = MainWindow()
+        window.set_tasks(make_tasks())
+        window.show()
+
+        window.palette_shortcut.activated.emit()
+
+        assert window.command_palette.isVisible()
+        window.command_palette.close()
+        window.close()
+
+    def test_argument_result_focuses_input(self, qapp):
+        window = MainWindow()
+        window.set_tasks(make_tasks())
+        window.show()
+
+        window.command_palette.search("destination")
+        window.command_palette._choose_current()
+
+        form = window.command_form
+        assert form.current_task.name == "Archivage"
+        component = form.command_components[1].argument_components["DEST"]["component"]
+        assert window.focusWidget() is component.line_edit
+        window.close()
+
+    def test_shared_argument_result_focuses_input(self, qapp):
+        window = MainWindow()
+        window.set_tasks(make_tasks())
+        window.show()
+
+        window.command_palette.search("racine")
+        window.command_palette._choose_current()
+
+        component = window.command_form.shared_argument_widgets["ROOT"]["component"]
+        assert window.focusWidget() is component.line_edit
+        window.close()
@@ -0,0 +1,270 @@
+"""
+Tests pour les sections repliables du formulaire paresseux (grosses tâches).
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from command_builder.components.argument_component.argument_component import (
+    ArgumentState,
+)
+from command_builder.components.command_component import CommandComponent
+from command_builder.components.command_form import CommandForm
+from command_builder.components.command_form.command_section import CommandSection
+from command_builder.models.arguments import Argument, ArgumentValue, TaskArgument
+from command_builder.models.command import Command
+from command_builder.models.task import Task
+from command_builder.services.command_template import quote_argument
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def make_command(index):
+    """Crée une commande avec un argument obligatoire, une valeur par défaut et un flag."""
+    return Command(
+        name=f"cmd{index}",
+        description="",
+        command=f"tool{index} {{SOURCE}} {{OUTPUT}} {{VERBOSE}}",
+        arguments=[
+            Argument(code="SOURCE", name="Source", required=1),
+            Argument(code="OUTPUT", name="Sortie", default="out.txt"),
+            Argument(code="VERBOSE", name="Verbeux", type="flag", value="-v"),
+        ],
+    )
+
+
+def make_task(count, name="Grosse tâche", arguments=None):
+    """Crée une tâche de count commandes."""
+    return Task(
+        name=name,
+        description="",
+        commands=[make_command(i) for i in range(count)],
+        arguments=arguments or [],
+    )
+
+
+def default_factory(command, parent, simple_mode=False):
+    """Factory créant un CommandComponent."""
+    return CommandComponent(command, parent, simple_mode)
+
+
+class TestArgumentState:
+    """Tests de l'état d'un argument sans widget."""
+
+    def test_from_argument_uses_default(self):
+        state = ArgumentState.from_argument(
+            Argument(code="OUTPUT", name="Sortie", default="out.txt")
+        )
+        assert state.get_value() == "out.txt"
+        assert state.has_default_value()
+
+    def test_valued_option(self):
+        argument = Argument(
+            code="LEVEL", name="Niveau", type="valued_option", value="--level"
+        )
+        state = ArgumentState.from_argument(argument)
+        assert state.get_value() == ""
+
+        state.set_value("3")
+        assert state.get_value() == "--level 3"
+        assert state.get_value_tokens() == ["--level", "3"]
+
+    def test_flag(self):
+        state = ArgumentState.from_argument(
+            Argument(code="VERBOSE", name="Verbeux", type="flag", value="-v")
+        )
+        assert state.get_value() == ""
+        state.set_value("1")
+        assert state.get_value() == "-v"
+
+    def test_component_round_trip(self, qapp):
+        component = CommandComponent(make_command(0), simple_mode=True)
+        component.argument_components["SOURCE"]["component"].set_value("a.txt")
+        component.argument_components["VERBOSE"]["component"].set_value("1")
+        states = component.get_argument_states()
+
+        restored = CommandComponent(make_command(0), simple_mode=True)
+        restored.set_argument_states(states)
+
+        assert restored.get_argument_values() == component.get_argument_values()
+        assert restored._build_full_command() == "tool0 a.txt out.txt -v"
+
+
+class TestCommandSection:
+    """Tests d'une section repliable."""
+
+    def test_collapsed_section_has_no_argument_widgets(self, qapp):
+        section = CommandSection(make_command(0), 1, default_factory)
+
+        assert not section.is_expanded
+        assert section.widget_count == 0
+        assert section.checkbox.text() == "1. cmd0"
+        assert "tool0 {Source} out.txt" in section.preview_label.text()
+        assert section.get_argument_values()["OUTPUT"] == "out.txt"
+
+    def test_collapsed_section_builds_command(self, qapp):
+        section = CommandSection(make_command(0), 1, default_factory)
+        section.set_argument_value("SOURCE", "a b.txt")
+
+        quoted = quote_argument("a b.txt")
+        assert section._build_full_command() == f"tool0 {quoted} out.txt"
+        assert section.build_argv() == ["tool0", "a b.txt", "out.txt"]
+        assert "a b.txt" in section.preview_label.text()
+
+    def test_expand_restores_values(self, qapp):
+        section = CommandSection(make_command(0), 1, default_factory)
+        section.set_argument_value("SOURCE", "a.txt")
+
+        section.expand()
+
+        assert section.is_expanded
+        assert section.widget_count == 3
+        component = section.argument_components["SOURCE"]["component"]
+        assert component.get_value() == "a.txt"
+        assert section._build_full_command() == "tool0 a.txt out.txt"
+
+    def test_collapse_keeps_edited_values(self, qapp):
+        section = CommandSection(make_command(0), 1, default_factory)
+        section.expand()
+        section.argument_components["SOURCE"]["component"].set_value("b.txt")
+
+        section.collapse()
+
+        assert not section.is_expanded
+        assert section.get_argument_values()["SOURCE"] == "b.txt"
+        assert "b.txt" in section.preview_label.text()
+
+    def test_toggle_records_user_choice(self, qapp):
+        section = CommandSection(make_command(0), 1, default_factory)
+        changes = []
+        section.expanded_changed.connect(changes.append)
+
+        section.toggle()
+        section.toggle()
+
+        assert changes == [True, False]
+        assert section.collapsed_by_user
+
+
+class TestLazyCommandForm:
+    """Tests du formulaire paresseux des grosses tâches."""
+
+    def test_small_task_stays_eager(self, qapp):
+        form = CommandForm(lazy_command_threshold=5)
+        form.set_task(make_task(5))
+        assert all(isinstance(w, CommandComponent) for w in form.command_components)
+
+    def test_large_task_uses_collapsed_sections(self, qapp):
+        form = CommandForm(lazy_command_threshold=5)
+        form.set_task(make_task(20))
+
+        assert len(form.command_components) == 20
+        assert all(isinstance(w, CommandSection) for w in form.command_components)
+        assert form.command_checkboxes == [
+            section.checkbox for section in form.command_components
+        ]
+        assert not any(section.is_expanded for section in form.command_components)
+
+    def test_visible_sections_realized(self, qapp):
+        form = CommandForm(lazy_command_threshold=5)
+        form.resize(600, 300)
+        form.show()
+        form.set_task(make_task(40))
+        page = form.page_stack.currentWidget()
+        qapp.processEvents()
+
+        page.realize_visible_sections()
+
+        expanded = [s for s in page.lazy_sections if s.is_expanded]
+        assert expanded and expanded[0] is page.lazy_sections[0]
+        assert not page.lazy_sections[-1].is_expanded
+        form.close()
+
+    def test_realized_sections_released_beyond_limit(self, qapp):
+        form = CommandForm(lazy_command_threshold=5, max_realized_commands=2)
+        form.resize(600, 300)
+        form.show()
+        form.set_task(make_task(40))
+        page = form.page_stack.currentWidget()
+        sections = page.lazy_sections
+        sections[0].expand()
+        sections[0].argument_components["SOURCE"]["component"].set_value("a.txt")
+        qapp.processEvents()
+
+        page.verticalScrollBar().setValue(page.verticalScrollBar().maximum())
+        qapp.processEvents()
+        page.realize_visible_sections()
+
+        assert not sections[0].is_expanded
+        assert sections[0].get_argument_values()["SOURCE"] == "a.txt"
+        assert any(section.is_expanded for section in sections[30:])
+        form.close()
+
+    def test_execute_collapsed_sections(self, qapp):
+        form = CommandForm(lazy_command_threshold=1)
+        form.set_task(make_task(2))
+        emitted = []
+        form.commands_to_execute.connect(emitted.append)
+        for section in form.command_components:
+            section.set_argument_value("SOURCE", "a.txt")
+        form.command_checkboxes[1].setChecked(False)
+
+        form._on_execute_clicked()
+
+        assert len(emitted) == 1
+        assert [cmd["command"] for cmd in emitted[0]] == ["tool0 a.txt out.txt"]
+
+    def test_shared_argument_updates_preview(self, qapp):
+        shared = TaskArgument(
+            code="SRC",
+            name="Source",
+            values=[ArgumentValue(command="cmd1", argument="SOURCE")],
+        )
+        form = CommandForm(lazy_command_threshold=1)
+        form.set_task(make_task(3, arguments=[shared]))
+        label = form.task_argument_components[0]["label"]
+
+        form._on_shared_argument_changed("SRC", "partagé.txt", label)
+        form._flush_shared_arguments()
+
+        section = form.command_components[1]
+        assert section.get_argument_values()["SOURCE"] == "partagé.txt"
+        assert "partagé.txt" in section.preview_label.text()
+
+    def test_evicted_page_values_restored(self, qapp):
+        form = CommandForm(max_cached_pages=1, lazy_command_threshold=1)
+        first = make_task(3, name="A")
+        form.set_task(first)
+        form.command_components[2].set_argument_value("SOURCE", "a.txt")
+        form.set_task(make_task(3, name="B"))
+
+        form.set_task(first)
+
+        section = form.command_components[2]
+        assert section.get_argument_values()["SOURCE"] == "a.txt"
+        assert "a.txt" in section.preview_label.text()
+
+    def test_focus_argument_expands_section(self, qapp):
+        form = CommandForm(lazy_command_threshold=5)
+        form.resize(600, 300)
+        form.show()
+        form.set_task(make_task(40))
+        page = form.page_stack.currentWidget()
+        qapp.processEvents()
+
+        assert form.focus_argument(35, "SOURCE")
+
+        section = form.command_components[35]
+        component = section.argument_components["SOURCE"]["component"]
+        assert section.is_expanded
+        assert form.focusWidget() is component.line_edit
+        assert page.verticalScrollBar().value() > 0
+        assert not form.focus_argument(99, "SOURCE")
+        form.close()
@@ -78,6 +78,51 @@ class TestConsoleOutputSequentialExecution:
         mock_finished.assert_called_once()
 
 
+class TestConsoleOutputSessionMode:
+    """Tests pour le mode session (un seul shell pour la séquence)."""
+
+    def test_session_commands_share_one_session(self, console_output):
+        """Les commandes marquées session reçoivent la même session shell."""
+        commands = [
+            {"name": "cmd1", "command": "echo test1", "session": True},
+            {"name": "cmd2", "command": "echo test2", "session": True},
+        ]
+
+        with patch.object(
+            console_output.executor_service, "execute_command"
+        ) as mock_execute:
+            console_output.execute_commands(commands)
+            session = mock_execute.call_args.kwargs["session"]
+            console_output.current_command_index = 1
+            console_output._execute_next_command()
+
+        assert session is not None
+        assert mock_execute.call_args.kwargs["session"] is session
+        assert "Mode session" in console_output.text_edit_console.toPlainText()
+
+    def test_no_session_by_default(self, console_output):
+        """Sans marqueur session, chaque commande a son propre processus."""
+        commands = [{"name": "cmd1", "command": "echo test1"}]
+
+        with patch.object(
+            console_output.executor_service, "execute_command"
+        ) as mock_execute:
+            console_output.execute_commands(commands)
+
+        assert mock_execute.call_args.kwargs["session"] is None
+
+    def test_session_closed_when_sequence_ends(self, console_output):
+        """La session est fermée à la fin de la séquence."""
+        commands = [{"name": "cmd1", "command": "echo test1", "session": True}]
+
+        with patch.object(console_output.executor_service, "execute_command"):
+            console_output.execute_commands(commands)
+
+        assert console_output._shell_session is not None
+        console_output._on_all_commands_finished()
+        assert console_output._shell_session is None
+
+
 class TestConsoleOutputErrorHandling:
     """Tests pour la gestion des erreurs et l'arrêt en cas d'erreur."""
 
@@ -117,6 +162,61 @@ class TestConsoleOutputErrorHandling:
         # Vérifier que l'arrêt en cas d'erreur a été appelé
         mock_error.assert_called_once()
 
+    def test_on_single_command_finished_after_stop(self, console_output):
+        """Teste qu'une commande interrompue par Stop n'est pas une erreur."""
+        console_output.commands_queue = [{"name": "cmd1", "command": "echo test1"}]
+        console_output.current_command_index = 0
+        console_output.command_start_time = __import__("datetime").datetime.now()
+        console_output.executor_service._stop_requested = True
+
+        with patch.object(
+            console_output, "_on_execution_stopped_by_user"
+        ) as mock_stopped:
+            console_output._on_single_command_finished(-15)
+
+        mock_stopped.assert_called_once()
+
+    def test_on_single_command_finished_reports_resources(self, console_output):
+        """Teste l'affichage et l'enregistrement des ressources consommées."""
+        from command_builder.models.run_record import ResourceUsage
+
+        console_output.commands_queue = [{"name": "cmd1", "command": "echo test1"}]
+        console_output.current_command_index = 0
+        console_output.command_start_time = __import__("datetime").datetime.now()
+        console_output._on_command_resources(ResourceUsage(1.25, 0.5, 4096, 0, 0))
+
+        with patch.object(console_output, "_execute_next_command"):
+            console_output._on_single_command_finished(0)
+
+        assert "Ressources: CPU 1.25s" in console_output.text_edit_console.toPlainText()
+        assert len(console_output.run_records) == 1
+        assert console_output.run_records[0].usage.user_cpu == 1.25
+
+    def test_export_run_records_csv(self, console_output, tmp_path):
+        """Teste l'export CSV des ressources par commande."""
+        from command_builder.models.run_record import ResourceUsage, RunRecord
+
+        console_output.run_records = [
+            RunRecord("cmd1", "echo 1", 0, 0.5, ResourceUsage(0.1, 0.0, 2048, 1, 2)),
+            RunRecord("cmd2", "echo 2", 1, 0.2),
+        ]
+        target = tmp_path / "resources.csv"
+        console_output.export_run_records(str(target))
+
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("name,command,return_code,duration,user_cpu")
+        assert lines[1] == "cmd1,echo 1,0,0.5,0.1,0.0,2048,1,2,0"
+        assert lines[2] == "cmd2,echo 2,1,0.2,,,,,,0"
+
+    def test_on_command_cancelled_reports_state(self, console_output):
+        """Teste l'affichage de l'état final d'une commande annulée."""
+        console_output._on_command_cancelled("terminated")
+        console_output._on_command_cancelled("killed")
+
+        text = console_output.text_edit_console.toPlainText()
+        assert "[STOP] Processus arrêté" in text
+        assert "processus tué" in text
+
     def test_on_execution_stopped_with_error(self, console_output):
         """Teste que _on_execution_stopped_with_error émet le signal."""
         commands = [
@@ -157,6 +257,575 @@ class TestConsoleOutputErrorHandling:
         assert "TOUTES LES COMMANDES TERMINÉES" in console_text
 
 
+class TestConsoleOutputIncrementalExecution:
+    """Tests pour l'exécution incrémentale (commandes à jour ignorées)."""
+
+    @pytest.fixture
+    def store(self):
+        """Stockage d'état en mémoire utilisé par la console."""
+        from command_builder.services.build_state import BuildStateStore
+
+        store = BuildStateStore()
+        with patch(
+            "command_builder.components.console_output.console_output."
+            "get_build_state_store",
+            return_value=store,
+        ):
+            yield store
+
+    @pytest.fixture
+    def commands(self, tmp_path):
+        """Deux commandes dont la première déclare une sortie existante."""
+        output = tmp_path / "out.txt"
+        output.write_text("data", encoding="utf-8")
+        return [
+            {
+                "name": "cmd1",
+                "command": "build 1",
+                "inputs": [],
+                "outputs": [str(output)],
+            },
+            {"name": "cmd2", "command": "build 2"},
+        ]
+
+    def test_up_to_date_command_is_skipped(self, console_output, store, commands):
+        store.record_success("build 1", [], commands[0]["outputs"])
+
+        with (
+            patch.object(
+                console_output.executor_service, "execute_command"
+            ) as mock_execute,
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            # La vérification se fait hors du thread de l'interface
+            assert console_output._build_state_job is not None
+            assert wait_until(lambda: mock_execute.called)
+
+        # Seule la seconde commande est lancée
+        assert mock_execute.call_args[0][0] == "build 2"
+        assert console_output.current_command_index == 1
+        assert "[SKIP]" in console_output.text_edit_console.toPlainText()
+        assert console_output.run_records[0].skipped
+
+    def test_force_runs_up_to_date_command(self, console_output, store, commands):
+        store.record_success("build 1", [], commands[0]["outputs"])
+        console_output.checkbox_force.setChecked(True)
+
+        with (
+            patch.object(
+                console_output.executor_service, "execute_command"
+            ) as mock_execute,
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+
+        assert mock_execute.call_args[0][0] == "build 1"
+        assert "[SKIP]" not in console_output.text_edit_console.toPlainText()
+
+    def test_success_records_build_state(self, console_output, store, commands):
+        console_output.commands_queue = commands
+        console_output.current_command_index = 0
+        console_output.command_start_time = __import__("datetime").datetime.now()
+
+        with patch.object(
+            console_output.executor_service, "execute_command"
+        ) as mock_execute:
+            console_output._on_single_command_finished(0)
+            assert wait_until(lambda: mock_execute.called)
+
+        assert store.is_up_to_date("build 1", [], commands[0]["outputs"])
+        assert mock_execute.call_args[0][0] == "build 2"
+
+    def test_stop_during_check_runs_nothing(self, console_output, store, commands):
+        store.record_success("build 1", [], commands[0]["outputs"])
+
+        with (
+            patch.object(
+                console_output.executor_service, "execute_command"
+            ) as mock_execute,
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_stop_clicked()
+            assert wait_until(lambda: not console_output.is_executing())
+
+        mock_execute.assert_not_called()
+        assert "ARRÊTÉE PAR L'UTILISATEUR" in (
+            console_output.text_edit_console.toPlainText()
+        )
+
+    def test_all_commands_skipped(self, console_output, store, commands):
+        store.record_success("build 1", [], commands[0]["outputs"])
+
+        with (
+            patch.object(console_output, "_cleanup_orphan_processes"),
+            patch.object(console_output, "_on_all_commands_finished") as mock_done,
+        ):
+            console_output.execute_commands(commands[:1])
+            assert wait_until(lambda: mock_done.called)
+
+        mock_done.assert_called_once()
+
+
+class TestConsoleOutputResume:
+    """Tests pour les points de reprise et la reprise d'une séquence."""
+
+    @pytest.fixture
+    def store(self):
+        """Stockage des points de reprise en mémoire utilisé par la console."""
+        from command_builder.services.run_checkpoint import RunCheckpointStore
+
+        store = RunCheckpointStore()
+        with patch(
+            "command_builder.components.console_output.console_output."
+            "get_run_checkpoint_store",
+            return_value=store,
+        ):
+            yield store
+
+    @pytest.fixture
+    def commands(self):
+        return [
+            {"name": "cmd1", "command": "echo 1"},
+            {"name": "cmd2", "command": "echo 2"},
+            {"name": "cmd3", "command": "echo 3"},
+        ]
+
+    def run_until_failure(self, console_output, commands):
+        """Exécute la séquence : la première commande réussit, la seconde échoue."""
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_single_command_finished(0)
+            console_output._on_single_command_finished(2)
+
+    def test_steps_are_checkpointed(self, console_output, store, commands):
+        self.run_until_failure(console_output, commands)
+
+        checkpoint = store.load()
+        assert checkpoint.commands == commands
+        assert checkpoint.results == [0, 2, None]
+        assert console_output.button_resume.isEnabled()
+
+    def test_resume_restarts_at_failed_step(self, console_output, store, commands):
+        self.run_until_failure(console_output, commands)
+
+        with (
+            patch.object(
+                console_output.executor_service, "execute_command"
+            ) as mock_execute,
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            assert console_output.resume_last_run()
+
+        assert mock_execute.call_args[0][0] == "echo 2"
+        assert console_output.current_command_index == 1
+        assert "Reprise à l'étape 2/3" in console_output.text_edit_console.toPlainText()
+        assert store.load().results == [0, None, None]
+
+    def test_resume_checks_inputs(self, console_output, store, tmp_path):
+        commands = [
+            {"name": "cmd1", "command": "echo 1"},
+            {
+                "name": "cmd2",
+                "command": "echo 2",
+                "inputs": [str(tmp_path / "absent.txt")],
+                "outputs": [str(tmp_path / "out.txt")],
+            },
+        ]
+        self.run_until_failure(console_output, commands)
+
+        with patch.object(
+            console_output.executor_service, "execute_command"
+        ) as mock_execute:
+            assert not console_output.resume_last_run()
+
+        mock_execute.assert_not_called()
+        assert "Entrée introuvable" in console_output.text_edit_console.toPlainText()
+
+    def test_nothing_to_resume(self, console_output, store):
+        assert not console_output.resume_last_run()
+        assert not console_output.button_resume.isEnabled()
+
+
+class TestConsoleOutputRunLog:
+    """Tests pour le journal compressé de chaque séquence."""
+
+    def test_run_output_streamed_to_log(self, console_output):
+        from command_builder.services.run_log import RunLogReader
+
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("bonjour")
+            console_output._on_single_command_finished(0)
+
+        reader = RunLogReader(console_output._run_log.log_path)
+        assert reader.commands[0].name == "cmd1"
+        assert "bonjour" in reader.command_lines(0)
+        assert "TOUTES LES COMMANDES TERMINÉES" in "\n".join(
+            reader.read_lines(0, reader.line_count)
+        )
+
+    def test_clear_drops_finished_run_log(self, console_output):
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_single_command_finished(0)
+        assert console_output._run_log_is_console
+
+        console_output.clear()
+
+        assert console_output._run_log is None
+        assert not console_output._run_log_is_console
+
+    def test_text_after_run_is_not_logged(self, console_output):
+        from command_builder.services.run_log import RunLogReader
+
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_single_command_finished(0)
+        console_output.append_text("après la séquence")
+
+        reader = RunLogReader(console_output._run_log.log_path)
+        assert "après la séquence" not in reader.read_lines(0, reader.line_count)
+        assert not console_output._run_log_is_console
+
+    def test_run_log_after_previous_text(self, console_output):
+        console_output.append_text("avant la séquence")
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+
+        assert not console_output._run_log_is_console
+
+    def test_export_copies_run_log(self, console_output, tmp_path):
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("bonjour")
+
+        # Texte affiché hors du journal : l'export lit le fichier
+        console_output.text_edit_console.clear()
+        target = tmp_path / "export.txt"
+        with patch(
+            "command_builder.components.console_output.console_output."
+            "QFileDialog.getSaveFileName",
+            return_value=(str(target), "Fichiers texte (*.txt)"),
+        ):
+            console_output.export_console()
+
+        assert wait_until(lambda: console_output._export_job is None)
+        assert "bonjour" in target.read_text(encoding="utf-8")
+
+    def _export_text(self, console_output, target):
+        """Exporte la console en texte et attend la fin de l'export."""
+        with patch(
+            "command_builder.components.console_output.console_output."
+            "QFileDialog.getSaveFileName",
+            return_value=(str(target), "Fichiers texte (*.txt)"),
+        ):
+            console_output.export_console()
+        assert wait_until(lambda: console_output._export_job is None)
+        return target.read_text(encoding="utf-8")
+
+    def test_export_after_clear_uses_console(self, console_output, tmp_path):
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("bonjour")
+            console_output._on_single_command_finished(0)
+
+        console_output.clear()
+        console_output.append_text("nouveau texte")
+        exported = self._export_text(console_output, tmp_path / "export.txt")
+
+        assert exported == "nouveau texte\n"
+
+    def test_export_after_clear_during_run(self, console_output, tmp_path):
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("effacé")
+            console_output.clear()
+            console_output._on_command_output("conservé")
+
+        exported = self._export_text(console_output, tmp_path / "export.txt")
+
+        assert "conservé" in exported
+        assert "effacé" not in exported
+
+    def test_export_includes_text_after_run(self, console_output, tmp_path):
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("bonjour")
+            console_output._on_single_command_finished(0)
+        console_output.append_text("note ajoutée")
+
+        exported = self._export_text(console_output, tmp_path / "export.txt")
+
+        assert "bonjour" in exported
+        assert exported.endswith("note ajoutée\n")
+
+    def test_export_jsonl_in_background(self, console_output, tmp_path):
+        import json
+
+        commands = [{"name": "cmd1", "command": "echo 1"}]
+        with (
+            patch.object(console_output.executor_service, "execute_command"),
+            patch.object(console_output, "_cleanup_orphan_processes"),
+        ):
+            console_output.execute_commands(commands)
+            console_output._on_command_output("bonjour")
+            console_output._on_command_error("attention")
+
+        target = tmp_path / "export"
+        with patch(
+            "command_builder.components.console_output.console_output."
+            "QFileDialog.getSaveFileName",
+            return_value=(str(target), "JSON Lines (*.jsonl)"),
+        ):
+            console_output.export_console()
+        assert console_output.button_exporter.text() == "Annuler l'export"
+
+        assert wait_until(lambda: console_output._export_job is None)
+        records = [
+            json.loads(line)
+            for line in (tmp_path / "export.jsonl").read_text("utf-8").splitlines()
+        ]
+        assert {
+            "command_index": 0,
+            "stream": "stdout",
+            "line": "bonjour",
+        }.items() <= records[-2].items()
+        assert records[-1]["stream"] == "stderr"
+        assert console_output.button_exporter.text() == "Exporter"
+        assert console_output.progress_bar_export.isHidden()
+
+    def test_export_button_cancels_export(self, console_output, tmp_path):
+        from command_builder.services.console_export import ConsoleExportJob
+
+        console_output.append_text("texte")
+        target = tmp_path / "export.txt"
+        with patch.object(ConsoleExportJob, "start"):
+            console_output.start_export(str(target), "txt")
+        job = console_output._export_job
+
+        # Un clic sur Exporter pendant l'export l'annule
+        console_output.export_console()
+        job.run()
+
+        assert console_output._export_job is None
+        assert "Exportation annulée" in console_output.text_edit_console.toPlainText()
+        assert not target.exists()
+
+    def test_open_log_viewer(self, console_output, tmp_path):
+        path = tmp_path / "console.txt"
+        path.write_text("ligne 1\nligne 2\n", encoding="utf-8")
+
+        viewer = console_output.open_log_viewer(str(path))
+        assert wait_until(lambda: not viewer.is_indexing())
+        assert viewer.text_log.toPlainText() == "ligne 1\nligne 2"
+        viewer.reject()
+
+        assert console_output.open_log_viewer(str(tmp_path / "absent.log")) is None
+        assert "Impossible d'ouvrir le journal" in (
+            console_output.text_edit_console.toPlainText()
+        )
+
+
+class TestConsoleOutputCoalescedRendering:
+    """Tests pour l'affichage groupé des sorties des commandes."""
+
+    def test_output_rendered_on_next_frame(self, console_output):
+        from PySide6.QtTest import QTest
+
+        console_output._on_command_output("ligne 1")
+        console_output._on_command_error("ligne 2")
+        assert "ligne 1" not in console_output.text_edit_console.toPlainText()
+
+        QTest.qWait(100)
+        text = console_output.text_edit_console.toPlainText()
+        assert "ligne 1\n[ERR] ligne 2" in text
+
+    def test_multiline_error_tags_every_line(self, console_output):
+        from command_builder.services.console_search import TAG_ERR
+
+        console_output._on_command_error("première\r\nseconde\ntroisième")
+        console_output.flush_output()
+
+        lines = list(console_output.console_view.buffer.iter_lines())
+        assert lines[-3:] == ["[ERR] première", "[ERR] seconde", "[ERR] troisième"]
+        assert list(console_output.search_index.tags[-3:]) == [TAG_ERR] * 3
+
+    def test_append_text_keeps_order(self, console_output):
+        console_output._on_command_output("sortie")
+        console_output.append_text("fin")
+
+        assert console_output.text_edit_console.toPlainText().endswith("sortie\nfin")
+
+    def test_clear_drops_pending_output(self, console_output):
+        console_output._on_command_output("sortie")
+        console_output.clear()
+        console_output.flush_output()
+
+        assert console_output.text_edit_console.toPlainText() == ""
+
+
+def wait_until(condition, timeout_ms=5000):
+    """Traite les événements Qt jusqu'à ce que condition() soit vraie."""
+    from PySide6.QtTest import QTest
+
+    for _ in range(timeout_ms // 10):
+        if condition():
+            return True
+        QTest.qWait(10)
+    return condition()
+
+
+def last_line_colors(console_output):
+    """Retourne les couleurs appliquées à la dernière ligne de la console."""
+    block = console_output.text_edit_console.document().lastBlock()
+    return [r.format.foreground().color().name() for r in block.layout().formats()]
+
+
+class TestConsoleOutputAnsiColors:
+    """Tests pour l'affichage des codes couleur ANSI."""
+
+    def test_colors_rendered_and_text_stored(self, console_output):
+        console_output._on_command_output("début")
+        console_output._on_command_output("\x1b[32mOK\x1b[0m test")
+        console_output.flush_output()
+
+        assert console_output.text_edit_console.toPlainText().endswith("début\nOK test")
+        assert "\x1b" not in "".join(console_output.console_view.buffer.iter_lines())
+        # Les styles des lignes visibles sont appliqués au prochain affichage
+        assert wait_until(lambda: last_line_colors(console_output) == ["#0dbc79"])
+
+    def test_color_state_kept_between_lines(self, console_output):
+        console_output._on_command_output("\x1b[31mrouge")
+        console_output._on_command_output("toujours rouge\x1b[0m")
+        console_output.flush_output()
+
+        console_output.console_view.apply_visible_styles()
+
+        document = console_output.text_edit_console.document()
+        assert document.lastBlock().text() == "toujours rouge"
+        assert last_line_colors(console_output) == ["#cd3131"]
+
+    def test_colors_reset_for_each_command(self, console_output):
+        console_output._on_command_output("\x1b[31mrouge")
+        console_output.commands_queue = [{"name": "cmd", "command": "echo"}]
+        console_output._append_command_header(console_output.commands_queue[0])
+
+        from command_builder.services.ansi_parser import DEFAULT_STYLE
+
+        assert console_output.ansi_parser.style == DEFAULT_STYLE
+
+
+class TestConsoleOutputSearch:
+    """Tests pour la barre de recherche de la console."""
+
+    @staticmethod
+    def search(console_output, text, regex=False, tag_index=0):
+        controller = console_output.search_controller
+        console_output.checkbox_regex.setChecked(regex)
+        console_output.combo_search_tag.setCurrentIndex(tag_index)
+        console_output.line_edit_search.setText(text)
+        controller._on_query_changed()
+        assert wait_until(lambda: not controller.is_running(), 5000)
+        return controller
+
+    def test_matches_are_counted_and_first_is_selected(self, console_output):
+        console_output.append_text("[CMD] make\nCompilation")
+        console_output._on_command_output("make: ok")
+        console_output.flush_output()
+
+        controller = self.search(console_output, "make")
+        assert controller.matches == [0, 2]
+        assert console_output.label_search_count.text() == "1/2"
+        assert console_output.text_edit_console.textCursor().selectedText() == (
+            "[CMD] make"
+        )
+
+    def test_next_and_previous_wrap(self, console_output):
+        console_output.append_text("a\nb\na")
+        controller = self.search(console_output, "a")
+
+        console_output.button_search_next.click()
+        assert controller.current == 1
+        console_output.button_search_next.click()
+        assert controller.current == 0
+        console_output.button_search_previous.click()
+        assert console_output.label_search_count.text() == "2/2"
+
+    def test_tag_filter(self, console_output):
+        console_output.append_text("[CMD] make")
+        console_output._on_command_error("make: erreur")
+        console_output.flush_output()
+
+        controller = self.search(console_output, "make", tag_index=2)
+        assert controller.matches == [1]
+
+    def test_new_lines_extend_results(self, console_output):
+        console_output.append_text("erreur 1")
+        controller = self.search(console_output, "erreur")
+        console_output.append_text("ok\nerreur 2")
+
+        assert wait_until(lambda: len(controller.matches) == 2, 5000)
+        assert controller.matches == [0, 2]
+
+    def test_invalid_regex(self, console_output):
+        console_output.append_text("texte")
+        self.search(console_output, "(", regex=True)
+
+        assert console_output.label_search_count.text() == "Expression invalide"
+        assert console_output.line_edit_search.property("invalid") is True
+
+    def test_no_result(self, console_output):
+        console_output.append_text("texte")
+        self.search(console_output, "absent")
+
+        assert console_output.label_search_count.text() == "Aucun résultat"
+
+    def test_clear_resets_results(self, console_output):
+        console_output.append_text("texte")
+        controller = self.search(console_output, "texte")
+        console_output.clear()
+
+        assert controller.matches == []
+        assert len(console_output.search_index) == 0
+
+
 class TestConsoleOutputAppendMethods:
     """Tests pour les méthodes d'ajout de texte."""
 
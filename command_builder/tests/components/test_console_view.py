@@ -0,0 +1,272 @@
+"""
+Tests pour l'affichage virtualisé de la console.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+
+from command_builder.components.console_output.console_view import (
+    PAGE_LINES,
+    ConsoleView,
+    style_format,
+)
+from command_builder.services.console_buffer import ConsoleBuffer
+
+LIMIT = 2 * PAGE_LINES
+
+
+@pytest.fixture
+def qapp():
+    """Fixture pour l'application Qt."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def view(qapp):
+    """ConsoleView limitée à LIMIT lignes affichées."""
+    text_edit = QPlainTextEdit()
+    text_edit.resize(400, 300)
+    text_edit.show()
+    return ConsoleView(text_edit, ConsoleBuffer(memory_lines=100), LIMIT)
+
+
+def displayed_lines(view):
+    """Retourne les lignes présentes dans la zone de texte."""
+    return view.text_edit.toPlainText().split("\n")
+
+
+def block_colors(view, number):
+    """Retourne les styles appliqués à une ligne : (début, longueur, couleur)."""
+    block = view.text_edit.document().findBlockByNumber(number)
+    return [
+        (r.start, r.length, r.format.foreground().color().name())
+        for r in block.layout().formats()
+    ]
+
+
+def fill(view, count):
+    """Ajoute count lignes numérotées par paquets."""
+    for start in range(0, count, 500):
+        view.append_lines([f"ligne {i}" for i in range(start, min(start + 500, count))])
+
+
+class TestConsoleView:
+    """Tests de la ConsoleView."""
+
+    def test_lines_displayed_below_limit(self, view):
+        fill(view, 10)
+        assert displayed_lines(view) == [f"ligne {i}" for i in range(10)]
+        assert view.is_live()
+
+    def test_document_is_bounded(self, view):
+        fill(view, 5 * LIMIT)
+
+        assert view.text_edit.document().blockCount() == LIMIT
+        assert view.window_start == 4 * LIMIT
+        assert displayed_lines(view)[-1] == f"ligne {5 * LIMIT - 1}"
+
+    def test_scrolling_to_top_pages_in_older_lines(self, view):
+        fill(view, 5 * LIMIT)
+        window_start = view.window_start
+
+        view.text_edit.verticalScrollBar().setValue(0)
+
+        assert view.window_start == window_start - PAGE_LINES
+        assert displayed_lines(view)[0] == f"ligne {view.window_start}"
+        assert view.text_edit.document().blockCount() == LIMIT
+        assert not view.is_live()
+
+    def test_new_lines_stored_while_reading_history(self, view):
+        fill(view, 5 * LIMIT)
+        view.text_edit.verticalScrollBar().setValue(0)
+        displayed = displayed_lines(view)
+
+        view.append_lines(["nouvelle"])
+
+        assert displayed_lines(view) == displayed
+        assert view.buffer.get_lines(5 * LIMIT, 1) == ["nouvelle"]
+
+    def test_scrolling_down_returns_to_live(self, view):
+        fill(view, 5 * LIMIT)
+        scroll_bar = view.text_edit.verticalScrollBar()
+        scroll_bar.setValue(0)
+        view.append_lines(["nouvelle"])
+
+        while not view.is_live():
+            scroll_bar.setValue(scroll_bar.maximum())
+
+        assert displayed_lines(view)[-1] == "nouvelle"
+
+    def test_clear(self, view):
+        fill(view, 100)
+        view.clear()
+        assert view.text_edit.toPlainText() == ""
+        assert len(view.buffer) == 0
+        assert view.window_count == 0
+
+    def test_follows_output_at_bottom(self, view):
+        fill(view, 500)
+        view.scroll_to_end()
+        view.append_lines([f"suite {i}" for i in range(200)])
+        view.scroll_to_end()
+
+        scroll_bar = view.text_edit.verticalScrollBar()
+        assert view.follow_output
+        assert scroll_bar.value() == scroll_bar.maximum()
+
+    def test_scrolling_up_stops_following(self, view):
+        fill(view, 500)
+        scroll_bar = view.text_edit.verticalScrollBar()
+        scroll_bar.setValue(100)
+
+        view.append_lines([f"suite {i}" for i in range(200)])
+        view.scroll_to_end()
+
+        assert not view.follow_output
+        assert scroll_bar.value() == 100
+
+        # Revenir en bas réactive le suivi
+        scroll_bar.setValue(scroll_bar.maximum())
+        assert view.follow_output
+
+    def test_view_kept_in_place_when_top_is_trimmed(self, view):
+        fill(view, LIMIT)
+        scroll_bar = view.text_edit.verticalScrollBar()
+        scroll_bar.setValue(1500)
+        first_visible = view.window_start + scroll_bar.value()
+
+        view.append_lines([f"suite {i}" for i in range(300)])
+
+        assert view.window_start + scroll_bar.value() == first_visible
+
+    def test_show_line_in_window(self, view):
+        fill(view, 500)
+        view.show_line(42)
+
+        assert view.text_edit.textCursor().selectedText() == "ligne 42"
+        assert not view.follow_output
+
+    def test_show_line_reloads_window(self, view):
+        fill(view, 3 * LIMIT)
+        view.show_line(10)
+
+        assert view.window_start == 0
+        assert view.text_edit.textCursor().selectedText() == "ligne 10"
+        assert not view.is_live()
+
+    def test_colored_lines(self, view):
+        from command_builder.services.ansi_parser import DEFAULT_STYLE, AnsiParser
+
+        view.append_lines(["avant"])
+        runs = AnsiParser().feed("\x1b[31mrouge\x1b[0m <b>\nsuite")
+        view.append_lines(["rouge <b>", "suite"], runs)
+        view.append_lines(["après"])
+        view.apply_visible_styles()
+
+        assert displayed_lines(view) == ["avant", "rouge <b>", "suite", "après"]
+        assert view.buffer.get_lines(0, 4) == displayed_lines(view)
+        assert block_colors(view, 1) == [(0, 5, "#cd3131")]
+        # Les lignes suivantes ne reprennent pas la couleur
+        assert block_colors(view, 2) == []
+        assert block_colors(view, 3) == []
+        assert runs[-1][1] == DEFAULT_STYLE
+
+    def test_styles_applied_when_lines_become_visible(self, view):
+        from command_builder.services.ansi_parser import AnsiParser
+
+        lines = [f"ligne {i}" for i in range(500)]
+        runs = AnsiParser().feed("\n".join(f"\x1b[32m{line}\x1b[0m" for line in lines))
+        view.append_lines(lines, runs)
+        view.apply_visible_styles()
+
+        # Seules les lignes visibles (la fin) ont reçu leurs styles
+        assert block_colors(view, 0) == []
+        assert block_colors(view, 499) == [(0, 9, "#0dbc79")]
+
+        view.text_edit.verticalScrollBar().setValue(0)
+        QApplication.processEvents()
+        assert block_colors(view, 0) == [(0, 7, "#0dbc79")]
+
+    def test_styles_follow_trimmed_window(self, view):
+        from command_builder.services.ansi_parser import AnsiParser
+
+        parser = AnsiParser()
+        for start in range(0, 3 * LIMIT, 500):
+            text = "\n".join(
+                f"ligne {i} \x1b[31mrouge\x1b[0m" for i in range(start, start + 500)
+            )
+            runs = parser.feed(text)
+            view.append_lines("".join(text for text, _ in runs).split("\n"), runs)
+        view.apply_visible_styles()
+
+        last = view.window_count - 1
+        assert view.text_edit.document().findBlockByNumber(last).text() == (
+            f"ligne {3 * LIMIT - 1} rouge"
+        )
+        assert block_colors(view, last) == [(11, 5, "#cd3131")]
+        # Seuls les segments des lignes de la fenêtre sont gardés
+        assert view._styled[0].end_line > view.window_start
+
+    def test_reloaded_lines_are_plain(self, view):
+        from command_builder.services.ansi_parser import AnsiParser
+
+        parser = AnsiParser()
+        for start in range(0, 3 * LIMIT, 500):
+            lines = [f"ligne {i}" for i in range(start, start + 500)]
+            view.append_lines(lines, parser.feed("\x1b[31m" + "\n".join(lines)))
+        view.show_line(10)
+        view.apply_visible_styles()
+
+        # Les segments des lignes sorties de la fenêtre ont été oubliés
+        assert view._styled == []
+        assert block_colors(view, 10) == []
+
+    def test_reloaded_lines_of_window_keep_styles(self, view):
+        from command_builder.services.ansi_parser import AnsiParser
+
+        lines = [f"ligne {i}" for i in range(3 * LIMIT)]
+        view.append_lines(lines, AnsiParser().feed("\x1b[31m" + "\n".join(lines)))
+        view.apply_visible_styles()
+        view.show_line(10)
+        view.apply_visible_styles()
+
+        # L'ajout couvre encore la fenêtre rechargée : ses styles s'appliquent
+        assert view.window_start == 0
+        assert block_colors(view, 10) == [(0, 8, "#cd3131")]
+
+    def test_clear_drops_styles(self, view):
+        from command_builder.services.ansi_parser import AnsiParser
+
+        view.append_lines(["rouge"], AnsiParser().feed("\x1b[31mrouge"))
+        view.clear()
+
+        assert view._styled == []
+
+
+class TestStyleFormat:
+    """Tests de la conversion des styles ANSI en formats Qt."""
+
+    def test_attributes(self):
+        from PySide6.QtGui import QFont
+
+        from command_builder.services.ansi_parser import DEFAULT_STYLE, apply_sgr
+
+        char_format = style_format(apply_sgr(DEFAULT_STYLE, "1;3;4;9;31;44"))
+        assert char_format.foreground().color().name() == "#cd3131"
+        assert char_format.background().color().name() == "#2472c8"
+        assert char_format.fontWeight() == QFont.Weight.Bold
+        assert char_format.fontItalic()
+        assert char_format.fontUnderline()
+        assert char_format.fontStrikeOut()
+
+    def test_inverse_uses_console_colors(self):
+        from command_builder.services.ansi_parser import (
+            DEFAULT_BACKGROUND,
+            DEFAULT_FOREGROUND,
+            DEFAULT_STYLE,
+            apply_sgr,
+        )
+
+        char_format = style_format(apply_sgr(DEFAULT_STYLE, "7"))
+        assert char_format.foreground().color().name() == DEFAULT_BACKGROUND
+        assert char_format.background().color().name() == DEFAULT_FOREGROUND
@@ -0,0 +1,105 @@
+"""
+Tests pour le panneau des erreurs YAML.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from command_builder.components.error_display import ErrorDisplay, ErrorsPanel
+from command_builder.components.error_display.error_list_model import (
+    COUNT_ROLE,
+    ErrorListModel,
+    error_title,
+    group_errors,
+)
+from command_builder.models.yaml_error import YamlError
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def make_errors():
+    """Trois erreurs dans deux fichiers."""
+    return [
+        YamlError("a.yaml", "SyntaxError", "Indentation invalide", line_number=3),
+        YamlError("b.yaml", "ValidationError", "Champ 'name' manquant"),
+        YamlError(
+            "a.yaml", "SyntaxError", "Deux-points manquant", 8, suggestion="Ajoutez ':'"
+        ),
+    ]
+
+
+class TestErrorListModel:
+    """Tests du modèle groupé des erreurs."""
+
+    def test_group_errors_keeps_order(self):
+        groups = group_errors(make_errors())
+
+        assert list(groups) == ["a.yaml", "b.yaml"]
+        assert [e.line_number for e in groups["a.yaml"]["SyntaxError"]] == [3, 8]
+
+    def test_tree_with_counts(self, qapp):
+        model = ErrorListModel(make_errors())
+
+        file_index = model.index(0, 0)
+        type_index = model.index(0, 0, file_index)
+        assert model.rowCount() == 2
+        assert file_index.data() == "📄 a.yaml  (2)"
+        assert type_index.data(COUNT_ROLE) == 2
+        assert model.error_at(type_index) is None
+        assert model.error_at(model.index(1, 0, type_index)).line_number == 8
+
+    def test_counts_by_type(self, qapp):
+        model = ErrorListModel(make_errors())
+        assert model.counts_by_type() == {"SyntaxError": 2, "ValidationError": 1}
+
+    def test_error_title(self):
+        assert error_title(make_errors()[0]) == "SyntaxError (ligne 3)"
+        assert error_title(make_errors()[1]) == "ValidationError"
+
+
+class TestErrorsPanel:
+    """Tests du panneau ErrorsPanel."""
+
+    def test_counts_shown_up_front(self, qapp):
+        panel = ErrorsPanel(make_errors())
+
+        title = panel.title_label.text()
+        assert title == "⚠️ 3 erreur(s) détectée(s) dans 2 fichier(s)"
+        assert panel.summary_label.text() == "SyntaxError : 2 · ValidationError : 1"
+        assert isinstance(panel.detail_display, ErrorDisplay)
+        assert not panel.detail_display.isVisibleTo(panel)
+
+    def test_selecting_error_shows_details(self, qapp):
+        errors = make_errors()
+        panel = ErrorsPanel(errors)
+
+        panel.select_error(errors[2])
+
+        assert panel.selected_error() is errors[2]
+        assert panel.detail_display.isVisibleTo(panel)
+        assert panel.detail_display.suggestionLabel.text() == "💡 Ajoutez ':'"
+
+    def test_few_errors_fully_expanded(self, qapp):
+        panel = ErrorsPanel(make_errors())
+        type_index = panel.model.index(0, 0, panel.model.index(0, 0))
+        assert panel.tree_view.isExpanded(type_index)
+
+    def test_many_errors_show_groups_only(self, qapp):
+        errors = [YamlError("a.yaml", "SyntaxError", f"Erreur {i}") for i in range(50)]
+        panel = ErrorsPanel(errors)
+
+        file_index = panel.model.index(0, 0)
+        assert panel.tree_view.isExpanded(file_index)
+        assert not panel.tree_view.isExpanded(panel.model.index(0, 0, file_index))
+
+    def test_empty(self, qapp):
+        panel = ErrorsPanel([])
+        assert panel.model.rowCount() == 0
+        assert panel.selected_error() is None
@@ -378,3 +378,29 @@ class TestHelpWindowMarkdownConverter:
         assert "File 2" in result2
         assert "File 2" not in result1
         assert "File 1" not in result2
+
+
+class TestHelpWindowLazyTabs:
+    """Tests du remplissage des onglets à leur première apparition."""
+
+    def test_only_current_tab_populated(self, qapp):
+        """Seul l'onglet affiché est rempli à l'ouverture."""
+        window = HelpWindow()
+
+        assert window.intro_text.toPlainText()
+        assert not window.examples_text.toPlainText()
+
+    def test_tab_populated_when_shown(self, qapp):
+        """Un onglet est rempli lorsqu'il est affiché, une seule fois."""
+        window = HelpWindow()
+        index = window.tab_widget.indexOf(window.examples_text.parentWidget())
+
+        with patch.object(
+            window, "_load_markdown_file", wraps=window._load_markdown_file
+        ) as load:
+            window.tab_widget.setCurrentIndex(index)
+            window.tab_widget.setCurrentIndex(0)
+            window.tab_widget.setCurrentIndex(index)
+
+        load.assert_called_once_with("examples.md")
+        assert window.examples_text.toPlainText()
@@ -0,0 +1,77 @@
+"""
+Tests pour la fenêtre de consultation des journaux archivés.
+"""
+
+import pytest
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from command_builder.components.log_viewer import LogViewer
+from command_builder.services.log_file import COMMAND_SEPARATOR
+from command_builder.services.run_log import RunLogWriter
+
+SEPARATOR = COMMAND_SEPARATOR.decode()
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def wait_until(condition, timeout_ms=5000):
+    """Traite les événements Qt jusqu'à ce que condition() soit vraie."""
+    for _ in range(timeout_ms // 10):
+        if condition():
+            return True
+        QTest.qWait(10)
+    return condition()
+
+
+@pytest.fixture
+def text_log(tmp_path):
+    """Journal texte de deux commandes."""
+    lines = ["Début"]
+    for i, name in enumerate(["build", "test"], 1):
+        lines += [SEPARATOR, f"[{i}/2] {name}", SEPARATOR]
+        lines += [f"{name} {n}" for n in range(3000)]
+    path = tmp_path / "console.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestLogViewer:
+    """Tests du LogViewer."""
+
+    def test_text_log_indexed_in_background(self, qapp, text_log):
+        viewer = LogViewer(str(text_log))
+        assert wait_until(lambda: not viewer.is_indexing())
+
+        assert len(viewer.log_file) == 6007
+        assert viewer.combo_commands.count() == 2
+        assert viewer.label_status.text() == "6007 lignes, 2 commandes"
+        assert viewer.text_log.toPlainText().startswith("Début\n" + SEPARATOR)
+
+        viewer.show_command(1)
+        assert viewer.text_log.textCursor().selectedText() == "[2/2] test"
+        viewer.reject()
+        assert viewer.log_file is None
+
+    def test_compressed_log(self, qapp, tmp_path):
+        writer = RunLogWriter(tmp_path / "run.log.gz")
+        writer.begin_command("cmd1")
+        writer.write_line("sortie", output=True)
+        writer.close()
+
+        viewer = LogViewer(str(writer.log_path))
+        assert not viewer.is_indexing()
+        assert viewer.text_log.toPlainText() == "sortie"
+        assert viewer.combo_commands.itemText(0) == "1. cmd1"
+        viewer.reject()
+
+    def test_missing_file(self, qapp, tmp_path):
+        with pytest.raises(OSError):
+            LogViewer(str(tmp_path / "absent.log"))
@@ -173,5 +173,6 @@ class TestElapsedTimer:
     def test_on_command_output_appends_text(self, console_output):
         """Vérifie que _on_command_output ajoute le texte à la console."""
         console_output._on_command_output("test output")
+        console_output.flush_output()
 
         assert "test output" in console_output.text_edit_console.toPlainText()
@@ -135,4 +135,5 @@ class TestCommandExecutorServiceStop:
         service.request_stop()
 
         mock_executor.cancel.assert_called_once()
-        mock_executor.wait.assert_called_once()
+        # L'annulation ne bloque pas l'interface
+        mock_executor.wait.assert_not_called()
@@ -0,0 +1,147 @@
+"""
+Tests pour la feuille de style unique de l'application.
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QLabel
+
+from command_builder.components import stylesheet
+from command_builder.components.stylesheet import (
+    COMPONENT_STYLESHEETS,
+    COMPONENTS_DIR,
+    VALIDATION_ERROR_MARK,
+    application_stylesheet,
+    apply_application_stylesheet,
+    scope_stylesheet,
+    set_default_value_style,
+    set_validation_style,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class TestScopeStylesheet:
+    """Tests de scope_stylesheet."""
+
+    def test_descendant_selectors_prefixed(self):
+        scoped = scope_stylesheet(
+            "/* Commentaire */\nQLabel#title { color: red; }",
+            "LogViewer",
+            "QDialog",
+        )
+        assert scoped == "LogViewer QLabel#title { color: red; }"
+
+    def test_selector_matching_component_itself(self):
+        scoped = scope_stylesheet(
+            "QDialog, #CommandForm:hover { color: red; }", "LogViewer", "QDialog"
+        )
+        selectors = scoped.split("{")[0].split(",")
+        assert [s.strip() for s in selectors] == [
+            "LogViewer QDialog",
+            "LogViewer",
+            "LogViewer #CommandForm:hover",
+            "LogViewer#CommandForm:hover",
+        ]
+
+    def test_component_selectors_kept(self):
+        scoped = scope_stylesheet(
+            "ErrorDisplay QLabel { color: red; }", "ErrorsPanel", "QWidget"
+        )
+        assert scoped == "ErrorDisplay QLabel { color: red; }"
+
+
+class TestApplicationStylesheet:
+    """Tests de la feuille fusionnée."""
+
+    def test_all_component_files_exist(self):
+        for _, _, qss_path in COMPONENT_STYLESHEETS:
+            assert (COMPONENTS_DIR / qss_path).exists()
+
+    def test_files_read_once(self, monkeypatch):
+        monkeypatch.setattr(stylesheet, "_stylesheet", None)
+        merged = application_stylesheet()
+        assert "QToolTip" in merged
+        assert "ArgumentComponent QLineEdit#argumentLineEdit" in merged
+
+        monkeypatch.setattr(stylesheet, "COMPONENTS_DIR", COMPONENTS_DIR / "absent")
+        assert application_stylesheet() is merged
+
+    def test_apply_sets_application_stylesheet_once(self, qapp, monkeypatch):
+        calls = []
+        monkeypatch.setattr(qapp, "setStyleSheet", calls.append)
+        monkeypatch.setattr(qapp, "styleSheet", lambda: "")
+        apply_application_stylesheet(qapp)
+        assert calls == [application_stylesheet()]
+
+        monkeypatch.setattr(qapp, "styleSheet", lambda: calls[0])
+        apply_application_stylesheet(qapp)
+        assert len(calls) == 1
+
+
+class TestDefaultValueStyle:
+    """Tests de set_default_value_style."""
+
+    def test_highlight_and_restore(self, qapp):
+        label = QLabel("Fichier <source> :")
+
+        set_default_value_style(label, True)
+        assert label.property("hasDefault") is True
+        assert "&lt;source&gt;" in label.text()
+        assert label.text().startswith("<span")
+
+        set_default_value_style(label, False)
+        assert label.text() == "Fichier <source> :"
+
+    def test_rich_text_kept(self, qapp):
+        label = QLabel('Base :  <span style="color: #e74c3c;"> *</span>')
+        label.setTextFormat(Qt.TextFormat.RichText)
+
+        set_default_value_style(label, True)
+        assert '<span style="color: #e74c3c;"> *</span></span>' in label.text()
+
+    def test_unchanged_state_is_noop(self, qapp):
+        label = QLabel("Argument :")
+        set_default_value_style(label, True)
+        highlighted = label.text()
+
+        label.setText("modifié ailleurs")
+        set_default_value_style(label, True)
+        assert label.text() == "modifié ailleurs"
+
+        set_default_value_style(label, False)
+        assert label.text() == "Argument :"
+        assert highlighted != "Argument :"
+
+
+class TestValidationStyle:
+    """Tests de set_validation_style."""
+
+    def test_error_marked_and_cleared(self, qapp):
+        label = QLabel("Source :")
+
+        set_validation_style(label, "Fichier introuvable")
+        assert VALIDATION_ERROR_MARK in label.text()
+        assert label.toolTip() == "Fichier introuvable"
+
+        set_validation_style(label, None)
+        assert label.text() == "Source :"
+        assert label.toolTip() == ""
+
+    def test_combined_with_default_style(self, qapp):
+        label = QLabel("Source :")
+        set_default_value_style(label, True)
+        set_validation_style(label, "Fichier introuvable")
+        assert VALIDATION_ERROR_MARK in label.text()
+        assert "rgb(76, 175, 80)" in label.text()
+
+        set_default_value_style(label, False)
+        assert VALIDATION_ERROR_MARK in label.text()
+        assert "rgb(76, 175, 80)" not in label.text()
@@ -0,0 +1,88 @@
+"""
+Tests pour le chargement des fichiers .ui précompilés.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QApplication, QLineEdit
+
+from command_builder.components import ui_loader
+from command_builder.components.ui_loader import (
+    compile_ui,
+    compiled_path_for,
+    load_ui,
+    ui_source_hash,
+)
+
+ARGUMENT_UI = (
+    Path(ui_loader.__file__).parent / "argument_component" / "argument_component.ui"
+)
+
+requires_uic = pytest.mark.skipif(
+    shutil.which("pyside6-uic") is None, reason="pyside6-uic non disponible"
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def ui_package(tmp_path, monkeypatch):
+    """Paquet temporaire contenant une copie de argument_component.ui."""
+    package = f"uipkg_{tmp_path.name}"
+    package_dir = tmp_path / package
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    shutil.copy(ARGUMENT_UI, package_dir)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(ui_loader, "_setup_classes", {})
+    return package, package_dir / ARGUMENT_UI.name
+
+
+class TestLoadUi:
+    """Tests de load_ui."""
+
+    @requires_uic
+    def test_compiled_module_used(self, qapp, ui_package):
+        package, ui_file = ui_package
+        compiled = compile_ui(ui_file)
+        assert compiled == compiled_path_for(ui_file)
+        assert f'UI_SOURCE_SHA256 = "{ui_source_hash(ui_file)}"' in (
+            compiled.read_text("utf-8")
+        )
+
+        widget = load_ui(ui_file, None, package)
+
+        assert ui_loader._setup_classes[ui_file] is not None
+        assert widget.objectName() == "ArgumentComponent"
+        assert widget.findChild(QLineEdit, "argumentLineEdit") is not None
+
+    @requires_uic
+    def test_stale_module_falls_back(self, qapp, ui_package):
+        package, ui_file = ui_package
+        compile_ui(ui_file)
+        ui_file.write_text(
+            ui_file.read_text("utf-8").replace("Parcourir...", "Choisir..."),
+            encoding="utf-8",
+        )
+
+        widget = load_ui(ui_file, None, package)
+
+        assert ui_loader._setup_classes[ui_file] is None
+        assert widget.findChild(QLineEdit, "argumentLineEdit") is not None
+
+    def test_missing_module_falls_back(self, qapp, ui_package):
+        package, ui_file = ui_package
+
+        widget = load_ui(ui_file, None, package)
+
+        assert ui_loader._setup_classes[ui_file] is None
+        assert widget.findChild(QLineEdit, "argumentLineEdit") is not None
@@ -3,9 +3,47 @@ Fixtures partagées pour les tests de CommandBuilder.
 """
 
 import json
+import os
 
 import pytest
 
+from command_builder.services.app_paths import DATA_DIR_ENV_VAR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_data_dir(tmp_path_factory):
+    """Redirige les données de l'application vers un répertoire temporaire."""
+    data_dir = tmp_path_factory.mktemp("app_data")
+    previous = os.environ.get(DATA_DIR_ENV_VAR)
+    os.environ[DATA_DIR_ENV_VAR] = str(data_dir)
+    yield data_dir
+    if previous is None:
+        os.environ.pop(DATA_DIR_ENV_VAR, None)
+    else:
+        os.environ[DATA_DIR_ENV_VAR] = previous
+
+
+@pytest.fixture
+def wait_executor():
+    """
+    Attend la fin d'un job d'exécution puis délivre ses signaux.
+
+    Les signaux d'un job sont traités par la boucle d'événements Qt, que les
+    tests ne font pas tourner : seuls ceux du job attendu sont délivrés.
+    """
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from PySide6.QtWidgets import QApplication
+
+    if QCoreApplication.instance() is None:
+        QApplication([])
+
+    def wait(executor, msecs=None):
+        finished = executor.wait(msecs)
+        QCoreApplication.sendPostedEvents(executor, QEvent.Type.MetaCall)
+        return finished
+
+    return wait
+
 
 @pytest.fixture
 def sample_command_json():
@@ -101,6 +101,17 @@ class TestSharedArgumentsBasicFlow:
         # La valeur par défaut de la commande devrait être préservée
         assert import_cmd.get_argument_by_code("db_path").default == ""
 
+    def test_apply_shared_arguments_selected_codes(self, task_with_shared_arguments):
+        """Test que seuls les arguments de tâche demandés sont appliqués."""
+        task = task_with_shared_arguments
+
+        shared_values = {"DATABASE_FILE": "data.db", "OUTPUT_DIR": "./results"}
+        task.apply_shared_arguments(shared_values, codes={"DATABASE_FILE"})
+
+        import_cmd = task.commands[0]
+        assert import_cmd.get_argument_by_code("db_path").default == "data.db"
+        assert import_cmd.get_argument_by_code("output").default != "./results"
+
     def test_apply_shared_arguments_uses_task_defaults(
         self, task_with_shared_arguments
     ):
@@ -1,6 +1,7 @@
 """Tests unitaires pour la validation des arguments (types, formats, etc.)."""
 
 import pytest
+from pydantic import ValidationError
 
 from command_builder.models.arguments import Argument
 from command_builder.models.command import Command
@@ -292,6 +293,17 @@ class TestArgumentValidationEdgeCases:
         is_valid, error = WithArguments.validate_single_argument(arg, "")
         assert not is_valid
 
+    def test_role_accepts_input_and_output(self):
+        """Test que role accepte "input" et "output"."""
+        assert Argument(code="IN", name="In", type="file", role="input").role == "input"
+        assert Argument(code="OUT", name="Out", role="output").role == "output"
+        assert Argument(code="ARG", name="Arg").role is None
+
+    def test_role_rejects_unknown_value(self):
+        """Test qu'un role inconnu est refusé."""
+        with pytest.raises(ValidationError):
+            Argument(code="ARG", name="Arg", role="temp")
+
 
 class TestArgumentValidationCustomRules:
     """Tests pour les règles de validation personnalisées (validation dict)."""
@@ -0,0 +1,61 @@
+"""
+Tests pour les modèles de mesure d'exécution.
+"""
+
+from command_builder.models.run_record import (
+    ResourceUsage,
+    RunRecord,
+    format_bytes,
+    format_run_summary,
+)
+
+
+def test_format_bytes():
+    """Les tailles sont formatées avec l'unité adaptée."""
+    assert format_bytes(None) == "n/d"
+    assert format_bytes(512) == "512 o"
+    assert format_bytes(1536) == "1.5 Ko"
+    assert format_bytes(5 * 1024 * 1024) == "5.0 Mo"
+    assert format_bytes(3 * 1024**3) == "3.0 Go"
+
+
+def test_resource_usage_str():
+    """La représentation texte contient toutes les mesures."""
+    usage = ResourceUsage(1.5, 0.25, 2 * 1024 * 1024, 1024, None)
+    text = str(usage)
+    assert "1.50s" in text
+    assert "0.25s" in text
+    assert "2.0 Mo" in text
+    assert "1.0 Ko lus" in text
+    assert "n/d écrits" in text
+
+
+def test_run_record_to_row():
+    """L'export à plat contient les colonnes CSV."""
+    record = RunRecord("Import", "import.exe", 0, 1.23456, ResourceUsage(1.0, 0.5))
+    row = record.to_row()
+    assert list(row) == RunRecord.CSV_COLUMNS
+    assert row["duration"] == 1.235
+    assert row["user_cpu"] == 1.0
+    assert row["peak_rss"] == ""
+
+
+def test_run_record_without_usage():
+    """Sans mesure (mode session), les colonnes de ressources sont vides."""
+    row = RunRecord("Import", "import.exe", 1, 2.0).to_row()
+    assert row["user_cpu"] == ""
+    assert row["return_code"] == 1
+
+
+def test_run_summary_marks_heaviest_command():
+    """Le résumé signale la commande la plus coûteuse en CPU."""
+    records = [
+        RunRecord("Import", "a", 0, 1.0, ResourceUsage(0.5, 0.1)),
+        RunRecord("Calcul", "b", 0, 3.0, ResourceUsage(2.5, 0.2)),
+        RunRecord("Export", "c", 0, 0.5),
+    ]
+    lines = format_run_summary(records)
+    assert len(lines) == 3
+    assert lines[1].startswith("[2] Calcul")
+    assert "plus coûteuse" in lines[1]
+    assert "plus coûteuse" not in lines[0]
@@ -7,6 +7,10 @@ import pytest
 from command_builder.models.arguments import Argument, ArgumentValue, TaskArgument
 from command_builder.models.command import Command
 from command_builder.models.task import Task
+from command_builder.services.command_executor import (
+    EXECUTOR_POOL_MAX_THREADS,
+    CommandExecutorService,
+)
 from command_builder.services.yaml_task_loader import load_yaml_task
 
 
@@ -332,6 +336,550 @@ class TestWorstCaseScenarios:
         assert elapsed < 5.0  # Devrait rester raisonnable
 
 
+class TestExecutorThreadReuse:
+    """Benchmark de réutilisation des threads par le service d'exécution."""
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(
+        not __import__("os").path.isdir("/proc/self/task"),
+        reason="Compte les threads via /proc",
+    )
+    def test_threads_created_per_1000_commands(self, wait_executor):
+        """Compte les threads créés pour exécuter 1000 commandes."""
+        import os
+
+        def thread_ids():
+            return set(os.listdir("/proc/self/task"))
+
+        service = CommandExecutorService()
+        existing = thread_ids()
+        created = set()
+        codes = []
+
+        start = time.time()
+        for _ in range(1000):
+            executor = service.execute_command(
+                "exit 0", on_finished=lambda code: codes.append(code)
+            )
+            assert wait_executor(executor, 5000)
+            created |= thread_ids() - existing
+        elapsed = time.time() - start
+
+        print(f"\n{len(created)} threads créés pour 1000 commandes ({elapsed:.2f}s)")
+        assert codes == [0] * 1000
+        # Sans pool : au moins 2000 threads (QThread + lecteur par commande).
+        # Avec : les threads du pool, plus ceux réservés aux deux lecteurs
+        assert len(created) <= EXECUTOR_POOL_MAX_THREADS + 2
+
+
+class TestSessionLaunchOverhead:
+    """Benchmark du coût de lancement d'une tâche de 30 commandes."""
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(__import__("os").name == "nt", reason="Commandes POSIX")
+    def test_session_mode_reduces_launch_overhead(self):
+        """Le mode session ne démarre aucun processus pour une commande interne."""
+        from PySide6.QtCore import QCoreApplication
+
+        from command_builder.services.shell_session import ShellSession
+
+        if QCoreApplication.instance() is None:
+            QCoreApplication([])
+
+        service = CommandExecutorService()
+
+        def run_sequence(session=None):
+            start = time.perf_counter()
+            for _ in range(30):
+                executor = service.execute_command("true", session=session)
+                assert executor.wait(5000)
+            return time.perf_counter() - start
+
+        per_process = run_sequence()
+        session = ShellSession()
+        try:
+            with_session = run_sequence(session)
+        finally:
+            session.close()
+
+        print(
+            f"\n30 commandes : {per_process * 1000:.1f} ms (un shell par commande)"
+            f" / {with_session * 1000:.1f} ms (session)"
+        )
+        # Un shell lancé à chaque étape (même pour la seule vérification de la
+        # syntaxe) ramènerait la session à la moitié du temps par processus
+        assert with_session < per_process / 4
+
+
+class TestConsoleRenderingThroughput:
+    """Benchmark de l'affichage des sorties dans la console (offscreen)."""
+
+    @pytest.mark.performance
+    def test_coalesced_rendering_throughput(self):
+        """L'affichage groupé (~30 Hz) dépasse largement l'affichage ligne à ligne."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.console_output import ConsoleOutput
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        # Avant : une insertion et un défilement par ligne
+        per_line = ConsoleOutput()
+        view = per_line.console_view
+        scroll_bar = per_line.text_edit_console.verticalScrollBar()
+        count = 300
+        start = time.perf_counter()
+        for i in range(count):
+            view.append_lines([f"ligne {i}"])
+            scroll_bar.setValue(scroll_bar.maximum())
+        per_line_rate = count / (time.perf_counter() - start)
+
+        # Après : lignes mises en attente, un affichage par image
+        coalesced = ConsoleOutput()
+        count = 60_000
+        lines_per_frame = 2_000
+        start = time.perf_counter()
+        for i in range(count):
+            coalesced.queue_output(f"ligne {i}")
+            if i % lines_per_frame == lines_per_frame - 1:
+                coalesced.flush_output()
+        coalesced.flush_output()
+        coalesced_rate = count / (time.perf_counter() - start)
+
+        print(
+            f"\nConsole : {per_line_rate:,.0f} lignes/s (ligne à ligne)"
+            f" / {coalesced_rate:,.0f} lignes/s (groupé)"
+        )
+        assert coalesced_rate > per_line_rate
+
+
+class TestTaskSwitching:
+    """Benchmark du changement de tâche dans le formulaire (offscreen)."""
+
+    @pytest.mark.performance
+    def test_cached_task_switch(self):
+        """Revenir à une tâche en cache est bien plus rapide que la construire."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.command_form import CommandForm
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        def make_task(name):
+            commands = [
+                Command(
+                    name=f"Command {i}",
+                    description="",
+                    command="echo " + " ".join(f"{{ARG_{j}}}" for j in range(5)),
+                    arguments=[
+                        Argument(code=f"ARG_{j}", name=f"Argument {j}")
+                        for j in range(5)
+                    ],
+                )
+                for i in range(20)
+            ]
+            return Task(name=name, description="", commands=commands)
+
+        form = CommandForm()
+        first, second = make_task("A"), make_task("B")
+
+        start = time.perf_counter()
+        form.set_task(first)
+        build_time = time.perf_counter() - start
+        form.set_task(second)
+
+        start = time.perf_counter()
+        form.set_task(first)
+        cached_time = time.perf_counter() - start
+
+        print(
+            f"\nChangement de tâche : {build_time * 1000:.1f} ms (construction)"
+            f" / {cached_time * 1000:.2f} ms (page en cache)"
+        )
+        assert form.current_task is first
+        assert cached_time < build_time / 5
+
+
+class TestLargeTaskForm:
+    """Benchmark de l'ouverture d'une tâche de 1000 commandes (offscreen)."""
+
+    @pytest.mark.performance
+    def test_lazy_form_opens_large_task(self):
+        """Les commandes sont repliées : aucun widget d'argument n'est créé."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.command_form import CommandForm
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        commands = [
+            Command(
+                name=f"Command {i}",
+                description="",
+                command="echo " + " ".join(f"{{ARG_{j}}}" for j in range(5)),
+                arguments=[
+                    Argument(code=f"ARG_{j}", name=f"Argument {j}", default="x")
+                    for j in range(5)
+                ],
+            )
+            for i in range(1000)
+        ]
+        task = Task(name="Huge Task", description="", commands=commands)
+        form = CommandForm()
+
+        start = time.perf_counter()
+        form.set_task(task)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nOuverture d'une tâche de 1000 commandes : {elapsed * 1000:.0f} ms")
+        assert len(form.command_checkboxes) == 1000
+        assert form.page_stack.currentWidget().widget_count == 1000
+        assert elapsed < 1.0
+
+
+class TestTaskListPerformance:
+    """Benchmark de la liste des tâches (offscreen)."""
+
+    @pytest.mark.performance
+    def test_set_and_filter_5000_tasks(self):
+        """Charger et filtrer 5000 tâches prend quelques millisecondes."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.task_list import TaskList
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        tasks = [
+            Task(name=f"Task {i:05d}", description="", commands=[])
+            for i in range(5000, 0, -1)
+        ]
+        task_list = TaskList()
+        task_list.resize(300, 600)
+        task_list.show()
+        QApplication.processEvents()  # Premier affichage (polices, style)
+
+        start = time.perf_counter()
+        task_list.set_tasks(tasks)
+        QApplication.processEvents()
+        set_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        task_list.set_filter_text("task 0123")
+        QApplication.processEvents()
+        filter_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = task_list.get_task("Task 04999")
+        lookup_time = time.perf_counter() - start
+
+        print(
+            f"\n5000 tâches : {set_time * 1000:.1f} ms (chargement)"
+            f" / {filter_time * 1000:.1f} ms (filtre)"
+            f" / {lookup_time * 1e6:.1f} µs (recherche par nom)"
+        )
+        assert found is not None and found.name == "Task 04999"
+        assert len(task_list.visible_tasks()) == 10
+        assert set_time < 0.2
+        assert filter_time < 0.2
+        task_list.close()
+
+
+class TestCommandPaletteSearch:
+    """Benchmark de l'index de recherche de la palette (Ctrl+P)."""
+
+    @pytest.mark.performance
+    def test_search_500_tasks(self):
+        """Chaque recherche dans 500 tâches (4 500 éléments) prend moins de 10 ms."""
+        from command_builder.services.task_search_index import TaskSearchIndex
+
+        words = ["export", "import", "sauvegarde", "analyse", "rapport"]
+        tasks = [
+            Task(
+                name=f"{words[i % 5].capitalize()} {i}",
+                description=f"Tâche de {words[(i * 3) % 5]} numéro {i}",
+                commands=[
+                    Command(
+                        name=f"{words[(i + j) % 5]}_{j}",
+                        description=f"Étape {j}",
+                        command="tool",
+                        arguments=[
+                            Argument(code=f"A{k}", name=f"{words[k]} fichier {k}")
+                            for k in range(4)
+                        ],
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(500)
+        ]
+
+        start = time.perf_counter()
+        index = TaskSearchIndex(tasks)
+        build_time = time.perf_counter() - start
+
+        queries = ["r", "ra", "rapport 44", "fichier", "sauvgarde", "export_2", "xyz"]
+        slowest = 0.0
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query)
+            slowest = max(slowest, time.perf_counter() - start)
+
+        print(
+            f"\n{len(index)} éléments : {build_time * 1000:.1f} ms (index)"
+            f" / {slowest * 1000:.2f} ms (recherche la plus lente)"
+        )
+        assert index.search("rapport 44")[0].title == "Rapport 44"
+        assert slowest < 0.01
+
+
+class TestErrorsPanelPerformance:
+    """Benchmark du panneau des erreurs YAML (offscreen)."""
+
+    @pytest.mark.performance
+    def test_show_1000_errors(self):
+        """Afficher 1000 erreurs ne crée pas un widget par erreur."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.error_display import ErrorsPanel
+        from command_builder.models.yaml_error import YamlError
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        types = ["ValidationError", "SyntaxError", "ReferenceError"]
+        errors = [
+            YamlError(
+                file_name=f"commands_{i % 3}.yaml",
+                error_type=types[i % 3],
+                error_message=f"Argument 'ARG_{i}' inconnu dans la commande cmd_{i}",
+                line_number=i,
+                suggestion="Vérifiez le nom de l'argument" if i % 2 else None,
+            )
+            for i in range(1000)
+        ]
+        ErrorsPanel(errors[:1])  # Premier affichage (polices, style)
+
+        start = time.perf_counter()
+        panel = ErrorsPanel(errors)
+        panel.resize(700, 500)
+        panel.show()
+        QApplication.processEvents()
+        elapsed = time.perf_counter() - start
+
+        print(f"\n1000 erreurs : {elapsed * 1000:.1f} ms")
+        assert panel.model.rowCount() == 3
+        assert elapsed < 0.5  # ~4 s avec un ErrorDisplay par erreur
+        panel.close()
+
+
+class TestAnsiRenderingThroughput:
+    """Benchmark de l'interprétation des codes couleur ANSI."""
+
+    @pytest.mark.performance
+    def test_ansi_parser_throughput(self):
+        """L'analyse des couleurs dépasse 100 000 lignes/s."""
+        from command_builder.services.ansi_parser import AnsiParser
+
+        lines = [
+            f"\x1b[1;32mPASSED\x1b[0m tests/test_{i}.py::test_\x1b[33mcas_{i}\x1b[0m"
+            for i in range(200_000)
+        ]
+        parser = AnsiParser()
+        start = time.perf_counter()
+        for line in lines:
+            parser.feed(line)
+        rate = len(lines) / (time.perf_counter() - start)
+
+        print(f"\nCouleurs ANSI : {rate:,.0f} lignes/s (analyse)")
+        assert rate > 100_000
+
+    @pytest.mark.performance
+    def test_colored_output_rendering(self):
+        """La couleur ne divise pas le débit de la console par plus de trois."""
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components.console_output import ConsoleOutput
+
+        if QApplication.instance() is None:
+            QApplication([])
+
+        def render(prefix, suffix):
+            console = ConsoleOutput()
+            count = 60_000
+            lines_per_frame = 2_000
+            start = time.perf_counter()
+            for i in range(count):
+                console.queue_output(f"{prefix}OK{suffix} fichier_{i}.c")
+                if i % lines_per_frame == lines_per_frame - 1:
+                    console.flush_output()
+                    console.console_view.apply_visible_styles()
+            console.flush_output()
+            console.console_view.apply_visible_styles()
+            rate = count / (time.perf_counter() - start)
+            assert len(console.console_view.buffer) == count
+            return console, rate
+
+        _, plain_rate = render("", "")
+        console, rate = render("\x1b[32m", "\x1b[0m")
+
+        print(
+            f"\nConsole colorée : {rate:,.0f} lignes/s (groupé) / "
+            f"{plain_rate:,.0f} lignes/s (texte brut)"
+        )
+        block = console.text_edit_console.document().lastBlock()
+        assert block.layout().formats()
+        # Le style n'est appliqué qu'aux lignes visibles : la couleur ne doit
+        # pas coûter autant que le texte lui-même (insertHtml : 5 fois plus lent)
+        assert rate > plain_rate / 3
+
+
+class TestConsoleSearchPerformance:
+    """Benchmark de la recherche dans la sortie de la console."""
+
+    @pytest.mark.performance
+    def test_search_million_lines(self):
+        """Une recherche sur un million de lignes reste interactive."""
+        from command_builder.services.console_buffer import ConsoleBuffer
+        from command_builder.services.console_search import (
+            TAG_ERR,
+            ConsoleSearchIndex,
+            SearchQuery,
+            search_lines,
+        )
+
+        buffer = ConsoleBuffer()
+        index = ConsoleSearchIndex()
+        count = 1_000_000
+        batch = 10_000
+        for first in range(0, count, batch):
+            lines = [
+                (
+                    f"[ERR] échec {i}"
+                    if i % 50_000 == 0
+                    else f"compilation fichier_{i}.c"
+                )
+                for i in range(first, first + batch)
+            ]
+            buffer.append_lines(lines)
+            index.add_lines(lines, output=True)
+
+        start = time.perf_counter()
+        matches = search_lines(buffer, index, SearchQuery("fichier_99999"))
+        substring_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        query = SearchQuery(r"\d+", regex=True, tag=TAG_ERR)
+        errors = search_lines(buffer, index, query)
+        filtered_time = time.perf_counter() - start
+
+        print(
+            f"\nRecherche sur {count:,} lignes : {substring_time * 1000:.0f} ms"
+            f" (texte) / {filtered_time * 1000:.0f} ms (regex, filtre [ERR])"
+        )
+        assert matches == [99999] + list(range(999990, 1_000_000))
+        assert len(errors) == count // 50_000
+        assert substring_time < 5.0
+        buffer.close()
+
+
+class TestLogFilePerformance:
+    """Benchmark de l'ouverture des journaux archivés."""
+
+    @pytest.mark.performance
+    def test_index_million_line_log(self, tmp_path):
+        """Un journal d'un million de lignes s'indexe vite, avec peu de mémoire."""
+        from command_builder.services.log_file import TextLogFile
+
+        count = 1_000_000
+        path = tmp_path / "console.log"
+        path.write_text(
+            "".join(f"compilation fichier_{i}.c\n" for i in range(count)),
+            encoding="utf-8",
+        )
+
+        start = time.perf_counter()
+        log_file = TextLogFile(path)
+        open_time = time.perf_counter() - start
+        log_file.build_index()
+        index_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lines = log_file.get_lines(777_777, 1000)
+        read_time = time.perf_counter() - start
+
+        print(
+            f"\nJournal de {count:,} lignes : ouverture {open_time * 1000:.1f} ms,"
+            f" indexation {index_time * 1000:.0f} ms,"
+            f" lecture de 1000 lignes {read_time * 1000:.1f} ms"
+        )
+        assert len(log_file) == count
+        assert lines[0] == "compilation fichier_777777.c"
+        assert open_time < 0.1
+        assert index_time < 5.0
+        assert read_time < 0.1
+        # Une position toutes les SPARSE_INDEX_STEP lignes seulement
+        assert log_file._offsets.itemsize * len(log_file._offsets) < 100_000
+        log_file.close()
+
+
+class TestWidgetConstruction:
+    """Benchmark de la construction des widgets depuis les fichiers .ui."""
+
+    @pytest.mark.performance
+    def test_compiled_ui_faster_than_runtime_loading(self, tmp_path, monkeypatch):
+        """Un .ui précompilé se construit plus vite qu'un .ui lu par QUiLoader."""
+        import shutil
+        from pathlib import Path
+
+        from PySide6.QtWidgets import QApplication
+
+        from command_builder.components import ui_loader
+
+        if shutil.which("pyside6-uic") is None:
+            pytest.skip("pyside6-uic non disponible")
+        if QApplication.instance() is None:
+            QApplication([])
+
+        source = (
+            Path(ui_loader.__file__).parent
+            / "argument_component"
+            / "argument_component.ui"
+        )
+        package_dir = tmp_path / "uibench"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        ui_file = Path(shutil.copy(source, package_dir))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(ui_loader, "_setup_classes", {})
+        ui_loader.compile_ui(ui_file)
+
+        count = 100
+
+        def build(package):
+            widgets = []
+            start = time.perf_counter()
+            for _ in range(count):
+                widgets.append(ui_loader.load_ui(ui_file, None, package))
+            elapsed = time.perf_counter() - start
+            for widget in widgets:
+                widget.deleteLater()
+            return elapsed
+
+        runtime_time = build(None)
+        compiled_time = build("uibench")
+
+        print(
+            f"\nConstruction de {count} widgets : {runtime_time * 1000:.0f} ms"
+            f" (QUiLoader) / {compiled_time * 1000:.0f} ms (précompilé)"
+        )
+        assert ui_loader._setup_classes[ui_file] is not None
+        assert compiled_time < runtime_time
+
+
 # Configuration pytest pour les tests lents
 def pytest_configure(config):
     """Configure les markers pytest."""
@@ -0,0 +1,82 @@
+"""
+Tests pour l'interprétation des codes couleur ANSI.
+"""
+
+from command_builder.services.ansi_parser import (
+    ANSI_BRIGHT_COLORS,
+    ANSI_COLORS,
+    DEFAULT_STYLE,
+    AnsiParser,
+    AnsiStyle,
+    apply_sgr,
+    color_256,
+)
+
+RED = AnsiStyle(foreground=ANSI_COLORS[1])
+
+
+class TestApplySgr:
+    """Tests de apply_sgr."""
+
+    def test_basic_colors(self):
+        style = apply_sgr(DEFAULT_STYLE, "1;31;44")
+        assert style == AnsiStyle(
+            foreground=ANSI_COLORS[1], background=ANSI_COLORS[4], bold=True
+        )
+        assert apply_sgr(style, "39;49;22") == DEFAULT_STYLE
+
+    def test_bright_colors(self):
+        assert apply_sgr(DEFAULT_STYLE, "92").foreground == ANSI_BRIGHT_COLORS[2]
+        assert apply_sgr(DEFAULT_STYLE, "103").background == ANSI_BRIGHT_COLORS[3]
+
+    def test_reset(self):
+        assert apply_sgr(RED, "0") == DEFAULT_STYLE
+        assert apply_sgr(RED, "") == DEFAULT_STYLE
+
+    def test_extended_colors(self):
+        assert apply_sgr(DEFAULT_STYLE, "38;5;196").foreground == "#ff0000"
+        assert apply_sgr(DEFAULT_STYLE, "48;2;1;2;3").background == "#010203"
+        assert apply_sgr(DEFAULT_STYLE, "38;5;240;1") == AnsiStyle(
+            foreground=color_256(240), bold=True
+        )
+
+    def test_color_256(self):
+        assert color_256(1) == ANSI_COLORS[1]
+        assert color_256(16) == "#000000"
+        assert color_256(231) == "#ffffff"
+        assert color_256(232) == "#080808"
+
+
+class TestAnsiParser:
+    """Tests de l'AnsiParser."""
+
+    def test_plain_text(self):
+        assert AnsiParser().feed("texte") == [("texte", DEFAULT_STYLE)]
+
+    def test_runs(self):
+        runs = AnsiParser().feed("a \x1b[31mrouge\x1b[0m b")
+        assert runs == [("a ", DEFAULT_STYLE), ("rouge", RED), (" b", DEFAULT_STYLE)]
+
+    def test_style_carried_across_chunks(self):
+        parser = AnsiParser()
+        parser.feed("\x1b[31mdébut")
+        assert parser.feed("suite") == [("suite", RED)]
+
+    def test_sequence_split_across_chunks(self):
+        parser = AnsiParser()
+        assert parser.feed("a\x1b[3") == [("a", DEFAULT_STYLE)]
+        assert parser.feed("1mb") == [("b", RED)]
+
+    def test_same_style_runs_are_merged(self):
+        runs = AnsiParser().feed("\x1b[31ma\x1b[31mb")
+        assert runs == [("ab", RED)]
+
+    def test_other_sequences_removed(self):
+        runs = AnsiParser().feed("\x1b[2K\x1b[?25l\x1b]0;titre\x07\x1b(Bok")
+        assert runs == [("ok", DEFAULT_STYLE)]
+
+    def test_reset(self):
+        parser = AnsiParser()
+        parser.feed("\x1b[31mrouge\x1b[")
+        parser.reset()
+        assert parser.feed("texte") == [("texte", DEFAULT_STYLE)]
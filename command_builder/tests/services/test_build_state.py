@@ -0,0 +1,114 @@
+"""
+Tests pour l'état de l'exécution incrémentale.
+"""
+
+import os
+
+from command_builder.services.app_paths import get_app_data_dir
+from command_builder.services.build_state import (
+    BuildStateStore,
+    get_build_state_store,
+    path_fingerprint,
+)
+
+
+def touch(path, content="data", mtime_ns=None):
+    """Écrit un fichier et fixe éventuellement sa date de modification."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestPathFingerprint:
+    """Tests de l'empreinte des fichiers et dossiers."""
+
+    def test_missing_path(self, tmp_path):
+        assert path_fingerprint(str(tmp_path / "absent")) is None
+
+    def test_file_changes_with_mtime(self, tmp_path):
+        path = tmp_path / "a.txt"
+        touch(path, mtime_ns=1_000_000_000)
+        before = path_fingerprint(str(path))
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        assert path_fingerprint(str(path)) != before
+
+    def test_directory_changes_with_content(self, tmp_path):
+        touch(tmp_path / "a.txt")
+        before = path_fingerprint(str(tmp_path))
+        assert before.startswith("dir:")
+        touch(tmp_path / "b.txt")
+        assert path_fingerprint(str(tmp_path)) != before
+
+
+class TestBuildStateStore:
+    """Tests du stockage de l'état des commandes réussies."""
+
+    def test_not_up_to_date_without_outputs(self, tmp_path):
+        store = BuildStateStore()
+        store.record_success("cmd", [], [])
+        assert not store.is_up_to_date("cmd", [], [])
+
+    def test_up_to_date_after_success(self, tmp_path):
+        source, result = str(tmp_path / "in.txt"), str(tmp_path / "out.txt")
+        touch(source)
+        touch(result)
+        store = BuildStateStore()
+
+        assert not store.is_up_to_date("cmd", [source], [result])
+        store.record_success("cmd", [source], [result])
+        assert store.is_up_to_date("cmd", [source], [result])
+        # Une autre ligne de commande (autres valeurs) n'est pas à jour
+        assert not store.is_up_to_date("cmd --other", [source], [result])
+
+    def test_changed_input_invalidates(self, tmp_path):
+        source, result = str(tmp_path / "in.txt"), str(tmp_path / "out.txt")
+        touch(source, mtime_ns=1_000_000_000)
+        touch(result)
+        store = BuildStateStore()
+        store.record_success("cmd", [source], [result])
+
+        touch(source, content="changed", mtime_ns=2_000_000_000)
+        assert not store.is_up_to_date("cmd", [source], [result])
+
+    def test_missing_output_invalidates(self, tmp_path):
+        result = str(tmp_path / "out.txt")
+        touch(result)
+        store = BuildStateStore()
+        store.record_success("cmd", [], [result])
+
+        os.remove(result)
+        assert not store.is_up_to_date("cmd", [], [result])
+
+    def test_output_not_produced_is_not_recorded(self, tmp_path):
+        result = str(tmp_path / "out.txt")
+        store = BuildStateStore()
+        store.record_success("cmd", [], [result])
+
+        touch(result)
+        assert not store.is_up_to_date("cmd", [], [result])
+
+    def test_invalidate(self, tmp_path):
+        result = str(tmp_path / "out.txt")
+        touch(result)
+        store = BuildStateStore()
+        store.record_success("cmd", [], [result])
+
+        store.invalidate("cmd")
+        assert not store.is_up_to_date("cmd", [], [result])
+
+    def test_state_persisted(self, tmp_path):
+        state_file = tmp_path / "state.json"
+        result = str(tmp_path / "out.txt")
+        touch(result)
+        BuildStateStore(state_file).record_success("cmd", [], [result])
+
+        assert BuildStateStore(state_file).is_up_to_date("cmd", [], [result])
+
+    def test_corrupted_state_ignored(self, tmp_path):
+        state_file = tmp_path / "state.json"
+        state_file.write_text("{invalide", encoding="utf-8")
+        assert not BuildStateStore(state_file).is_up_to_date("cmd", [], ["x"])
+
+    def test_shared_store_uses_app_data_dir(self):
+        assert get_build_state_store().state_file.parent == get_app_data_dir()
@@ -23,6 +23,7 @@ def mock_command_widget():
     widget.command = MagicMock()
     widget.command.name = "TestCommand"
     widget._build_full_command = MagicMock(return_value="test.exe --arg value")
+    widget.build_argv = MagicMock(return_value=["test.exe", "--arg", "value"])
     return widget
 
 
@@ -58,6 +59,82 @@ class TestCommandBuilderServiceBuildList:
 
         assert result == []
 
+    def test_build_session_marks_commands(self, app, mock_command_widget):
+        """En mode session, chaque commande est marquée."""
+        result = CommandBuilderService.build_commands_list(
+            [mock_command_widget], [], session=True
+        )
+
+        assert result[0]["session"] is True
+
+    def test_build_without_session_has_no_marker(self, app, mock_command_widget):
+        """Hors mode session, aucune clé session n'est ajoutée."""
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert "session" not in result[0]
+
+    def test_build_includes_argv(self, app, mock_command_widget):
+        """La liste d'arguments est ajoutée pour une exécution directe."""
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert result[0]["argv"] == ["test.exe", "--arg", "value"]
+
+    def test_build_shell_command_has_no_argv(self, app, mock_command_widget):
+        """Une commande exécutée via le shell n'a pas de liste d'arguments."""
+        mock_command_widget.build_argv.return_value = None
+
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert "argv" not in result[0]
+
+    def test_build_session_drops_argv(self, app, mock_command_widget):
+        """En mode session, la commande est exécutée par le shell de la session."""
+        result = CommandBuilderService.build_commands_list(
+            [mock_command_widget], [], session=True
+        )
+
+        assert "argv" not in result[0]
+
+    def test_build_includes_grace_period(self, app, mock_command_widget):
+        """Le délai de grâce défini dans le YAML est transmis."""
+        mock_command_widget.command.cancel_grace_period = 10
+
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert result[0]["grace_period"] == 10.0
+
+    def test_build_without_grace_period(self, app, mock_command_widget):
+        """Sans délai de grâce dans le YAML, aucune clé n'est ajoutée."""
+        mock_command_widget.command.cancel_grace_period = None
+
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert "grace_period" not in result[0]
+
+    def test_build_includes_io_paths(self, app, mock_command_widget):
+        """Les entrées et sorties déclarées sont transmises."""
+        mock_command_widget.get_io_paths.return_value = {
+            "inputs": ["in.csv"],
+            "outputs": ["out.db"],
+        }
+
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert result[0]["inputs"] == ["in.csv"]
+        assert result[0]["outputs"] == ["out.db"]
+
+    def test_build_without_outputs_has_no_io_paths(self, app, mock_command_widget):
+        """Sans sortie déclarée, la commande n'est pas incrémentale."""
+        mock_command_widget.get_io_paths.return_value = {
+            "inputs": ["in.csv"],
+            "outputs": [],
+        }
+
+        result = CommandBuilderService.build_commands_list([mock_command_widget], [])
+
+        assert "inputs" not in result[0]
+        assert "outputs" not in result[0]
+
     def test_build_multiple_commands_partial_checked(self, app):
         """Construit avec plusieurs commandes partiellement cochées."""
         widget1 = MagicMock()
@@ -5,6 +5,7 @@ Teste l'exécution séquentielle et l'arrêt en cas d'erreur.
 
 import os
 import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -17,6 +18,7 @@ if sys.platform.startswith("win") and os.getenv("TERM") is None:
 from command_builder.services.command_executor import (
     CommandExecutor,
     CommandExecutorService,
+    resolve_launch,
 )
 
 
@@ -51,7 +53,7 @@ class TestCommandExecutorService:
         assert executor is not None
         assert service.current_executor is executor
 
-    def test_execute_command_with_callbacks(self):
+    def test_execute_command_with_callbacks(self, wait_executor):
         """Teste l'exécution avec callbacks."""
         service = CommandExecutorService()
         output_lines = []
@@ -72,7 +74,7 @@ class TestCommandExecutorService:
         )
 
         # Attendre que l'exécution se termine
-        executor.wait()
+        wait_executor(executor)
 
         # Vérifier que les callbacks ont été appelés
         assert len(return_codes) > 0
@@ -98,3 +100,75 @@ class TestCommandExecutorService:
         # Le nouvel exécuteur doit être différent
         assert executor1 is not executor2
         assert service.current_executor is executor2
+
+    def test_execute_argv_without_shell(self, wait_executor):
+        """Teste qu'une liste d'arguments est passée telle quelle à l'exécutable."""
+        service = CommandExecutorService()
+        output_lines = []
+        return_codes = []
+        value = "my file; $HOME & echo injected"
+
+        executor = service.execute_command(
+            "display only",
+            on_output=output_lines.append,
+            on_finished=return_codes.append,
+            argv=[sys.executable, "-c", "import sys; print(sys.argv[1])", value],
+        )
+        wait_executor(executor)
+
+        assert output_lines == [value]
+        assert return_codes == [0]
+        assert executor.pid is not None
+
+    def test_execute_argv_missing_executable(self, wait_executor):
+        """Teste le message d'erreur quand l'exécutable est introuvable."""
+        service = CommandExecutorService()
+        error_lines = []
+        return_codes = []
+
+        executor = service.execute_command(
+            "missing-tool",
+            on_error=error_lines.append,
+            on_finished=return_codes.append,
+            argv=["cb-missing-tool-xyz", "--help"],
+        )
+        wait_executor(executor)
+
+        assert error_lines == ["Exécutable introuvable: cb-missing-tool-xyz"]
+        assert return_codes == [-1]
+
+
+class TestResolveLaunch:
+    """Tests pour la résolution de l'exécutable d'une liste d'arguments."""
+
+    @patch("command_builder.services.command_executor.os.name", "posix")
+    def test_posix_argv_unchanged(self):
+        """Sous Unix, l'exécutable est cherché dans le PATH par le système."""
+        assert resolve_launch(["tool", "a b"]) == (["tool", "a b"], False)
+
+    @patch("command_builder.services.command_executor.os.name", "nt")
+    @patch("command_builder.services.command_executor.shutil.which")
+    def test_windows_executable_resolved_with_pathext(self, mock_which):
+        """Sous Windows, l'extension est trouvée via PATHEXT."""
+        mock_which.return_value = "C:\\tools\\tool.EXE"
+        assert resolve_launch(["tool", "a b"]) == (
+            ["C:\\tools\\tool.EXE", "a b"],
+            False,
+        )
+
+    @patch("command_builder.services.command_executor.os.name", "nt")
+    @patch("command_builder.services.command_executor.shutil.which")
+    def test_windows_batch_file_goes_through_shell(self, mock_which):
+        """Un script .bat est lancé par cmd.exe avec des arguments cités."""
+        mock_which.return_value = "C:\\tools\\tool.bat"
+        assert resolve_launch(["tool", "a b", "x&y"]) == (
+            'C:\\tools\\tool.bat "a b" "x&y"',
+            True,
+        )
+
+    @patch("command_builder.services.command_executor.os.name", "nt")
+    @patch("command_builder.services.command_executor.shutil.which")
+    def test_windows_missing_executable(self, mock_which):
+        """Un exécutable introuvable est laissé tel quel (erreur au lancement)."""
+        mock_which.return_value = None
+        assert resolve_launch(["missing"]) == (["missing"], False)
@@ -3,11 +3,17 @@ Tests étendus pour le service d'exécution de commandes.
 Améliore la couverture de command_executor.py
 """
 
+import os
+import sys
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from command_builder.services.command_executor import (
+    CANCEL_STATE_KILLED,
+    CANCEL_STATE_TERMINATED,
+    EXECUTOR_POOL_MAX_THREADS,
     CommandExecutor,
     CommandExecutorService,
 )
@@ -50,18 +56,64 @@ class TestCommandExecutorExtended:
         assert executor._is_cancelled is True
         # _kill_process ne doit pas être appelé car poll() != None
 
+    @patch.object(CommandExecutor, "_terminate_process")
     @patch.object(CommandExecutor, "_kill_process")
-    def test_executor_cancel_kills_running_process(self, mock_kill):
-        """Teste que cancel() tue un processus en cours."""
-        executor = CommandExecutor("echo test")
+    def test_executor_cancel_does_not_block(self, mock_kill, mock_terminate):
+        """Teste que cancel() ne fait que signaler l'annulation au job."""
+        executor = CommandExecutor("echo test", grace_period=0)
         mock_process = Mock()
         mock_process.poll.return_value = None  # Processus en cours
         executor._process = mock_process
-        
+
         executor.cancel()
-        
+
         assert executor._is_cancelled is True
+        mock_kill.assert_not_called()
+        mock_terminate.assert_not_called()
+
+    @patch.object(CommandExecutor, "_terminate_process")
+    @patch.object(CommandExecutor, "_kill_process")
+    def test_escalation_kills_without_grace_period(self, mock_kill, mock_terminate):
+        """Teste que le job tue immédiatement un processus sans délai de grâce."""
+        executor = CommandExecutor("echo test", grace_period=0)
+        mock_process = Mock()
+        executor.cancel()
+
+        executor._escalate_cancellation(mock_process)
+
         mock_kill.assert_called_once_with(mock_process)
+        mock_terminate.assert_not_called()
+
+    @patch.object(CommandExecutor, "_terminate_process")
+    @patch.object(CommandExecutor, "_kill_process")
+    def test_escalation_requests_termination_first(self, mock_kill, mock_terminate):
+        """Teste que le job demande d'abord l'arrêt sans tuer le processus."""
+        executor = CommandExecutor("echo test", grace_period=5)
+        mock_process = Mock()
+        executor.cancel()
+
+        executor._escalate_cancellation(mock_process)
+        executor._escalate_cancellation(mock_process)
+
+        mock_terminate.assert_called_once_with(mock_process)
+        mock_kill.assert_not_called()
+
+    @patch("command_builder.services.command_executor.os.kill", create=True)
+    @patch("command_builder.services.command_executor.os.name", "nt")
+    def test_terminate_process_windows_sends_ctrl_break(self, mock_kill):
+        """Teste que l'arrêt demandé sous Windows envoie CTRL_BREAK au groupe."""
+        with patch(
+            "command_builder.services.command_executor.signal.CTRL_BREAK_EVENT",
+            1,
+            create=True,
+        ):
+            executor = CommandExecutor("echo test")
+            mock_process = Mock()
+            mock_process.pid = 12345
+
+            executor._terminate_process(mock_process)
+
+            mock_kill.assert_called_once_with(12345, 1)
 
 
 class TestCommandExecutorServiceExtended:
@@ -101,7 +153,8 @@ class TestCommandExecutorServiceExtended:
         
         assert service._stop_requested is True
         mock_executor.cancel.assert_called_once()
-        mock_executor.wait.assert_called_once_with(1000)
+        # L'annulation ne bloque pas le thread appelant
+        mock_executor.wait.assert_not_called()
 
     def test_cancel_current_execution_no_executor(self):
         """Teste cancel_current_execution() sans exécuteur."""
@@ -303,3 +356,108 @@ class TestCommandExecutorSignals:
         executor.output_received.connect(callback)
         executor.error_received.connect(callback)
         executor.execution_finished.connect(callback)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Utilise les signaux POSIX")
+class TestStagedCancellation:
+    """Tests pour l'annulation progressive (arrêt demandé puis forcé)."""
+
+    SLEEP = "import time; print('ready', flush=True); time.sleep(30)"
+    IGNORE_TERM = (
+        "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+        "print('ready', flush=True); time.sleep(30)"
+    )
+
+    def start(self, service, script, grace_period, states, codes, ready):
+        """Lance un script Python et attend qu'il soit prêt."""
+        executor = service.execute_command(
+            "python",
+            argv=[sys.executable, "-c", script],
+            on_output=ready.append,
+            on_finished=codes.append,
+            on_cancelled=states.append,
+            grace_period=grace_period,
+            exclusive=False,
+        )
+        deadline = time.monotonic() + 5
+        while executor.pid is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Laisser le processus installer ses gestionnaires de signaux
+        executor.wait(300)
+        return executor
+
+    def test_graceful_termination(self, wait_executor):
+        """Un processus qui accepte SIGTERM s'arrête sans être tué."""
+        service = CommandExecutorService()
+        states, codes, ready = [], [], []
+        executor = self.start(service, self.SLEEP, 10, states, codes, ready)
+
+        service.cancel_current_execution()
+
+        assert wait_executor(executor, 5000)
+        assert states == [CANCEL_STATE_TERMINATED]
+        assert len(codes) == 1 and codes[0] != 0
+
+    def test_escalation_after_grace_period(self, wait_executor):
+        """Un processus qui ignore SIGTERM est tué après le délai de grâce."""
+        service = CommandExecutorService()
+        states, codes, ready = [], [], []
+        executor = self.start(service, self.IGNORE_TERM, 0.3, states, codes, ready)
+
+        start = time.monotonic()
+        service.cancel_current_execution()
+
+        assert wait_executor(executor, 5000)
+        assert time.monotonic() - start >= 0.3
+        assert states == [CANCEL_STATE_KILLED]
+
+    def test_stop_parallel_jobs_does_not_block(self, wait_executor):
+        """Arrêter dix exécutions parallèles rend la main immédiatement."""
+        service = CommandExecutorService()
+        states, codes, ready = [], [], []
+        executors = [
+            self.start(service, self.IGNORE_TERM, 0.5, states, codes, ready)
+            for _ in range(10)
+        ]
+        assert len(service.active_executors()) == 10
+
+        start = time.monotonic()
+        service.request_stop()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert all(wait_executor(executor, 5000) for executor in executors)
+        assert states == [CANCEL_STATE_KILLED] * 10
+        assert service.active_executors() == []
+
+
+class TestParallelExecution:
+    """Tests des exécutions parallèles dans le pool partagé."""
+
+    def test_parallel_jobs_do_not_starve_readers(self, wait_executor):
+        """Plus de jobs que de threads du pool : toutes les sorties sont lues."""
+        service = CommandExecutorService()
+        # Sorties plus grandes que le tampon d'un pipe : le processus se bloque
+        # tant que ses flux ne sont pas lus
+        script = (
+            "import sys; sys.stdout.write('o' * 200000 + '\\n'); "
+            "sys.stderr.write('e' * 200000)"
+        )
+        outputs, errors, codes = [], [], []
+        jobs = EXECUTOR_POOL_MAX_THREADS + 4
+        executors = [
+            service.execute_command(
+                "python",
+                argv=[sys.executable, "-c", script],
+                on_output=outputs.append,
+                on_error=errors.append,
+                on_finished=codes.append,
+                exclusive=False,
+            )
+            for _ in range(jobs)
+        ]
+
+        assert all(wait_executor(executor, 20000) for executor in executors)
+        assert codes == [0] * jobs
+        assert [len(line) for line in outputs] == [200000] * jobs
+        assert [len(text) for text in errors] == [200000] * jobs
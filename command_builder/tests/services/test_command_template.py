@@ -0,0 +1,242 @@
+"""
+Tests pour la compilation des modèles de commande en liste d'arguments.
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from command_builder.services.command_template import (
+    Placeholder,
+    compile_template,
+    format_command_line,
+    quote_argument,
+    render_argv,
+    render_command_line,
+    split_template,
+    template_requires_shell,
+)
+
+
+class TestSplitTemplate:
+    """Tests pour le découpage des modèles en jetons."""
+
+    def test_split_on_whitespace(self):
+        """Les jetons sont séparés par les espaces."""
+        assert split_template("tool  {A}\t--opt {B}") == [
+            "tool",
+            "{A}",
+            "--opt",
+            "{B}",
+        ]
+
+    def test_quotes_group_token(self):
+        """Les guillemets regroupent un jeton et sont retirés."""
+        assert split_template("tool \"my file.txt\" 'a b'") == [
+            "tool",
+            "my file.txt",
+            "a b",
+        ]
+
+    def test_backslashes_are_kept(self):
+        """Les chemins Windows ne sont pas altérés."""
+        assert split_template(r"C:\tools\app.exe {DIR}\out.db") == [
+            r"C:\tools\app.exe",
+            r"{DIR}\out.db",
+        ]
+
+    def test_empty_quotes_produce_empty_token(self):
+        """Une chaîne vide entre guillemets reste un argument."""
+        assert split_template('tool ""') == ["tool", ""]
+
+
+class TestRequiresShell:
+    """Tests pour la détection des fonctionnalités du shell."""
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_plain_command_posix(self):
+        """Une commande simple est exécutée directement."""
+        assert template_requires_shell("tool {INPUT} --debug") is False
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_shell_features_posix(self):
+        """Redirections, pipes et variables nécessitent le shell."""
+        assert template_requires_shell("tool {A} > out.txt") is True
+        assert template_requires_shell("tool {A} | grep x") is True
+        assert template_requires_shell("tool $HOME") is True
+        assert template_requires_shell("cd {DIR}") is True
+
+    @patch("command_builder.services.command_template.os.name", "nt")
+    def test_shell_features_windows(self):
+        """Les commandes internes de cmd.exe nécessitent le shell."""
+        assert template_requires_shell("echo {A}") is True
+        assert template_requires_shell("tool %PATH%") is True
+        assert template_requires_shell("tool {A} && tool {B}") is True
+        assert template_requires_shell("computeprofile {A} --config {B}") is False
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_placeholders_are_not_shell_syntax(self):
+        """Les accolades des placeholders ne déclenchent pas le shell."""
+        assert template_requires_shell("tool {A}{B}") is False
+
+
+class TestCompileTemplate:
+    """Tests pour la compilation des modèles."""
+
+    def test_segments(self):
+        """Les placeholders sont séparés du texte littéral."""
+        compiled = compile_template("tool --out={OUT}.db {IN}", False)
+        assert compiled.tokens == (
+            ("tool",),
+            ("--out=", Placeholder("OUT"), ".db"),
+            (Placeholder("IN"),),
+        )
+
+    def test_compilation_is_cached(self):
+        """Un même modèle n'est compilé qu'une fois."""
+        assert compile_template("tool {A}") is compile_template("tool {A}")
+
+    def test_explicit_shell_overrides_detection(self):
+        """Le champ shell du YAML force le mode d'exécution."""
+        assert compile_template("tool {A}", True).requires_shell is True
+        assert compile_template("tool {A} > x", False).requires_shell is False
+
+
+class TestRenderArgv:
+    """Tests pour la production de la liste d'arguments."""
+
+    def test_value_with_spaces_stays_single_argument(self):
+        """Une valeur contenant des espaces reste un seul argument."""
+        compiled = compile_template("tool {IN} --config {CFG}", False)
+        argv = render_argv(
+            compiled, {"IN": ["C:\\My Data\\in put.db"], "CFG": ["a;b & c"]}
+        )
+        assert argv == ["tool", "C:\\My Data\\in put.db", "--config", "a;b & c"]
+
+    def test_empty_value_is_dropped(self):
+        """Un placeholder sans valeur ne produit aucun argument."""
+        compiled = compile_template("tool {IN} {FLAG}", False)
+        assert render_argv(compiled, {"IN": ["x"], "FLAG": []}) == ["tool", "x"]
+
+    def test_multi_token_value(self):
+        """Une option avec préfixe produit plusieurs arguments."""
+        compiled = compile_template("tool {OPT}", False)
+        assert render_argv(compiled, {"OPT": ["--level", "3"]}) == [
+            "tool",
+            "--level",
+            "3",
+        ]
+
+    def test_value_inside_token(self):
+        """Une valeur insérée dans un jeton mixte est concaténée."""
+        compiled = compile_template("tool --out={OUT}.db", False)
+        assert render_argv(compiled, {"OUT": ["my result"]}) == [
+            "tool",
+            "--out=my result.db",
+        ]
+
+    def test_unknown_placeholder_is_kept(self):
+        """Un placeholder sans argument correspondant est laissé tel quel."""
+        compiled = compile_template("tool {UNKNOWN}", False)
+        assert render_argv(compiled, {}) == ["tool", "{UNKNOWN}"]
+
+
+class TestFormatCommandLine:
+    """Tests pour le formatage d'une liste d'arguments."""
+
+    @patch("command_builder.services.command_template.os.name", "nt")
+    def test_windows_quoting(self):
+        """Les arguments avec espaces sont entourés de guillemets (Windows)."""
+        assert (
+            format_command_line(["tool", "C:\\My Data\\in.db"])
+            == 'tool "C:\\My Data\\in.db"'
+        )
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_posix_quoting(self):
+        """Les arguments spéciaux sont protégés (POSIX)."""
+        assert format_command_line(["tool", "a b", "$x"]) == "tool 'a b' '$x'"
+
+    @patch("command_builder.services.command_template.os.name", "nt")
+    def test_windows_special_characters_are_quoted(self):
+        """Les caractères spéciaux de cmd.exe imposent des guillemets."""
+        assert quote_argument("a&b") == '"a&b"'
+        assert quote_argument('say "hi"') == '^"say ^"^"hi^"^"^"'
+        assert quote_argument("%PATH%") == '^"^%PATH^%^"'
+        assert quote_argument("C:\\dir\\") == "C:\\dir\\"
+        assert quote_argument("C:\\my dir\\") == '"C:\\my dir\\\\"'
+        assert quote_argument("") == '""'
+
+    @pytest.mark.parametrize(
+        "value", ['a" & calc & "', 'x"|whoami', '"& del /q *', "%PATH%", "50% & 20%"]
+    )
+    @patch("command_builder.services.command_template.os.name", "nt")
+    def test_windows_value_cannot_inject_commands(self, value):
+        """Une valeur ne peut ni terminer la citation ni étendre de variable."""
+        text, operators, variables = parse_cmd_line(
+            format_command_line(["tool.bat", value])
+        )
+        assert operators == []
+        assert variables == []
+        # Argument reçu : entre guillemets, guillemets internes doublés
+        assert text == 'tool.bat "' + value.replace('"', '""') + '"'
+
+
+def parse_cmd_line(line):
+    """
+    Analyse une ligne comme cmd.exe (hors fichier de commandes).
+
+    Returns:
+        Tuple (texte après retrait des ^, opérateurs exécutés, variables étendues)
+    """
+    variables = [name for name in re.findall(r"%([^%]+)%", line) if "^" not in name]
+    text, operators, quoted, escaped = [], [], False, False
+    for char in line:
+        if escaped:
+            text.append(char)
+            escaped = False
+        elif char == "^" and not quoted:
+            escaped = True
+        else:
+            if char == '"':
+                quoted = not quoted
+            elif char in "&|<>" and not quoted:
+                operators.append(char)
+            text.append(char)
+    return "".join(text), operators, variables
+
+
+class TestRenderCommandLine:
+    """Tests pour la ligne de commande affichée et passée au shell."""
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_values_are_quoted_and_shell_text_kept(self):
+        """Les valeurs sont protégées, les redirections du modèle conservées."""
+        command_line = render_command_line(
+            "tool {IN} {FLAG}  > {LOG}",
+            {"IN": ["my file; rm x"], "FLAG": [], "LOG": ["out.log"]},
+        )
+        assert command_line == "tool 'my file; rm x' > out.log"
+
+    @patch("command_builder.services.command_template.os.name", "nt")
+    def test_value_inside_token(self):
+        """Une valeur collée à du texte reste un seul argument (Windows)."""
+        command_line = render_command_line(
+            "tool {DB}\\{NAME}.sqlite", {"DB": ["C:\\My Data"], "NAME": ["p"]}
+        )
+        assert command_line == 'tool "C:\\My Data"\\p.sqlite'
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_value_quoted_in_template_is_inserted_as_is(self):
+        """Une valeur déjà entre guillemets dans le modèle n'est pas re-citée."""
+        assert render_command_line('tool "{IN}"', {"IN": ["a b"]}) == 'tool "a b"'
+
+    @patch("command_builder.services.command_template.os.name", "posix")
+    def test_spaces_inside_values_are_kept(self):
+        """Seuls les espaces du modèle sont réduits."""
+        assert render_command_line("tool {A}", {"A": ["a  b"]}) == "tool 'a  b'"
+
+    def test_unknown_placeholder_is_kept(self):
+        """Un placeholder sans valeur connue est laissé tel quel."""
+        assert render_command_line("tool {Source}", {}) == "tool {Source}"
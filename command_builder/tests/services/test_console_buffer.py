@@ -0,0 +1,61 @@
+"""
+Tests pour le stockage des lignes de la console.
+"""
+
+from command_builder.services.console_buffer import SPARSE_INDEX_STEP, ConsoleBuffer
+
+
+def make_buffer(count, memory_lines=100):
+    """Crée un stockage contenant count lignes numérotées."""
+    buffer = ConsoleBuffer(memory_lines=memory_lines)
+    buffer.append_lines([f"ligne {i}" for i in range(count)])
+    return buffer
+
+
+class TestConsoleBuffer:
+    """Tests du ConsoleBuffer."""
+
+    def test_recent_lines(self):
+        buffer = make_buffer(50)
+        assert len(buffer) == 50
+        assert buffer.get_lines(45, 10) == [f"ligne {i}" for i in range(45, 50)]
+
+    def test_old_lines_read_from_disk(self):
+        buffer = make_buffer(3 * SPARSE_INDEX_STEP + 10)
+        start = SPARSE_INDEX_STEP + 17
+        assert buffer.get_lines(start, 5) == [
+            f"ligne {i}" for i in range(start, start + 5)
+        ]
+
+    def test_range_across_disk_and_memory(self):
+        count = 1000
+        buffer = make_buffer(count)
+        assert buffer.get_lines(880, 40) == [f"ligne {i}" for i in range(880, 920)]
+
+    def test_memory_is_bounded(self):
+        buffer = make_buffer(10000, memory_lines=100)
+        assert len(buffer._recent) == 100
+        assert len(buffer._offsets) == 10000 // SPARSE_INDEX_STEP + 1
+
+    def test_appends_in_several_chunks(self):
+        buffer = ConsoleBuffer(memory_lines=10)
+        for i in range(0, 600, 7):
+            buffer.append_lines([f"ligne {j}" for j in range(i, min(i + 7, 600))])
+        assert buffer.get_lines(300, 3) == ["ligne 300", "ligne 301", "ligne 302"]
+
+    def test_unicode_lines(self):
+        buffer = ConsoleBuffer(memory_lines=1)
+        buffer.append_lines(["é à ✓", "dernière"])
+        assert buffer.get_lines(0, 1) == ["é à ✓"]
+
+    def test_iter_lines(self):
+        buffer = make_buffer(250, memory_lines=10)
+        assert list(buffer.iter_lines(page_size=64)) == [
+            f"ligne {i}" for i in range(250)
+        ]
+
+    def test_clear(self):
+        buffer = make_buffer(500)
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.get_lines(0, 10) == []
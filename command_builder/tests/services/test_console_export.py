@@ -0,0 +1,140 @@
+"""
+Tests pour l'export de la sortie de la console.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from command_builder.services.console_buffer import ConsoleBuffer
+from command_builder.services.console_export import (
+    EXPORT_PAGE_LINES,
+    FORMAT_GZIP,
+    FORMAT_HTML,
+    FORMAT_JSONL,
+    FORMAT_TEXT,
+    ConsoleBufferSource,
+    RunLogSource,
+    export_console,
+    format_for_path,
+    strip_tag,
+)
+from command_builder.services.console_search import ConsoleSearchIndex
+from command_builder.services.run_log import RunLogWriter
+
+
+@pytest.fixture
+def log_source(tmp_path):
+    """Journal d'une séquence de deux commandes."""
+    writer = RunLogWriter(tmp_path / "run.log.gz", block_size=64)
+    writer.write_line("Commande 1/2")
+    writer.begin_command("cmd1")
+    writer.write_line("[CMD] echo <a>")
+    writer.write_line("sortie 1", output=True)
+    writer.begin_command("cmd2")
+    writer.write_line("[ERR] échec", output=True)
+    writer.close()
+    return RunLogSource(writer.log_path)
+
+
+def make_buffer_source(lines, output=False):
+    """Source lue depuis le stockage de la console."""
+    buffer = ConsoleBuffer(memory_lines=100)
+    index = ConsoleSearchIndex()
+    buffer.append_lines(lines)
+    index.add_lines(lines, output=output)
+    return ConsoleBufferSource(buffer, index)
+
+
+class TestExportHelpers:
+    """Tests des fonctions utilitaires."""
+
+    def test_format_for_path(self):
+        assert format_for_path("a.txt") == FORMAT_TEXT
+        assert format_for_path("a.JSONL") == FORMAT_JSONL
+        assert format_for_path("a.html") == FORMAT_HTML
+        assert format_for_path("a.log.gz") == FORMAT_GZIP
+        assert format_for_path("a") == FORMAT_TEXT
+
+    def test_strip_tag(self):
+        assert strip_tag("[ERR] boom") == "boom"
+        assert strip_tag("[CMD]echo") == "echo"
+        assert strip_tag("texte") == "texte"
+
+
+class TestExportConsole:
+    """Tests de export_console."""
+
+    def test_text(self, log_source, tmp_path):
+        target = tmp_path / "out.txt"
+        assert export_console(log_source, str(target), FORMAT_TEXT)
+        assert target.read_text(encoding="utf-8") == (
+            "Commande 1/2\n[CMD] echo <a>\nsortie 1\n[ERR] échec\n"
+        )
+
+    def test_jsonl(self, log_source, tmp_path):
+        target = tmp_path / "out.jsonl"
+        export_console(log_source, str(target), FORMAT_JSONL)
+
+        lines = target.read_text(encoding="utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [(r["command_index"], r["stream"], r["line"]) for r in records] == [
+            (None, "console", "Commande 1/2"),
+            (0, "command", "echo <a>"),
+            (0, "stdout", "sortie 1"),
+            (1, "stderr", "échec"),
+        ]
+        assert all(r["timestamp"] for r in records)
+
+    def test_html_is_escaped(self, log_source, tmp_path):
+        target = tmp_path / "out.html"
+        export_console(log_source, str(target), FORMAT_HTML)
+
+        page = target.read_text(encoding="utf-8")
+        assert page.startswith("<!DOCTYPE html>")
+        assert '<span class="command">[CMD] echo &lt;a&gt;</span>' in page
+        assert '<span class="stderr">[ERR] échec</span>' in page
+        assert page.rstrip().endswith("</html>")
+
+    def test_gzip_copies_log(self, log_source, tmp_path):
+        target = tmp_path / "out.log.gz"
+        export_console(log_source, str(target), FORMAT_GZIP)
+        assert target.read_bytes() == log_source.log_path.read_bytes()
+
+    def test_buffer_source(self, tmp_path):
+        source = make_buffer_source(["[CMD] ls", "fichier"], output=True)
+        target = tmp_path / "out.log.gz"
+        export_console(source, str(target), FORMAT_GZIP)
+        with gzip.open(target, "rt", encoding="utf-8") as f:
+            assert f.read() == "[CMD] ls\nfichier\n"
+
+        target = tmp_path / "out.jsonl"
+        export_console(source, str(target), FORMAT_JSONL)
+        record = json.loads(target.read_text("utf-8").splitlines()[1])
+        assert record == {
+            "timestamp": None,
+            "command_index": None,
+            "stream": "stdout",
+            "line": "fichier",
+        }
+
+    def test_progress(self, tmp_path):
+        source = make_buffer_source(["x"] * (EXPORT_PAGE_LINES + 10))
+        progress = []
+        target = tmp_path / "out.txt"
+        export_console(source, str(target), on_progress=lambda *p: progress.append(p))
+        assert progress == [
+            (EXPORT_PAGE_LINES, EXPORT_PAGE_LINES + 10),
+            (EXPORT_PAGE_LINES + 10, EXPORT_PAGE_LINES + 10),
+        ]
+
+    def test_cancelled_leaves_no_file(self, tmp_path):
+        source = make_buffer_source(["x"] * 10)
+        target = tmp_path / "out.txt"
+        assert not export_console(source, str(target), is_cancelled=lambda: True)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_console(make_buffer_source(["x"]), str(tmp_path / "a"), "pdf")
@@ -0,0 +1,129 @@
+"""
+Tests pour la recherche dans la sortie de la console.
+"""
+
+import re
+
+import pytest
+
+from command_builder.services.console_buffer import ConsoleBuffer
+from command_builder.services.console_search import (
+    CHUNK_LINES,
+    TAG_CMD,
+    TAG_ERR,
+    TAG_NONE,
+    TAG_OUT,
+    ConsoleSearchIndex,
+    SearchQuery,
+    classify_line,
+    search_lines,
+)
+
+
+def make_console(lines, output=False):
+    """Crée un stockage et son index contenant les lignes données."""
+    buffer = ConsoleBuffer(memory_lines=100)
+    index = ConsoleSearchIndex()
+    buffer.append_lines(lines)
+    index.add_lines(lines, output=output)
+    return buffer, index
+
+
+class TestClassifyLine:
+    """Tests de l'étiquetage des lignes."""
+
+    def test_prefixes(self):
+        assert classify_line("[CMD] echo") == TAG_CMD
+        assert classify_line("[ERR] boom") == TAG_ERR
+        assert classify_line("[OUT] ok") == TAG_OUT
+
+    def test_untagged_lines(self):
+        assert classify_line("Commande 1/2") == TAG_NONE
+        assert classify_line("sortie brute", output=True) == TAG_OUT
+        assert classify_line("[ERR] boom", output=True) == TAG_ERR
+
+
+class TestSearchLines:
+    """Tests de search_lines."""
+
+    def test_substring_is_case_insensitive(self):
+        buffer, index = make_console(["Alpha", "beta", "ALPHABET", "gamma"])
+        assert search_lines(buffer, index, SearchQuery("alpha")) == [0, 2]
+
+    def test_case_sensitive(self):
+        buffer, index = make_console(["Alpha", "alpha"])
+        query = SearchQuery("alpha", case_sensitive=True)
+        assert search_lines(buffer, index, query) == [1]
+
+    def test_substring_escapes_special_characters(self):
+        buffer, index = make_console(["a.b", "axb"])
+        assert search_lines(buffer, index, SearchQuery("a.b")) == [0]
+
+    def test_regex(self):
+        buffer, index = make_console(["code 12", "code x", "code 345"])
+        query = SearchQuery(r"^code \d+$", regex=True)
+        assert search_lines(buffer, index, query) == [0, 2]
+
+    def test_one_result_per_line(self):
+        buffer, index = make_console(["aaa", "b", "a"])
+        assert search_lines(buffer, index, SearchQuery("a")) == [0, 2]
+
+    def test_invalid_regex(self):
+        buffer, index = make_console(["x"])
+        with pytest.raises(re.error):
+            search_lines(buffer, index, SearchQuery("(", regex=True))
+
+    def test_tag_filter(self):
+        buffer, index = make_console(["[CMD] make", "[ERR] make: erreur", "make"])
+        query = SearchQuery("make", tag=TAG_ERR)
+        assert search_lines(buffer, index, query) == [1]
+
+    def test_chunks_without_tag_are_skipped(self):
+        lines = ["sortie"] * (2 * CHUNK_LINES) + ["[ERR] sortie"]
+        buffer, index = make_console(lines, output=True)
+        read_starts = []
+        read_text = buffer.read_text
+
+        def spy(start, count):
+            read_starts.append(start)
+            return read_text(start, count)
+
+        buffer.read_text = spy
+        query = SearchQuery("sortie", tag=TAG_ERR)
+        assert search_lines(buffer, index, query) == [2 * CHUNK_LINES]
+        assert read_starts == [2 * CHUNK_LINES]
+
+    def test_incremental_range(self):
+        lines = [f"ligne {i}" for i in range(CHUNK_LINES + 50)]
+        buffer, index = make_console(lines)
+        query = SearchQuery(r"ligne \d*7$", regex=True)
+        first = search_lines(buffer, index, query, 0, CHUNK_LINES + 10)
+        rest = search_lines(buffer, index, query, CHUNK_LINES + 10)
+        assert first + rest == [i for i in range(len(lines)) if i % 10 == 7]
+        assert all(line >= CHUNK_LINES + 10 for line in rest)
+
+    def test_cancelled(self):
+        buffer, index = make_console(["a"] * (3 * CHUNK_LINES))
+        query = SearchQuery("a")
+        assert search_lines(buffer, index, query, is_cancelled=lambda: True) == []
+
+
+class TestConsoleSearchIndex:
+    """Tests de l'index des étiquettes."""
+
+    def test_chunk_masks(self):
+        index = ConsoleSearchIndex()
+        index.add_lines(["x"] * CHUNK_LINES, output=True)
+        index.add_lines(["[CMD] y"])
+        assert len(index) == CHUNK_LINES + 1
+        assert index.chunk_has_tag(0, TAG_OUT)
+        assert not index.chunk_has_tag(0, TAG_CMD)
+        assert index.chunk_has_tag(1, TAG_CMD)
+        assert index.tag_of(CHUNK_LINES) == TAG_CMD
+
+    def test_clear(self):
+        index = ConsoleSearchIndex()
+        index.add_lines(["x"])
+        index.clear()
+        assert len(index) == 0
+        assert index.chunk_masks == []
@@ -0,0 +1,111 @@
+"""
+Tests pour la conversion en cache de la documentation d'aide.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from command_builder.services import help_renderer
+from command_builder.services.help_renderer import (
+    help_source_hash,
+    load_help_html,
+    prerender_help,
+    prerendered_path_for,
+)
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    """Compte les conversions Markdown (cache mémoire vidé)."""
+    monkeypatch.setattr(help_renderer, "_rendered", {})
+    calls = []
+    render = help_renderer.render_markdown
+
+    def counting_render(text):
+        calls.append(text)
+        return render(text)
+
+    monkeypatch.setattr(help_renderer, "render_markdown", counting_render)
+    return calls
+
+
+class TestLoadHelpHtml:
+    """Tests de load_help_html."""
+
+    def test_converted_then_cached_on_disk(self, tmp_path, conversions, monkeypatch):
+        md_path = tmp_path / "intro.md"
+        md_path.write_text("# Titre\n\n**gras**", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        html = load_help_html(md_path, cache_dir)
+        assert "<h1>Titre</h1>" in html
+        assert (cache_dir / "intro.html").exists()
+
+        # Nouvelle session : cache mémoire vide, le cache disque suffit
+        monkeypatch.setattr(help_renderer, "_rendered", {})
+        assert load_help_html(md_path, cache_dir) == html
+        assert len(conversions) == 1
+
+    def test_modified_file_converted_again(self, tmp_path, conversions):
+        md_path = tmp_path / "intro.md"
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        md_path.write_text("# Avant", encoding="utf-8")
+        load_help_html(md_path, cache_dir)
+
+        md_path.write_text("# Après", encoding="utf-8")
+        html = load_help_html(md_path, cache_dir)
+
+        assert "Après" in html
+        assert len(conversions) == 2
+
+    def test_prerendered_html_used(self, tmp_path, conversions):
+        md_path = tmp_path / "intro.md"
+        md_path.write_text("# Titre", encoding="utf-8")
+
+        assert prerender_help(tmp_path) == [prerendered_path_for(md_path)]
+        conversions.clear()
+        help_renderer._rendered.clear()
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        assert "<h1>Titre</h1>" in load_help_html(md_path, cache_dir)
+        assert conversions == []
+        assert not (cache_dir / "intro.html").exists()
+
+    def test_stale_prerendered_html_ignored(self, tmp_path, conversions):
+        md_path = tmp_path / "intro.md"
+        md_path.write_text("# Ancien", encoding="utf-8")
+        prerender_help(tmp_path)
+        md_path.write_text("# Nouveau", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        assert "Nouveau" in load_help_html(md_path, cache_dir)
+
+    def test_missing_file(self, tmp_path):
+        assert load_help_html(tmp_path / "absent.md", tmp_path) == ""
+
+    def test_hash_depends_on_content(self):
+        assert help_source_hash(b"a") != help_source_hash(b"b")
+
+
+def test_markdown_not_imported_at_startup():
+    """Importer la fenêtre d'aide ne charge pas le paquet markdown."""
+    code = (
+        "import sys\n"
+        "import command_builder.components.main_window\n"
+        "print('markdown' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[3],  # Racine du projet
+    )
+    assert result.stdout.strip() == "False"
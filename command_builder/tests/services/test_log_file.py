@@ -0,0 +1,128 @@
+"""
+Tests pour la lecture des journaux archivés.
+"""
+
+import pytest
+
+from command_builder.services.console_buffer import SPARSE_INDEX_STEP
+from command_builder.services.log_file import (
+    COMMAND_SEPARATOR,
+    CompressedLogFile,
+    TextLogFile,
+    open_log_file,
+)
+from command_builder.services.run_log import RunLogWriter
+
+SEPARATOR = COMMAND_SEPARATOR.decode()
+
+
+def write_text_log(path, lines, newline="\n"):
+    """Écrit un journal texte."""
+    path.write_bytes(newline.join(lines).encode("utf-8") + newline.encode())
+    return path
+
+
+class TestTextLogFile:
+    """Tests du TextLogFile."""
+
+    def test_lines_available_after_indexing(self, tmp_path):
+        lines = [f"ligne {i}" for i in range(3 * SPARSE_INDEX_STEP + 7)]
+        log_file = TextLogFile(write_text_log(tmp_path / "a.log", lines))
+        assert len(log_file) == 0 and not log_file.complete
+
+        log_file.build_index(chunk_size=100)
+
+        assert log_file.complete
+        assert len(log_file) == len(lines)
+        assert log_file.get_lines(0, 3) == lines[:3]
+        start = SPARSE_INDEX_STEP + 5
+        assert (
+            log_file.get_lines(start, 2 * SPARSE_INDEX_STEP)
+            == (lines[start : start + 2 * SPARSE_INDEX_STEP])
+        )
+        assert log_file.get_lines(len(lines) - 1, 10) == lines[-1:]
+        assert log_file.get_lines(len(lines), 10) == []
+        log_file.close()
+
+    def test_last_line_without_newline_and_crlf(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes("première\r\nseconde\r\nfin".encode("utf-8"))
+        log_file = TextLogFile(path)
+        log_file.build_index()
+        assert log_file.get_lines(0, 10) == ["première", "seconde", "fin"]
+        log_file.close()
+
+    def test_commands_detected(self, tmp_path):
+        lines = ["Début"]
+        for i, name in enumerate(["build", "test"], 1):
+            lines += [SEPARATOR, f"[{i}/2] {name}", SEPARATOR, "[CMD] make"]
+        lines.append("[1/2] pas une commande")
+        for newline in ("\n", "\r\n"):
+            path = write_text_log(tmp_path / "a.log", lines, newline)
+            log_file = TextLogFile(path)
+            log_file.build_index(chunk_size=16)
+            assert [(c.name, c.first_line) for c in log_file.commands] == [
+                ("build", 2),
+                ("test", 6),
+            ]
+            log_file.close()
+
+    def test_progress_and_cancel(self, tmp_path):
+        lines = ["x" * 50] * 100
+        log_file = TextLogFile(write_text_log(tmp_path / "a.log", lines))
+        calls = []
+        log_file.build_index(
+            on_progress=lambda: calls.append(len(log_file)),
+            is_cancelled=lambda: len(calls) >= 2,
+            chunk_size=1000,
+        )
+        assert len(calls) == 2 and not log_file.complete
+        log_file.build_index()
+        assert log_file.complete and len(log_file) == 100
+        log_file.close()
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "vide.log"
+        path.write_bytes(b"")
+        log_file = TextLogFile(path)
+        assert log_file.complete
+        log_file.build_index()
+        assert len(log_file) == 0 and log_file.get_lines(0, 10) == []
+        log_file.close()
+
+    def test_closed_file_returns_no_lines(self, tmp_path):
+        log_file = TextLogFile(write_text_log(tmp_path / "a.log", ["a", "b"]))
+        log_file.build_index()
+        log_file.close()
+        assert log_file.get_lines(0, 2) == []
+
+
+class TestCompressedLogFile:
+    """Tests du CompressedLogFile."""
+
+    def test_reads_run_log(self, tmp_path):
+        writer = RunLogWriter(tmp_path / "run.log.gz", block_size=64)
+        writer.write_line("Commande 1/1")
+        writer.begin_command("cmd1")
+        for i in range(50):
+            writer.write_line(f"sortie {i}", output=True)
+        writer.close()
+
+        log_file = open_log_file(writer.log_path)
+        assert isinstance(log_file, CompressedLogFile)
+        assert log_file.complete and len(log_file) == 51
+        assert log_file.get_lines(10, 3) == ["sortie 9", "sortie 10", "sortie 11"]
+        assert [c.name for c in log_file.commands] == ["cmd1"]
+        log_file.close()
+        assert log_file.get_lines(0, 1) == []
+
+    def test_missing_index(self, tmp_path):
+        path = tmp_path / "seul.log.gz"
+        path.write_bytes(b"")
+        with pytest.raises(OSError):
+            open_log_file(path)
+
+    def test_text_log_opened(self, tmp_path):
+        log_file = open_log_file(write_text_log(tmp_path / "a.log", ["a"]))
+        assert isinstance(log_file, TextLogFile)
+        log_file.close()
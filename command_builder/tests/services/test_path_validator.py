@@ -0,0 +1,196 @@
+"""
+Tests pour la validation en direct des arguments de type fichier ou dossier.
+"""
+
+import pytest
+from PySide6.QtCore import QObject
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from command_builder.models.arguments import Argument
+from command_builder.services.path_validator import (
+    PathProbe,
+    PathValidator,
+    StatCache,
+    check_path_argument,
+    probe_path,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture pour créer une instance de QApplication."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class FakeClock:
+    """Horloge pilotée par le test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Target(QObject):
+    """Champ recevant les résultats de validation."""
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    def set_validation_error(self, message):
+        self.results.append(message)
+
+
+def wait_for(validator, timeout_ms=2000):
+    """Attend la fin des vérifications en cours."""
+    elapsed = 0
+    while validator.is_running() and elapsed < timeout_ms:
+        QTest.qWait(10)
+        elapsed += 10
+
+
+class TestStatCache:
+    """Tests du cache des examens de chemins."""
+
+    def test_probe_path(self, tmp_path):
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("a")
+
+        assert probe_path(str(file_path)) == PathProbe(True, False, True)
+        assert probe_path(str(tmp_path)).is_dir
+        assert not probe_path(str(tmp_path / "absent")).exists
+
+    def test_results_reused_until_ttl(self):
+        calls = []
+        clock = FakeClock()
+        cache = StatCache(
+            ttl=5.0,
+            probe=lambda path: calls.append(path) or PathProbe(True),
+            clock=clock,
+        )
+
+        cache.probe("x")
+        cache.probe("x")
+        clock.now = 4.9
+        cache.probe("x")
+        assert calls == ["x"]
+
+        clock.now = 10.0
+        cache.probe("x")
+        assert calls == ["x", "x"]
+
+    def test_oldest_entries_dropped(self):
+        cache = StatCache(max_entries=2, probe=lambda path: PathProbe(False))
+        for path in ("a", "b", "c"):
+            cache.probe(path)
+        assert len(cache) == 2
+
+    def test_invalidate(self):
+        calls = []
+        cache = StatCache(probe=lambda path: calls.append(path) or PathProbe(True))
+        cache.probe("x")
+        cache.invalidate("x")
+        cache.probe("x")
+        assert calls == ["x", "x"]
+
+
+class TestCheckPathArgument:
+    """Tests de check_path_argument."""
+
+    def test_existing_file(self, tmp_path):
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("a")
+        argument = Argument(code="IN", name="Entrée", type="file")
+
+        assert check_path_argument(argument, str(file_path), StatCache()) is None
+
+    def test_missing_file(self, tmp_path):
+        argument = Argument(code="IN", name="Entrée", type="file")
+        message = check_path_argument(argument, str(tmp_path / "x"), StatCache())
+        assert "introuvable" in message
+
+    def test_extension_checked_first(self, tmp_path):
+        argument = Argument(
+            code="IN",
+            name="Entrée",
+            type="file",
+            validation={"file_extensions": [".csv"]},
+        )
+        message = check_path_argument(argument, str(tmp_path / "a.txt"), StatCache())
+        assert "extension" in message
+
+    def test_directory(self, tmp_path):
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("a")
+        argument = Argument(code="DIR", name="Dossier", type="directory")
+
+        assert check_path_argument(argument, str(tmp_path), StatCache()) is None
+        assert "n'est pas un dossier" in check_path_argument(
+            argument, str(file_path), StatCache()
+        )
+
+    def test_output_needs_existing_parent(self, tmp_path):
+        argument = Argument(code="OUT", name="Sortie", type="file", role="output")
+        cache = StatCache()
+
+        assert check_path_argument(argument, str(tmp_path / "new.txt"), cache) is None
+        message = check_path_argument(argument, str(tmp_path / "x" / "new.txt"), cache)
+        assert "Le dossier de 'Sortie'" in message
+
+    def test_empty_and_text_values_ignored(self):
+        cache = StatCache(probe=lambda path: pytest.fail("examen inattendu"))
+        assert check_path_argument(Argument(code="A", name="A"), "x", cache) is None
+        assert (
+            check_path_argument(Argument(code="A", name="A", type="file"), " ", cache)
+            is None
+        )
+
+
+class TestPathValidator:
+    """Tests du validateur en direct."""
+
+    def test_last_value_checked_off_thread(self, qapp, tmp_path):
+        probed = []
+        cache = StatCache(probe=lambda path: probed.append(path) or PathProbe(False))
+        validator = PathValidator(cache=cache, debounce_ms=20)
+        target = Target()
+        argument = Argument(code="IN", name="Entrée", type="file")
+
+        for value in ("a", "ab", "abc"):
+            validator.validate(target, argument, str(tmp_path / value))
+        assert target.results == []
+        wait_for(validator)
+
+        assert probed == [str(tmp_path / "abc")]
+        assert len(target.results) == 1 and "introuvable" in target.results[0]
+
+    def test_empty_value_answered_immediately(self, qapp):
+        validator = PathValidator(cache=StatCache(), debounce_ms=20)
+        target = Target()
+        argument = Argument(code="IN", name="Entrée", type="file")
+
+        validator.validate(target, argument, "absent.txt")
+        validator.validate(target, argument, "")
+
+        assert target.results == [None]
+        assert not validator.is_running()
+
+    def test_stale_result_ignored(self, qapp):
+        validator = PathValidator(
+            cache=StatCache(probe=lambda path: PathProbe(False)), debounce_ms=0
+        )
+        target = Target()
+        argument = Argument(code="IN", name="Entrée", type="file")
+
+        validator.validate(target, argument, "absent.txt")
+        validator.flush()
+        validator.validate(target, argument, "")  # Avant l'arrivée du résultat
+        wait_for(validator)
+
+        assert target.results == [None]
@@ -0,0 +1,275 @@
+"""
+Tests pour le registre des arbres de processus lancés par l'application.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+if os.name == "nt":
+    pytest.skip(
+        "Les tests du registre utilisent les groupes de processus POSIX",
+        allow_module_level=True,
+    )
+
+from command_builder.services.app_paths import DATA_DIR_ENV_VAR, get_app_data_dir
+from command_builder.services.command_executor import CommandExecutor
+from command_builder.services.process_registry import (
+    ProcessRecord,
+    ProcessRegistry,
+    get_process_registry,
+    read_process_start_time,
+)
+
+SLEEP_SCRIPT = "import time; time.sleep(30)"
+IGNORE_TERM_SCRIPT = (
+    "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)"
+)
+
+
+def spawn(script=SLEEP_SCRIPT):
+    """Démarre un processus Python dans son propre groupe de processus."""
+    return subprocess.Popen([sys.executable, "-c", script], start_new_session=True)
+
+
+def process_state(pid):
+    """Retourne l'état d'un processus lu dans /proc (None s'il n'existe plus)."""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    return stat[stat.rfind(")") + 2]
+
+
+def wait_dead(process, timeout=5.0):
+    """Attend la fin d'un processus et retourne True s'il est terminé."""
+    try:
+        process.wait(timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registre sauvegardé dans un fichier temporaire."""
+    return ProcessRegistry(tmp_path / "registry.json")
+
+
+@pytest.fixture
+def processes():
+    """Liste de processus tués en fin de test."""
+    started = []
+    yield started
+    for process in started:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+class TestAppDataDir:
+    """Tests pour le répertoire de données de l'application."""
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        """La variable d'environnement remplace l'emplacement par défaut."""
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path / "data"))
+        assert get_app_data_dir() == tmp_path / "data"
+        assert (tmp_path / "data").is_dir()
+
+
+class TestProcessStartTime:
+    """Tests pour la lecture de l'heure de démarrage."""
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="Nécessite /proc")
+    def test_start_time_of_running_process(self, processes):
+        """L'heure de démarrage est stable pour un même processus."""
+        process = spawn()
+        processes.append(process)
+        start_time = read_process_start_time(process.pid)
+        assert start_time is not None
+        assert read_process_start_time(process.pid) == start_time
+
+    def test_start_time_of_missing_process(self):
+        """Un processus inexistant n'a pas d'heure de démarrage."""
+        process = spawn("pass")
+        process.wait()
+        assert read_process_start_time(process.pid) is None
+
+
+class TestProcessRegistry:
+    """Tests pour ProcessRegistry."""
+
+    def test_cleanup_kills_registered_tree(self, registry, processes):
+        """Le nettoyage tue un arbre enregistré encore actif."""
+        process = spawn()
+        processes.append(process)
+        registry.register(process.pid)
+
+        assert registry.cleanup() == [process.pid]
+        assert wait_dead(process)
+        assert registry.records() == []
+
+    def test_cleanup_ignores_unregistered_process(self, registry, processes):
+        """Une autre instance du même exécutable n'est pas touchée."""
+        registered = spawn()
+        other = spawn()
+        processes.extend([registered, other])
+        registry.register(registered.pid)
+
+        registry.cleanup()
+
+        assert wait_dead(registered)
+        assert other.poll() is None
+
+    def test_cleanup_orphans_spares_running_executor(self, registry, processes):
+        """Au début d'une exécution, un arbre dont l'exécuteur tourne est conservé."""
+        running = spawn()
+        detached = spawn()
+        processes.extend([running, detached])
+        registry.register(running.pid)
+        registry.register(detached.pid)
+        # L'exécuteur de detached a fini, mais son arbre tourne encore
+        assert registry.release(detached.pid) is False
+
+        assert registry.cleanup_orphans() == [detached.pid]
+        assert wait_dead(detached)
+        assert running.poll() is None
+        assert [record.pid for record in registry.records()] == [running.pid]
+
+        # À la fermeture de l'application, tout est arrêté
+        assert registry.cleanup() == [running.pid]
+        assert wait_dead(running)
+
+    def test_release_finished_process(self, registry):
+        """Un processus terminé sans descendant est retiré du registre."""
+        process = spawn("pass")
+        registry.register(process.pid)
+        process.wait()
+
+        assert registry.release(process.pid) is True
+        assert registry.records() == []
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="Nécessite /proc")
+    def test_release_keeps_tree_with_orphans(self, registry, tmp_path):
+        """Un arbre dont un descendant tourne encore reste enregistré."""
+        # La racine lance un processus en arrière-plan puis se termine
+        pid_file = tmp_path / "child.pid"
+        script = (
+            "import subprocess, sys; "
+            f"child = subprocess.Popen([sys.executable, '-c', {SLEEP_SCRIPT!r}]); "
+            f"open({str(pid_file)!r}, 'w').write(str(child.pid))"
+        )
+        process = spawn(script)
+        registry.register(process.pid)
+        process.wait()
+        child_pid = int(pid_file.read_text())
+
+        assert registry.release(process.pid) is False
+        assert registry.cleanup() == [process.pid]
+        # Le descendant est tué (éventuellement zombie en attente de son parent)
+        time.sleep(0.2)
+        assert process_state(child_pid) in (None, "Z")
+
+    def test_reused_pid_is_not_killed(self, registry, processes):
+        """Un PID réutilisé (heure de démarrage différente) n'est pas tué."""
+        process = spawn()
+        processes.append(process)
+        record = registry.register(process.pid)
+        record.start_time = (record.start_time or 0) + 1
+
+        assert registry.cleanup() == []
+        assert process.poll() is None
+
+    def test_records_are_saved(self, registry, processes):
+        """Les enregistrements sont sauvegardés dans le fichier d'état."""
+        process = spawn()
+        processes.append(process)
+        registry.register(process.pid)
+
+        with open(registry.state_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        assert [entry["pid"] for entry in saved] == [process.pid]
+
+    def test_cleanup_orphans_of_dead_instance(self, registry, processes):
+        """Les arbres laissés par une instance terminée sont nettoyés."""
+        orphan = spawn()
+        processes.append(orphan)
+        dead_owner = spawn("pass")
+        dead_owner.wait()
+        record = ProcessRecord(
+            pid=orphan.pid,
+            pgid=orphan.pid,
+            start_time=read_process_start_time(orphan.pid),
+            owner_pid=dead_owner.pid,
+            owner_start_time=12345,
+        )
+        registry.state_file.write_text(json.dumps([record.__dict__]))
+
+        assert registry.cleanup() == [orphan.pid]
+        assert wait_dead(orphan)
+        assert json.loads(registry.state_file.read_text()) == []
+
+    def test_cleanup_spares_running_instance(self, registry, processes):
+        """Les arbres d'une autre instance en cours d'exécution sont conservés."""
+        child = spawn()
+        owner = spawn()
+        processes.extend([child, owner])
+        record = ProcessRecord(
+            pid=child.pid,
+            pgid=child.pid,
+            start_time=read_process_start_time(child.pid),
+            owner_pid=owner.pid,
+            owner_start_time=read_process_start_time(owner.pid),
+        )
+        registry.state_file.write_text(json.dumps([record.__dict__]))
+
+        assert registry.cleanup() == []
+        assert child.poll() is None
+        assert len(json.loads(registry.state_file.read_text())) == 1
+
+
+class TestExecutorRegistration:
+    """Tests de l'enregistrement des processus par CommandExecutor."""
+
+    def test_finished_command_is_released(self):
+        """Une commande terminée n'est plus dans le registre."""
+        executor = CommandExecutor("true")
+        executor.start()
+        assert executor.wait(5000)
+
+        pids = [record.pid for record in get_process_registry().records()]
+        assert executor.pid not in pids
+
+    def test_background_child_is_cleaned(self):
+        """Un programme laissé en arrière-plan par une commande est nettoyé."""
+        executor = CommandExecutor(
+            f"{sys.executable} -c '{SLEEP_SCRIPT}' >/dev/null 2>&1 &"
+        )
+        executor.start()
+        assert executor.wait(5000)
+
+        registry = get_process_registry()
+        assert executor.pid in [record.pid for record in registry.records()]
+        assert executor.pid in registry.cleanup()
+
+    def test_cancelled_command_keeps_grace_period(self):
+        """Une commande annulée n'est pas tuée par le nettoyage d'une exécution."""
+        executor = CommandExecutor(
+            "python",
+            argv=[sys.executable, "-c", IGNORE_TERM_SCRIPT],
+            grace_period=30,
+        )
+        executor.start()
+        # Laisser le processus installer son gestionnaire de signal
+        assert executor.wait(300) is False
+        executor.cancel()
+
+        assert executor.pid not in get_process_registry().cleanup_orphans()
+        assert executor.isRunning()
+        get_process_registry().cleanup()
+        assert executor.wait(5000)
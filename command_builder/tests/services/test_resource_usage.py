@@ -0,0 +1,128 @@
+"""
+Tests pour la mesure des ressources consommées par les commandes.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+if os.name == "nt":
+    pytest.skip(
+        "Les tests de mesure utilisent wait4 et /proc",
+        allow_module_level=True,
+    )
+
+from PySide6.QtCore import QCoreApplication
+
+from command_builder.services.command_executor import CommandExecutor
+from command_builder.services.resource_usage import ProcessWaiter, read_proc_io
+
+HAS_PROC_IO = os.path.exists(f"/proc/{os.getpid()}/io")
+
+
+@pytest.fixture
+def app():
+    """Fixture pour l'application Qt."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def run_and_measure(args, shell=False):
+    """Lance un processus et attend sa fin avec ProcessWaiter."""
+    process = subprocess.Popen(args, shell=shell)
+    waiter = ProcessWaiter(process)
+    assert waiter.wait(timeout=30)
+    return process, waiter.usage
+
+
+def python_script(script):
+    """Retourne la ligne de commande exécutant un script Python."""
+    return [sys.executable, "-c", script]
+
+
+class TestProcessWaiter:
+    """Tests pour ProcessWaiter."""
+
+    def test_return_code(self):
+        """Le code de retour est renseigné sur le processus."""
+        process, usage = run_and_measure(python_script("raise SystemExit(3)"))
+        assert process.returncode == 3
+        assert process.poll() == 3
+        assert usage is not None
+
+    def test_cpu_time(self):
+        """Le temps CPU utilisateur d'une boucle de calcul est mesuré."""
+        script = (
+            "import time\n"
+            "end = time.process_time() + 0.3\n"
+            "while time.process_time() < end: pass"
+        )
+        _, usage = run_and_measure(python_script(script))
+        assert usage.user_cpu + usage.system_cpu >= 0.25
+
+    def test_peak_rss(self):
+        """La mémoire résidente maximale reflète une allocation."""
+        script = "data = bytearray(64 * 1024 * 1024); data[::4096] = b'x' * len(data[::4096])"
+        _, usage = run_and_measure(python_script(script))
+        assert usage.peak_rss >= 64 * 1024 * 1024
+
+    @pytest.mark.skipif(not HAS_PROC_IO, reason="Nécessite /proc/<pid>/io")
+    def test_io_bytes(self, tmp_path):
+        """Les octets écrits par le processus sont mesurés."""
+        target = tmp_path / "out.bin"
+        script = f"open({str(target)!r}, 'wb').write(b'x' * 2 * 1024 * 1024)"
+        _, usage = run_and_measure(python_script(script))
+        assert usage.write_bytes >= 2 * 1024 * 1024
+        assert usage.read_bytes > 0
+
+    def test_shell_child_is_included(self):
+        """Via le shell, la commande lancée par le shell est comptée."""
+        script = (
+            "import time; end = time.process_time() + 0.3\n"
+            "while time.process_time() < end: pass"
+        )
+        command = f'{sys.executable} -c "{script}"; true'
+        _, usage = run_and_measure(command, shell=True)
+        assert usage.user_cpu + usage.system_cpu >= 0.25
+
+    def test_timeout(self):
+        """wait() retourne False tant que le processus tourne."""
+        process = subprocess.Popen(python_script("import time; time.sleep(5)"))
+        try:
+            assert ProcessWaiter(process).wait(timeout=0.05) is False
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_already_reaped_process(self):
+        """Un processus déjà récupéré par Popen termine l'attente sans mesure."""
+        process = subprocess.Popen(python_script("pass"))
+        process.wait()
+        waiter = ProcessWaiter(process)
+        assert waiter.wait(timeout=1)
+        assert waiter.usage is None
+
+    @pytest.mark.skipif(not HAS_PROC_IO, reason="Nécessite /proc/<pid>/io")
+    def test_read_proc_io_missing_process(self):
+        """Un processus inexistant n'a pas de compteurs."""
+        process = subprocess.Popen(python_script("pass"))
+        process.wait()
+        assert read_proc_io(process.pid) == (None, None)
+
+
+class TestExecutorResources:
+    """Tests de l'émission des ressources par CommandExecutor."""
+
+    def test_resources_emitted_before_finished(self, app, wait_executor):
+        """Les ressources sont émises avant execution_finished."""
+        events = []
+        executor = CommandExecutor("python", argv=python_script("print('ok')"))
+        executor.resources_measured.connect(lambda usage: events.append(usage))
+        executor.execution_finished.connect(lambda code: events.append(code))
+        executor.start()
+        assert wait_executor(executor, 10000)
+
+        assert len(events) == 2
+        assert events[0].peak_rss > 0
+        assert events[1] == 0
@@ -0,0 +1,79 @@
+"""
+Tests pour les points de reprise des séquences de commandes.
+"""
+
+from command_builder.services.app_paths import get_app_data_dir
+from command_builder.services.run_checkpoint import (
+    RunCheckpoint,
+    RunCheckpointStore,
+    get_run_checkpoint_store,
+)
+
+COMMANDS = [
+    {"name": "cmd1", "command": "echo 1"},
+    {"name": "cmd2", "command": "echo 2", "arguments": {"INPUT": "a b.txt"}},
+    {"name": "cmd3", "command": "echo 3"},
+]
+
+
+class TestRunCheckpoint:
+    """Tests du point de reprise."""
+
+    def test_results_aligned_with_commands(self):
+        checkpoint = RunCheckpoint(commands=COMMANDS)
+        assert checkpoint.results == [None, None, None]
+
+    def test_resume_index_is_first_failed_step(self):
+        checkpoint = RunCheckpoint(commands=COMMANDS)
+        checkpoint.record_step(0, 0)
+        checkpoint.record_step(1, 2)
+        assert checkpoint.resume_index() == 1
+
+    def test_resume_index_is_first_unexecuted_step(self):
+        checkpoint = RunCheckpoint(commands=COMMANDS)
+        checkpoint.record_step(0, 0)
+        assert checkpoint.resume_index() == 1
+
+    def test_completed_run_has_no_resume_index(self):
+        checkpoint = RunCheckpoint(commands=COMMANDS, results=[0, 0, 0])
+        assert checkpoint.resume_index() is None
+
+    def test_record_step_out_of_range_ignored(self):
+        checkpoint = RunCheckpoint(commands=COMMANDS)
+        checkpoint.record_step(5, 0)
+        assert checkpoint.results == [None, None, None]
+
+
+class TestRunCheckpointStore:
+    """Tests du stockage des points de reprise."""
+
+    def test_empty_store(self, tmp_path):
+        assert RunCheckpointStore(tmp_path / "run.json").load() is None
+
+    def test_checkpoint_persisted(self, tmp_path):
+        state_file = tmp_path / "run.json"
+        checkpoint = RunCheckpoint(
+            commands=COMMANDS, results=[0, 1, None], started_at="2024-01-01T10:00:00"
+        )
+        RunCheckpointStore(state_file).save(checkpoint)
+
+        loaded = RunCheckpointStore(state_file).load()
+        assert loaded == checkpoint
+        assert loaded.commands[1]["arguments"] == {"INPUT": "a b.txt"}
+
+    def test_clear(self, tmp_path):
+        state_file = tmp_path / "run.json"
+        store = RunCheckpointStore(state_file)
+        store.save(RunCheckpoint(commands=COMMANDS))
+
+        store.clear()
+        assert store.load() is None
+        assert not state_file.exists()
+
+    def test_corrupted_file_ignored(self, tmp_path):
+        state_file = tmp_path / "run.json"
+        state_file.write_text("[1, 2", encoding="utf-8")
+        assert RunCheckpointStore(state_file).load() is None
+
+    def test_shared_store_uses_app_data_dir(self):
+        assert get_run_checkpoint_store().state_file.parent == get_app_data_dir()
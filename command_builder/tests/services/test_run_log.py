@@ -0,0 +1,166 @@
+"""
+Tests pour les journaux d'exécution compressés.
+"""
+
+import gzip
+import os
+import time
+
+from command_builder.services import run_log
+from command_builder.services.run_log import (
+    RunLogReader,
+    RunLogWriter,
+    create_run_log,
+    export_run_log,
+    index_path_for,
+)
+
+
+def write_log(path, commands, block_size=64):
+    """Écrit un journal de test : {nom: [lignes]}."""
+    writer = RunLogWriter(path, block_size=block_size)
+    for name, lines in commands.items():
+        writer.begin_command(name)
+        for line in lines:
+            writer.write_line(line)
+    writer.close()
+    return writer
+
+
+class TestRunLogWriter:
+    """Tests de l'écriture des journaux."""
+
+    def test_log_is_standard_gzip(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        write_log(path, {"cmd1": ["a", "b"], "cmd2": ["c"]})
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read() == "a\nb\nc\n"
+
+    def test_output_written_in_several_blocks(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        write_log(path, {"cmd1": [f"ligne {i:04d}" for i in range(100)]})
+
+        reader = RunLogReader(path)
+        assert len(reader.blocks) > 1
+        assert reader.line_count == 100
+
+    def test_multiline_entry_counts_each_line(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        writer = write_log(path, {"cmd1": ["a\nb"]})
+        assert writer.line_count == 2
+
+    def test_write_after_close_ignored(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        writer = write_log(path, {"cmd1": ["a"]})
+        writer.write_line("b")
+        assert RunLogReader(path).line_count == 1
+
+    def test_flush_makes_lines_readable(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        writer = RunLogWriter(path)
+        writer.write_line("en cours")
+        writer.flush()
+
+        assert RunLogReader(path).read_lines(0, 1) == ["en cours"]
+        writer.close()
+
+
+class TestRunLogReader:
+    """Tests de la lecture à accès direct."""
+
+    def test_read_lines_across_blocks(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        lines = [f"ligne {i:04d}" for i in range(200)]
+        write_log(path, {"cmd1": lines})
+
+        reader = RunLogReader(path)
+        assert reader.read_lines(37, 50) == lines[37:87]
+        assert reader.read_lines(195, 10) == lines[195:]
+        assert reader.read_lines(250, 10) == []
+
+    def test_command_lines(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        commands = {
+            "cmd1": [f"un {i}" for i in range(30)],
+            "cmd2": [f"deux {i}" for i in range(30)],
+        }
+        write_log(path, commands)
+
+        reader = RunLogReader(path)
+        assert [command.name for command in reader.commands] == ["cmd1", "cmd2"]
+        assert reader.command_lines(0) == commands["cmd1"]
+        assert reader.command_lines(1) == commands["cmd2"]
+
+    def test_truncated_index_entry_ignored(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        write_log(path, {"cmd1": ["a"]})
+        with open(index_path_for(path), "a", encoding="utf-8") as f:
+            f.write('{"block": [12')
+
+        assert RunLogReader(path).read_lines(0, 5) == ["a"]
+
+    def test_line_metadata(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(run_log.time, "time", lambda: now[0])
+        path = tmp_path / "run.log.gz"
+        writer = RunLogWriter(path)
+        writer.write_line("Commande 1/1")
+        writer.begin_command("cmd1")
+        now[0] = 1000.2
+        writer.write_line("[CMD] echo")
+        now[0] = 1002.0
+        writer.write_line("sortie", output=True)
+        now[0] = 1002.1
+        writer.write_line("fin")
+        writer.close()
+
+        reader = RunLogReader(path)
+        times = [reader.line_time(i) for i in range(4)]
+        assert times == [1000.0, 1000.0, 1002.0, 1002.0]
+        assert [reader.command_index(i) for i in range(4)] == [None, 0, 0, 0]
+        assert [reader.is_output(i) for i in range(4)] == [False, False, True, False]
+        assert list(reader.iter_blocks()) == [
+            (0, ["Commande 1/1", "[CMD] echo", "sortie", "fin"])
+        ]
+
+
+class TestRunLogFiles:
+    """Tests de l'export et de la rotation des journaux."""
+
+    def test_export_text(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        write_log(path, {"cmd1": ["é", "b"]})
+
+        target = tmp_path / "export.txt"
+        export_run_log(path, str(target))
+        assert target.read_text(encoding="utf-8") == "é\nb\n"
+
+    def test_export_gzip_is_copy(self, tmp_path):
+        path = tmp_path / "run.log.gz"
+        write_log(path, {"cmd1": ["a"]})
+
+        target = tmp_path / "export.log.gz"
+        export_run_log(path, str(target))
+        assert target.read_bytes() == path.read_bytes()
+
+    def test_old_logs_pruned(self, tmp_path):
+        old = time.time() - (run_log.RUN_LOG_RETENTION_DAYS + 1) * 24 * 3600
+        recent = time.time() - (run_log.RUN_LOG_RETENTION_DAYS - 1) * 24 * 3600
+        for stamp in (old, old, recent):
+            writer = create_run_log(tmp_path)
+            writer.close()
+            os.utime(writer.log_path, (stamp, stamp))
+
+        new_log = create_run_log(tmp_path)
+        new_log.close()
+
+        assert len(list(tmp_path.glob("*.log.gz"))) == 2
+        assert len(list(tmp_path.glob("*.idx"))) == 2
+        assert new_log.log_path.exists()
+
+    def test_many_recent_logs_kept(self, tmp_path):
+        for _ in range(30):
+            create_run_log(tmp_path).close()
+
+        assert len(list(tmp_path.glob("*.log.gz"))) == 30
@@ -0,0 +1,190 @@
+"""
+Tests pour la session shell persistante (mode session des tâches).
+"""
+
+import os
+import sys
+
+import pytest
+
+if os.name == "nt":
+    pytest.skip(
+        "Les tests de session utilisent des commandes POSIX",
+        allow_module_level=True,
+    )
+
+from PySide6.QtCore import QCoreApplication
+
+from command_builder.services.command_executor import CommandExecutorService
+from command_builder.services.shell_session import (
+    SessionCommandExecutor,
+    ShellSession,
+)
+
+
+@pytest.fixture
+def app():
+    """Fixture pour l'application Qt."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def session():
+    """Fixture qui fournit une session shell fermée en fin de test."""
+    shell_session = ShellSession()
+    yield shell_session
+    shell_session.close()
+    if shell_session.is_alive():
+        shell_session.process.kill()
+
+
+def run(shell_session, command):
+    """Exécute une commande et retourne (code, lignes de sortie, stderr)."""
+    lines = []
+    code, stderr = shell_session.run_command(
+        command, lambda line: lines.append(line.rstrip("\n")), lambda: False
+    )
+    return code, lines, stderr
+
+
+class TestShellSession:
+    """Tests pour ShellSession."""
+
+    def test_session_not_started_initially(self, session):
+        """Le shell n'est démarré qu'à la première commande."""
+        assert session.process is None
+        assert session.is_alive() is False
+
+    def test_run_command_returns_output_and_code(self, session):
+        """La sortie et le code de retour sont délimités par le marqueur."""
+        code, lines, stderr = run(session, "echo hello")
+        assert code == 0
+        assert lines == ["hello"]
+        assert stderr == ""
+
+    def test_exit_codes_per_command(self, session):
+        """Chaque commande rapporte son propre code de retour."""
+        assert run(session, "false")[0] == 1
+        assert run(session, "sh -c 'exit 7'")[0] == 7
+        assert run(session, "true")[0] == 0
+
+    def test_single_shell_for_sequence(self, session):
+        """Toutes les commandes s'exécutent dans le même processus shell."""
+        run(session, "echo 1")
+        pid = session.process.pid
+        _, lines, _ = run(session, "echo $$")
+        assert lines == [str(pid)]
+
+    def test_working_directory_persists(self, session, tmp_path):
+        """Un changement de répertoire reste visible pour la commande suivante."""
+        run(session, f"cd '{tmp_path}'")
+        _, lines, _ = run(session, "pwd")
+        assert lines == [str(tmp_path)]
+
+    def test_environment_persists(self, session):
+        """Une variable exportée reste visible pour la commande suivante."""
+        run(session, "export CB_SESSION_TEST=42")
+        _, lines, _ = run(session, 'echo "$CB_SESSION_TEST"')
+        assert lines == ["42"]
+
+    def test_output_without_trailing_newline(self, session):
+        """Une sortie sans retour à la ligne final est conservée."""
+        code, lines, _ = run(session, "printf partial")
+        assert code == 0
+        assert lines == ["partial"]
+
+    def test_stderr_is_separated_per_command(self, session):
+        """La sortie d'erreur est rattachée à la bonne commande."""
+        _, _, stderr = run(session, "echo oops >&2")
+        assert stderr.strip() == "oops"
+        _, _, stderr = run(session, "echo fine")
+        assert stderr == ""
+
+    def test_command_does_not_consume_session_input(self, session):
+        """Une commande qui lit stdin ne consomme pas les lignes du shell."""
+        code, lines, _ = run(session, "cat")
+        assert code == 0
+        assert lines == []
+        assert run(session, "echo still-alive")[1] == ["still-alive"]
+
+    def test_unbalanced_quote_fails_only_its_step(self, session):
+        """Un guillemet non fermé fait échouer la commande sans bloquer le shell."""
+        code, lines, stderr = run(session, "echo 'unterminated")
+        assert code != 0
+        assert lines == []
+        assert stderr != ""
+        assert run(session, "echo next") == (0, ["next"], "")
+
+    def test_syntax_error_keeps_session(self, session):
+        """Une erreur de syntaxe ne termine pas le shell de la session."""
+        run(session, "export CB_SESSION_TEST=kept")
+        pid = session.process.pid
+
+        code, _, stderr = run(session, "echo before; fi")
+        assert code != 0
+        assert "fi" in stderr
+
+        _, lines, _ = run(session, 'echo "$CB_SESSION_TEST"')
+        assert lines == ["kept"]
+        assert session.process.pid == pid
+        assert session.is_alive()
+
+    def test_syntax_error_runs_nothing(self, session):
+        """Une commande mal formée n'est pas exécutée, même en partie."""
+        code, lines, _ = run(session, "echo first\nif true; then")
+        assert code != 0
+        assert lines == []
+
+    def test_function_persists(self, session):
+        """Une fonction définie par une commande reste disponible ensuite."""
+        run(session, "greet() { echo hi; }")
+        assert run(session, "greet") == (0, ["hi"], "")
+
+    def test_exit_ends_session(self, session):
+        """Une commande exit termine la session avec son code."""
+        code, _, _ = run(session, "exit 3")
+        assert code == 3
+        with pytest.raises(RuntimeError):
+            run(session, "echo too-late")
+
+    def test_step_file_keeps_literal_percent(self, session):
+        """Les % protégés d'une valeur restent littéraux dans le fichier .cmd."""
+        path = session._write_step_file('tool ^"^%PATH^%^" %TEMP%')
+        with open(path, encoding="utf-8", newline="") as step_file:
+            assert step_file.read() == '@echo off\r\ntool ^"%%PATH%%^" %TEMP%\r\n'
+        session.close()
+        assert not os.path.exists(path)
+
+    def test_cancel_kills_process_tree(self, app, session):
+        """L'annulation tue le shell et les processus qu'il a lancés."""
+        run(session, "true")
+        executor = SessionCommandExecutor(
+            f"{sys.executable} -c 'import time; time.sleep(30)'", session
+        )
+        executor.start()
+        # Attendre que la commande soit lancée
+        assert executor.wait(300) is False
+        executor.cancel()
+        assert executor.wait(5000) is True
+        assert session.is_alive() is False
+
+
+class TestSessionExecution:
+    """Tests d'exécution via CommandExecutorService."""
+
+    def test_execute_command_with_session(self, app, session, wait_executor):
+        """execute_command utilise la session quand elle est fournie."""
+        service = CommandExecutorService()
+        outputs = []
+        codes = []
+
+        executor = service.execute_command(
+            "echo from-session",
+            on_output=outputs.append,
+            on_finished=codes.append,
+            session=session,
+        )
+        assert isinstance(executor, SessionCommandExecutor)
+        assert wait_executor(executor, 5000)
+        assert outputs == ["from-session"]
+        assert codes == [0]
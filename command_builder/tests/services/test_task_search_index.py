@@ -0,0 +1,138 @@
+"""
+Tests pour l'index de recherche de la palette d'ouverture rapide.
+"""
+
+import pytest
+
+from command_builder.models.arguments import Argument, TaskArgument
+from command_builder.models.command import Command
+from command_builder.models.task import Task
+from command_builder.services.task_search_index import (
+    KIND_ARGUMENT,
+    KIND_COMMAND,
+    KIND_SHARED_ARGUMENT,
+    KIND_TASK,
+    TaskSearchIndex,
+    normalize_text,
+    trigrams,
+)
+
+
+@pytest.fixture
+def tasks():
+    """Catalogue de deux tâches."""
+    return [
+        Task(
+            name="Déploiement serveur",
+            description="Publie l'application sur le serveur de recette",
+            arguments=[TaskArgument(code="ENV", name="Environnement cible")],
+            commands=[
+                Command(
+                    name="Compilation",
+                    description="Compile les sources",
+                    command="make",
+                    arguments=[Argument(code="OUT", name="Dossier de sortie")],
+                ),
+                Command(
+                    name="Copie",
+                    description="Copie les binaires",
+                    command="scp",
+                    arguments=[
+                        Argument(code="OUT", name="Dossier de sortie"),
+                        Argument(code="HOST", name="Hôte distant"),
+                    ],
+                ),
+            ],
+        ),
+        Task(
+            name="Export comptable",
+            description="Exporte les écritures du mois",
+            commands=[
+                Command(
+                    name="Extraction",
+                    description="",
+                    command="extract",
+                    arguments=[Argument(code="MONTH", name="Mois")],
+                )
+            ],
+        ),
+    ]
+
+
+class TestNormalization:
+    """Tests de la normalisation des textes."""
+
+    def test_case_and_accents_ignored(self):
+        assert normalize_text("Déploiement ÉTÉ") == "deploiement ete"
+
+    def test_trigrams(self):
+        assert trigrams("abcd") == {"abc", "bcd"}
+        assert trigrams("ab") == set()
+
+
+class TestTaskSearchIndex:
+    """Tests de TaskSearchIndex."""
+
+    def test_entries_built_once_per_element(self, tasks):
+        index = TaskSearchIndex(tasks)
+        kinds = [entry.kind for entry in index.entries]
+
+        assert kinds.count(KIND_TASK) == 2
+        assert kinds.count(KIND_SHARED_ARGUMENT) == 1
+        assert kinds.count(KIND_COMMAND) == 3
+        # "Dossier de sortie" est indexé une seule fois pour sa tâche
+        assert kinds.count(KIND_ARGUMENT) == 3
+
+    def test_task_name_ranked_first(self, tasks):
+        results = TaskSearchIndex(tasks).search("deploiement")
+        assert results[0].kind == KIND_TASK
+        assert results[0].task_name == "Déploiement serveur"
+
+    def test_command_result_points_to_command(self, tasks):
+        result = TaskSearchIndex(tasks).search("copie")[0]
+        assert (result.kind, result.task_name, result.command_index) == (
+            KIND_COMMAND,
+            "Déploiement serveur",
+            1,
+        )
+
+    def test_argument_result_points_to_first_command(self, tasks):
+        result = TaskSearchIndex(tasks).search("dossier sortie")[0]
+        assert result.kind == KIND_ARGUMENT
+        assert (result.command_index, result.argument_code) == (0, "OUT")
+
+    def test_shared_argument_has_no_command(self, tasks):
+        result = TaskSearchIndex(tasks).search("environnement")[0]
+        assert result.kind == KIND_SHARED_ARGUMENT
+        assert result.command_index is None
+        assert result.argument_code == "ENV"
+
+    def test_all_words_required(self, tasks):
+        index = TaskSearchIndex(tasks)
+        assert [r.title for r in index.search("export mois")] == ["Export comptable"]
+        assert index.search("export serveur") == []
+
+    def test_short_words_match_word_starts(self, tasks):
+        titles = [r.title for r in TaskSearchIndex(tasks).search("ho")]
+        assert titles == ["Hôte distant"]
+
+    def test_description_searched(self, tasks):
+        titles = [r.title for r in TaskSearchIndex(tasks).search("recette")]
+        assert titles == ["Déploiement serveur"]
+
+    def test_typo_tolerated(self, tasks):
+        results = TaskSearchIndex(tasks).search("deploiment")
+        assert results and results[0].title == "Déploiement serveur"
+
+    def test_empty_query(self, tasks):
+        assert TaskSearchIndex(tasks).search("  ") == []
+
+    def test_limit(self, tasks):
+        assert len(TaskSearchIndex(tasks).search("e", limit=2)) == 2
+
+    def test_rebuild_replaces_entries(self, tasks):
+        index = TaskSearchIndex(tasks)
+        index.rebuild(tasks[1:])
+
+        assert index.search("deploiement") == []
+        assert index.search("export")[0].title == "Export comptable"
@@ -0,0 +1,37 @@
+"""
+Compile the Qt Designer .ui files of CommandBuilder into Python modules.
+
+Components load the generated <name>_ui.py modules instead of parsing the
+.ui XML at runtime; a module that no longer matches its .ui file is ignored
+and the component falls back to QUiLoader.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from command_builder.components.ui_loader import compile_all
+
+
+def get_components_dir():
+    """Get the directory containing the UI components."""
+    return Path(__file__).parent.absolute() / "command_builder" / "components"
+
+
+def main():
+    """Main entry point for the compile script."""
+    components_dir = get_components_dir()
+    try:
+        compiled = compile_all(components_dir)
+    except (OSError, subprocess.CalledProcessError) as e:
+        # pyside6-uic missing, compilation failed or module not writable
+        print(f"Error compiling UI files: {e}")
+        if isinstance(e, subprocess.CalledProcessError) and e.stderr:
+            print(e.stderr)
+        sys.exit(1)
+    for path in compiled:
+        print(f"[OK] {path.relative_to(components_dir)}")
+
+
+if __name__ == "__main__":
+    main()
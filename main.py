@@ -6,6 +6,8 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
 from command_builder.components.main_window import MainWindow
+from command_builder.components.stylesheet import apply_application_stylesheet
+from command_builder.services.process_registry import get_process_registry
 from command_builder.services.yaml_task_loader import load_yaml_tasks
 
 
@@ -27,11 +29,21 @@ def setup_application():
         app_icon = QIcon(icon_path)
         app.setWindowIcon(app_icon)
 
+    # Feuille de style de tous les composants, appliquée une seule fois
+    apply_application_stylesheet(app)
+
     return app
 
 
 if __name__ == "__main__":
     app = setup_application()
+
+    # Arrêter les processus laissés par une instance précédente, puis ceux
+    # encore actifs à la fermeture de l'application
+    registry = get_process_registry()
+    registry.cleanup()
+    app.aboutToQuit.connect(registry.cleanup)
+
     tasks, errors = load_yaml_tasks()
     main_window = MainWindow()
     main_window.set_tasks(tasks)